@@ -0,0 +1,214 @@
+"""
+RoleDetailData 的 msgspec.Struct 版本
+
+字段与方法与 model.py 中的 pydantic 模型保持一致，供评分/伤害计算等热路径使用，
+可直接从 json/msgpack 字节解码，避免先解析为 dict 再做 pydantic 校验。
+"""
+
+import time
+from typing import Dict, List, Literal, Optional, Union
+
+import msgspec
+from msgspec import Struct
+from msgspec import json as msgjson
+from msgspec import msgpack
+
+from .model import RoleDetailData
+
+
+class RoleStruct(Struct, kw_only=True):
+    roleId: int
+    level: int
+    breach: Optional[int] = None
+    roleName: str
+    roleIconUrl: Optional[str] = None
+    rolePicUrl: Optional[str] = None
+    starLevel: int
+    attributeId: int
+    attributeName: Optional[str] = None
+    weaponTypeId: int
+    weaponTypeName: Optional[str] = None
+    acronym: str
+    chainUnlockNum: Optional[int] = None
+
+
+class ChainStruct(Struct, kw_only=True):
+    name: Optional[str] = None
+    order: int
+    description: Optional[str] = None
+    iconUrl: Optional[str] = None
+    unlocked: bool
+
+
+class WeaponStruct(Struct, kw_only=True):
+    weaponId: int
+    weaponName: str
+    weaponType: int
+    weaponStarLevel: int
+    weaponIcon: Optional[str] = None
+    weaponEffectName: Optional[str] = None
+
+
+class WeaponDataStruct(Struct, kw_only=True):
+    weapon: WeaponStruct
+    level: int
+    breach: Optional[int] = None
+    resonLevel: Optional[int] = None
+
+
+class PhantomPropStruct(Struct, kw_only=True):
+    phantomPropId: int
+    name: str
+    phantomId: int
+    quality: int
+    cost: int
+    iconUrl: str
+    skillDescription: Optional[str] = None
+
+
+class FetterDetailStruct(Struct, kw_only=True):
+    groupId: int
+    name: str
+    iconUrl: Optional[str] = None
+    num: int
+    firstDescription: Optional[str] = None
+    secondDescription: Optional[str] = None
+
+
+class PropsStruct(Struct, kw_only=True):
+    attributeName: str
+    iconUrl: Optional[str] = None
+    attributeValue: str
+
+
+class EquipPhantomStruct(Struct, kw_only=True):
+    phantomProp: PhantomPropStruct
+    cost: int
+    quality: int
+    level: int
+    fetterDetail: FetterDetailStruct
+    mainProps: Optional[List[PropsStruct]] = None
+    subProps: Optional[List[PropsStruct]] = None
+
+    def get_props(self):
+        props = []
+        if self.mainProps:
+            props.extend(self.mainProps)
+        if self.subProps:
+            props.extend(self.subProps)
+
+        return props
+
+
+class EquipPhantomDataStruct(Struct, kw_only=True):
+    cost: int
+    equipPhantomList: Optional[List[Optional[EquipPhantomStruct]]] = None
+
+
+class SkillStruct(Struct, kw_only=True):
+    id: int
+    type: str
+    name: str
+    description: str
+    iconUrl: str
+
+
+class SkillDataStruct(Struct, kw_only=True):
+    skill: SkillStruct
+    level: int
+
+
+class RoleDetailStruct(Struct, kw_only=True):
+    role: RoleStruct
+    level: int
+    chainList: List[ChainStruct]
+    weaponData: WeaponDataStruct
+    phantomData: Optional[EquipPhantomDataStruct] = None
+    skillList: List[SkillDataStruct]
+
+    def get_chain_num(self):
+        """获取命座数量"""
+        num = 0
+        for chain in self.chainList:
+            if chain.unlocked:
+                num += 1
+        return num
+
+    def get_chain_name(self):
+        n = self.get_chain_num()
+        return f"{['零', '一', '二', '三', '四', '五', '六'][n]}链"
+
+    def get_skill_level(
+        self,
+        skill_type: Literal["常态攻击", "共鸣技能", "共鸣解放", "变奏技能", "共鸣回路"],
+    ):
+        skill_level = 1
+        _skill = next(
+            (skill for skill in self.skillList if skill.skill.type == skill_type), None
+        )
+        if _skill:
+            skill_level = _skill.level - 1
+        return skill_level
+
+    def get_skill_list(self):
+        sort = ["常态攻击", "共鸣技能", "共鸣回路", "共鸣解放", "变奏技能", "延奏技能"]
+        return sorted(self.skillList, key=lambda x: sort.index(x.skill.type))
+
+
+# 与 pydantic 的宽松模式保持一致，允许 "1" -> 1 之类的转换
+role_detail_json_decoder = msgjson.Decoder(RoleDetailStruct, strict=False)
+role_detail_msgpack_decoder = msgpack.Decoder(RoleDetailStruct, strict=False)
+
+
+def decode_role_detail(
+    buf: bytes, fmt: Literal["json", "msgpack"] = "msgpack"
+) -> RoleDetailStruct:
+    """从字节直接解码"""
+    if fmt == "json":
+        return role_detail_json_decoder.decode(buf)
+    return role_detail_msgpack_decoder.decode(buf)
+
+
+def role_detail_to_struct(
+    data: Union[Dict, RoleDetailData, RoleDetailStruct],
+) -> RoleDetailStruct:
+    if isinstance(data, RoleDetailStruct):
+        return data
+    if isinstance(data, RoleDetailData):
+        data = data.model_dump()
+    return msgspec.convert(data, RoleDetailStruct, strict=False)
+
+
+def struct_to_role_detail(data: RoleDetailStruct) -> RoleDetailData:
+    return RoleDetailData(**msgspec.to_builtins(data))
+
+
+def benchmark_role_detail_decode(
+    data: List[Dict], rounds: int = 20
+) -> Dict[str, float]:
+    """
+    对比 pydantic 与 msgspec.Struct 的解码耗时(单位 ms，每轮解码全部角色后取平均)
+    """
+    json_bytes = [msgjson.encode(r) for r in data]
+    msgpack_bytes = [msgpack.encode(r) for r in data]
+
+    def _timeit(func) -> float:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            func()
+        return (time.perf_counter() - start) * 1000 / rounds
+
+    return {
+        "role_num": len(data),
+        "pydantic_json_ms": _timeit(
+            lambda: [RoleDetailData.model_validate_json(b) for b in json_bytes]
+        ),
+        "pydantic_dict_ms": _timeit(lambda: [RoleDetailData(**r) for r in data]),
+        "struct_json_ms": _timeit(
+            lambda: [role_detail_json_decoder.decode(b) for b in json_bytes]
+        ),
+        "struct_msgpack_ms": _timeit(
+            lambda: [role_detail_msgpack_decoder.decode(b) for b in msgpack_bytes]
+        ),
+        "struct_dict_ms": _timeit(lambda: [role_detail_to_struct(r) for r in data]),
+    }
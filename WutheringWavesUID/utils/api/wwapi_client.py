@@ -0,0 +1,248 @@
+"""
+排行服务(wwapi)读接口的共享客户端
+
+- 全局复用一个 httpx.AsyncClient，保持长连接
+- 熔断: 连续失败 BREAKER_THRESHOLD 次后打开，BREAKER_COOLDOWN 秒内直接失败；
+  冷却后放行一个探测请求，成功则恢复
+- 持有率/出场率/卡池等变化缓慢的数据使用 stale-while-revalidate 缓存:
+  过期后先返回旧数据并在后台刷新，接口不可用时继续使用旧数据
+- 每个接口记录请求数、失败数与耗时，可通过 get_wwapi_metrics 查看
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from gsuid_core.logger import logger
+
+from ...wutheringwaves_config import WutheringWavesConfig
+from ..cache import register_cache
+from .wwapi import MAIN_URL
+
+REQUEST_TIMEOUT = httpx.Timeout(10, connect=3)
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 30
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_wwapi_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _client
+
+
+async def close_wwapi_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN
+    ):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.fail_count = 0
+        self.open_count = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.time() - self.opened_at < self.cooldown:
+                return False
+            self.state = self.HALF_OPEN
+        # 半开状态只放行一个探测请求
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def on_success(self):
+        self.state = self.CLOSED
+        self.fail_count = 0
+        self._probing = False
+
+    def on_failure(self):
+        self._probing = False
+        self.fail_count += 1
+        if self.state == self.HALF_OPEN or self.fail_count >= self.threshold:
+            if self.state != self.OPEN:
+                self.open_count += 1
+                logger.warning(f"[鸣潮] 排行服务连续失败{self.fail_count}次, 暂停请求")
+            self.state = self.OPEN
+            self.opened_at = time.time()
+
+
+class EndpointMetrics:
+    def __init__(self):
+        self.count = 0
+        self.fail = 0
+        self.rejected = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+
+    def record(self, cost_ms: float, ok: bool):
+        self.count += 1
+        if not ok:
+            self.fail += 1
+        self.total_ms += cost_ms
+        self.last_ms = cost_ms
+        self.max_ms = max(self.max_ms, cost_ms)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "fail": self.fail,
+            "rejected": self.rejected,
+            "avg_ms": self.total_ms / self.count if self.count else 0,
+            "max_ms": self.max_ms,
+            "last_ms": self.last_ms,
+        }
+
+
+breaker = CircuitBreaker()
+_metrics: Dict[str, EndpointMetrics] = {}
+
+
+def _get_metrics(url: str) -> EndpointMetrics:
+    name = url.replace(MAIN_URL, "")
+    if name not in _metrics:
+        _metrics[name] = EndpointMetrics()
+    return _metrics[name]
+
+
+async def wwapi_request(
+    method: str,
+    url: str,
+    json: Optional[Dict] = None,
+    need_token: bool = False,
+) -> Optional[Any]:
+    """返回响应 json，失败或熔断中返回 None"""
+    headers = {"Content-Type": "application/json"}
+    if need_token:
+        WavesToken = WutheringWavesConfig.get_config("WavesToken").data
+        if not WavesToken:
+            return None
+        headers["Authorization"] = f"Bearer {WavesToken}"
+
+    metrics = _get_metrics(url)
+    if not breaker.allow():
+        metrics.rejected += 1
+        return None
+
+    start = time.perf_counter()
+    ok = False
+    try:
+        res = await get_wwapi_client().request(
+            method, url, json=json, headers=headers
+        )
+        # 4xx 为请求本身的问题，不计入熔断
+        ok = res.status_code < 500
+        if res.status_code == 200:
+            return res.json()
+        logger.warning(f"请求排行服务失败: {url} {res.status_code} - {res.text}")
+    except Exception as e:
+        logger.warning(f"请求排行服务失败: {url} {e}")
+    finally:
+        metrics.record((time.perf_counter() - start) * 1000, ok)
+        if ok:
+            breaker.on_success()
+        else:
+            breaker.on_failure()
+    return None
+
+
+class SWRCache:
+    """
+    stale-while-revalidate 缓存
+    ttl 内直接返回；超过 ttl 但在 stale_ttl 内返回旧值并在后台刷新；
+    超过 stale_ttl 或没有值时等待请求
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.cache: Dict[str, tuple] = {}
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+    async def _refresh(self, key: str, fetch: Callable, condition: Callable):
+        value = await fetch()
+        if condition(value):
+            self.cache[key] = (value, time.time())
+            return value
+        return None
+
+    def _refresh_task(self, key: str, fetch: Callable, condition: Callable):
+        task = self._refreshing.get(key)
+        if task is None or task.done():
+            task = asyncio.create_task(self._refresh(key, fetch, condition))
+            self._refreshing[key] = task
+        return task
+
+    async def get(
+        self,
+        key: str,
+        fetch: Callable,
+        condition: Callable[[Any], bool] = lambda x: x is not None,
+    ) -> Optional[Any]:
+        cached = self.cache.get(key)
+        if cached:
+            value, at = cached
+            age = time.time() - at
+            if age < self.ttl:
+                return value
+            if age < self.stale_ttl:
+                self._refresh_task(key, fetch, condition)
+                return value
+
+        value = await self._refresh_task(key, fetch, condition)
+        if value is None and cached:
+            # 接口不可用时继续使用旧数据
+            return cached[0]
+        return value
+
+
+# 持有率/出场率/卡池
+stat_cache = SWRCache(3600, 7 * 86400)
+register_cache("wwapi.stat", stat_cache.cache)
+
+
+async def get_cached_data(
+    url: str, condition: Callable[[Any], bool] = lambda x: x is not None
+) -> Optional[Any]:
+    """GET url 并取 data 字段，使用 stat_cache 缓存"""
+
+    async def _fetch():
+        res = await wwapi_request("GET", url)
+        if isinstance(res, dict):
+            return res.get("data")
+        return None
+
+    return await stat_cache.get(url, _fetch, condition)
+
+
+def get_wwapi_metrics() -> Dict[str, Any]:
+    return {
+        "breaker": breaker.state,
+        "fail_count": breaker.fail_count,
+        "open_count": breaker.open_count,
+        "endpoints": {name: m.to_dict() for name, m in _metrics.items()},
+    }
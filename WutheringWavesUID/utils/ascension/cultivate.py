@@ -0,0 +1,163 @@
+"""
+本地养成成本
+
+角色/武器的突破材料可由 detail_json 中的 ascensions 与 material 表离线计算。
+技能升级、经验材料以及背包缺口不在本地数据中，仍以 get_batch_role_cost 为准，
+本地结果用于校验接口返回与接口不可用时的降级展示
+"""
+
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from msgspec import json as msgjson
+
+from gsuid_core.logger import logger
+
+from ..api.model import CultivateCost, RoleCostDetail
+from .char import char_id_data
+from .char import get_breach as get_char_breach
+from .weapon import get_breach as get_weapon_breach
+from .weapon import weapon_id_data
+
+MAP_PATH = Path(__file__).parent.parent / "map/detail_json/material"
+material_id_data = {}
+
+# 贝币
+COIN_ID = "2"
+# 只用于角色突破的材料标签: 7 BOSS材料 45 特产
+ASCENSION_ONLY_TAGS = {7, 45}
+
+
+def read_material_json_files(directory):
+    files = directory.rglob("*.json")
+
+    for file in files:
+        try:
+            with open(file, "r", encoding="utf-8") as f:
+                data = msgjson.decode(f.read())
+                file_name = file.name.split(".")[0]
+                material_id_data[file_name] = data
+        except Exception as e:
+            logger.exception(f"read_material_json_files load fail decoding {file}", e)
+
+
+read_material_json_files(MAP_PATH)
+
+
+def get_role_name_star(char_id: Union[str, int]) -> Optional[Tuple[str, int]]:
+    char_data = char_id_data.get(str(char_id))
+    if not char_data:
+        return None
+    return char_data["name"], char_data["starLevel"]
+
+
+def get_weapon_name_star(weapon_id: Union[str, int]) -> Optional[Tuple[str, int]]:
+    weapon_data = weapon_id_data.get(str(weapon_id))
+    if not weapon_data:
+        return None
+    return weapon_data["name"], weapon_data["starLevel"]
+
+
+def _sum_ascensions(
+    ascensions: Dict[str, List[Dict]], keys: List[str]
+) -> Dict[str, int]:
+    cost = Counter()
+    for key in keys:
+        for item in ascensions.get(key) or []:
+            if item["value"] > 0:
+                cost[str(item["key"])] += item["value"]
+    return dict(cost)
+
+
+def calc_role_breach_cost(
+    char_id: Union[str, int], start_level: int, end_level: int
+) -> Dict[str, int]:
+    """角色从 start_level 升到 end_level 需要的突破材料 {材料id: 数量}"""
+    char_data = char_id_data.get(str(char_id))
+    if not char_data or end_level <= start_level:
+        return {}
+    start = get_char_breach(None, start_level)
+    end = get_char_breach(None, end_level)
+    # ascensions["1"] 为 0 -> 1 突破
+    keys = [str(i) for i in range(start + 1, end + 1)]
+    return _sum_ascensions(char_data.get("ascensions") or {}, keys)
+
+
+def calc_weapon_breach_cost(
+    weapon_id: Union[str, int], start_level: int, end_level: int
+) -> Dict[str, int]:
+    """武器从 start_level 升到 end_level 需要的突破材料 {材料id: 数量}"""
+    weapon_data = weapon_id_data.get(str(weapon_id))
+    if not weapon_data or end_level <= start_level:
+        return {}
+    start = get_weapon_breach(None, start_level)
+    end = get_weapon_breach(None, end_level)
+    # ascensions["0"] 为 0 -> 1 突破
+    keys = [str(i) for i in range(start, end)]
+    return _sum_ascensions(weapon_data.get("ascensions") or {}, keys)
+
+
+def calc_content_breach_cost(content: Dict) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """get_batch_role_cost 的一项请求内容对应的 (角色, 武器) 突破材料"""
+    role_cost = calc_role_breach_cost(
+        content["roleId"], content["roleStartLevel"], content["roleEndLevel"]
+    )
+    weapon_cost = {}
+    if content.get("weaponId"):
+        weapon_cost = calc_weapon_breach_cost(
+            content["weaponId"], content["weaponStartLevel"], content["weaponEndLevel"]
+        )
+    return role_cost, weapon_cost
+
+
+def to_cultivate_cost_list(cost: Dict[str, int]) -> List[CultivateCost]:
+    """转换为接口相同的结构，贝币在前，其余按品质从高到低"""
+    result = []
+    for material_id, num in cost.items():
+        material = material_id_data.get(material_id, {})
+        result.append(
+            CultivateCost(
+                id=material_id,
+                name=material.get("name", ""),
+                iconUrl="",
+                num=num,
+                type=material.get("type", 0),
+                quality=material.get("rarity", 1),
+                isPreview=False,
+            )
+        )
+    result.sort(key=lambda x: (x.id != COIN_ID, -x.quality, x.id))
+    return result
+
+
+def is_ascension_only(material_id: str) -> bool:
+    material = material_id_data.get(material_id)
+    if not material:
+        return False
+    return bool(ASCENSION_ONLY_TAGS.intersection(material.get("tag_num") or []))
+
+
+def check_role_cost(content: Dict, role_cost_detail: RoleCostDetail) -> List[str]:
+    """
+    用本地突破材料校验接口返回的 allCost
+    只用于突破的材料数量必须一致，其余材料(技能也会消耗)接口数量不少于本地
+    """
+    role_cost, weapon_cost = calc_content_breach_cost(content)
+    local = Counter(role_cost)
+    local.update(weapon_cost)
+
+    remote = {i.id: i.num for i in role_cost_detail.allCost or []}
+    errors = []
+    for material_id, num in local.items():
+        remote_num = remote.get(material_id, 0)
+        if is_ascension_only(material_id):
+            ok = remote_num == num
+        else:
+            ok = remote_num >= num
+        if not ok:
+            name = material_id_data.get(material_id, {}).get("name", material_id)
+            errors.append(
+                f"{content['roleId']} {name}({material_id}) 本地:{num} 接口:{remote_num}"
+            )
+    return errors
@@ -0,0 +1,163 @@
+"""
+玩家数据文件的原子写入
+
+- 序列化与写文件都在线程中执行，不阻塞事件循环
+- 先写入同目录下的临时文件并 fsync，再 os.replace 覆盖目标文件，
+  写入中途崩溃不会留下半个文件
+- 同一路径的写入串行执行；上一次写入未完成时到达的多次写入会合并，
+  只写最后一次的数据
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from msgspec import json as msgjson
+
+from gsuid_core.logger import logger
+
+Serializer = Callable[[], bytes]
+
+
+def _fsync_dir(path: Path):
+    if sys.platform == "win32":
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _replace(src: str, dst: Path, retry: int = 5):
+    # windows 下目标文件被其他进程打开时 replace 会失败，稍等重试
+    for i in range(retry):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if i == retry - 1:
+                raise
+            time.sleep(0.05 * (i + 1))
+
+
+def write_file_atomic(path: Path, data: bytes):
+    """同步版本，需在线程中调用"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        _replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(path.parent)
+
+
+class _PathState:
+    __slots__ = ("pending", "waiters", "task")
+
+    def __init__(self):
+        # 最新一次等待写入的数据
+        self.pending: Optional[Serializer] = None
+        # (future, 对应的数据)
+        self.waiters: List[Tuple[asyncio.Future, Serializer]] = []
+        self.task: Optional[asyncio.Task] = None
+
+
+class AtomicWriter:
+    def __init__(self):
+        self._states: Dict[Path, _PathState] = {}
+        self.writes = 0
+        self.coalesced = 0
+
+    async def write(self, path: Path, serializer: Serializer) -> bool:
+        """
+        写入 serializer() 的结果
+
+        返回 True 表示本次数据已落盘；返回 False 表示本次写入被之后到达的
+        同路径写入合并，落盘的是更新的数据
+        """
+        path = Path(path)
+        state = self._states.get(path)
+        if state is None:
+            state = self._states[path] = _PathState()
+
+        if state.pending is not None:
+            self.coalesced += 1
+        state.pending = serializer
+        future = asyncio.get_running_loop().create_future()
+        state.waiters.append((future, serializer))
+
+        if state.task is None or state.task.done():
+            state.task = asyncio.create_task(self._flush(path, state))
+        return await future
+
+    async def write_bytes(self, path: Path, data: bytes) -> bool:
+        return await self.write(path, lambda: data)
+
+    async def write_json(self, path: Path, obj: Any) -> bool:
+        """obj 在写入完成前不应再被修改"""
+        return await self.write(path, lambda: msgjson.encode(obj))
+
+    async def _flush(self, path: Path, state: _PathState):
+        try:
+            while state.pending is not None:
+                serializer = state.pending
+                waiters = state.waiters
+                state.pending = None
+                state.waiters = []
+
+                error: Optional[BaseException] = None
+                try:
+                    await asyncio.to_thread(self._serialize_write, path, serializer)
+                    self.writes += 1
+                except Exception as e:
+                    error = e
+
+                for future, s in waiters:
+                    if future.done():
+                        continue
+                    if error is not None:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(s is serializer)
+        finally:
+            if state.pending is None and self._states.get(path) is state:
+                del self._states[path]
+
+    @staticmethod
+    def _serialize_write(path: Path, serializer: Serializer):
+        write_file_atomic(path, serializer())
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "writes": self.writes,
+            "coalesced": self.coalesced,
+            "pending": len(self._states),
+        }
+
+
+storage_writer = AtomicWriter()
+
+
+async def save_json_atomic(path: Path, obj: Any):
+    try:
+        await storage_writer.write_json(path, obj)
+    except Exception as e:
+        logger.exception(f"save {path} failed:", e)
@@ -1,39 +1,369 @@
+import asyncio
+import sys
 import time
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+# 估算容器大小时抽样的元素数
+SIZE_SAMPLE = 20
+SIZE_MAX_DEPTH = 4
+
+
+def estimate_size(obj: Any, depth: int = 0) -> int:
+    """估算对象占用的字节数，容器按抽样元素的平均大小推算"""
+    if isinstance(obj, (bytes, bytearray, str, int, float, bool)) or obj is None:
+        return sys.getsizeof(obj)
+    # PIL.Image
+    if hasattr(obj, "getbands") and hasattr(obj, "size"):
+        width, height = obj.size
+        return width * height * len(obj.getbands())
+    if depth >= SIZE_MAX_DEPTH:
+        return sys.getsizeof(obj)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        items = list(islice(obj.items(), SIZE_SAMPLE))
+        if items:
+            sample = sum(
+                estimate_size(k, depth + 1) + estimate_size(v, depth + 1)
+                for k, v in items
+            )
+            size += sample * len(obj) // len(items)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = list(islice(obj, SIZE_SAMPLE))
+        if items:
+            sample = sum(estimate_size(v, depth + 1) for v in items)
+            size += sample * len(obj) // len(items)
+    elif hasattr(obj, "__struct_fields__"):
+        # msgspec.Struct
+        size += sum(
+            estimate_size(getattr(obj, f, None), depth + 1)
+            for f in obj.__struct_fields__
+        )
+    elif hasattr(obj, "__dict__"):
+        size += estimate_size(vars(obj), depth + 1)
+    return size
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class CacheEntry:
+    """
+    source 返回缓存容器(dict/list/TimedCache 等)
+    自带大小统计的容器可以实现 cache_size()，命中统计可以使用容器的 hits/misses
+    evictable 为 False 的缓存(如冷却时间)不参与内存压力清理，只能手动清空
+    """
+
+    def __init__(
+        self,
+        name: str,
+        source: Callable[[], Any],
+        stats: Optional[CacheStats] = None,
+        evictable: bool = True,
+    ):
+        self.name = name
+        self.source = source
+        self.stats = stats
+        self.evictable = evictable
+
+    def container(self) -> Any:
+        return self.source()
+
+    def length(self) -> int:
+        container = self.container()
+        if isinstance(container, TimedCache):
+            return len(container.cache)
+        try:
+            return len(container)
+        except TypeError:
+            return 0
+
+    def size(self) -> int:
+        container = self.container()
+        if hasattr(container, "cache_size"):
+            return container.cache_size()
+        if isinstance(container, TimedCache):
+            container = container.cache
+        return estimate_size(container)
+
+    def clear(self):
+        container = self.container()
+        if hasattr(container, "clear"):
+            container.clear()
+
+    def shrink(self):
+        """内存压力下清理: TimedCache 删除过期项与较早的一半，其他容器清空"""
+        container = self.container()
+        if isinstance(container, TimedCache):
+            container.shrink(0.5)
+        else:
+            self.clear()
+        if self.stats:
+            self.stats.evictions += 1
+
+
+class CacheRegistry:
+    def __init__(self):
+        self.entries: Dict[str, CacheEntry] = {}
+
+    def register(
+        self,
+        name: str,
+        source: Any,
+        stats: Optional[CacheStats] = None,
+        evictable: bool = True,
+    ) -> CacheEntry:
+        """source 可以是容器本身，或返回容器的函数(容器会被整体替换时使用)"""
+        if not callable(source) or isinstance(source, TimedCache):
+            container = source
+            source = lambda: container  # noqa: E731
+        # 同名时加序号，避免覆盖
+        key = name
+        index = 1
+        while key in self.entries:
+            index += 1
+            key = f"{name}#{index}"
+        entry = CacheEntry(key, source, stats, evictable)
+        self.entries[key] = entry
+        return entry
+
+    def report(self) -> List[Dict[str, Any]]:
+        result = []
+        for entry in self.entries.values():
+            stats = entry.stats or entry.container()
+            hits = getattr(stats, "hits", 0)
+            misses = getattr(stats, "misses", 0)
+            result.append(
+                {
+                    "name": entry.name,
+                    "length": entry.length(),
+                    "size": entry.size(),
+                    "hit_rate": hits / (hits + misses) if hits + misses else None,
+                    "hits": hits,
+                    "misses": misses,
+                    "evictions": getattr(stats, "evictions", 0),
+                    "evictable": entry.evictable,
+                }
+            )
+        result.sort(key=lambda x: x["size"], reverse=True)
+        return result
+
+    def clear(self, name: str = "") -> List[str]:
+        """清空名称包含 name 的缓存，name 为空时清空全部可清理的缓存"""
+        cleared = []
+        for entry in self.entries.values():
+            if name and name not in entry.name:
+                continue
+            if not name and not entry.evictable:
+                continue
+            entry.clear()
+            cleared.append(entry.name)
+        return cleared
+
+    def enforce_budget(self, limit: int) -> Tuple[int, List[str]]:
+        """
+        估算总大小超过 limit 字节时，从最大的缓存开始清理直到低于 limit
+        返回 (清理前大小, 清理的缓存)
+        """
+        sizes = {name: entry.size() for name, entry in self.entries.items()}
+        total = sum(sizes.values())
+        if limit <= 0 or total <= limit:
+            return total, []
+
+        evicted = []
+        current = total
+        for name in sorted(sizes, key=lambda x: sizes[x], reverse=True):
+            entry = self.entries[name]
+            if not entry.evictable:
+                continue
+            entry.shrink()
+            current += entry.size() - sizes[name]
+            evicted.append(name)
+            if current <= limit:
+                break
+        return total, evicted
+
+
+cache_registry = CacheRegistry()
+
+
+def register_cache(
+    name: str,
+    source: Any,
+    stats: Optional[CacheStats] = None,
+    evictable: bool = True,
+) -> CacheEntry:
+    return cache_registry.register(name, source, stats, evictable)
 
 
 class TimedCache:
-    def __init__(self, timeout=5, maxsize=10):
-        self.cache = OrderedDict()
+    """
+    所有项的过期时间相同，按写入顺序追加到过期队列中，队列天然按过期时间有序，
+    清理时只需从队头弹出，均摊 O(1)。cache 保持最近使用顺序，超过 maxsize 时淘汰最久未使用的
+    """
+
+    def __init__(self, timeout=5, maxsize=10, name: str = "", evictable=True):
+        self.cache: "OrderedDict[Any, Tuple[Any, float]]" = OrderedDict()
         self.timeout = timeout
         self.maxsize = maxsize
+        self.stats = CacheStats()
+        # (过期时间, key)，key 被重新写入后旧的记录在弹出时跳过
+        self._expire_queue: Deque[Tuple[float, Any]] = deque()
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        if name:
+            register_cache(name, self, self.stats, evictable)
+
+    def __len__(self) -> int:
+        return len(self.cache)
 
     def set(self, key, value):
-        if len(self.cache) >= self.maxsize:
-            self._clean_up()
+        self._clean_up()
+        expiry = time.monotonic() + self.timeout
         if key in self.cache:
             self.cache.move_to_end(key)
-        else:
-            self._clean_up()
-        self.cache[key] = (value, time.time() + self.timeout)
+        self.cache[key] = (value, expiry)
+        self._expire_queue.append((expiry, key))
+        while len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+            self.stats.evictions += 1
+        # 重复写入同一个 key 时队列中的旧记录过多，重建队列
+        if len(self._expire_queue) > 2 * len(self.cache) + 64:
+            self._expire_queue = deque(
+                sorted((exp, k) for k, (_, exp) in self.cache.items())
+            )
 
     def get(self, key):
-        if key in self.cache:
-            value, expiry = self.cache.pop(key)
-            if time.time() < expiry:
-                self.cache[key] = (value, expiry)
-                return value
+        item = self.cache.get(key)
+        if item is not None:
+            if time.monotonic() < item[1]:
+                self.cache.move_to_end(key)
+                self.stats.hits += 1
+                return item[0]
+            del self.cache[key]
+        self.stats.misses += 1
         return None
 
+    async def get_or_set(
+        self,
+        key,
+        factory: Callable[[], Awaitable[Any]],
+        condition: Callable[[Any], bool] = lambda x: x is not None,
+    ):
+        """
+        未命中时调用 factory 获取并写入，同一个 key 同时只会调用一次，
+        其余调用等待同一个结果，调用者被取消时由等待者重新获取
+        """
+        while True:
+            value = self.get(key)
+            if value is not None:
+                return value
+
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # future 未被取消说明是等待者自身被取消
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await factory()
+        except Exception as e:
+            future.set_exception(e)
+            # 没有其他等待者时避免 "exception was never retrieved"
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            if condition(value):
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
     def delete(self, key):
         if key in self.cache:
             del self.cache[key]
 
+    def clear(self):
+        self.cache.clear()
+        self._expire_queue.clear()
+
+    def shrink(self, ratio: float):
+        """删除过期项，再按最近使用顺序删除最早的 ratio 部分"""
+        self._clean_up()
+        for _ in range(int(len(self.cache) * ratio)):
+            self.cache.popitem(last=False)
+
     def _clean_up(self):
-        current_time = time.time()
-        keys_to_delete = []
-        for key, (value, expiry_time) in self.cache.items():
-            if expiry_time <= current_time:
-                keys_to_delete.append(key)
-        for key in keys_to_delete:
-            del self.cache[key]
+        now = time.monotonic()
+        queue = self._expire_queue
+        while queue and queue[0][0] <= now:
+            expiry, key = queue.popleft()
+            item = self.cache.get(key)
+            # 只删除与记录一致的项，重新写入过的 key 不受影响
+            if item is not None and item[1] == expiry:
+                del self.cache[key]
+
+
+def benchmark_timed_cache(sizes=(10000, 100000)) -> List[Dict[str, float]]:
+    """
+    TimedCache 各操作的平均耗时(微秒)
+    legacy_set_us 为旧实现每次写入新 key 时全量扫描的耗时
+    """
+    result = []
+    for n in sizes:
+        cache = TimedCache(3600, n)
+        keys = [f"key_{i}" for i in range(n)]
+
+        start = time.perf_counter()
+        for key in keys:
+            cache.set(key, key)
+        fill = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in keys:
+            cache.get(key)
+        get = time.perf_counter() - start
+
+        # 已满时继续写入新 key，触发淘汰
+        start = time.perf_counter()
+        for i in range(n):
+            cache.set(f"new_{i}", i)
+        evict = time.perf_counter() - start
+
+        # 旧实现: 每次写入新 key 遍历整个 OrderedDict
+        legacy = OrderedDict((key, (key, time.time() + 3600)) for key in keys)
+        rounds = 20
+        start = time.perf_counter()
+        for _ in range(rounds):
+            now = time.time()
+            expired = [k for k, (_, exp) in legacy.items() if exp <= now]
+            for key in expired:
+                del legacy[key]
+        legacy_set = time.perf_counter() - start
+
+        result.append(
+            {
+                "size": n,
+                "len": len(cache),
+                "set_us": fill * 1e6 / n,
+                "get_us": get * 1e6 / n,
+                "evict_set_us": evict * 1e6 / n,
+                "legacy_set_us": legacy_set * 1e6 / rounds,
+            }
+        )
+    return result
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional, Union
 from gsuid_core.logger import logger
 
 from ...utils.api.model import Props, RoleDetailData
+from ...utils.api.model_struct import PropsStruct, RoleDetailStruct
 from ...utils.api.model_other import EnemyDetailData
 from ...utils.damage.utils import (
     SONATA_ANCIENT,
@@ -23,7 +24,7 @@ from ..resource.constant import card_sort_map as card_sort_map_back
 class WuWaCalc(object):
     def __init__(
         self,
-        role_detail: RoleDetailData,
+        role_detail: Union[RoleDetailData, RoleDetailStruct],
         enemy_detail: Optional[EnemyDetailData] = None,
     ):
         """
@@ -50,7 +51,7 @@ class WuWaCalc(object):
         calc.role_card = calc.enhance_summation_card_value(calc.phantom_card)
         calc.damageAttribute = calc.card_sort_map_to_attribute(calc.role_card)
         """
-        self.role_detail: RoleDetailData = role_detail
+        self.role_detail: Union[RoleDetailData, RoleDetailStruct] = role_detail
         # 声骸预处理 -> 声骸套装，声骸数量，声骸首位id
         self.phantom_pre = {}
         # 声骸面板数据
@@ -75,7 +76,11 @@ class WuWaCalc(object):
             return
         self.can_calc = True
 
-    def sum_phantom_value(self, result: Dict[str, str], prop_list: List[Props]) -> Dict:
+    def sum_phantom_value(
+        self,
+        result: Dict[str, str],
+        prop_list: Union[List[Props], List[PropsStruct]],
+    ) -> Dict:
         name_per = ["攻击", "生命", "防御"]
 
         for prop in prop_list:
@@ -212,7 +217,7 @@ class WuWaCalc(object):
         if "echo_id" in result:
             echo_clz = WavesEchoRegister.find_class(result["echo_id"])
             if echo_clz:
-                e = echo_clz()
+                e = echo_clz.get_instance()
                 temp = e.do_equipment_first(role_id)
                 logger.debug(f"首位声骸数据 {e.name}-{e.id}-{temp}")
                 for key, value in temp.items():
@@ -413,10 +418,11 @@ class WuWaCalc(object):
         # logger.debug(f"面板数据: {card_sort_map}")
         return card_sort_map
 
-    def card_sort_map_to_attribute(self, card_sort_map: Dict):
+    def card_sort_map_to_attribute(self, card_sort_map: Dict, trace: bool = True):
         attr = DamageAttribute(
             enemy_resistance=self.enemy_detail.enemy_resistance / 100,
             enemy_level=self.enemy_detail.enemy_level,
+            trace=trace,
         )
         attr.set_char_atk(card_sort_map["char_atk"])
         attr.set_char_life(card_sort_map["char_life"])
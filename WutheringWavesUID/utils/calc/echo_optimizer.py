@@ -0,0 +1,512 @@
+"""
+声骸配装优化
+
+接口只返回角色身上已装备的声骸，因此以玩家全部角色已装备的声骸作为背包，
+为指定角色搜索 cost 之和不超过 12、主套装件数达标的 5 声骸组合
+
+1. 每个声骸按该角色的评分权重(calc.json)预先打分，评分只与单个声骸有关
+2. 同 cost 同套装只保留评分靠前的声骸，分支定界按评分之和选出候选组合
+3. 候选组合分块交给计算进程，使用与面板相同的 WuWaCalc + 排行伤害函数精确计算，
+   超过时限时只使用已算完的部分
+"""
+
+import asyncio
+import copy
+import heapq
+import random
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+import msgspec
+from msgspec import Struct
+
+from ..api.model_struct import (
+    EquipPhantomDataStruct,
+    EquipPhantomStruct,
+    RoleDetailStruct,
+    role_detail_to_struct,
+)
+from ..ascension.sonata import get_sonata_detail
+from ..calc_pool import get_calc_workers, run_in_calc_pool
+from ..calculate import calc_phantom_score, get_calc_map
+from ..damage.abstract import DamageRankRegister
+from ..expression_ctx import calc_rank_damage
+from . import WuWaCalc
+
+MAX_COST = 12
+EQUIP_NUM = 5
+# 同 cost 同套装保留的声骸数
+BUCKET_KEEP = 6
+# 按评分选出的候选组合数
+MAX_CANDIDATES = 240
+# 一个组合中 cost 4 的声骸都会尝试放在首位，展开后的组合数上限
+MAX_COMBOS = 480
+
+# 声骸在背包中的下标，首位为主声骸
+Combo = Tuple[int, ...]
+
+
+class EchoItem(Struct):
+    index: int
+    cost: int
+    sonata: str
+    score: float
+
+
+class EchoBuild(Struct):
+    combo: Combo
+    expected_damage: float
+    crit_damage: Optional[float]
+    score: float
+
+
+class OptimizeResult(Struct):
+    role_name: str
+    rank_title: str
+    sonata: str
+    inventory: List[EquipPhantomStruct]
+    builds: List[EchoBuild]
+    current_damage: Optional[float]
+    candidate_num: int
+    scored_num: int
+    search_ms: float
+    calc_ms: float
+    timeout: bool
+
+
+def collect_echo_inventory(role_data_list: List[Dict]) -> List[Dict]:
+    """全部角色已装备的声骸"""
+    inventory = []
+    for role_data in role_data_list:
+        phantom_data = role_data.get("phantomData")
+        if not phantom_data or not phantom_data.get("equipPhantomList"):
+            continue
+        for phantom in phantom_data["equipPhantomList"]:
+            if phantom and phantom.get("phantomProp"):
+                inventory.append(phantom)
+    return inventory
+
+
+def get_current_combo(
+    role_data: Dict, inventory_data: List[Dict]
+) -> Optional[Combo]:
+    """当前装备在背包中的下标，背包需由 collect_echo_inventory 生成"""
+    phantom_data = role_data.get("phantomData") or {}
+    equip = [p for p in phantom_data.get("equipPhantomList") or [] if p]
+    if not equip:
+        return None
+    position = {id(p): i for i, p in enumerate(equip)}
+    combo = [i for i, p in enumerate(inventory_data) if id(p) in position]
+    if len(combo) != len(equip):
+        return None
+    return tuple(sorted(combo, key=lambda i: position[id(inventory_data[i])]))
+
+
+def score_inventory(
+    role: RoleDetailStruct,
+    inventory: List[EquipPhantomStruct],
+    calc_map: Optional[Dict],
+) -> List[EchoItem]:
+    items = []
+    for index, phantom in enumerate(inventory):
+        score, _ = calc_phantom_score(
+            role.role.roleId, phantom.get_props(), phantom.cost, calc_map
+        )
+        items.append(
+            EchoItem(
+                index=index,
+                cost=phantom.cost,
+                sonata=phantom.fetterDetail.name,
+                score=score,
+            )
+        )
+    return items
+
+
+def choose_sonata(items: List[EchoItem]) -> Optional[str]:
+    """未指定套装时，选评分最高的若干件之和最大且件数足够的套装"""
+    group: Dict[str, List[float]] = {}
+    for item in items:
+        group.setdefault(item.sonata, []).append(item.score)
+
+    best, best_score = None, -1.0
+    for name, scores in group.items():
+        need = get_sonata_detail(name).full_piece_effect() if name else 0
+        if not need or len(scores) < need:
+            continue
+        score = sum(sorted(scores, reverse=True)[:need])
+        if score > best_score:
+            best, best_score = name, score
+    return best
+
+
+def search_combos(
+    items: List[EchoItem],
+    sonata: str,
+    max_candidates: int = MAX_CANDIDATES,
+    time_limit: float = 5,
+) -> List[Tuple[float, Combo]]:
+    """
+    按评分之和选出 max_candidates 个满足 cost 与套装件数的 5 声骸组合
+    返回 (评分之和, 组合)，组合内下标有序，尚未确定首位
+    超过 time_limit(秒) 时返回已找到的组合
+    """
+    need = get_sonata_detail(sonata).full_piece_effect()
+
+    # 同一组合中同 cost 同套装的声骸最多 5 个，只保留评分靠前的
+    buckets: Dict[Tuple[int, str], List[EchoItem]] = {}
+    for item in items:
+        buckets.setdefault((item.cost, item.sonata), []).append(item)
+    pool: List[EchoItem] = []
+    for bucket in buckets.values():
+        bucket.sort(key=lambda x: x.score, reverse=True)
+        pool.extend(bucket[:BUCKET_KEEP])
+    pool.sort(key=lambda x: x.score, reverse=True)
+
+    n = len(pool)
+    prefix = [0.0]
+    for item in pool:
+        prefix.append(prefix[-1] + item.score)
+    # 下标 i 之后还剩多少件目标套装
+    sonata_left = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        sonata_left[i] = sonata_left[i + 1] + (pool[i].sonata == sonata)
+
+    heap: List[Tuple[float, Combo]] = []
+    chosen: List[int] = []
+    deadline = time.perf_counter() + time_limit
+    visited = 0
+
+    def dfs(start: int, cost: int, score: float, sonata_num: int) -> bool:
+        nonlocal visited
+        visited += 1
+        if visited & 0xFFF == 0 and time.perf_counter() > deadline:
+            return False
+
+        left = EQUIP_NUM - len(chosen)
+        if left == 0:
+            if sonata_num < need:
+                return True
+            entry = (score, tuple(sorted(pool[i].index for i in chosen)))
+            if len(heap) < max_candidates:
+                heapq.heappush(heap, entry)
+            elif score > heap[0][0]:
+                heapq.heapreplace(heap, entry)
+            return True
+
+        for i in range(start, n - left + 1):
+            # pool 按评分降序，之后的上界只会更小
+            bound = score + prefix[i + left] - prefix[i]
+            if len(heap) >= max_candidates and bound <= heap[0][0]:
+                break
+            if sonata_num + sonata_left[i] < need:
+                break
+            item = pool[i]
+            # 剩余位置每个至少 1 cost
+            if cost + item.cost + left - 1 > MAX_COST:
+                continue
+            if need - sonata_num >= left and item.sonata != sonata:
+                continue
+            chosen.append(i)
+            ok = dfs(
+                i + 1,
+                cost + item.cost,
+                score + item.score,
+                sonata_num + (item.sonata == sonata),
+            )
+            chosen.pop()
+            if not ok:
+                return False
+        return True
+
+    dfs(0, 0, 0.0, 0)
+    return sorted(heap, reverse=True)
+
+
+def expand_main_echo(
+    candidates: List[Tuple[float, Combo]],
+    inventory: List[EquipPhantomStruct],
+    max_combos: int = MAX_COMBOS,
+) -> List[Tuple[float, Combo]]:
+    """首位声骸决定声骸技能与首位加成，组合中每个最高 cost 的声骸都尝试放在首位"""
+    result = []
+    for score, combo in candidates:
+        top_cost = max(inventory[i].cost for i in combo)
+        seen = set()
+        for i in combo:
+            phantom_id = inventory[i].phantomProp.phantomId
+            if inventory[i].cost != top_cost or phantom_id in seen:
+                continue
+            seen.add(phantom_id)
+            result.append((score, (i,) + tuple(x for x in combo if x != i)))
+            if len(result) >= max_combos:
+                return result
+    return result
+
+
+def prepare_candidates(
+    role: RoleDetailStruct,
+    inventory: List[EquipPhantomStruct],
+    sonata: Optional[str] = None,
+    current: Optional[Combo] = None,
+) -> Tuple[Optional[str], List[Tuple[float, Combo]]]:
+    """
+    返回 (目标套装, 已确定首位的候选组合)
+    未指定套装时优先使用当前装备的套装，当前装备总是在候选中
+    """
+    # 与角色评分一致，以当前装备计算评分权重
+    calc = WuWaCalc(role)
+    calc.phantom_pre = calc.prepare_phantom()
+    calc.phantom_card = calc.enhance_summation_phantom_value(calc.phantom_pre)
+    calc_map = get_calc_map(calc.phantom_card, role.role.roleName, role.role.roleId)
+    items = score_inventory(role, inventory, calc_map)
+
+    target = sonata
+    if not target:
+        for ph_detail in calc.phantom_pre.get("ph_detail", []):
+            if ph_detail["isFull"]:
+                target = ph_detail["ph_name"]
+                break
+    if not target:
+        target = choose_sonata(items)
+    if not target:
+        return None, []
+
+    candidates = expand_main_echo(search_combos(items, target), inventory)
+    if not candidates:
+        return target, []
+    if current and all(combo != current for _, combo in candidates):
+        candidates.insert(0, (sum(items[i].score for i in current), current))
+    return target, dedupe_combos(candidates, inventory)
+
+
+def _echo_key(phantom: EquipPhantomStruct) -> Tuple:
+    return (
+        phantom.phantomProp.phantomId,
+        phantom.cost,
+        phantom.fetterDetail.name,
+        tuple((p.attributeName, p.attributeValue) for p in phantom.get_props()),
+    )
+
+
+def dedupe_combos(
+    candidates: List[Tuple[float, Combo]],
+    inventory: List[EquipPhantomStruct],
+) -> List[Tuple[float, Combo]]:
+    """不同角色身上可能有完全相同的声骸，首位与其余声骸都相同的组合只保留一个"""
+    keys = {}
+    seen = set()
+    result = []
+    for score, combo in candidates:
+        for i in combo:
+            if i not in keys:
+                keys[i] = _echo_key(inventory[i])
+        signature = (keys[combo[0]], tuple(sorted(keys[i] for i in combo[1:])))
+        if signature in seen:
+            continue
+        seen.add(signature)
+        result.append((score, combo))
+    return result
+
+
+def score_echo_combos(
+    role_data: Dict,
+    inventory_data: List[Dict],
+    combos: List[Combo],
+    deadline: float,
+) -> List[Tuple[Combo, float, Optional[float]]]:
+    """
+    在计算进程中执行，参数为可 pickle 的原始数据
+    返回 (组合, 期望伤害, 暴击伤害)，超过 deadline(time.time()) 后不再计算
+    """
+    role = role_detail_to_struct(role_data)
+    rankDetail = DamageRankRegister.find_class(str(role.role.roleId))
+    if not rankDetail:
+        return []
+    inventory = msgspec.convert(
+        inventory_data, List[EquipPhantomStruct], strict=False
+    )
+
+    result = []
+    for combo in combos:
+        if time.time() > deadline:
+            break
+        equip = [inventory[i] for i in combo]
+        role.phantomData = EquipPhantomDataStruct(
+            cost=sum(p.cost for p in equip), equipPhantomList=equip
+        )
+        calc = WuWaCalc(role)
+        calc.phantom_pre = calc.prepare_phantom()
+        calc.phantom_card = calc.enhance_summation_phantom_value(calc.phantom_pre)
+        damage = calc_rank_damage(calc, role, rankDetail)
+        result.append((combo, damage.expected_damage, damage.crit_damage))
+    return result
+
+
+def _split_chunks(combos: List[Combo], workers: int) -> List[List[Combo]]:
+    # 每个进程分到多块，先完成的进程可以继续领取，时限内尽量多算
+    size = max(len(combos) // (workers * 4), 8)
+    return [combos[i : i + size] for i in range(0, len(combos), size)]
+
+
+async def _score_chunk(
+    role_data: Dict,
+    inventory_data: List[Dict],
+    chunk: List[Combo],
+    deadline: float,
+) -> List[Tuple[Combo, float, Optional[float]]]:
+    # 只把这一块用到的声骸发给计算进程，下标重新编号
+    used = sorted({i for combo in chunk for i in combo})
+    local = {index: i for i, index in enumerate(used)}
+    result = await run_in_calc_pool(
+        score_echo_combos,
+        role_data,
+        [inventory_data[i] for i in used],
+        [tuple(local[i] for i in combo) for combo in chunk],
+        deadline,
+    )
+    return [
+        (tuple(used[i] for i in combo), expected, crit)
+        for combo, expected, crit in result
+    ]
+
+
+async def optimize_echo(
+    role_data: Dict,
+    inventory_data: List[Dict],
+    sonata: Optional[str] = None,
+    top_k: int = 3,
+    timeout: float = 15,
+) -> Union[OptimizeResult, str]:
+    role = role_detail_to_struct(role_data)
+    role_name = role.role.roleName
+    rankDetail = DamageRankRegister.find_class(str(role.role.roleId))
+    if not rankDetail:
+        return f"[鸣潮] 角色【{role_name}】暂不支持伤害计算，无法优化配装"
+
+    inventory = msgspec.convert(
+        inventory_data, List[EquipPhantomStruct], strict=False
+    )
+    start = time.perf_counter()
+
+    target, candidates = await asyncio.to_thread(
+        prepare_candidates,
+        role,
+        inventory,
+        sonata,
+        get_current_combo(role_data, inventory_data),
+    )
+    if not target:
+        return "[鸣潮] 背包中没有能凑齐套装的声骸"
+    if not candidates:
+        return f"[鸣潮] 背包中的声骸无法凑齐【{target}】套装"
+    search_ms = (time.perf_counter() - start) * 1000
+
+    current_damage = None
+    if role.phantomData and role.phantomData.equipPhantomList:
+        calc = WuWaCalc(role)
+        calc.phantom_pre = calc.prepare_phantom()
+        calc.phantom_card = calc.enhance_summation_phantom_value(calc.phantom_pre)
+        current_damage = calc_rank_damage(calc, role, rankDetail).expected_damage
+
+    start = time.perf_counter()
+    deadline = time.time() + timeout
+    combos = [c for _, c in candidates]
+    tasks = [
+        asyncio.create_task(
+            _score_chunk(role_data, inventory_data, chunk, deadline)
+        )
+        for chunk in _split_chunks(combos, get_calc_workers())
+    ]
+    done, pending = await asyncio.wait(tasks, timeout=timeout + 1)
+    for task in pending:
+        task.cancel()
+
+    scores = {combo: score for score, combo in candidates}
+    scored: List[EchoBuild] = []
+    for task in done:
+        if task.cancelled() or task.exception():
+            continue
+        for combo, expected, crit in task.result():
+            scored.append(EchoBuild(combo, expected, crit, scores[combo]))
+    calc_ms = (time.perf_counter() - start) * 1000
+
+    builds = heapq.nlargest(top_k, scored, key=lambda x: x.expected_damage)
+    return OptimizeResult(
+        role_name=role_name,
+        rank_title=rankDetail["title"],
+        sonata=target,
+        inventory=inventory,
+        builds=builds,
+        current_damage=current_damage,
+        candidate_num=len(combos),
+        scored_num=len(scored),
+        search_ms=search_ms,
+        calc_ms=calc_ms,
+        timeout=bool(pending) or len(scored) < len(combos),
+    )
+
+
+def build_benchmark_inventory(
+    inventory_data: List[Dict], size: int = 200, seed: int = 0
+) -> List[Dict]:
+    """
+    以已有声骸为模板扩充背包：复制后从同 cost 的声骸中随机换副词条与套装
+    """
+    if not inventory_data:
+        return []
+    rng = random.Random(seed)
+    by_cost: Dict[int, List[Dict]] = {}
+    for phantom in inventory_data:
+        by_cost.setdefault(phantom["cost"], []).append(phantom)
+
+    result = list(inventory_data[:size])
+    while len(result) < size:
+        template = rng.choice(inventory_data)
+        same_cost = by_cost[template["cost"]]
+        phantom = copy.deepcopy(template)
+        phantom["subProps"] = copy.deepcopy(rng.choice(same_cost).get("subProps"))
+        phantom["fetterDetail"] = copy.deepcopy(
+            rng.choice(same_cost)["fetterDetail"]
+        )
+        result.append(phantom)
+    return result
+
+
+async def benchmark_echo_optimizer(
+    role_data: Dict, inventory_data: List[Dict], size: int = 200
+) -> Dict:
+    """200 声骸背包下的搜索与计算耗时，并与单线程逐个计算对比"""
+    inventory_data = build_benchmark_inventory(inventory_data, size)
+    result = await optimize_echo(role_data, inventory_data, timeout=60)
+    if isinstance(result, str):
+        return {"error": result}
+
+    single_ms = 0.0
+    if result.scored_num:
+        # 单线程计算一部分组合，按数量折算
+        _, candidates = await asyncio.to_thread(
+            prepare_candidates,
+            role_detail_to_struct(role_data),
+            result.inventory,
+            result.sonata,
+        )
+        combos = [c for _, c in candidates[:48]]
+        start = time.perf_counter()
+        await asyncio.to_thread(
+            score_echo_combos, role_data, inventory_data, combos, time.time() + 60
+        )
+        cost = (time.perf_counter() - start) * 1000
+        single_ms = cost * result.scored_num / len(combos)
+
+    return {
+        "inventory_num": len(inventory_data),
+        "candidate_num": result.candidate_num,
+        "scored_num": result.scored_num,
+        "search_ms": result.search_ms,
+        "calc_ms": result.calc_ms,
+        "single_ms": single_ms,
+        "workers": get_calc_workers(),
+        "best": result.builds[0].expected_damage if result.builds else 0,
+        "current": result.current_damage or 0,
+    }
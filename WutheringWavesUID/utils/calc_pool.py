@@ -0,0 +1,102 @@
+"""
+批量伤害计算进程池
+
+- 进程数由 CalcProcessNum 控制，0 表示不使用多进程，在默认线程池中计算
+- 使用 spawn 启动，子进程启动时注册伤害计算模块；子进程不导入配置包(会注册命令、
+  连接数据库)，所需配置由 initargs 传入
+- 进程池损坏(子进程被杀等)时重建，本次计算退回线程中执行
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from gsuid_core.logger import logger
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+
+
+def _init_worker(warm_up: bool):
+    from .damage.abstract import (
+        DamageDetailRegister,
+        DamageRankRegister,
+        WavesCharRegister,
+        WavesEchoRegister,
+        WavesWeaponRegister,
+    )
+    from .map.damage.register import init_damage_register
+
+    init_damage_register()
+    if warm_up:
+        for register in (
+            WavesWeaponRegister,
+            WavesEchoRegister,
+            WavesCharRegister,
+            DamageDetailRegister,
+            DamageRankRegister,
+        ):
+            register.load_all()
+
+
+def _get_process_num() -> int:
+    from ..wutheringwaves_config import WutheringWavesConfig
+
+    return WutheringWavesConfig.get_config("CalcProcessNum").data
+
+
+def get_calc_workers() -> int:
+    """可并行的计算单元数，不使用多进程时为 1"""
+    return max(_get_process_num(), 1)
+
+
+def get_calc_executor() -> Optional[ProcessPoolExecutor]:
+    global _executor, _executor_workers
+
+    workers = _get_process_num()
+    if workers <= 0:
+        shutdown_calc_executor()
+        return None
+
+    if _executor is not None and _executor_workers != workers:
+        shutdown_calc_executor()
+
+    if _executor is None:
+        from ..wutheringwaves_config import WutheringWavesConfig
+
+        warm_up = WutheringWavesConfig.get_config("DamageWarmUp").data
+        _executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(warm_up,),
+        )
+        _executor_workers = workers
+        logger.info(f"[鸣潮] 伤害计算进程池已启动 进程数: {workers}")
+    return _executor
+
+
+def shutdown_calc_executor():
+    global _executor, _executor_workers
+    if _executor is None:
+        return
+    _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    _executor_workers = 0
+
+
+async def run_in_calc_pool(func: Callable[..., Any], *args) -> Any:
+    """func 与参数需可被 pickle"""
+    loop = asyncio.get_running_loop()
+    executor = get_calc_executor()
+    if executor is None:
+        return await loop.run_in_executor(None, func, *args)
+
+    try:
+        return await loop.run_in_executor(executor, func, *args)
+    except BrokenProcessPool:
+        logger.warning("[鸣潮] 伤害计算进程池已损坏，重建后本次在线程中计算")
+        shutdown_calc_executor()
+        return await loop.run_in_executor(None, func, *args)
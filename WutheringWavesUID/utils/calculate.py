@@ -19,12 +19,18 @@ score_interval = ["c", "b", "a", "s", "ss", "sss"]
 fix_max_score = 50
 
 
-def get_calc_map(ctx: Dict, char_name: str, char_id: Union[int, str]):
+def get_calc_dir(char_name: str, char_id: Union[int, str]) -> Path:
+    """角色评分模板所在目录，没有专属模板时使用 default"""
     if str(char_id) in ID_FULL_CHAR_NAME:
         char_name = ID_FULL_CHAR_NAME[str(char_id)]
     char_path = MAP_PATH / char_name
-    if not char_path.is_dir():
+    if not char_name or not char_path.is_dir():
         char_path = MAP_PATH / "default"
+    return char_path
+
+
+def get_calc_map(ctx: Dict, char_name: str, char_id: Union[int, str]):
+    char_path = get_calc_dir(char_name, char_id)
 
     def check_conditions(file_name):
         condition_path = char_path / file_name
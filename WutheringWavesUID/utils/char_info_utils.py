@@ -1,26 +1,24 @@
-import json
-from typing import Any, Dict, Generator, Union
+from typing import Any, Dict, Generator, List, Optional, Union
 
-import aiofiles
+from ..utils.api.model import RoleDetailData
+from ..utils.api.model_struct import RoleDetailStruct
+from .player_store import (
+    load_player_raw,
+    load_player_role_raw,
+    load_player_role_struct,
+)
 
-from gsuid_core.logger import logger
 
-from ..utils.api.model import RoleDetailData
-from .resource.RESOURCE_PATH import PLAYER_PATH
+async def get_all_role_detail_raw_list(uid: str) -> Union[List[Dict], None]:
+    """每次调用返回新解码的 dict，修改不会影响缓存"""
+    return await load_player_raw(uid)
 
 
 async def get_all_role_detail_info_list(
     uid: str,
 ) -> Union[Generator[RoleDetailData, Any, None], None]:
-    path = PLAYER_PATH / uid / "rawData.json"
-    if not path.exists():
-        return None
-    try:
-        async with aiofiles.open(path, mode="r", encoding="utf-8") as f:
-            player_data = json.loads(await f.read())
-    except Exception as e:
-        logger.exception(f"get role detail info failed {path}:", e)
-        path.unlink(missing_ok=True)
+    player_data = await get_all_role_detail_raw_list(uid)
+    if player_data is None:
         return None
 
     return iter(RoleDetailData(**r) for r in player_data)
@@ -49,3 +47,20 @@ async def get_all_roleid_detail_info_int(
     if not _all:
         return None
     return {r.role.roleId: r for r in _all}
+
+
+async def get_role_detail_info(
+    uid: str, role_id: Union[int, str, List[int], List[str]]
+) -> Optional[RoleDetailData]:
+    """只解码单个角色"""
+    raw = await load_player_role_raw(uid, role_id)
+    if not raw:
+        return None
+    return RoleDetailData(**raw)
+
+
+async def get_role_detail_struct(
+    uid: str, role_id: Union[int, str, List[int], List[str]]
+) -> Optional[RoleDetailStruct]:
+    """只解码单个角色，用于评分/伤害计算"""
+    return await load_player_role_struct(uid, role_id)
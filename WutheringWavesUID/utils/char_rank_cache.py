@@ -0,0 +1,138 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import aiofiles
+
+from gsuid_core.logger import logger
+
+from .atomic_writer import save_json_atomic
+from .cache import TimedCache
+from .calculate import get_calc_dir
+from .map.damage.register import DAMAGE_MODULE_MAP
+from .name_convert import char_id_to_char_name
+from .resource.RESOURCE_PATH import PLAYER_PATH
+from .util import get_version
+
+# 角色评分/伤害计算结果缓存 {roleId: {hash, sign, damage, rank}}
+CHAR_RANK_CACHE_FILE = "charRankCache.json"
+
+UTILS_PATH = Path(__file__).parent
+DAMAGE_MODULE_PATH = UTILS_PATH / "map/damage"
+
+# 计算签名只检查文件修改时间，短时间内复用，修改模板/脚本后无需重启即可生效
+calc_sign_cache = TimedCache(timeout=60, maxsize=200, name="char_rank.calc_sign")
+
+
+def _files_sign(paths: Iterable[Path]) -> str:
+    content = []
+    for path in sorted(paths):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        content.append(f"{path.name}:{stat.st_mtime_ns}:{stat.st_size}")
+    return hashlib.md5("|".join(content).encode()).hexdigest()
+
+
+def _shared_calc_files() -> Iterable[Path]:
+    """所有角色共用的计算代码"""
+    yield from (UTILS_PATH / "damage").glob("*.py")
+    for path in DAMAGE_MODULE_PATH.glob("*.py"):
+        if not path.name.startswith("damage_"):
+            yield path
+    yield UTILS_PATH / "calculate.py"
+    yield UTILS_PATH / "map/calc_score_script.py"
+
+
+def get_calc_sign(role_id: int) -> str:
+    """
+    角色评分/伤害的计算签名: 插件版本 + 共用计算代码 + 角色伤害脚本 + 评分模板目录
+    任一文件变化后签名改变，已缓存的结果失效
+    """
+    sign = calc_sign_cache.get(role_id)
+    if sign is not None:
+        return sign
+
+    shared = calc_sign_cache.get("shared")
+    if shared is None:
+        shared = _files_sign(_shared_calc_files())
+        calc_sign_cache.set("shared", shared)
+
+    char_name = char_id_to_char_name(str(role_id)) or ""
+    files = list(get_calc_dir(char_name, role_id).glob("*.json"))
+    module = DAMAGE_MODULE_MAP.get(str(role_id))
+    if module:
+        files.append(DAMAGE_MODULE_PATH / f"{module}.py")
+    sign = f"{get_version()}|{shared}|{_files_sign(files)}"
+    calc_sign_cache.set(role_id, sign)
+    return sign
+
+
+async def _load_json_map(uid: str, file_name: str) -> Dict[str, Any]:
+    path = PLAYER_PATH / uid / file_name
+    if not path.exists():
+        return {}
+    try:
+        async with aiofiles.open(path, mode="r", encoding="utf-8") as f:
+            data = json.loads(await f.read())
+    except Exception as e:
+        logger.exception(f"load {path} failed:", e)
+        path.unlink(missing_ok=True)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+async def _save_json_map(uid: str, file_name: str, data: Dict[str, Any]):
+    _dir = PLAYER_PATH / uid
+    _dir.mkdir(parents=True, exist_ok=True)
+    await save_json_atomic(_dir / file_name, data)
+
+
+async def load_char_rank_cache(uid: str) -> Dict[str, Dict]:
+    """读取角色评分/期望伤害的持久化缓存"""
+    return await _load_json_map(uid, CHAR_RANK_CACHE_FILE)
+
+
+async def save_char_rank_cache(uid: str, rank_cache: Dict[str, Dict]):
+    await _save_json_map(uid, CHAR_RANK_CACHE_FILE, rank_cache)
+
+
+def get_cached_char_rank(
+    rank_cache: Dict[str, Dict],
+    role_id: int,
+    role_hash: Optional[str],
+    need_expected_damage: bool = False,
+) -> Optional[Dict]:
+    """
+    命中条件: 角色数据哈希一致、计算签名一致(插件版本/伤害脚本/评分模板未变化)，
+    需要期望伤害时缓存也必须包含期望伤害
+    """
+    if not role_hash:
+        return None
+    entry = rank_cache.get(str(role_id))
+    if not entry:
+        return None
+    if entry.get("hash") != role_hash:
+        return None
+    if entry.get("sign") != get_calc_sign(role_id):
+        return None
+    if need_expected_damage and not entry.get("damage"):
+        return None
+    return entry.get("rank")
+
+
+def set_cached_char_rank(
+    rank_cache: Dict[str, Dict],
+    role_id: int,
+    role_hash: str,
+    rank: Dict,
+    need_expected_damage: bool = False,
+):
+    rank_cache[str(role_id)] = {
+        "hash": role_hash,
+        "sign": get_calc_sign(role_id),
+        "damage": need_expected_damage,
+        "rank": rank,
+    }
@@ -1,15 +1,57 @@
-from typing import List, Optional, Union
+import importlib
+import threading
+import time
+from types import FunctionType
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from ...utils.damage.damage import DamageAttribute
 
 
 class WavesRegister(object):
     _id_cls_map = {}
+    # id -> (模块路径, 属性名)，首次查找该 id 时导入
+    _lazy_map: Dict[str, Tuple[str, str]] = {}
+    # (模块路径, 注册函数名)，首次查找时导入并注册整个模块
+    _loader: Optional[Tuple[str, str]] = None
+    # 模块路径 -> 首次导入耗时(ms)
+    _load_cost: Dict[str, float] = {}
+    # 后台预加载在线程中执行
+    _lock = threading.RLock()
 
     @classmethod
     def find_class(cls, _id):
+        clz = cls._id_cls_map.get(_id)
+        if clz is not None:
+            return clz
+        if cls._loader is None and _id not in cls._lazy_map:
+            return None
+
+        with cls._lock:
+            cls._load(_id)
         return cls._id_cls_map.get(_id)
 
+    @classmethod
+    def _load(cls, _id):
+        if cls._loader is not None:
+            module_path, func_name = cls._loader
+            module = cls._import(module_path)
+            getattr(module, func_name)()
+            cls._loader = None
+        if _id in cls._lazy_map:
+            module_path, attr = cls._lazy_map[_id]
+            module = cls._import(module_path)
+            cls._id_cls_map[_id] = getattr(module, attr)
+            del cls._lazy_map[_id]
+
+    @classmethod
+    def load_all(cls):
+        """导入全部未加载的模块，逐个加锁，避免长时间阻塞其他线程的查找"""
+        with cls._lock:
+            cls._load(None)
+        for _id in list(cls._lazy_map.keys()):
+            with cls._lock:
+                cls._load(_id)
+
     @classmethod
     def register_class(cls, _id, _clz):
         # old_cls = cls.find_class(_id)
@@ -17,25 +59,65 @@ class WavesRegister(object):
         #     raise TypeError('%s already register %s for type %s' % (cls, old_cls, _id))
         cls._id_cls_map[_id] = _clz
 
+    @classmethod
+    def register_lazy(cls, _id, module_path: str, attr: str):
+        """只记录 id 对应的模块，首次查找时再导入"""
+        cls._lazy_map[_id] = (module_path, attr)
+
+    @classmethod
+    def set_loader(cls, module_path: str, func_name: str):
+        """
+        首次查找时导入 module_path 并调用其中的 func_name 完成注册
+        module_path 可以是相对于 utils.damage 的路径，如 ".register_weapon"
+        """
+        cls._loader = (module_path, func_name)
+
+    @classmethod
+    def _import(cls, module_path: str):
+        start = time.perf_counter()
+        # 相对路径以本模块所在的包为准
+        module = importlib.import_module(module_path, __package__)
+        # 多个 id 共用同一模块时只记录首次导入
+        cls._load_cost.setdefault(module_path, (time.perf_counter() - start) * 1000)
+        return module
+
+    @classmethod
+    def load_stats(cls) -> Dict[str, float]:
+        return dict(cls._load_cost)
+
 
 class WavesWeaponRegister(WavesRegister):
     _id_cls_map = {}
+    _lazy_map = {}
+    _load_cost = {}
 
 
 class WavesEchoRegister(WavesRegister):
     _id_cls_map = {}
+    _lazy_map = {}
+    _load_cost = {}
 
 
 class WavesCharRegister(WavesRegister):
     _id_cls_map = {}
+    _lazy_map = {}
+    _load_cost = {}
 
 
 class DamageDetailRegister(WavesRegister):
     _id_cls_map = {}
+    _lazy_map = {}
+    _load_cost = {}
 
 
 class DamageRankRegister(WavesRegister):
     _id_cls_map = {}
+    _lazy_map = {}
+    _load_cost = {}
+
+
+# 武器效果实例池上限，超出后整体清空
+WEAPON_INSTANCE_CACHE_SIZE = 4096
 
 
 class WeaponAbstract(object):
@@ -43,6 +125,9 @@ class WeaponAbstract(object):
     type = None
     name = None
 
+    # (类, 武器id, 等级, 突破, 谐振) -> 实例，实例创建后只读
+    _instance_cache: Dict[Tuple, "WeaponAbstract"] = {}
+
     def __init__(
         self,
         weapon_id: Union[str, int],
@@ -87,13 +172,54 @@ class WeaponAbstract(object):
 
         func_list.append("cast_phantom")
 
-        func_list = [x for i, x in enumerate(func_list) if func_list.index(x) == i]
+        dispatch = self._get_dispatch()
+        # 保序去重
+        for func_name in dict.fromkeys(func_list):
+            method = dispatch.get(func_name)
+            if method is not None and method(self, attr, isGroup):
+                return
 
-        for func_name in func_list:
-            method = getattr(self, func_name, None)
-            if callable(method):
-                if method(attr, isGroup):
-                    return
+    @classmethod
+    def get_instance(
+        cls,
+        weapon_id: Union[str, int],
+        weapon_level: int,
+        weapon_breach: Union[int, None] = None,
+        weapon_reson_level: int = 1,
+    ) -> "WeaponAbstract":
+        """按 (武器id, 等级, 突破, 谐振) 复用实例，避免每次计算都重新获取武器详情"""
+        key = (cls, weapon_id, weapon_level, weapon_breach, weapon_reson_level)
+        cache = WeaponAbstract._instance_cache
+        instance = cache.get(key)
+        if instance is None:
+            instance = cls(weapon_id, weapon_level, weapon_breach, weapon_reson_level)
+            if len(cache) >= WEAPON_INSTANCE_CACHE_SIZE:
+                cache.clear()
+            cache[key] = instance
+        return instance
+
+    @classmethod
+    def _get_dispatch(cls) -> Dict[str, Callable]:
+        """
+        方法名 -> 函数，每个类只计算一次
+        未重写的空钩子不放入表中，调用时直接跳过
+        """
+        dispatch = cls.__dict__.get("_dispatch")
+        if dispatch is not None:
+            return dispatch
+
+        dispatch = {}
+        for name in dir(cls):
+            if name.startswith("_"):
+                continue
+            func = getattr(cls, name)
+            if not isinstance(func, FunctionType):
+                continue
+            if func is _WEAPON_HOOKS.get(name):
+                continue
+            dispatch[name] = func
+        cls._dispatch = dispatch
+        return dispatch
 
     def get_title(self):
         return f"{self.name}-{self.weapon_detail.get_resonLevel_name()}"
@@ -162,10 +288,28 @@ class WeaponAbstract(object):
         pass
 
 
+# WeaponAbstract 中的空钩子
+_WEAPON_HOOKS: Dict[str, Callable] = {
+    name: func
+    for name, func in vars(WeaponAbstract).items()
+    if isinstance(func, FunctionType)
+    and name not in ("do_action", "get_title", "param")
+}
+
+
 class EchoAbstract(object):
     name = None
     id = None
 
+    @classmethod
+    def get_instance(cls) -> "EchoAbstract":
+        """声骸效果无状态，每个类只创建一个实例"""
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = cls()
+            cls._instance = instance
+        return instance
+
     def do_echo(self, attr: DamageAttribute, isGroup: bool = False):
         self.damage(attr, isGroup)
 
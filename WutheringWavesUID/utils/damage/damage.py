@@ -1,11 +1,16 @@
-from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, Union
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 from ...utils.api.model import RoleDetailData
+from ...utils.api.model_struct import RoleDetailStruct
 from ...utils.damage.utils import AbnormalType, parse_skill_multi
 from .constants import onlineLevel2EquivalentLevel, spectro_frazzle_effect_atk
 
 
+# 伤害脚本通过 get_effect 读取的效果，不记录过程时也需要保留
+TRACE_KEEP_TITLES = {"默认手法"}
+
+
 class WavesEffect(object):
     def __init__(self, element_msg: str, element_value: Any):
         self.element_msg = element_msg
@@ -22,6 +27,61 @@ class WavesEffect(object):
         return e
 
 
+def format_damage(num: Optional[float]) -> str:
+    """绘图时再格式化为带逗号的整数"""
+    if num is None:
+        return ""
+    return f"{num:,.0f}"
+
+
+@dataclass
+class DamageResult:
+    """
+    伤害计算结果，保留完整精度
+
+    crit_damage 为 None 时只有一个数值(治疗量、护盾量等)，保存在 expected_damage
+    segments 为多段伤害的明细 [(标题, 结果)]
+    split 为 True 时各段分开展示，不合并为总伤害
+    """
+
+    crit_damage: Optional[float] = None
+    expected_damage: float = 0
+    segments: List[Tuple[str, "DamageResult"]] = field(default_factory=list)
+    split: bool = False
+
+    def __iter__(self):
+        # 兼容 crit_damage, expected_damage = calc_damage(attr, role)
+        yield self.crit_damage
+        yield self.expected_damage
+
+    @classmethod
+    def merge(
+        cls, segments: List[Tuple[str, "DamageResult"]], split: bool = False
+    ) -> "DamageResult":
+        """多段伤害求和"""
+        crit_list = [r.crit_damage for _, r in segments]
+        return cls(
+            crit_damage=(
+                None if any(c is None for c in crit_list) else sum(crit_list)  # type: ignore
+            ),
+            expected_damage=sum(r.expected_damage for _, r in segments),
+            segments=segments,
+            split=split,
+        )
+
+    @property
+    def crit_text(self) -> str:
+        if self.split:
+            return " + ".join(r.crit_text for _, r in self.segments)
+        return format_damage(self.crit_damage)
+
+    @property
+    def expected_text(self) -> str:
+        if self.split:
+            return " + ".join(r.expected_text for _, r in self.segments)
+        return format_damage(self.expected_damage)
+
+
 def calc_percent_expression(express) -> float:
     """
     计算包含百分比的数学表达式。
@@ -131,6 +191,7 @@ class DamageAttribute:
         teammate_char_ids: Optional[List[int]] = None,
         env_spectro=False,
         online_level=1,
+        trace=True,
     ):
         """
         初始化 DamageAttribute 类的实例。
@@ -160,10 +221,11 @@ class DamageAttribute:
         :param echo_id: 声骸技能id
         :param char_attr: 角色属性 ["冷凝", "衍射", "导电", "热熔", "气动", "湮灭"]
         :param sync_strike: 协同攻击
+        :param trace: 是否记录计算过程(effect)，排行只需要数值时可关闭
         """
         if teammate_char_ids is None:
             teammate_char_ids = []
-        self.role: Optional[RoleDetailData] = role
+        self.role: Optional[Union[RoleDetailData, RoleDetailStruct]] = role
         # 角色模版 ["temp_atk", "temp_life", "temp_def"]
         self.char_template: Literal["temp_atk", "temp_life", "temp_def"] = char_template
         # 角色基础攻击力
@@ -230,6 +292,8 @@ class DamageAttribute:
         self.energy_regen = energy_regen
         # 效果
         self.effect = []
+        # 是否记录计算过程，伤害脚本与武器/声骸效果只在为 True 时拼接说明文字
+        self.trace = trace
         # 敌人等级
         self.enemy_level = 0
         # 队友id
@@ -254,9 +318,12 @@ class DamageAttribute:
         self.abnormalType = None
 
         if enemy_resistance:
-            self.add_enemy_resistance(
-                enemy_resistance, "敌人抗性", f"{enemy_resistance:.0%}"
-            )
+            if trace:
+                self.add_enemy_resistance(
+                    enemy_resistance, "敌人抗性", f"{enemy_resistance:.0%}"
+                )
+            else:
+                self.add_enemy_resistance(enemy_resistance)
         self.set_enemy_level(enemy_level)
 
     def __str__(self):
@@ -302,11 +369,13 @@ class DamageAttribute:
             f")"
         )
 
-    def set_role(self, role: RoleDetailData):
+    def set_role(self, role: Union[RoleDetailData, RoleDetailStruct]):
         self.role = role
         return self
 
     def add_effect(self, title: str, msg: str):
+        if not self.trace and title not in TRACE_KEEP_TITLES:
+            return
         effect = WavesEffect.add_effect(title, msg)
         if effect is None:
             return
@@ -320,6 +389,8 @@ class DamageAttribute:
 
     def set_enemy_level(self, enemy_level: int):
         self.enemy_level = enemy_level
+        if not self.trace:
+            return self
 
         title = "敌人等级"
         msg = f"{enemy_level}级"
@@ -164,7 +164,7 @@ class Char_1204(CharAbstract):
         weapon_id = 21030015
         weapon_clz = WavesWeaponRegister.find_class(weapon_id)
         if weapon_clz:
-            w = weapon_clz(weapon_id, 90, 6, resonLevel)
+            w = weapon_clz.get_instance(weapon_id, 90, 6, resonLevel)
             w.do_action("buff", attr, isGroup)
 
 
@@ -492,7 +492,7 @@ class Char_1505(CharAbstract):
         # 星序协响
         weapon_clz = WavesWeaponRegister.find_class(21050036)
         if weapon_clz:
-            w = weapon_clz(21050036, 90, 6, resonLevel)
+            w = weapon_clz.get_instance(21050036, 90, 6, resonLevel)
             w.do_action("skill_create_healing", attr, isGroup)
 
         if attr.char_template == temp_atk:
@@ -562,7 +562,7 @@ class Char_1506(CharAbstract):
         # 和光回唱
         weapon_clz = WavesWeaponRegister.find_class(21050046)
         if weapon_clz:
-            w = weapon_clz(21050046, 90, 6, resonLevel)
+            w = weapon_clz.get_instance(21050046, 90, 6, resonLevel)
             method = getattr(w, "cast_extension", None)
             if callable(method):
                 method(attr, isGroup)
@@ -49,7 +49,7 @@ class Weapon_21010015(WeaponAbstract):
             return
         dmg = f"{self.param(1)}*{self.param(2)}"
         title = self.get_title()
-        msg = f"施放共鸣技能时，共鸣解放伤害加成提升{dmg}"
+        msg = f"施放共鸣技能时，共鸣解放伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -66,7 +66,7 @@ class Weapon_21010016(WeaponAbstract):
             return
         dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}"
         title = self.get_title()
-        msg = f"施放变奏技能时，自身重击伤害加成提升{dmg}"
+        msg = f"施放变奏技能时，自身重击伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
     def cast_liberation(self, attr: DamageAttribute, isGroup: bool = False):
@@ -75,7 +75,7 @@ class Weapon_21010016(WeaponAbstract):
             return
         dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}"
         title = self.get_title()
-        msg = f"施放共鸣解放时，自身重击伤害加成提升{dmg}"
+        msg = f"施放共鸣解放时，自身重击伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -103,7 +103,7 @@ class Weapon_21010026(WeaponAbstract):
         # 施放变奏技能时，自身获得【岁蕴】，使共鸣技能伤害加成提升24%
         dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}"
         title = self.get_title()
-        msg = f"施放变奏技能时，使共鸣技能伤害加成提升{dmg}"
+        msg = f"施放变奏技能时，使共鸣技能伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
     def cast_skill(self, attr: DamageAttribute, isGroup: bool = False):
@@ -114,7 +114,7 @@ class Weapon_21010026(WeaponAbstract):
         # 施放共鸣技能时，自身获得【福泽】，使共鸣技能伤害加成提升24%
         dmg = f"{self.weapon_detail.param[3][self.weapon_reson_level - 1]}"
         title = self.get_title()
-        msg = f"施放共鸣技能时，使共鸣技能伤害加成提升{dmg}"
+        msg = f"施放共鸣技能时，使共鸣技能伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -133,7 +133,7 @@ class Weapon_21010034(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(1)}"
             title = self.get_title()
-            msg = f"生命大于{self.param(0)}时，攻击提升{dmg}"
+            msg = f"生命大于{self.param(0)}时，攻击提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -150,7 +150,7 @@ class Weapon_21010036(WeaponAbstract):
             return
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放变奏技能时，共鸣解放伤害提升{dmg}"
+        msg = f"施放变奏技能时，共鸣解放伤害提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -160,7 +160,7 @@ class Weapon_21010036(WeaponAbstract):
             return
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放共鸣解放时，共鸣解放伤害提升{dmg}"
+        msg = f"施放共鸣解放时，共鸣解放伤害提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -170,7 +170,9 @@ class Weapon_21010036(WeaponAbstract):
             return
         dmg = f"{self.param(5)}"
         title = self.get_title()
-        msg = f"施放重击伤害时，使队伍中的角色热熔伤害加成提升{dmg}"
+        msg = (
+            f"施放重击伤害时，使队伍中的角色热熔伤害加成提升{dmg}" if attr.trace else ""
+        )
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -195,13 +197,13 @@ class Weapon_21010044(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}"
             title = self.get_title()
-            msg = f"施放变奏技能时，自身攻击提升{dmg}"
+            msg = f"施放变奏技能时，自身攻击提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
         if attr.char_template == temp_def:
             dmg = f"{self.param(1)}"
             title = self.get_title()
-            msg = f"施放变奏技能时，自身防御提升{dmg}"
+            msg = f"施放变奏技能时，自身防御提升{dmg}" if attr.trace else ""
             attr.add_def_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -216,7 +218,7 @@ class Weapon_21010046(WeaponAbstract):
             return
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放共鸣技能时，重击伤害提升{dmg}"
+        msg = f"施放共鸣技能时，重击伤害提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
     def trigger_shield(self, attr: DamageAttribute, isGroup: bool = False):
@@ -225,7 +227,7 @@ class Weapon_21010046(WeaponAbstract):
             return
         dmg = f"{self.param(3)}*{self.param(4)}"
         title = self.get_title()
-        msg = f"自身获得护盾时，重击伤害无视目标{dmg}防御"
+        msg = f"自身获得护盾时，重击伤害无视目标{dmg}防御" if attr.trace else ""
         attr.add_defense_reduction(calc_percent_expression(dmg), title, msg)
 
 
@@ -255,13 +257,21 @@ class Weapon_21010056(WeaponAbstract):
         title = self.get_title()
         # 施放变奏技能或附加异常效应时，共鸣解放伤害加成提升
         dmg = f"{self.param(1)}*{self.param(2)}"
-        msg = f"施放变奏技能或附加【异常效应】时，共鸣解放伤害加成提升{dmg}"
+        msg = (
+            f"施放变奏技能或附加【异常效应】时，共鸣解放伤害加成提升{dmg}"
+            if attr.trace
+            else ""
+        )
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
         # 千咲：满层时，附加异常效应时全属性伤害加成
         if attr.role and attr.role.role.roleId == 1508:
             dmg2 = f"{self.param(4)}"
-            msg = f"满层时附加【异常效应】，全属性伤害加成提升{dmg2}"
+            msg = (
+                f"满层时附加【异常效应】，全属性伤害加成提升{dmg2}"
+                if attr.trace
+                else ""
+            )
             attr.add_dmg_bonus(calc_percent_expression(dmg2), title, msg)
 
 
@@ -282,7 +292,7 @@ class Weapon_21010064(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(2)}*{self.param(3)}"
             title = self.get_title()
-            msg = f"施放共鸣技能后，每2秒攻击提升{dmg}"
+            msg = f"施放共鸣技能后，每2秒攻击提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -296,7 +306,7 @@ class Weapon_21010074(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
-            msg = f"施放普攻时，自身攻击提升{dmg}"
+            msg = f"施放普攻时，自身攻击提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
             return True
 
@@ -305,7 +315,7 @@ class Weapon_21010074(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
-            msg = f"施放重击伤害时，自身攻击提升{dmg}"
+            msg = f"施放重击伤害时，自身攻击提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
             return True
 
@@ -322,7 +332,11 @@ class Weapon_21010084(WeaponAbstract):
             return
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
+        msg = (
+            f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
+            if attr.trace
+            else ""
+        )
         attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -344,7 +358,11 @@ class Weapon_21010094(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}*{self.param(2)}"
             title = self.get_title()
-            msg = f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
+            msg = (
+                f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
+                if attr.trace
+                else ""
+            )
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -359,13 +377,13 @@ class Weapon_21010104(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}"
             title = self.get_title()
-            msg = f"施放共鸣解放时，攻击提升{dmg}"
+            msg = f"施放共鸣解放时，攻击提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
         if attr.char_damage == hit_damage:
             dmg = f"{self.param(1)}"
             title = self.get_title()
-            msg = f"施放共鸣解放时，重击伤害加成提升{dmg}"
+            msg = f"施放共鸣解放时，重击伤害加成提升{dmg}" if attr.trace else ""
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -397,7 +415,7 @@ class Weapon_21020015(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}*{self.weapon_detail.param[2][self.weapon_reson_level - 1]}"
             title = self.get_title()
-            msg = f"施放共鸣技能时，攻击提升{dmg}"
+            msg = f"施放共鸣技能时，攻击提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
             return True
 
@@ -414,7 +432,7 @@ class Weapon_21020016(WeaponAbstract):
 
         dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}*14"
         title = self.get_title()
-        msg = f"每层【灼羽】使共鸣技能伤害加成提升{dmg}"
+        msg = f"每层【灼羽】使共鸣技能伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -431,13 +449,13 @@ class Weapon_21020017(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg1 = f"{self.weapon_detail.param[3][self.weapon_reson_level - 1]}*{self.weapon_detail.param[5][self.weapon_reson_level - 1]}"
             attr.add_atk_percent(calc_percent_expression(dmg1))
-            msg = f"【凶猛】为10层时，攻击提升{dmg1}"
+            msg = f"【凶猛】为10层时，攻击提升{dmg1}" if attr.trace else ""
             attr.add_effect(title, msg)
 
         dmg2 = f"{self.weapon_detail.param[7][self.weapon_reson_level - 1]}"
         attr.add_crit_rate(calc_percent_expression(dmg2))
         title = self.get_title()
-        msg = f"【凶猛】为10层时， 暴击率提升{dmg2}"
+        msg = f"【凶猛】为10层时， 暴击率提升{dmg2}" if attr.trace else ""
         attr.add_effect(title, msg)
 
     def cast_attack(self, attr: DamageAttribute, isGroup: bool = False):
@@ -487,7 +505,7 @@ class Weapon_21020026(WeaponAbstract):
         else:
             dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}*{self.weapon_detail.param[3][self.weapon_reson_level - 1]}"
         title = self.get_title()
-        msg = f"普攻伤害加成提升{dmg}"
+        msg = f"普攻伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -507,7 +525,11 @@ class Weapon_21020034(WeaponAbstract):
         if attr.char_damage == hit_damage:
             dmg = f"{self.param(1)}"
             title = self.get_title()
-            msg = f"生命低于{self.param(0)}时，重击伤害加成提升{dmg}"
+            msg = (
+                f"生命低于{self.param(0)}时，重击伤害加成提升{dmg}"
+                if attr.trace
+                else ""
+            )
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -524,7 +546,7 @@ class Weapon_21020036(WeaponAbstract):
 
         dmg = f"{self.param(3)}"
         title = self.get_title()
-        msg = f"造成普攻伤害时，普攻伤害加成提升{dmg}"
+        msg = f"造成普攻伤害时，普攻伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
     def cast_liberation(self, attr: DamageAttribute, isGroup: bool = False):
@@ -533,7 +555,7 @@ class Weapon_21020036(WeaponAbstract):
             return
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放共鸣解放后，普攻伤害加成提升{dmg}"
+        msg = f"施放共鸣解放后，普攻伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -559,7 +581,7 @@ class Weapon_21020044(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}"
             title = self.get_title()
-            msg = f"施放变奏技能时，自身攻击提升{dmg}"
+            msg = f"施放变奏技能时，自身攻击提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -574,7 +596,7 @@ class Weapon_21020046(WeaponAbstract):
             return
         dmg = f"{self.param(0)}"
         title = self.get_title()
-        msg = f"造成治疗时，自身共鸣技能伤害提升{dmg}"
+        msg = f"造成治疗时，自身共鸣技能伤害提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
     def cast_skill(self, attr: DamageAttribute, isGroup: bool = False):
@@ -584,7 +606,11 @@ class Weapon_21020046(WeaponAbstract):
         if attr.role and attr.role.role.roleId in [1406, 1408]:
             dmg = f"{self.param(2)}"
             title = self.get_title()
-            msg = f"风主施放共鸣技能时，附近队伍中登场角色气动伤害加深{dmg}"
+            msg = (
+                f"风主施放共鸣技能时，附近队伍中登场角色气动伤害加深{dmg}"
+                if attr.trace
+                else ""
+            )
             attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
 
 
@@ -604,12 +630,20 @@ class Weapon_21020056(WeaponAbstract):
         if attr.env_aero_erosion:
             dmg = f"{self.param(2)}"
             title = self.get_title()
-            msg = f"当目标的风蚀效应不少于1层时，对目标造成的伤害加深{dmg}"
+            msg = (
+                f"当目标的风蚀效应不少于1层时，对目标造成的伤害加深{dmg}"
+                if attr.trace
+                else ""
+            )
             attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
 
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放变奏技能或普攻后15秒内，自身造成伤害无视目标{dmg}防御"
+        msg = (
+            f"施放变奏技能或普攻后15秒内，自身造成伤害无视目标{dmg}防御"
+            if attr.trace
+            else ""
+        )
         attr.add_defense_reduction(calc_percent_expression(dmg), title, msg)
 
 
@@ -630,7 +664,11 @@ class Weapon_21020064(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(1)}*{self.param(2)}"
             title = self.get_title()
-            msg = f"角色登场后获得{self.param(0)}层【守誓】效果，使攻击提升{dmg}"
+            msg = (
+                f"角色登场后获得{self.param(0)}层【守誓】效果，使攻击提升{dmg}"
+                if attr.trace
+                else ""
+            )
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -646,7 +684,7 @@ class Weapon_21020066(WeaponAbstract):
         if attr.char_damage == hit_damage:
             dmg = f"{self.param(2)}%*2"
             title = self.get_title()
-            msg = f"施放声骸技能时，重击伤害加成提升{dmg}"
+            msg = f"施放声骸技能时，重击伤害加成提升{dmg}" if attr.trace else ""
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -661,13 +699,13 @@ class Weapon_21020074(WeaponAbstract):
         if attr.char_damage == attack_damage:
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
-            msg = f"施放共鸣技能时，自身普攻加成提升{dmg}"
+            msg = f"施放共鸣技能时，自身普攻加成提升{dmg}" if attr.trace else ""
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
         if attr.char_damage == hit_damage:
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
-            msg = f"施放共鸣技能时，自身重击加成提升{dmg}"
+            msg = f"施放共鸣技能时，自身重击加成提升{dmg}" if attr.trace else ""
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -683,7 +721,11 @@ class Weapon_21020084(WeaponAbstract):
             return
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
+        msg = (
+            f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
+            if attr.trace
+            else ""
+        )
         attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -705,7 +747,11 @@ class Weapon_21020094(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}*{self.param(2)}"
             title = self.get_title()
-            msg = f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
+            msg = (
+                f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
+                if attr.trace
+                else ""
+            )
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -720,13 +766,13 @@ class Weapon_21020104(WeaponAbstract):
         if attr.char_damage == liberation_damage:
             dmg = f"{self.param(1)}"
             title = self.get_title()
-            msg = f"施放共鸣解放时，共鸣解放伤害加成提升{dmg}"
+            msg = f"施放共鸣解放时，共鸣解放伤害加成提升{dmg}" if attr.trace else ""
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}"
             title = self.get_title()
-            msg = f"施放共鸣解放时，攻击提升{dmg}"
+            msg = f"施放共鸣解放时，攻击提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -759,7 +805,7 @@ class Weapon_21030015(WeaponAbstract):
             if attr.char_template == temp_atk:
                 dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}*{self.weapon_detail.param[2][self.weapon_reson_level - 1]}"
                 title = self.get_title()
-                msg = f"施放延奏技能后，入场角色攻击提升{dmg}"
+                msg = f"施放延奏技能后，入场角色攻击提升{dmg}" if attr.trace else ""
                 attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -776,7 +822,7 @@ class Weapon_21030016(WeaponAbstract):
             return
         dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}"
         title = self.get_title()
-        msg = f"施放变奏技能时，自身共鸣技能伤害加成提升{dmg}"
+        msg = f"施放变奏技能时，自身共鸣技能伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -786,7 +832,7 @@ class Weapon_21030016(WeaponAbstract):
             return
         dmg = f"{self.weapon_detail.param[1][self.weapon_reson_level - 1]}"
         title = self.get_title()
-        msg = f"施放共鸣解放时，自身共鸣技能伤害加成提升{dmg}"
+        msg = f"施放共鸣解放时，自身共鸣技能伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -816,13 +862,19 @@ class Weapon_21030026(WeaponAbstract):
         # 为目标添加【风蚀效应】后，自身气动伤害加成提升24%。
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"为目标添加【风蚀效应】后，自身气动伤害加成提升{dmg}"
+        msg = (
+            f"为目标添加【风蚀效应】后，自身气动伤害加成提升{dmg}" if attr.trace else ""
+        )
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
         # 攻击命中带有【风蚀效应】的敌人时，降低对方10%的气动抗性
         dmg = f"{self.param(3)}"
         title = self.get_title()
-        msg = f"攻击命中带有【风蚀效应】的敌人时，降低对方{dmg}的气动抗性"
+        msg = (
+            f"攻击命中带有【风蚀效应】的敌人时，降低对方{dmg}的气动抗性"
+            if attr.trace
+            else ""
+        )
         attr.add_enemy_resistance(-calc_percent_expression(dmg), title, msg)
 
 
@@ -850,14 +902,14 @@ class Weapon_21030036(WeaponAbstract):
             return False
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"造成声骸技能伤害时，重击伤害加深{dmg}"
+        msg = f"造成声骸技能伤害时，重击伤害加深{dmg}" if attr.trace else ""
         attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
 
         # 嘉贝莉娜
         if attr.role and attr.role.role.roleId == 1208:
             dmg = f"{self.param(6)}"
             title = self.get_title()
-            msg = f"无视目标{dmg}防御"
+            msg = f"无视目标{dmg}防御" if attr.trace else ""
             attr.add_defense_reduction(calc_percent_expression(dmg), title, msg)
 
         return True
@@ -868,14 +920,14 @@ class Weapon_21030036(WeaponAbstract):
             return False
         dmg = f"{self.param(3)}"
         title = self.get_title()
-        msg = f"造成重击伤害时，声骸技能伤害加深{dmg}"
+        msg = f"造成重击伤害时，声骸技能伤害加深{dmg}" if attr.trace else ""
         attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
 
         # 嘉贝莉娜
         if attr.role and attr.role.role.roleId == 1208:
             dmg = f"{self.param(6)}"
             title = self.get_title()
-            msg = f"无视目标{dmg}防御"
+            msg = f"无视目标{dmg}防御" if attr.trace else ""
             attr.add_defense_reduction(calc_percent_expression(dmg), title, msg)
 
         return True
@@ -910,7 +962,7 @@ class Weapon_21030064(WeaponAbstract):
 
         dmg = f"{self.param(0)}*{self.param(2)}"
         title = self.get_title()
-        msg = f"角色冲刺或闪避时，攻击提升{dmg}"
+        msg = f"角色冲刺或闪避时，攻击提升{dmg}" if attr.trace else ""
         attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -926,7 +978,9 @@ class Weapon_21030074(WeaponAbstract):
             return
         dmg = f"{self.param(0)}*{self.param(1)}"
         title = self.get_title()
-        msg = f"造成普攻或重击伤害时，自身共鸣技能伤害加成提升{dmg}"
+        msg = (
+            f"造成普攻或重击伤害时，自身共鸣技能伤害加成提升{dmg}" if attr.trace else ""
+        )
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -936,7 +990,9 @@ class Weapon_21030074(WeaponAbstract):
             return
         dmg = f"{self.param(0)}*{self.param(1)}"
         title = self.get_title()
-        msg = f"造成普攻或重击伤害时，自身共鸣技能伤害加成提升{dmg}"
+        msg = (
+            f"造成普攻或重击伤害时，自身共鸣技能伤害加成提升{dmg}" if attr.trace else ""
+        )
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -953,7 +1009,11 @@ class Weapon_21030084(WeaponAbstract):
             return
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
+        msg = (
+            f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
+            if attr.trace
+            else ""
+        )
         attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -975,7 +1035,11 @@ class Weapon_21030094(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}*{self.param(2)}"
             title = self.get_title()
-            msg = f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
+            msg = (
+                f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
+                if attr.trace
+                else ""
+            )
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -990,13 +1054,13 @@ class Weapon_21030104(WeaponAbstract):
         if attr.char_damage == hit_damage:
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
-            msg = f"造成普攻伤害时，重击伤害加成提升{dmg}"
+            msg = f"造成普攻伤害时，重击伤害加成提升{dmg}" if attr.trace else ""
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
         if attr.char_damage == attack_damage:
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
-            msg = f"造成普攻伤害时，攻击伤害加成提升{dmg}"
+            msg = f"造成普攻伤害时，攻击伤害加成提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -1005,13 +1069,13 @@ class Weapon_21030104(WeaponAbstract):
         if attr.char_damage == hit_damage:
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
-            msg = f"造成重击伤害时，重击伤害加成提升{dmg}"
+            msg = f"造成重击伤害时，重击伤害加成提升{dmg}" if attr.trace else ""
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
         if attr.char_damage == attack_damage:
             dmg = f"{self.param(0)}*{self.param(1)}"
             title = self.get_title()
-            msg = f"造成重击伤害时，攻击伤害加成提升{dmg}"
+            msg = f"造成重击伤害时，攻击伤害加成提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -1046,7 +1110,7 @@ class Weapon_21040015(WeaponAbstract):
             return
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"造成共鸣技能伤害时，普攻伤害加成提升{dmg}"
+        msg = f"造成共鸣技能伤害时，普攻伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
     def cast_attack(self, attr: DamageAttribute, isGroup: bool = False):
@@ -1056,7 +1120,7 @@ class Weapon_21040015(WeaponAbstract):
 
         dmg = f"{self.param(3)}"
         title = self.get_title()
-        msg = f"造成普攻伤害时，共鸣技能伤害加成提升{dmg}"
+        msg = f"造成普攻伤害时，共鸣技能伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -1073,7 +1137,7 @@ class Weapon_21040016(WeaponAbstract):
         # 施放共鸣解放时，自身共鸣解放伤害加成提升48%，持续8秒；施放共鸣技能时，该效果延长5秒，最多可延长3次。
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放共鸣解放时，自身共鸣解放伤害加成提升{dmg}"
+        msg = f"施放共鸣解放时，自身共鸣解放伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -1103,7 +1167,7 @@ class Weapon_21040026(WeaponAbstract):
         # 攻击提升12%。施放普攻或变奏技能时，自身重击伤害加成提升48%，持续3秒。
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放普攻技能时，自身重击伤害加成提升{dmg}"
+        msg = f"施放普攻技能时，自身重击伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -1115,7 +1179,7 @@ class Weapon_21040026(WeaponAbstract):
         # 攻击提升12%。施放普攻或变奏技能时，自身重击伤害加成提升48%，持续3秒。
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放变奏技能时，自身重击伤害加成提升{dmg}"
+        msg = f"施放变奏技能时，自身重击伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -1137,7 +1201,7 @@ class Weapon_21040034(WeaponAbstract):
 
         dmg = f"{self.param(0)}"
         title = self.get_title()
-        msg = f"冲刺或冲刺时，攻击提升{dmg}"
+        msg = f"冲刺或冲刺时，攻击提升{dmg}" if attr.trace else ""
         attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -1151,13 +1215,13 @@ class Weapon_21040036(WeaponAbstract):
         # 攻击提升12%。施放普攻时，获得以下效果：自身造成伤害无视目标8%防御。
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放普攻技能时，自身造成伤害无视目标{dmg}防御"
+        msg = f"施放普攻技能时，自身造成伤害无视目标{dmg}防御" if attr.trace else ""
         attr.add_defense_reduction(calc_percent_expression(dmg), title, msg)
 
         if attr.env_spectro_deepen:
             dmg = f"{self.param(2)}"
             title = self.get_title()
-            msg = f"自身直接造成的【光噪效应】伤害加深{dmg}"
+            msg = f"自身直接造成的【光噪效应】伤害加深{dmg}" if attr.trace else ""
             attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
 
 
@@ -1179,7 +1243,7 @@ class Weapon_21040044(WeaponAbstract):
             return
         dmg = f"{self.param(0)}"
         title = self.get_title()
-        msg = f"施放变奏技能时，自身共鸣解放伤害加成提升{dmg}"
+        msg = f"施放变奏技能时，自身共鸣解放伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -1197,12 +1261,12 @@ class Weapon_21040046(WeaponAbstract):
             return
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放变奏技能时，自身共鸣解放伤害加成提升{dmg}"
+        msg = f"施放变奏技能时，自身共鸣解放伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
         dmg = f"{self.param(3)}*{self.param(5)}"
         title = self.get_title()
-        msg = f"自身获得护盾时，共鸣解放伤害无视目标{dmg}防御"
+        msg = f"自身获得护盾时，共鸣解放伤害无视目标{dmg}防御" if attr.trace else ""
         attr.add_defense_reduction(calc_percent_expression(dmg), title, msg)
 
         return True
@@ -1215,12 +1279,12 @@ class Weapon_21040046(WeaponAbstract):
             return
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放共鸣解放时，自身共鸣解放伤害加成提升{dmg}"
+        msg = f"施放共鸣解放时，自身共鸣解放伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
         dmg = f"{self.param(3)}*{self.param(5)}"
         title = self.get_title()
-        msg = f"自身获得护盾时，共鸣解放伤害无视目标{dmg}防御"
+        msg = f"自身获得护盾时，共鸣解放伤害无视目标{dmg}防御" if attr.trace else ""
         attr.add_defense_reduction(calc_percent_expression(dmg), title, msg)
 
         return True
@@ -1243,12 +1307,20 @@ class Weapon_21040064(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(1)}*{self.param(0)}"
             title = self.get_title()
-            msg = f"施放共鸣解放时，获得3层【铁甲】效果，使攻击提升{dmg}"
+            msg = (
+                f"施放共鸣解放时，获得3层【铁甲】效果，使攻击提升{dmg}"
+                if attr.trace
+                else ""
+            )
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
         dmg = f"{self.param(1)}*{self.param(0)}"
         title = self.get_title()
-        msg = f"施放共鸣解放时，获得3层【铁甲】效果，使防御提升{dmg}"
+        msg = (
+            f"施放共鸣解放时，获得3层【铁甲】效果，使防御提升{dmg}"
+            if attr.trace
+            else ""
+        )
         attr.add_def_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -1263,7 +1335,7 @@ class Weapon_21040074(WeaponAbstract):
             return
         dmg = f"{self.param(0)}"
         title = self.get_title()
-        msg = f"施放共鸣技能时，自身共鸣解放伤害加成提升{dmg}"
+        msg = f"施放共鸣技能时，自身共鸣解放伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -1280,7 +1352,11 @@ class Weapon_21040084(WeaponAbstract):
             return
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
+        msg = (
+            f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
+            if attr.trace
+            else ""
+        )
         attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -1302,7 +1378,11 @@ class Weapon_21040094(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}*{self.param(2)}"
             title = self.get_title()
-            msg = f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
+            msg = (
+                f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
+                if attr.trace
+                else ""
+            )
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -1317,13 +1397,13 @@ class Weapon_21040104(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}"
             title = self.get_title()
-            msg = f"施放共鸣解放时，攻击提升{dmg}"
+            msg = f"施放共鸣解放时，攻击提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
         if attr.char_damage == liberation_damage:
             dmg = f"{self.param(1)}"
             title = self.get_title()
-            msg = f"施放共鸣解放时，共鸣解放伤害加成提升{dmg}"
+            msg = f"施放共鸣解放时，共鸣解放伤害加成提升{dmg}" if attr.trace else ""
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -1358,7 +1438,7 @@ class Weapon_21050015(WeaponAbstract):
 
         dmg = f"{self.param(1)}*{self.param(2)}"
         title = self.get_title()
-        msg = f"造成普攻伤害时，普攻伤害加成提升{dmg}"
+        msg = f"造成普攻伤害时，普攻伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -1377,11 +1457,11 @@ class Weapon_21050016(WeaponAbstract):
 
         dmg1 = f"{self.param(1)}*{self.param(2)}"
         title = self.get_title()
-        msg = f"造成共鸣技能伤害时，自身攻击提升{dmg1}"
+        msg = f"造成共鸣技能伤害时，自身攻击提升{dmg1}" if attr.trace else ""
         attr.add_atk_percent(calc_percent_expression(dmg1), title, msg)
         if attr.sync_strike:
             dmg2 = f"{self.param(4)}"
-            msg = f"自身不在场时，该效果攻击额外提升{dmg2}"
+            msg = f"自身不在场时，该效果攻击额外提升{dmg2}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg2), title, msg)
 
 
@@ -1398,7 +1478,7 @@ class Weapon_21050017(WeaponAbstract):
 
         dmg = f"{self.param(0)}"
         title = self.get_title()
-        msg = f"施放共鸣解放时，自身治疗效果加成提升{dmg}"
+        msg = f"施放共鸣解放时，自身治疗效果加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -1427,7 +1507,7 @@ class Weapon_21050026(WeaponAbstract):
         if attr.sync_strike:
             dmg = f"{self.param(5)}"
             title = self.get_title()
-            msg = f"使自身不在场时普攻伤害加成提升{dmg}"
+            msg = f"使自身不在场时普攻伤害加成提升{dmg}" if attr.trace else ""
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         else:
             buff_layer = int(self.param(2))
@@ -1441,7 +1521,9 @@ class Weapon_21050026(WeaponAbstract):
 
             dmg = f"{self.param(1)}*{buff_layer}"
             title = self.get_title()
-            msg = f"施放共鸣技能时，自身在场时普攻伤害加成提升{dmg}"
+            msg = (
+                f"施放共鸣技能时，自身在场时普攻伤害加成提升{dmg}" if attr.trace else ""
+            )
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -1463,7 +1545,11 @@ class Weapon_21050027(WeaponAbstract):
             return
         dmg = f"{self.param(0)*4}"
         title = self.get_title()
-        msg = f"对带有【光噪效应】的敌人造成伤害时获得效果：自身衍射伤害提升{dmg}"
+        msg = (
+            f"对带有【光噪效应】的敌人造成伤害时获得效果：自身衍射伤害提升{dmg}"
+            if attr.trace
+            else ""
+        )
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -1479,7 +1565,11 @@ class Weapon_21050034(WeaponAbstract):
             return
         dmg = f"{self.param(5)}"
         title = self.get_title()
-        msg = f"施放共鸣技能时，若角色生命高于{self.param(4)}，则攻击提升{dmg}"
+        msg = (
+            f"施放共鸣技能时，若角色生命高于{self.param(4)}，则攻击提升{dmg}"
+            if attr.trace
+            else ""
+        )
         attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -1494,7 +1584,7 @@ class Weapon_21050036(WeaponAbstract):
             return
         dmg = f"{self.weapon_detail.param[4][self.weapon_reson_level - 1]}"
         title = self.get_title()
-        msg = f"使附近队伍中所有角色的攻击提升{dmg}"
+        msg = f"使附近队伍中所有角色的攻击提升{dmg}" if attr.trace else ""
         attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -1515,13 +1605,13 @@ class Weapon_21050044(WeaponAbstract):
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}"
             title = self.get_title()
-            msg = f"施放变奏技能时，自身攻击提升{dmg}"
+            msg = f"施放变奏技能时，自身攻击提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
         if attr.char_template == temp_life:
             dmg = f"{self.param(1)}"
             title = self.get_title()
-            msg = f"施放变奏技能时，自身生命提升{dmg}"
+            msg = f"施放变奏技能时，自身生命提升{dmg}" if attr.trace else ""
             attr.add_life_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -1552,7 +1642,7 @@ class Weapon_21050046(WeaponAbstract):
         # 对附加了【光噪效应】的目标造成伤害时，自身普攻、重击伤害加成提升14%，可以叠加3层。
         dmg = f"{self.param(1)}*{self.param(2)}"
         title = self.get_title()
-        msg = f"光噪效应状态下，自身普攻、重击伤害加成提升{dmg}"
+        msg = f"光噪效应状态下，自身普攻、重击伤害加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
     def cast_extension(self, attr: DamageAttribute, isGroup: bool = False):
@@ -1566,7 +1656,9 @@ class Weapon_21050046(WeaponAbstract):
         # 施放延奏技能时，使队伍中登场角色周围的目标受到【光噪效应】伤害加深30%，持续30秒
         dmg = f"{self.param(4)}"
         title = self.get_title()
-        msg = f"施放延奏技能时，使登场角色【光噪效应】伤害加深{dmg}"
+        msg = (
+            f"施放延奏技能时，使登场角色【光噪效应】伤害加深{dmg}" if attr.trace else ""
+        )
         attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
 
 
@@ -1592,13 +1684,13 @@ class Weapon_21050056(WeaponAbstract):
         if attr.char_damage == attack_damage:
             dmg = f"{self.param(6)}"
             title = self.get_title()
-            msg = f"普攻伤害加成提升{dmg}"
+            msg = f"普攻伤害加成提升{dmg}" if attr.trace else ""
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
         if attr.role and attr.role.role.roleId == 1607:
             dmg = f"{self.param(8)}"
             title = self.get_title()
-            msg = f"无视目标{dmg}%湮灭属性抗性"
+            msg = f"无视目标{dmg}%湮灭属性抗性" if attr.trace else ""
             attr.add_enemy_resistance(-calc_percent_expression(dmg), title, msg)
 
 
@@ -1614,7 +1706,7 @@ class Weapon_21050064(WeaponAbstract):
             return
         dmg = f"{self.param(0)}*{self.param(2)}"
         title = self.get_title()
-        msg = f"造成普攻伤害时，治疗效果加成提升{dmg}"
+        msg = f"造成普攻伤害时，治疗效果加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -1624,7 +1716,7 @@ class Weapon_21050064(WeaponAbstract):
             return
         dmg = f"{self.param(0)}*{self.param(2)}"
         title = self.get_title()
-        msg = f"造成重击伤害时，治疗效果加成提升{dmg}"
+        msg = f"造成重击伤害时，治疗效果加成提升{dmg}" if attr.trace else ""
         attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -1640,18 +1732,18 @@ class Weapon_21050066(WeaponAbstract):
         # 无视目标8%防御
         dmg = f"{self.param(4)}"
         title = self.get_title()
-        msg = f"造成声骸技能伤害后，无视目标{dmg}%防御"
+        msg = f"造成声骸技能伤害后，无视目标{dmg}%防御" if attr.trace else ""
         attr.add_defense_reduction(calc_percent_expression(dmg), title, msg)
         if attr.char_damage == phantom_damage:
             dmg = f"{self.param(3)}"
             title = self.get_title()
-            msg = f"造成声骸技能伤害后，声骸技能伤害加深{dmg}"
+            msg = f"造成声骸技能伤害后，声骸技能伤害加深{dmg}" if attr.trace else ""
             attr.add_dmg_deepen(calc_percent_expression(dmg), title, msg)
 
         if attr.char_damage == skill_damage:
             dmg = f"{self.param(2)}"
             title = self.get_title()
-            msg = f"造成声骸技能伤害后，共鸣技能伤害加成提升{dmg}"
+            msg = f"造成声骸技能伤害后，共鸣技能伤害加成提升{dmg}" if attr.trace else ""
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
 
@@ -1668,7 +1760,7 @@ class Weapon_21050074(WeaponAbstract):
 
         dmg = f"{self.param(0)}"
         title = self.get_title()
-        msg = f"施放共鸣解放时，自身攻击提升{dmg}"
+        msg = f"施放共鸣解放时，自身攻击提升{dmg}" if attr.trace else ""
         attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -1684,7 +1776,11 @@ class Weapon_21050084(WeaponAbstract):
             return
         dmg = f"{self.param(1)}"
         title = self.get_title()
-        msg = f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
+        msg = (
+            f"施放共鸣技能时，获得{self.param(0)}点共鸣能量，且攻击提升{dmg}"
+            if attr.trace
+            else ""
+        )
         attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
         return True
 
@@ -1704,7 +1800,11 @@ class Weapon_21050094(WeaponAbstract):
         if attr.is_env_abnormal and attr.char_template == temp_atk:
             dmg = f"{self.param(0)}*{self.param(2)}"
             title = self.get_title()
-            msg = f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
+            msg = (
+                f"对带有【异常效应】的怪物造成伤害时，自身攻击提升{dmg}"
+                if attr.trace
+                else ""
+            )
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -1719,13 +1819,13 @@ class Weapon_21050104(WeaponAbstract):
         if attr.char_damage == attack_damage:
             dmg = f"{self.param(0)}"
             title = self.get_title()
-            msg = f"施放共鸣技能时，普攻伤害加成提升{dmg}"
+            msg = f"施放共鸣技能时，普攻伤害加成提升{dmg}" if attr.trace else ""
             attr.add_dmg_bonus(calc_percent_expression(dmg), title, msg)
 
         if attr.char_template == temp_atk:
             dmg = f"{self.param(0)}"
             title = self.get_title()
-            msg = f"施放共鸣技能时，攻击加成提升{dmg}"
+            msg = f"施放共鸣技能时，攻击加成提升{dmg}" if attr.trace else ""
             attr.add_atk_percent(calc_percent_expression(dmg), title, msg)
 
 
@@ -135,15 +135,3 @@ def parse_skill_multi(temp):
         return value, percent
     return 0, 0
 
-
-def add_comma_separated_numbers(*nums: str) -> str:
-    """
-    接受多个带逗号的数字字符串，去除逗号后进行加法计算，并返回结果，结果也带逗号。
-    :return: 计算后的整数和，格式化为带逗号的字符串
-    """
-    total = sum(float(num.replace(",", "")) for num in nums)
-    return f"{total:,.0f}"
-
-
-def comma_separated_number(num: str):
-    return float(num.replace(",", ""))
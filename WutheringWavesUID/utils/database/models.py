@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
 from sqlalchemy import delete, null, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,11 +21,13 @@ exec_list.extend(
         'ALTER TABLE WavesUser ADD COLUMN bbs_sign_switch TEXT DEFAULT "off"',
         'ALTER TABLE WavesUser ADD COLUMN bat TEXT DEFAULT ""',
         'ALTER TABLE WavesUser ADD COLUMN did TEXT DEFAULT ""',
+        "ALTER TABLE WavesPush ADD COLUMN resin_check_time INTEGER DEFAULT 0",
     ]
 )
 
 T_WavesBind = TypeVar("T_WavesBind", bound="WavesBind")
 T_WavesUser = TypeVar("T_WavesUser", bound="WavesUser")
+T_WavesPush = TypeVar("T_WavesPush", bound="WavesPush")
 
 
 class WavesBind(Bind, table=True):
@@ -281,6 +283,71 @@ class WavesPush(Push, table=True):
     )
     resin_value: Optional[int] = Field(title="体力阈值", default=180)
     resin_is_push: Optional[str] = Field(title="体力是否已推送", default="off")
+    resin_check_time: Optional[int] = Field(title="体力下次检查时间", default=0)
+
+    @classmethod
+    @with_session
+    async def select_push_data(
+        cls: Type[T_WavesPush], session: AsyncSession, uid: str, bot_id: str
+    ) -> Optional[T_WavesPush]:
+        sql = select(cls).where(cls.uid == uid, cls.bot_id == bot_id)
+        result = await session.execute(sql)
+        data = result.scalars().all()
+        return data[0] if data else None
+
+    @classmethod
+    @with_session
+    async def get_all_resin_push(
+        cls: Type[T_WavesPush], session: AsyncSession
+    ) -> List[T_WavesPush]:
+        """获取所有开启体力推送的数据"""
+        sql = select(cls).where(
+            and_(
+                col(cls.resin_push) != null(),
+                col(cls.resin_push) != "off",
+            )
+        )
+        result = await session.execute(sql)
+        data = result.scalars().all()
+        return list(data)
+
+    @classmethod
+    @with_session
+    async def set_resin_state(
+        cls: Type[T_WavesPush],
+        session: AsyncSession,
+        states: List[Tuple[str, str, str, int]],
+    ):
+        """批量更新体力推送状态 [(uid, bot_id, resin_is_push, resin_check_time)]"""
+        for uid, bot_id, is_push, check_time in states:
+            await session.execute(
+                update(cls)
+                .where(col(cls.uid) == uid, col(cls.bot_id) == bot_id)
+                .values(resin_is_push=is_push, resin_check_time=check_time)
+            )
+        return True
+
+    @classmethod
+    @with_session
+    async def set_push_data(
+        cls: Type[T_WavesPush],
+        session: AsyncSession,
+        uid: str,
+        bot_id: str,
+        **data,
+    ):
+        """更新推送设置，不存在时新建"""
+        sql = select(cls).where(cls.uid == uid, cls.bot_id == bot_id)
+        result = await session.execute(sql)
+        if result.scalars().first():
+            await session.execute(
+                update(cls)
+                .where(col(cls.uid) == uid, col(cls.bot_id) == bot_id)
+                .values(**data)
+            )
+        else:
+            session.add(cls(uid=uid, bot_id=bot_id, **data))
+        return True
 
 
 @site.register_admin
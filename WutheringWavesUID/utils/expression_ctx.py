@@ -1,13 +1,22 @@
-from typing import Dict, Optional
+import time
+from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel
 
 from ..utils.api.model import RoleDetailData
+from ..utils.api.model_struct import RoleDetailStruct, role_detail_to_struct
 from .calc import WuWaCalc
 from .calculate import calc_phantom_score, get_calc_map, get_total_score_bg
 from .char_info_utils import get_all_role_detail_info
+from .char_rank_cache import (
+    get_cached_char_rank,
+    load_char_rank_cache,
+    save_char_rank_cache,
+    set_cached_char_rank,
+)
 from .damage.abstract import DamageRankRegister
-from .damage.utils import comma_separated_number
+from .damage.damage import DamageResult
+from .player_store import get_role_hash, load_role_hash
 
 
 class WavesCharRank(BaseModel):
@@ -43,88 +52,179 @@ class WavesCharRank(BaseModel):
         }
 
 
+def calc_rank_damage(
+    calc: WuWaCalc,
+    role_detail: Union[RoleDetailData, RoleDetailStruct],
+    rankDetail: Dict,
+    trace: bool = False,
+) -> DamageResult:
+    """
+    排行用的伤害计算，默认不记录计算过程，只需要数值结果
+    需要先完成 calc.phantom_card 的计算
+    """
+    calc.role_card = calc.enhance_summation_card_value(calc.phantom_card)
+    calc.damageAttribute = calc.card_sort_map_to_attribute(calc.role_card, trace)
+    return rankDetail["func"](calc.damageAttribute, role_detail)
+
+
+def check_rank_mode(
+    role_details: List[Union[RoleDetailData, RoleDetailStruct]],
+) -> Dict:
+    """
+    对比记录计算过程与不记录时的伤害结果，结果必须完全一致
+    返回不一致的角色与两种模式的耗时(单位 ms)
+    """
+    result = {"role_num": 0, "mismatch": [], "trace_ms": 0.0, "rank_ms": 0.0}
+    for role_detail in role_details:
+        if not role_detail.phantomData or not role_detail.phantomData.equipPhantomList:
+            continue
+        rankDetail = DamageRankRegister.find_class(str(role_detail.role.roleId))
+        if not rankDetail:
+            continue
+
+        values = []
+        for trace in (True, False):
+            calc = WuWaCalc(role_detail)
+            calc.phantom_pre = calc.prepare_phantom()
+            calc.phantom_card = calc.enhance_summation_phantom_value(calc.phantom_pre)
+            start = time.perf_counter()
+            values.append(calc_rank_damage(calc, role_detail, rankDetail, trace))
+            cost = (time.perf_counter() - start) * 1000
+            result["trace_ms" if trace else "rank_ms"] += cost
+
+        result["role_num"] += 1
+        if values[0] != values[1]:
+            result["mismatch"].append(
+                {
+                    "roleId": role_detail.role.roleId,
+                    "roleName": role_detail.role.roleName,
+                    "trace": f"{values[0].crit_text}/{values[0].expected_text}",
+                    "rank": f"{values[1].crit_text}/{values[1].expected_text}",
+                }
+            )
+    return result
+
+
+def calc_waves_char_rank(
+    role_detail: Union[RoleDetailData, RoleDetailStruct],
+    need_expected_damage: bool = False,
+) -> WavesCharRank:
+    phantom_score = 0
+    calc: WuWaCalc = WuWaCalc(role_detail)
+    # calc_temp = None
+    expected_damage = None
+
+    sonataName = ""
+    expected_name = ""
+    if role_detail.phantomData and role_detail.phantomData.equipPhantomList:
+        equipPhantomList = role_detail.phantomData.equipPhantomList
+
+        calc.phantom_pre = calc.prepare_phantom()
+        calc.phantom_card = calc.enhance_summation_phantom_value(calc.phantom_pre)
+        calc.calc_temp = get_calc_map(
+            calc.phantom_card,
+            role_detail.role.roleName,
+            role_detail.role.roleId,
+        )
+        for i, _phantom in enumerate(equipPhantomList):
+            if _phantom and _phantom.phantomProp:
+                props = _phantom.get_props()
+                _score, _bg = calc_phantom_score(
+                    role_detail.role.roleId, props, _phantom.cost, calc.calc_temp
+                )
+                phantom_score += _score
+
+        if need_expected_damage:
+            rankDetail = DamageRankRegister.find_class(str(role_detail.role.roleId))
+            if rankDetail:
+                result = calc_rank_damage(calc, role_detail, rankDetail)
+                expected_damage = result.expected_damage
+                expected_name = rankDetail["title"]
+
+        for ph_detail in calc.phantom_pre.get("ph_detail", []):
+            if ph_detail.get("ph_name") and ph_detail.get("ph_num") == 5:
+                sonataName = ph_detail["ph_name"]
+                break
+
+            if ph_detail.get("ph_name") and ph_detail.get("isFull"):
+                sonataName = ph_detail["ph_name"]
+                break
+
+    phantom_score = round(phantom_score, 2)
+    return WavesCharRank(
+        **{
+            "roleId": role_detail.role.roleId,
+            "roleName": role_detail.role.roleName,
+            "starLevel": role_detail.role.starLevel,
+            "level": role_detail.level,
+            "chain": role_detail.get_chain_num(),
+            "chainName": role_detail.get_chain_name(),
+            "score": phantom_score,
+            "score_bg": get_total_score_bg(
+                role_detail.role.roleName, phantom_score, calc.calc_temp
+            ),
+            "expected_damage": expected_damage,
+            "weaponId": role_detail.weaponData.weapon.weaponId,
+            "weaponLevel": role_detail.weaponData.level,
+            "weaponResonLevel": role_detail.weaponData.resonLevel,
+            "sonataName": sonataName,
+            "expected_name": expected_name,
+        }
+    )
+
+
 async def get_waves_char_rank(uid, all_role_detail, need_expected_damage=False):
+    """
+    all_role_detail 可以是原始角色数据(dict)或 RoleDetailData
+    未变化的角色(内容哈希一致)直接使用持久化的评分/期望伤害结果
+    """
     if not all_role_detail:
         all_role_detail = await get_all_role_detail_info(uid)
     if isinstance(all_role_detail, Dict):
         temp = all_role_detail.values()
     else:
         temp = all_role_detail if all_role_detail else []
+
+    rank_cache = await load_char_rank_cache(uid)
+    role_hash_map: Optional[Dict[str, str]] = None
+    cache_changed = False
+
     waves_char_rank = []
     for role_detail in temp:
-        if not isinstance(role_detail, RoleDetailData):
-            role_detail = RoleDetailData(**role_detail)
+        if isinstance(role_detail, RoleDetailData):
+            # 来自玩家数据文件的模型，使用落盘时记录的哈希
+            if role_hash_map is None:
+                role_hash_map = await load_role_hash(uid)
+            role_id = role_detail.role.roleId
+            role_hash = role_hash_map.get(str(role_id))
+        else:
+            role_id = role_detail["role"]["roleId"]
+            role_hash = get_role_hash(role_detail)
+
+        cached = get_cached_char_rank(
+            rank_cache, role_id, role_hash, need_expected_damage
+        )
+        if cached:
+            waves_char_rank.append(WavesCharRank(**cached))
+            continue
 
-        phantom_score = 0
-        calc: WuWaCalc = WuWaCalc(role_detail)
-        # calc_temp = None
-        expected_damage = None
+        if not isinstance(role_detail, RoleDetailData):
+            role_detail = role_detail_to_struct(role_detail)
 
-        sonataName = ""
-        expected_name = ""
-        if role_detail.phantomData and role_detail.phantomData.equipPhantomList:
-            equipPhantomList = role_detail.phantomData.equipPhantomList
+        wcr = calc_waves_char_rank(role_detail, need_expected_damage)
+        waves_char_rank.append(wcr)
 
-            calc.phantom_pre = calc.prepare_phantom()
-            calc.phantom_card = calc.enhance_summation_phantom_value(calc.phantom_pre)
-            calc.calc_temp = get_calc_map(
-                calc.phantom_card,
-                role_detail.role.roleName,
-                role_detail.role.roleId,
+        if role_hash:
+            set_cached_char_rank(
+                rank_cache,
+                role_id,
+                role_hash,
+                wcr.model_dump(),
+                need_expected_damage,
             )
-            for i, _phantom in enumerate(equipPhantomList):
-                if _phantom and _phantom.phantomProp:
-                    props = _phantom.get_props()
-                    _score, _bg = calc_phantom_score(
-                        role_detail.role.roleId, props, _phantom.cost, calc.calc_temp
-                    )
-                    phantom_score += _score
-
-            if need_expected_damage:
-                rankDetail = DamageRankRegister.find_class(str(role_detail.role.roleId))
-                if rankDetail:
-                    calc.role_card = calc.enhance_summation_card_value(
-                        calc.phantom_card
-                    )
-                    calc.damageAttribute = calc.card_sort_map_to_attribute(
-                        calc.role_card
-                    )
-                    _, expected_damage = rankDetail["func"](
-                        calc.damageAttribute, role_detail
-                    )
-                    expected_damage = comma_separated_number(expected_damage)
-                    expected_name = rankDetail["title"]
-
-            for ph_detail in calc.phantom_pre.get("ph_detail", []):
-                if ph_detail.get("ph_name") and ph_detail.get("ph_num") == 5:
-                    sonataName = ph_detail["ph_name"]
-                    break
-
-                if ph_detail.get("ph_name") and ph_detail.get("isFull"):
-                    sonataName = ph_detail["ph_name"]
-                    break
-
-        phantom_score = round(phantom_score, 2)
-        wcr = WavesCharRank(
-            **{
-                "roleId": role_detail.role.roleId,
-                "roleName": role_detail.role.roleName,
-                "starLevel": role_detail.role.starLevel,
-                "level": role_detail.level,
-                "chain": role_detail.get_chain_num(),
-                "chainName": role_detail.get_chain_name(),
-                "score": phantom_score,
-                "score_bg": get_total_score_bg(
-                    role_detail.role.roleName, phantom_score, calc.calc_temp
-                ),
-                "expected_damage": expected_damage,
-                "weaponId": role_detail.weaponData.weapon.weaponId,
-                "weaponLevel": role_detail.weaponData.level,
-                "weaponResonLevel": role_detail.weaponData.resonLevel,
-                "sonataName": sonataName,
-                "expected_name": expected_name,
-            }
-        )
-        waves_char_rank.append(wcr)
+            cache_changed = True
+
+    if cache_changed:
+        await save_char_rank_cache(uid, rank_cache)
 
     return waves_char_rank
@@ -0,0 +1,29 @@
+"""
+账号基础信息/共鸣者列表的短时缓存
+
+同一 uid 连续查看简报、深塔、冥海等页面时复用，不重复请求 get_base_info/get_role_info
+"""
+
+from typing import Optional
+
+from .api.model import AccountBaseInfo, RoleList
+from .cache import TimedCache
+
+account_info_cache = TimedCache(600, 500, "account_info")
+role_info_cache = TimedCache(600, 500, "role_info")
+
+
+def get_cached_account_info(uid: str) -> Optional[AccountBaseInfo]:
+    return account_info_cache.get(uid)
+
+
+def set_cached_account_info(uid: str, account_info: AccountBaseInfo):
+    account_info_cache.set(uid, account_info)
+
+
+def get_cached_role_info(uid: str) -> Optional[RoleList]:
+    return role_info_cache.get(uid)
+
+
+def set_cached_role_info(uid: str, role_info: RoleList):
+    role_info_cache.set(uid, role_info)
@@ -54,7 +54,7 @@ def weapon_damage(
     # 武器谐振
     weapon_clz = WavesWeaponRegister.find_class(weapon_data.weapon.weaponId)
     if weapon_clz:
-        w = weapon_clz(
+        w = weapon_clz.get_instance(
             weapon_data.weapon.weaponId,
             weapon_data.level,
             weapon_data.breach,
@@ -67,7 +67,7 @@ def echo_damage(attr: DamageAttribute, isGroup: bool):
     # 声骸计算
     echo_clz = WavesEchoRegister.find_class(attr.echo_id)
     if echo_clz:
-        e = echo_clz()
+        e = echo_clz.get_instance()
         e.do_echo(attr, isGroup)
 
 
@@ -3,7 +3,7 @@ from .buff import shouanren_buff, changli_buff
 from .damage import echo_damage, weapon_damage, phase_damage
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     skill_damage_calc,
     SkillType,
@@ -20,7 +20,7 @@ from ...damage.utils import (
 
 def calc_damage_0(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(hit_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -38,7 +38,7 @@ def calc_damage_0(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = f"重击·爆裂"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -85,15 +85,15 @@ def calc_damage_0(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -111,7 +111,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = f"冰棱伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -158,15 +158,15 @@ def calc_damage_1(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -184,7 +184,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], "3", skillLevel
     )
     title = f"冰棱爆炸伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -240,15 +240,15 @@ def calc_damage_2(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_3(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(liberation_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -266,7 +266,7 @@ def calc_damage_3(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = f"冰川伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -308,15 +308,15 @@ def calc_damage_3(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_4(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -334,7 +334,7 @@ def calc_damage_4(
         char_result.skillTrees, SkillTreeMap[skill_type], "2", skillLevel
     )
     title = f"冰川爆炸伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -390,15 +390,15 @@ def calc_damage_4(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_10(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> (str, str):
+) -> DamageResult:
     attr.set_char_damage(liberation_damage)
     attr.set_char_template("temp_atk")
     # 守岸人buff
@@ -5,7 +5,7 @@ from gsuid_core.logger import logger
 from .damage import echo_damage, weapon_damage, phase_damage
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     skill_damage_calc,
     SkillType,
@@ -21,27 +21,27 @@ from ...damage.utils import (
 
 def calc_damage(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     attr1 = copy.deepcopy(attr)
-    crit_damage1, expected_damage1 = calc_damage_1(attr1, role, isGroup)
+    result1 = calc_damage_1(attr1, role, isGroup)
 
     attr2 = copy.deepcopy(attr)
-    crit_damage2, expected_damage2 = calc_damage_a(attr2, role, isGroup)
+    result2 = calc_damage_a(attr2, role, isGroup)
 
     attr3 = copy.deepcopy(attr)
-    crit_damage3, expected_damage3 = calc_damage_e(attr3, role, isGroup)
+    result3 = calc_damage_e(attr3, role, isGroup)
 
     attr4 = copy.deepcopy(attr)
-    crit_damage4, expected_damage4 = calc_damage_ea(attr4, role, isGroup)
-
-    crit_damage = crit_damage1 + crit_damage2 + crit_damage3 + crit_damage4
-    expected_damage = (
-        expected_damage1 + expected_damage2 + expected_damage3 + expected_damage4
+    result4 = calc_damage_ea(attr4, role, isGroup)
+
+    result = DamageResult.merge(
+        [
+            ("r伤害", result1),
+            ("a第一段伤害", result2),
+            ("5e总伤害", result3),
+            ("4a总伤害", result4),
+        ]
     )
-    # 暴击伤害
-    crit_damage = f"{crit_damage:,.0f}"
-    # 期望伤害
-    expected_damage = f"{expected_damage:,.0f}"
 
     attr.add_effect(" ", " ")
     attr.effect.extend(attr1.effect[2:])
@@ -51,12 +51,12 @@ def calc_damage(
     attr.effect.extend(attr3.effect[2:])
     attr.add_effect(" ", " ")
     attr.effect.extend(attr4.effect[2:])
-    return crit_damage, expected_damage
+    return result
 
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(liberation_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -74,7 +74,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = f"共鸣解放"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -110,17 +110,17 @@ def calc_damage_1(
     # 期望伤害
     expected_damage = attr.calculate_expected_damage()
 
-    attr.add_effect(
-        "r伤害", f"期望伤害:{crit_damage:,.0f}; 暴击伤害:{expected_damage:,.0f}"
-    )
-
-    logger.debug(f"{role_name}- 属性值: {attr}")
-    return crit_damage, expected_damage
+    if attr.trace:
+        attr.add_effect(
+            "r伤害", f"期望伤害:{crit_damage:,.0f}; 暴击伤害:{expected_damage:,.0f}"
+        )
+        logger.debug(f"{role_name}- 属性值: {attr}")
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_a(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(attack_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -138,7 +138,7 @@ def calc_damage_a(
         char_result.skillTrees, SkillTreeMap[skill_type], "3", skillLevel
     )
     title = f"a第一段"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -176,17 +176,18 @@ def calc_damage_a(
     # 期望伤害
     expected_damage = attr.calculate_expected_damage()
 
-    attr.add_effect(
-        "a第一段伤害", f"期望伤害:{crit_damage:,.0f}; 暴击伤害:{expected_damage:,.0f}"
-    )
-
-    logger.debug(f"{role_name}- 属性值: {attr}")
-    return crit_damage, expected_damage
+    if attr.trace:
+        attr.add_effect(
+            "a第一段伤害",
+            f"期望伤害:{crit_damage:,.0f}; 暴击伤害:{expected_damage:,.0f}",
+        )
+        logger.debug(f"{role_name}- 属性值: {attr}")
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_ea(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(attack_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -205,7 +206,7 @@ def calc_damage_ea(
     )
     skill_multi = f"({skill_multi})*2"
     title = f"a第一段"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     skill_multi = skill_damage_calc(
@@ -213,7 +214,7 @@ def calc_damage_ea(
     )
     skill_multi = f"({skill_multi})*2"
     title = f"a第二段"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -256,17 +257,17 @@ def calc_damage_ea(
     # 期望伤害
     expected_damage = attr.calculate_expected_damage()
 
-    attr.add_effect(
-        "4a总伤害", f"期望伤害:{crit_damage:,.0f}; 暴击伤害:{expected_damage:,.0f}"
-    )
-
-    logger.debug(f"{role_name}- 属性值: {attr}")
-    return crit_damage, expected_damage
+    if attr.trace:
+        attr.add_effect(
+            "4a总伤害", f"期望伤害:{crit_damage:,.0f}; 暴击伤害:{expected_damage:,.0f}"
+        )
+        logger.debug(f"{role_name}- 属性值: {attr}")
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_e(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -285,7 +286,7 @@ def calc_damage_e(
     )
     skill_multi = f"({skill_multi})*5"
     title = f"e"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -325,12 +326,12 @@ def calc_damage_e(
     # 期望伤害
     expected_damage = attr.calculate_expected_damage()
 
-    attr.add_effect(
-        "5e总伤害", f"期望伤害:{crit_damage:,.0f}; 暴击伤害:{expected_damage:,.0f}"
-    )
-
-    logger.debug(f"{role_name}- 属性值: {attr}")
-    return crit_damage, expected_damage
+    if attr.trace:
+        attr.add_effect(
+            "5e总伤害", f"期望伤害:{crit_damage:,.0f}; 暴击伤害:{expected_damage:,.0f}"
+        )
+        logger.debug(f"{role_name}- 属性值: {attr}")
+    return DamageResult(crit_damage, expected_damage)
 
 
 damage_detail = [
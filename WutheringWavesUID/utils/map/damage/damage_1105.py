@@ -2,7 +2,7 @@
 from .damage import echo_damage, weapon_damage, phase_damage
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     skill_damage_calc,
     SkillType,
@@ -19,7 +19,7 @@ from ...damage.utils import (
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -39,7 +39,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = f"以形写神"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -71,15 +71,15 @@ def calc_damage_1(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(hit_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -99,7 +99,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = f"重击·构形"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -131,15 +131,15 @@ def calc_damage_2(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_3(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(attack_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -159,7 +159,7 @@ def calc_damage_3(
         char_result.skillTrees, SkillTreeMap[skill_type], "3", skillLevel
     )
     title = f"神来之笔"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -200,15 +200,15 @@ def calc_damage_3(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_4(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(attack_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -228,7 +228,7 @@ def calc_damage_4(
         char_result.skillTrees, SkillTreeMap[skill_type], "3", skillLevel
     )
     title = f"神来之笔"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -269,15 +269,15 @@ def calc_damage_4(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_5(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(attack_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -297,7 +297,7 @@ def calc_damage_5(
         char_result.skillTrees, SkillTreeMap[skill_type], "4", skillLevel
     )
     title = f"极意·神来之笔"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -343,15 +343,15 @@ def calc_damage_5(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_6(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(attack_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -372,7 +372,7 @@ def calc_damage_6(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = f"墨鹤伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -413,10 +413,10 @@ def calc_damage_6(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 damage_detail = [
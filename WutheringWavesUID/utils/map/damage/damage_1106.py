@@ -1,9 +1,9 @@
 # 釉瑚
-from typing import List, Optional, Union
+from typing import List, Union
 
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     SkillTreeMap,
     SkillType,
@@ -40,7 +40,7 @@ def calc_damage_1(
     role: RoleDetailData,
     isGroup: bool = False,
     skill_name: Union[str, List[str]] = "",
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -58,7 +58,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = "诗中物"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -111,10 +111,10 @@ def calc_damage_1(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
@@ -122,7 +122,7 @@ def calc_damage_2(
     role: RoleDetailData,
     isGroup: bool = False,
     skill_name: Union[str, List[str]] = "",
-) -> tuple[Optional[str], str]:
+) -> DamageResult:
     damage_func = [cast_attack, cast_skill, cast_hit, cast_liberation]
     attr.set_char_damage(heal_bonus)
     attr.set_char_template("temp_atk")
@@ -141,14 +141,14 @@ def calc_damage_2(
             char_result.skillTrees, SkillTreeMap[skill_type], "3", skillLevel
         )
         title = "双关额外治疗量"
-        msg = f"技能倍率{skill_multi}"
+        msg = f"技能倍率{skill_multi}" if attr.trace else ""
     else:
         # 技能技能倍率
         skill_multi = skill_damage_calc(
             char_result.skillTrees, SkillTreeMap[skill_type], "2", skillLevel
         )
         title = "诗中物治疗量"
-        msg = f"技能倍率{skill_multi}"
+        msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_healing_skill_multi(skill_multi, title, msg)
 
     # 设置角色等级
@@ -164,13 +164,13 @@ def calc_damage_2(
 
     healing_bonus = attr.calculate_healing(attr.effect_attack)
 
-    crit_damage = f"{healing_bonus:,.0f}"
-    return None, crit_damage
+    crit_damage = healing_bonus
+    return DamageResult(None, crit_damage)
 
 
 def calc_damage_3(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[Optional[str], str]:
+) -> DamageResult:
     damage_func = [cast_attack, cast_skill, cast_hit, cast_liberation]
     attr.set_char_damage(heal_bonus)
     attr.set_char_template("temp_atk")
@@ -187,7 +187,7 @@ def calc_damage_3(
         char_result.skillTrees, SkillTreeMap[skill_type], "2", skillLevel
     )
     title = "匣中问祯治疗量"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_healing_skill_multi(skill_multi, title, msg)
 
     # 设置角色等级
@@ -203,8 +203,8 @@ def calc_damage_3(
 
     healing_bonus = attr.calculate_healing(attr.effect_attack)
 
-    crit_damage = f"{healing_bonus:,.0f}"
-    return None, crit_damage
+    crit_damage = healing_bonus
+    return DamageResult(None, crit_damage)
 
 
 damage_detail = [
@@ -5,7 +5,7 @@ from .buff import shouanren_buff, zhezhi_buff
 from .damage import echo_damage, weapon_damage, phase_damage
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute, calc_percent_expression
+from ...damage.damage import DamageAttribute, DamageResult, calc_percent_expression
 from ...damage.utils import (
     skill_damage_calc,
     SkillType,
@@ -15,13 +15,12 @@ from ...damage.utils import (
     cast_hit,
     skill_damage,
     cast_liberation,
-    add_comma_separated_numbers,
 )
 
 
 def calc_damage(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     title = "默认手法"
     if isGroup:
         msg = "变奏入场 ee aa aaa z qr aaaaa"
@@ -31,26 +30,26 @@ def calc_damage(
     attr.add_effect(title, msg)
     init_len = len(attr.effect)
     attr1 = copy.deepcopy(attr)
-    crit_damage1, expected_damage1 = calc_damage_r(attr1, role, isGroup)
-    attr1.add_effect("r伤害", f"期望伤害:{crit_damage1}; 暴击伤害:{expected_damage1}")
+    result1 = calc_damage_r(attr1, role, isGroup)
+    attr1.add_effect(
+        "r伤害", f"期望伤害:{result1.crit_text}; 暴击伤害:{result1.expected_text}"
+    )
 
     attr2 = copy.deepcopy(attr)
-    crit_damage2, expected_damage2 = calc_damage_3(
-        attr2, role, isGroup, trigger_times=4
-    )
+    result2 = calc_damage_3(attr2, role, isGroup, trigger_times=4)
     attr2.add_effect(
-        "死兆*4伤害", f"期望伤害:{crit_damage2}; 暴击伤害:{expected_damage2}"
+        "死兆*4伤害",
+        f"期望伤害:{result2.crit_text}; 暴击伤害:{result2.expected_text}",
     )
 
     attr3 = copy.deepcopy(attr)
-    crit_damage3, expected_damage3 = calc_damage_2(attr3, role, isGroup)
+    result3 = calc_damage_2(attr3, role, isGroup)
     attr3.add_effect(
-        "r尾刀伤害", f"期望伤害:{crit_damage3}; 暴击伤害:{expected_damage3}"
+        "r尾刀伤害", f"期望伤害:{result3.crit_text}; 暴击伤害:{result3.expected_text}"
     )
 
-    crit_damage = add_comma_separated_numbers(crit_damage1, crit_damage2, crit_damage3)
-    expected_damage = add_comma_separated_numbers(
-        expected_damage1, expected_damage2, expected_damage3
+    result = DamageResult.merge(
+        [("r伤害", result1), ("死兆*4伤害", result2), ("r尾刀伤害", result3)]
     )
 
     attr.add_effect(" ", " ")
@@ -60,12 +59,12 @@ def calc_damage(
     attr.add_effect(" ", " ")
     attr.effect.extend(attr3.effect[init_len + 1 :])
 
-    return crit_damage, expected_damage
+    return result
 
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -90,7 +89,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = f"末路见行"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -139,15 +138,15 @@ def calc_damage_1(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -172,7 +171,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], "4", skillLevel
     )
     title = f"致死以终"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -226,15 +225,15 @@ def calc_damage_2(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_3(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False, trigger_times=1
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -259,7 +258,7 @@ def calc_damage_3(
         char_result.skillTrees, SkillTreeMap[skill_type], "2", skillLevel
     )
     title = f"死兆"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -313,15 +312,15 @@ def calc_damage_3(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage() * trigger_times:,.0f}"
+    crit_damage = attr.calculate_crit_damage() * trigger_times
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage() * trigger_times:,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage() * trigger_times
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_33(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False, trigger_times=1
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -392,7 +391,7 @@ def calc_damage_33(
     )
 
     title = f"死兆"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_effect(title, msg)
 
     sm = skill_multi.split("+")
@@ -404,7 +403,8 @@ def calc_damage_33(
         attr.add_effect(title, msg)
         s1_ratio = ((s1 + s2) * 2.866 - s2 * 2) / s1 - 1
         s2_ratio = 1
-        attr.add_effect("六链技能倍率加成", f"{1 + s1_ratio:.4f} + {1 + s2_ratio}")
+        if attr.trace:
+            attr.add_effect("六链技能倍率加成", f"{1 + s1_ratio:.4f} + {1 + s2_ratio}")
     else:
         s1_ratio = 0
         s2_ratio = 0
@@ -415,25 +415,30 @@ def calc_damage_33(
     attr1.add_skill_multi(s1)
     attr1.add_skill_ratio(s1_ratio)
     # 暴击伤害
-    s1_crit_damage = f"{attr1.calculate_crit_damage():,.0f}"
+    s1_crit_damage = attr1.calculate_crit_damage()
     # 期望伤害
-    s1_expected_damage = f"{attr1.calculate_expected_damage():,.0f}"
+    s1_expected_damage = attr1.calculate_expected_damage()
 
     attr2.add_skill_multi(s2)
     attr2.add_skill_ratio(s2_ratio)
     # 暴击伤害
-    s2_crit_damage = f"{attr2.calculate_crit_damage():,.0f}"
+    s2_crit_damage = attr2.calculate_crit_damage()
     # 期望伤害
-    s2_expected_damage = f"{attr2.calculate_expected_damage():,.0f}"
-
-    crit_damage = f"{s1_crit_damage} + {s2_crit_damage}"
-    expected_damage = f"{s1_expected_damage} + {s2_expected_damage}"
-    return crit_damage, expected_damage
+    s2_expected_damage = attr2.calculate_expected_damage()
+
+    # 两段分开展示
+    return DamageResult.merge(
+        [
+            ("死兆", DamageResult(s1_crit_damage, s1_expected_damage)),
+            ("死兆追加", DamageResult(s2_crit_damage, s2_expected_damage)),
+        ],
+        split=True,
+    )
 
 
 def calc_damage_r(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -458,7 +463,7 @@ def calc_damage_r(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = f"新浪潮时代"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -507,15 +512,15 @@ def calc_damage_r(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_10(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> (str, str):
+) -> DamageResult:
     """
     0+1守/0折枝/致死以终伤害
     """
@@ -533,7 +538,7 @@ def calc_damage_10(
 
 def calc_damage_11(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> (str, str):
+) -> DamageResult:
     """
     6+5守/6折/致死以终伤害
     """
@@ -3,11 +3,10 @@ import copy
 
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     SkillTreeMap,
     SkillType,
-    add_comma_separated_numbers,
     cast_attack,
     cast_liberation,
     cast_skill,
@@ -67,7 +66,7 @@ def calc_damage_0(
     role: RoleDetailData,
     isGroup: bool = False,
     is_lianzhao: bool = False,
-) -> tuple[str, str]:
+) -> DamageResult:
     """
     焚身以火
     """
@@ -87,7 +86,7 @@ def calc_damage_0(
     )
 
     title = "焚身以火"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色等级
@@ -124,15 +123,15 @@ def calc_damage_0(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     """
     离火照丹心
     """
@@ -153,7 +152,7 @@ def calc_damage_1(
     )
 
     title = "离火照丹心"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     damage_func = [cast_attack, cast_skill, cast_liberation]
@@ -181,33 +180,32 @@ def calc_damage_1(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     attr1 = copy.deepcopy(attr)
-    crit_damage1, expected_damage1 = calc_damage_0(attr1, role, isGroup)
-    attr1.add_effect("焚身以火暴击伤害", f"{crit_damage1}")
-    attr1.add_effect("焚身以火期望伤害", f"{expected_damage1}")
+    result1 = calc_damage_0(attr1, role, isGroup)
+    attr1.add_effect("焚身以火暴击伤害", result1.crit_text)
+    attr1.add_effect("焚身以火期望伤害", result1.expected_text)
 
     attr2 = copy.deepcopy(attr)
-    crit_damage2, expected_damage2 = calc_damage_1(attr2, role, isGroup)
-    attr2.add_effect("离火照丹心暴击伤害", f"{crit_damage2}")
-    attr2.add_effect("离火照丹心期望伤害", f"{expected_damage2}")
+    result2 = calc_damage_1(attr2, role, isGroup)
+    attr2.add_effect("离火照丹心暴击伤害", result2.crit_text)
+    attr2.add_effect("离火照丹心期望伤害", result2.expected_text)
 
     attr3 = copy.deepcopy(attr)
-    crit_damage3, expected_damage3 = calc_damage_0(attr3, role, isGroup, True)
-    attr3.add_effect("焚身以火暴击伤害", f"{crit_damage3}")
-    attr3.add_effect("焚身以火期望伤害", f"{expected_damage3}")
+    result3 = calc_damage_0(attr3, role, isGroup, True)
+    attr3.add_effect("焚身以火暴击伤害", result3.crit_text)
+    attr3.add_effect("焚身以火期望伤害", result3.expected_text)
 
-    crit_damage = add_comma_separated_numbers(crit_damage1, crit_damage2, crit_damage3)
-    expected_damage = add_comma_separated_numbers(
-        expected_damage1, expected_damage2, expected_damage3
+    result = DamageResult.merge(
+        [("焚身以火", result1), ("离火照丹心", result2), ("焚身以火", result3)]
     )
 
     attr.add_effect(" ", " ")
@@ -216,12 +214,12 @@ def calc_damage_2(
     attr.effect.extend(attr2.effect[2:])
     attr.add_effect(" ", " ")
     attr.effect.extend(attr3.effect[2:])
-    return crit_damage, expected_damage
+    return result
 
 
 def calc_damage_10(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_char_damage(liberation_damage)
     attr.set_char_template("temp_atk")
 
@@ -236,7 +234,7 @@ def calc_damage_10(
 
 def calc_damage_11(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_char_damage(liberation_damage)
     attr.set_char_template("temp_atk")
 
@@ -251,7 +249,7 @@ def calc_damage_11(
 
 def calc_damage_12(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_char_damage(skill_damage)
     attr.set_char_template("temp_atk")
 
@@ -266,7 +264,7 @@ def calc_damage_12(
 
 def calc_damage_13(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_char_damage(skill_damage)
     attr.set_char_template("temp_atk")
 
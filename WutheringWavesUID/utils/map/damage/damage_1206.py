@@ -1,7 +1,7 @@
 # 船长
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     SkillTreeMap,
     SkillType,
@@ -21,7 +21,7 @@ def calc_damage_1(
     role: RoleDetailData,
     isGroup: bool = False,
     is_single: bool = False,
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(attack_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -41,7 +41,7 @@ def calc_damage_1(
     if is_single:
         skill_multi = skill_multi.split("+")[-1]
     title = "火焰归亡曲"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -64,7 +64,11 @@ def calc_damage_1(
         atk_flat = int((attr.energy_regen - 1.5) * 2000)
         if atk_flat > 2600:
             atk_flat = 2600
-        msg = f"每超1%为20点攻击提升，上限为2600，当前提升{atk_flat}"
+        msg = (
+            f"每超1%为20点攻击提升，上限为2600，当前提升{atk_flat}"
+            if attr.trace
+            else ""
+        )
         attr.add_atk_flat(atk_flat, title, msg)
 
     # 设置声骸属性
@@ -99,15 +103,15 @@ def calc_damage_1(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(liberation_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -125,7 +129,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = "直到世界尽头"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -148,7 +152,11 @@ def calc_damage_2(
         atk_flat = int((attr.energy_regen - 1.5) * 1200)
         if atk_flat > 1560:
             atk_flat = 1560
-        msg = f"每超1%为12点攻击提升，上限为1560，当前提升{atk_flat}"
+        msg = (
+            f"每超1%为12点攻击提升，上限为1560，当前提升{atk_flat}"
+            if attr.trace
+            else ""
+        )
         attr.add_atk_flat(atk_flat, title, msg)
 
     # 设置声骸属性
@@ -168,15 +176,15 @@ def calc_damage_2(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_10(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_char_damage(attack_damage)
     attr.set_char_template("temp_atk")
     # 守岸人buff
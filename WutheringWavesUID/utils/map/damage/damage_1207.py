@@ -3,7 +3,7 @@ from typing import Literal
 
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute, calc_percent_expression
+from ...damage.damage import DamageAttribute, DamageResult, calc_percent_expression
 from ...damage.utils import (
     SkillTreeMap,
     SkillType,
@@ -36,7 +36,7 @@ def calc_damage_2(
     role: RoleDetailData,
     isGroup: bool = False,
     skill_name: Literal["r1", "r2"] = "r1",
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(liberation_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -60,7 +60,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], param_id, skillLevel
     )
 
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     title = "燃旗-共鸣回路"
@@ -79,7 +79,7 @@ def calc_damage_2(
                 msg = "热熔提升10%"
                 attr.add_dmg_bonus(0.1, title, msg)
 
-            msg = f"攻击力提升(6*{team_num})%"
+            msg = f"攻击力提升(6*{team_num})%" if attr.trace else ""
             attr.add_atk_percent(0.06 * molten_num, title, msg)
         else:
             title = "追猎-共鸣解放"
@@ -113,7 +113,7 @@ def calc_damage_2(
             # 施放共鸣解放荣光欢酣于火时，额外获得荣光效果，35秒内：
             # 队伍中的角色攻击时无视3%热熔抗性，并且队伍中每有一名除露帕外的热熔属性角色，无视热熔抗性效果增加3%，上限为9%，当队伍中的热熔属性角色达到3名时，无视热熔抗性的效果额外增加6%。
             title = f"{role_name}-荣光效果"
-            msg = f"角色攻击时无视3*{molten_num}%热熔抗性"
+            msg = f"角色攻击时无视3*{molten_num}%热熔抗性" if attr.trace else ""
             attr.add_enemy_resistance(-0.03 * molten_num, title, msg)
 
             if molten_num >= 3:
@@ -153,10 +153,10 @@ def calc_damage_2(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_3(
@@ -164,7 +164,7 @@ def calc_damage_3(
     role: RoleDetailData,
     isGroup: bool = False,
     isSingle: bool = True,
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(liberation_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -188,7 +188,7 @@ def calc_damage_3(
         skill_multi = f"{s2*100:.2f}%"
 
     title = "狼舞的决意·极"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     title = "燃旗-共鸣回路"
@@ -206,7 +206,7 @@ def calc_damage_3(
             msg = "热熔提升10%"
             attr.add_dmg_bonus(0.1, title, msg)
 
-        msg = f"攻击力提升(6*{team_num})%"
+        msg = f"攻击力提升(6*{team_num})%" if attr.trace else ""
         attr.add_atk_percent(0.06 * molten_num, title, msg)
     else:
         title = "追猎-共鸣解放"
@@ -241,7 +241,7 @@ def calc_damage_3(
             # 施放共鸣解放荣光欢酣于火时，额外获得荣光效果，35秒内：
             # 队伍中的角色攻击时无视3%热熔抗性，并且队伍中每有一名除露帕外的热熔属性角色，无视热熔抗性效果增加3%，上限为9%，当队伍中的热熔属性角色达到3名时，无视热熔抗性的效果额外增加6%。
             title = f"{role_name}-荣光效果"
-            msg = f"角色攻击时无视3*{molten_num}%热熔抗性"
+            msg = f"角色攻击时无视3*{molten_num}%热熔抗性" if attr.trace else ""
             attr.add_enemy_resistance(-0.03 * molten_num, title, msg)
 
             if molten_num >= 3:
@@ -286,15 +286,15 @@ def calc_damage_3(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_10(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_char_damage(liberation_damage)
     attr.set_char_template("temp_atk")
     # 守岸人buff
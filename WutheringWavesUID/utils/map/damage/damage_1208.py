@@ -3,7 +3,7 @@ from typing import Literal
 
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     SkillTreeMap,
     SkillType,
@@ -25,7 +25,7 @@ def calc_damage_1(
     isGroup: bool = False,
     size: Literal[1, 2, 3, 4, 5] = 1,
     char_damage: Literal["hit_damage", "phantom_damage"] = hit_damage,
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(char_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -44,7 +44,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], skillParamId, skillLevel
     )
     title = f"普攻·炽天猎杀第{size}段"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -108,10 +108,10 @@ def calc_damage_1(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
@@ -120,7 +120,7 @@ def calc_damage_2(
     isGroup: bool = False,
     size: Literal[1, 2, 3] = 1,
     char_damage: Literal["hit_damage", "phantom_damage"] = hit_damage,
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(char_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -139,7 +139,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], skillParamId, skillLevel
     )
     title = f"重击·炼羽裁决第{size}段"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -203,17 +203,17 @@ def calc_damage_2(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_3(
     attr: DamageAttribute,
     role: RoleDetailData,
     isGroup: bool = False,
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(phantom_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -231,7 +231,7 @@ def calc_damage_3(
         char_result.skillTrees, SkillTreeMap[skill_type], "16", skillLevel
     )
     title = "共鸣解放·炼净伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -282,10 +282,10 @@ def calc_damage_3(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 damage_detail = [
@@ -3,7 +3,7 @@
 from .damage import echo_damage, weapon_damage, phase_damage
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     skill_damage_calc,
     SkillType,
@@ -17,7 +17,7 @@ from ...damage.utils import (
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -35,7 +35,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "2", skillLevel
     )
     title = f"雷之楔协同攻击"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -74,15 +74,15 @@ def calc_damage_1(
     effect_value = attr.effect_def
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage(effect_value):,.0f}"
+    crit_damage = attr.calculate_crit_damage(effect_value)
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage(effect_value):,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage(effect_value)
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(liberation_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -100,7 +100,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = f"寂土重明"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -135,10 +135,10 @@ def calc_damage_2(
     effect_value = attr.effect_def
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage(effect_value):,.0f}"
+    crit_damage = attr.calculate_crit_damage(effect_value)
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage(effect_value):,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage(effect_value)
+    return DamageResult(crit_damage, expected_damage)
 
 
 damage_detail = [
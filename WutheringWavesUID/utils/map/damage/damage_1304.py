@@ -3,7 +3,7 @@ from .buff import weilinai_buff, zhezhi_buff, shouanren_buff, dengdeng_buff
 from .damage import echo_damage, weapon_damage, phase_damage
 from ...api.model import RoleDetailData
 from ...ascension.char import get_char_detail, WavesCharResult
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     skill_damage_calc,
     skill_damage,
@@ -15,7 +15,7 @@ from ...damage.utils import (
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     """
     惊龙破空·炳星
     """
@@ -34,14 +34,14 @@ def calc_damage_1(
     # 技能倍率
     skill_multi = skill_damage_calc(char_result.skillTrees, "7", "9", skillLevel)
     title = "惊龙破空·炳星"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     #
     skill_multi = skill_damage_calc(char_result.skillTrees, "7", "10", skillLevel)
     dmg = f"{skill_multi}*50"
     title = "【韶光】增加倍率"
-    msg = f"技能倍率{dmg}"
+    msg = f"技能倍率{dmg}" if attr.trace else ""
     attr.add_skill_multi(dmg, title, msg)
 
     # 设置角色等级
@@ -86,15 +86,15 @@ def calc_damage_1(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     """
     移岁诛邪
     """
@@ -112,7 +112,7 @@ def calc_damage_2(
     # 技能倍率
     skill_multi = skill_damage_calc(char_result.skillTrees, "3", "1", skillLevel)
     title = "移岁诛邪"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色等级
@@ -150,15 +150,15 @@ def calc_damage_2(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_3(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> (str, str):
+) -> DamageResult:
     """
     0维/0折枝/惊龙破空·炳星
     """
@@ -176,7 +176,7 @@ def calc_damage_3(
 
 def calc_damage_4(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> (str, str):
+) -> DamageResult:
     """
     0+1守/0折枝/惊龙破空·炳星
     """
@@ -194,7 +194,7 @@ def calc_damage_4(
 
 def calc_damage_5(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> (str, str):
+) -> DamageResult:
     """
     6+5守/6灯灯/惊龙破空·炳星
     """
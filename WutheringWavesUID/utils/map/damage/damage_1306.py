@@ -1,11 +1,9 @@
 # 奥古斯塔
 
-from typing import Tuple
-
 from ...api.model import RoleDetailData
 from .damage import echo_damage, phase_damage, weapon_damage
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute, calc_percent_expression
+from ...damage.damage import DamageAttribute, DamageResult, calc_percent_expression
 from ...damage.utils import (
     SkillType,
     SkillTreeMap,
@@ -42,7 +40,7 @@ def chain_damage(
             crit_rate_bonus = min(max(crit_rate / 0.01, 0), 50)
             add_crit_dmg = crit_rate_bonus * 2 * 0.01
             title = f"{role_name}-二链"
-            msg = f"爆伤提升{add_crit_dmg*100:.2f}%"
+            msg = f"爆伤提升{add_crit_dmg*100:.2f}%" if attr.trace else ""
             attr.add_crit_dmg(add_crit_dmg, title, msg)
 
         # 暴击高于150%时，每多出1%暴击，奥古斯塔暴击伤害提升2%，最高可提升50%暴击伤害
@@ -52,7 +50,7 @@ def chain_damage(
             crit_rate_bonus = min(max(crit_rate / 0.01, 0), 25)
             add_crit_dmg = crit_rate_bonus * 2 * 0.01
             title = f"{role_name}-六链"
-            msg = f"爆伤提升{add_crit_dmg*100:.2f}%"
+            msg = f"爆伤提升{add_crit_dmg*100:.2f}%" if attr.trace else ""
             attr.add_crit_dmg(add_crit_dmg, title, msg)
 
     elif chain_num >= 2:
@@ -71,7 +69,7 @@ def chain_damage(
             crit_rate_bonus = min(max(crit_rate / 0.01, 0), 50)
             add_crit_dmg = crit_rate_bonus * 2 * 0.01
             title = f"{role_name}-二链"
-            msg = f"爆伤提升{add_crit_dmg*100:.2f}%"
+            msg = f"爆伤提升{add_crit_dmg*100:.2f}%" if attr.trace else ""
             attr.add_crit_dmg(add_crit_dmg, title, msg)
 
     elif chain_num >= 1:
@@ -103,7 +101,7 @@ def calc_damage_1(
     role: RoleDetailData,
     isGroup: bool = False,
     isSingle: bool = True,
-) -> Tuple[str, str]:
+) -> DamageResult:
     # 设置角色固有技能
     role_breach = role.role.breach
     if role_breach and role_breach >= 3:
@@ -132,7 +130,7 @@ def calc_damage_1(
         skill_multi = f"{s2*100:.2f}%"
 
     title = "共鸣技能·不败恒阳·落袭伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -162,17 +160,17 @@ def calc_damage_1(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute,
     role: RoleDetailData,
     isGroup: bool = False,
-) -> Tuple[str, str]:
+) -> DamageResult:
     # 设置角色固有技能
     role_breach = role.role.breach
     if role_breach and role_breach >= 3:
@@ -197,7 +195,7 @@ def calc_damage_2(
     )
 
     title = "赫日威临·烈阳伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -227,10 +225,10 @@ def calc_damage_2(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_3(
@@ -238,7 +236,7 @@ def calc_damage_3(
     role: RoleDetailData,
     isGroup: bool = False,
     isSingle: bool = True,
-) -> Tuple[str, str]:
+) -> DamageResult:
     # 设置角色固有技能
     role_breach = role.role.breach
     if role_breach and role_breach >= 3:
@@ -270,7 +268,7 @@ def calc_damage_3(
     else:
         title = "赫日威临·不朽者之肃总伤"
 
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -300,10 +298,10 @@ def calc_damage_3(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 damage_detail = [
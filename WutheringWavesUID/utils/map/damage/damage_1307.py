@@ -2,7 +2,7 @@
 
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     SkillTreeMap,
     SkillType,
@@ -18,7 +18,7 @@ from .damage import echo_damage, phase_damage, weapon_damage
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     """
     召劾鬼神治疗量
     """
@@ -40,7 +40,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "32", skillLevel
     )
     title = "召劾鬼神治疗量"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_healing_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -75,13 +75,13 @@ def calc_damage_1(
 
     # 治疗量
     healing_bonus = attr.calculate_healing(attr.effect_attack)
-    crit_damage = f"{healing_bonus:,.0f}"
-    return None, crit_damage
+    crit_damage = healing_bonus
+    return DamageResult(None, crit_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     """
     三链-五雷荡煞阵触发治疗
     """
@@ -96,7 +96,7 @@ def calc_damage_2(
     # 检查是否有三链
     chain_num = role.get_chain_num()
     if chain_num < 3:
-        return None, "0"
+        return DamageResult(None, 0)
 
     # 三链
     title = "三链-五雷荡煞阵触发治疗"
@@ -132,13 +132,13 @@ def calc_damage_2(
 
     # 治疗量
     healing_bonus = attr.calculate_healing(attr.effect_attack)
-    crit_damage = f"{healing_bonus:,.0f}"
-    return None, crit_damage
+    crit_damage = healing_bonus
+    return DamageResult(None, crit_damage)
 
 
 def calc_damage_3(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     """
     飞雷诀·归一伤害
     """
@@ -160,7 +160,7 @@ def calc_damage_3(
         char_result.skillTrees, SkillTreeMap[skill_type], "25", skillLevel
     )
     title = "飞雷诀·归一伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -190,10 +190,10 @@ def calc_damage_3(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 damage_detail = [
@@ -7,7 +7,7 @@ from typing import Literal
 
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     SkillTreeMap,
     SkillType,
@@ -38,7 +38,7 @@ def calc_damage_1(
         "小卡空中回收2剑",
         "小卡空中回收3剑",
     ] = "小卡普攻1段",
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_aero_erosion()
     # 设置角色伤害类型
     attr.set_char_damage(attack_damage)
@@ -76,7 +76,7 @@ def calc_damage_1(
     )
 
     title = skill_name
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -139,7 +139,11 @@ def calc_damage_1(
         aeroErosionNumTemp = min(aeroErosionNum - 3, 3)
         if aeroErosionNumTemp > 0:
             title = f"{role_name}-以风刻痕留蚀"
-            msg = f"3层风蚀，对其造成的伤害额外提升10%*{aeroErosionNumTemp}"
+            msg = (
+                f"3层风蚀，对其造成的伤害额外提升10%*{aeroErosionNumTemp}"
+                if attr.trace
+                else ""
+            )
             attr.add_dmg_bonus(0.1 * aeroErosionNumTemp, title, msg)
 
     # 声骸
@@ -150,15 +154,15 @@ def calc_damage_1(
 
     effect_life = attr.effect_life
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage(effect_life):,.0f}"
+    crit_damage = attr.calculate_crit_damage(effect_life)
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage(effect_life):,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage(effect_life)
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_aero_erosion()
     # 设置角色伤害类型
     attr.set_char_damage(attack_damage)
@@ -178,7 +182,7 @@ def calc_damage_2(
     )
 
     title = "小卡共鸣技能"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -231,7 +235,11 @@ def calc_damage_2(
         aeroErosionNumTemp = min(aeroErosionNum - 3, 3)
         if aeroErosionNumTemp > 0:
             title = f"{role_name}-以风刻痕留蚀"
-            msg = f"3层风蚀，对其造成的伤害额外提升10%*{aeroErosionNumTemp}"
+            msg = (
+                f"3层风蚀，对其造成的伤害额外提升10%*{aeroErosionNumTemp}"
+                if attr.trace
+                else ""
+            )
             attr.add_dmg_bonus(0.1 * aeroErosionNumTemp, title, msg)
 
     # 声骸
@@ -242,10 +250,10 @@ def calc_damage_2(
 
     effect_life = attr.effect_life
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage(effect_life):,.0f}"
+    crit_damage = attr.calculate_crit_damage(effect_life)
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage(effect_life):,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage(effect_life)
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_11(
@@ -264,7 +272,7 @@ def calc_damage_11(
         "大卡空中2段",
         "大卡空中3段",
     ] = "大卡普攻1段",
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_aero_erosion()
     # 设置角色伤害类型
     attr.set_char_damage(attack_damage)
@@ -304,7 +312,7 @@ def calc_damage_11(
     )
 
     title = skill_name
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -362,7 +370,11 @@ def calc_damage_11(
         aeroErosionNumTemp = min(aeroErosionNum - 3, 3)
         if aeroErosionNumTemp > 0:
             title = f"{role_name}-以风刻痕留蚀"
-            msg = f"3层风蚀，对其造成的伤害额外提升10%*{aeroErosionNumTemp}"
+            msg = (
+                f"3层风蚀，对其造成的伤害额外提升10%*{aeroErosionNumTemp}"
+                if attr.trace
+                else ""
+            )
             attr.add_dmg_bonus(0.1 * aeroErosionNumTemp, title, msg)
 
     # 声骸
@@ -373,15 +385,15 @@ def calc_damage_11(
 
     effect_life = attr.effect_life
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage(effect_life):,.0f}"
+    crit_damage = attr.calculate_crit_damage(effect_life)
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage(effect_life):,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage(effect_life)
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_12(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_aero_erosion()
     # 设置角色伤害类型
     attr.set_char_damage(liberation_damage)
@@ -401,7 +413,7 @@ def calc_damage_12(
     )
 
     title = "大卡共鸣解放"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -452,7 +464,11 @@ def calc_damage_12(
     # 造成伤害时目标每拥有1层【风蚀效应】，对目标造成的伤害加深20%，至多5层，命中后会清空目标拥有的【风蚀效应】。
     aeroErosionNumTemp = min(aeroErosionNum, 5)
     title = f"{role_name}-看潮怒风哮之刃"
-    msg = f"{aeroErosionNumTemp}层【风蚀效应】，对目标造成的伤害加深20%*{aeroErosionNumTemp}"
+    msg = (
+        f"{aeroErosionNumTemp}层【风蚀效应】，对目标造成的伤害加深20%*{aeroErosionNumTemp}"
+        if attr.trace
+        else ""
+    )
     attr.add_dmg_deepen(0.2 * aeroErosionNumTemp, title, msg)
 
     # 设置角色固有技能
@@ -466,7 +482,11 @@ def calc_damage_12(
         aeroErosionNumTemp = min(aeroErosionNum - 3, 3)
         if aeroErosionNumTemp > 0:
             title = f"{role_name}-以风刻痕留蚀"
-            msg = f"3层风蚀，对其造成的伤害额外提升10%*{aeroErosionNumTemp}"
+            msg = (
+                f"3层风蚀，对其造成的伤害额外提升10%*{aeroErosionNumTemp}"
+                if attr.trace
+                else ""
+            )
             attr.add_dmg_bonus(0.1 * aeroErosionNumTemp, title, msg)
 
     # 声骸
@@ -477,15 +497,15 @@ def calc_damage_12(
 
     effect_life = attr.effect_life
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage(effect_life):,.0f}"
+    crit_damage = attr.calculate_crit_damage(effect_life)
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage(effect_life):,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage(effect_life)
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_20(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_char_damage(liberation_damage)
     attr.set_char_template("temp_life")
 
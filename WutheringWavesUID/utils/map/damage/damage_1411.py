@@ -3,7 +3,7 @@
 
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     SkillTreeMap,
     SkillType,
@@ -23,7 +23,7 @@ def calc_damage_1(
     attr: DamageAttribute,
     role: RoleDetailData,
     isGroup: bool = False,
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(hit_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -41,7 +41,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "27", skillLevel
     )
     title = "答剑·忠烈死节"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -107,21 +107,21 @@ def calc_damage_1(
         crit_rate_bonus = int(min(max(crit_rate / 0.01, 0), 15))
         print(crit_rate_bonus)
         title = "共鸣解放"
-        msg = f"暴击伤害提升2*{crit_rate_bonus}%"
+        msg = f"暴击伤害提升2*{crit_rate_bonus}%" if attr.trace else ""
         attr.add_crit_dmg(crit_rate_bonus * 0.02, title, msg)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute,
     role: RoleDetailData,
     isGroup: bool = False,
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(phantom_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -139,7 +139,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], "13", skillLevel
     )
     title = "万钧一断"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -210,14 +210,14 @@ def calc_damage_2(
         crit_rate = crit_rate - 0.5
         crit_rate_bonus = int(min(max(crit_rate / 0.01, 0), 15))
         title = "共鸣解放"
-        msg = f"暴击伤害提升2*{crit_rate_bonus}%"
+        msg = f"暴击伤害提升2*{crit_rate_bonus}%" if attr.trace else ""
         attr.add_crit_dmg(crit_rate_bonus * 0.02, title, msg)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 damage_detail = [
@@ -2,7 +2,7 @@
 from .damage import echo_damage, weapon_damage
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     cast_skill,
     skill_damage_calc,
@@ -17,7 +17,7 @@ from ...damage.utils import (
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(heal_bonus)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -37,7 +37,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "5", skillLevel
     )
     title = "星星花绽放"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_healing_skill_multi(skill_multi, title, msg)
 
     damage_func = [cast_attack, cast_hit, cast_skill]
@@ -65,13 +65,13 @@ def calc_damage_1(
 
     healing_bonus = attr.calculate_healing(attr.effect_attack)
 
-    crit_damage = f"{healing_bonus:,.0f}"
-    return None, crit_damage
+    crit_damage = healing_bonus
+    return DamageResult(None, crit_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(heal_bonus)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -91,7 +91,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], "2", skillLevel
     )
     title = "草木生长"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_healing_skill_multi(skill_multi, title, msg)
 
     damage_func = [cast_attack, cast_skill, cast_liberation]
@@ -120,13 +120,13 @@ def calc_damage_2(
 
     healing_bonus = attr.calculate_healing(attr.effect_attack)
 
-    crit_damage = f"{healing_bonus:,.0f}"
-    return None, crit_damage
+    crit_damage = healing_bonus
+    return DamageResult(None, crit_damage)
 
 
 def calc_damage_3(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(heal_bonus)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -146,7 +146,7 @@ def calc_damage_3(
         char_result.skillTrees, SkillTreeMap[skill_type], "4", skillLevel
     )
     title = "协同攻击"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_healing_skill_multi(skill_multi, title, msg)
 
     damage_func = [cast_attack, cast_skill, cast_liberation]
@@ -180,8 +180,8 @@ def calc_damage_3(
 
     healing_bonus = attr.calculate_healing(attr.effect_attack)
 
-    crit_damage = f"{healing_bonus:,.0f}"
-    return None, crit_damage
+    crit_damage = healing_bonus
+    return DamageResult(None, crit_damage)
 
 
 damage_detail = [
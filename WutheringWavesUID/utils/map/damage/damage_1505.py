@@ -2,7 +2,7 @@
 from .damage import echo_damage, weapon_damage, phase_damage
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     cast_skill,
     skill_damage_calc,
@@ -14,7 +14,7 @@ from ...damage.utils import (
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     damage_func = [cast_skill]
     attr.set_char_damage(heal_bonus)
     attr.set_char_template("temp_life")
@@ -30,7 +30,7 @@ def calc_damage_1(
     # 技能倍率
     skill_multi = skill_damage_calc(char_result.skillTrees, "2", "2", skillLevel)
     title = "混沌理论"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_healing_skill_multi(skill_multi, title, msg)
 
     # 设置角色等级
@@ -50,13 +50,13 @@ def calc_damage_1(
 
     healing_bonus = attr.calculate_healing(attr.effect_life)
 
-    crit_damage = f"{healing_bonus:,.0f}"
-    return None, crit_damage
+    crit_damage = healing_bonus
+    return DamageResult(None, crit_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> (str, str):
+) -> DamageResult:
     damage_func = [cast_skill]
     attr.set_char_damage(heal_bonus)
     attr.set_char_template("temp_life")
@@ -72,7 +72,7 @@ def calc_damage_2(
     # 技能倍率
     skill_multi = skill_damage_calc(char_result.skillTrees, "3", "1", skillLevel)
     title = "终末回环"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_healing_skill_multi(skill_multi, title, msg)
 
     # 设置角色等级
@@ -92,13 +92,13 @@ def calc_damage_2(
 
     healing_bonus = attr.calculate_healing(attr.effect_life)
 
-    crit_damage = f"{healing_bonus:,.0f}"
-    return None, crit_damage
+    crit_damage = healing_bonus
+    return DamageResult(None, crit_damage)
 
 
 def calc_damage_3(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> (str, str):
+) -> DamageResult:
     attr.set_char_damage(liberation_damage)
     attr.set_char_template("temp_life")
 
@@ -113,7 +113,7 @@ def calc_damage_3(
     # 技能倍率
     skill_multi = skill_damage_calc(char_result.skillTrees, "6", "2", skillLevel)
     title = "洞悉伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     damage_func = [cast_variation]
@@ -145,8 +145,8 @@ def calc_damage_3(
 
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
-    crit_damage = f"{attr.calculate_crit_damage(attr.effect_life):,.0f}"
-    return None, crit_damage
+    crit_damage = attr.calculate_crit_damage(attr.effect_life)
+    return DamageResult(None, crit_damage)
 
 
 damage_detail = [
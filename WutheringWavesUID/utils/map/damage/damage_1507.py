@@ -2,7 +2,7 @@
 
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute, calc_percent_expression
+from ...damage.damage import DamageAttribute, DamageResult, calc_percent_expression
 from ...damage.utils import (
     SkillTreeMap,
     SkillType,
@@ -21,7 +21,7 @@ from .damage import echo_damage, phase_damage, weapon_damage
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_spectro_deepen()
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
@@ -40,7 +40,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "3", skillLevel
     )
     title = "集中压制伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -93,15 +93,15 @@ def calc_damage_1(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_spectro_deepen()
     # 设置角色伤害类型
     attr.set_char_damage(hit_damage)
@@ -120,7 +120,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], "3", skillLevel
     )
     title = "终夜伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 每点【焰光】增加倍率
@@ -128,7 +128,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], "4", skillLevel
     )
     title = "【焰光】增加倍率*40层"
-    msg = f"{yanguang_multi}*40"
+    msg = f"{yanguang_multi}*40" if attr.trace else ""
     attr.add_skill_multi(f"{yanguang_multi}*40", title, msg)
 
     title = "斩棘"
@@ -185,15 +185,15 @@ def calc_damage_2(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_3(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_spectro_deepen()
     # 设置角色伤害类型
     attr.set_char_damage(hit_damage)
@@ -214,7 +214,7 @@ def calc_damage_3(
     sm = skill_multi.split("+")
     skill_multi = calc_percent_expression(sm[1]) * 0.5303128453301832
     title = "终夜尾刀伤害"
-    msg = f"技能倍率{skill_multi*100:.2f}%"
+    msg = f"技能倍率{skill_multi*100:.2f}%" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 每点【焰光】增加倍率
@@ -222,7 +222,7 @@ def calc_damage_3(
         char_result.skillTrees, SkillTreeMap[skill_type], "4", skillLevel
     )
     title = "【焰光】增加倍率*20层"
-    msg = f"{yanguang_multi}*20"
+    msg = f"{yanguang_multi}*20" if attr.trace else ""
     attr.add_skill_multi(f"{yanguang_multi}*20")
 
     title = "斩棘"
@@ -278,15 +278,15 @@ def calc_damage_3(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_4(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(liberation_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -304,7 +304,7 @@ def calc_damage_4(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = "重燃伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -356,15 +356,15 @@ def calc_damage_4(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_5(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(liberation_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -384,7 +384,7 @@ def calc_damage_5(
     sm = skill_multi.split("+")
     skill_multi = calc_percent_expression(sm[1])
     title = "终绝将至之刻2段伤害"
-    msg = f"技能倍率{skill_multi*100:.2f}%"
+    msg = f"技能倍率{skill_multi*100:.2f}%" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -436,15 +436,15 @@ def calc_damage_5(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_10(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_spectro_deepen()
     attr.set_char_damage(hit_damage)
     attr.set_char_template("temp_atk")
@@ -457,7 +457,7 @@ def calc_damage_10(
 
 def calc_damage_11(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_spectro_deepen()
     attr.set_char_damage(hit_damage)
     attr.set_char_template("temp_atk")
@@ -472,7 +472,7 @@ def calc_damage_11(
 
 def calc_damage_12(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_spectro_deepen()
     attr.set_char_damage(hit_damage)
     attr.set_char_template("temp_atk")
@@ -487,7 +487,7 @@ def calc_damage_12(
 
 def calc_damage_13(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_spectro_deepen()
     attr.set_char_damage(hit_damage)
     attr.set_char_template("temp_atk")
@@ -502,7 +502,7 @@ def calc_damage_13(
 
 def calc_damage_14(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_spectro_deepen()
     attr.set_char_damage(hit_damage)
     attr.set_char_template("temp_atk")
@@ -517,7 +517,7 @@ def calc_damage_14(
 
 def calc_damage_15(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     attr.set_env_spectro_deepen()
     attr.set_char_damage(hit_damage)
     attr.set_char_template("temp_atk")
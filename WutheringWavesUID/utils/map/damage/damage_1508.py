@@ -2,7 +2,7 @@
 
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail
-from ...damage.damage import DamageAttribute, calc_percent_expression
+from ...damage.damage import DamageAttribute, DamageResult, calc_percent_expression
 from ...damage.utils import (
     SkillTreeMap,
     SkillType,
@@ -20,7 +20,7 @@ from .damage import echo_damage, phase_damage, weapon_damage
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     """
     即刻·归无伤害
     """
@@ -44,7 +44,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "20", skillLevel
     )
     title = "即刻·归无伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -104,15 +104,15 @@ def calc_damage_1(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     """
     即刻·归无治疗量
     """
@@ -134,7 +134,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], "21", skillLevel
     )
     title = "即刻·归无治疗量"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_healing_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -169,13 +169,13 @@ def calc_damage_2(
 
     # 治疗量
     healing_bonus = attr.calculate_healing(attr.effect_attack)
-    crit_damage = f"{healing_bonus:,.0f}"
-    return None, crit_damage
+    crit_damage = healing_bonus
+    return DamageResult(None, crit_damage)
 
 
 def calc_damage_3(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     """
     电锯模式长按总伤（锯环·疾攻第2段长按+第3段长按+锯环·终结）
     """
@@ -217,22 +217,26 @@ def calc_damage_3(
 
     # 分别添加各部分技能倍率
     title = "锯环·疾攻第2段长按"
-    msg = f"技能倍率{skill_multi_2}"
+    msg = f"技能倍率{skill_multi_2}" if attr.trace else ""
     attr.add_skill_multi(skill_multi_2, title, msg)
 
     title = "锯环·疾攻第3段长按"
-    msg = f"技能倍率{skill_multi_3}"
+    msg = f"技能倍率{skill_multi_3}" if attr.trace else ""
     attr.add_skill_multi(skill_multi_3, title, msg)
 
     title = "锯环·终结基础伤害"
-    msg = f"技能倍率{skill_multi_final}"
+    msg = f"技能倍率{skill_multi_final}" if attr.trace else ""
     attr.add_skill_multi(skill_multi_final, title, msg)
 
     # 残响加成（使用calc_percent_expression计算数值）
     per_echo_value = calc_percent_expression(skill_multi_per_echo)
     echo_bonus = per_echo_value * echo_consumed
     title = "锯环·终结残响加成"
-    msg = f"每点残响{skill_multi_per_echo}×{echo_consumed}点={echo_bonus:.2%}"
+    msg = (
+        f"每点残响{skill_multi_per_echo}×{echo_consumed}点={echo_bonus:.2%}"
+        if attr.trace
+        else ""
+    )
     attr.add_skill_multi(f"{echo_bonus:.2%}", title, msg)
 
     # 设置角色施放技能
@@ -308,15 +312,15 @@ def calc_damage_3(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_4(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> tuple[str, str]:
+) -> DamageResult:
     """
     65守/即刻·归无伤害
     """
@@ -3,7 +3,7 @@
 from .damage import echo_damage, weapon_damage, phase_damage
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     skill_damage_calc,
     SkillType,
@@ -22,7 +22,7 @@ def calc_damage_1(
     role: RoleDetailData,
     isGroup: bool = False,
     isHitCounterattack: bool = False,
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(attack_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -40,21 +40,21 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "9", skillLevel
     )
     title = f"御反之隙第一段伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     skill_multi = skill_damage_calc(
         char_result.skillTrees, SkillTreeMap[skill_type], "10", skillLevel
     )
     title = f"御反之隙第二段伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     skill_multi = skill_damage_calc(
         char_result.skillTrees, SkillTreeMap[skill_type], "11", skillLevel
     )
     title = f"御反之隙第三段伤害"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -101,10 +101,10 @@ def calc_damage_1(
 
     effect_value = attr.effect_def
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage(effect_value):,.0f}"
+    crit_damage = attr.calculate_crit_damage(effect_value)
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage(effect_value):,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage(effect_value)
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_2(
@@ -112,7 +112,7 @@ def calc_damage_2(
     role: RoleDetailData,
     isGroup: bool = False,
     isHitCounterattack: bool = False,
-) -> (str, str):
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(liberation_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -130,7 +130,7 @@ def calc_damage_2(
         char_result.skillTrees, SkillTreeMap[skill_type], "20", skillLevel
     )
     title = f"不动如山"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -174,10 +174,10 @@ def calc_damage_2(
 
     effect_value = attr.effect_def
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage(effect_value):,.0f}"
+    crit_damage = attr.calculate_crit_damage(effect_value)
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage(effect_value):,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage(effect_value)
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_3(
@@ -185,7 +185,7 @@ def calc_damage_3(
     role: RoleDetailData,
     isGroup: bool = False,
     isHitCounterattack: bool = False,
-) -> (str, str):
+) -> DamageResult:
     damage_func = [cast_attack, cast_skill, cast_hit]
     attr.set_char_damage("")
     attr.set_char_template("temp_def")
@@ -202,21 +202,21 @@ def calc_damage_3(
         char_result.skillTrees, SkillTreeMap[skill_type], "27", skillLevel
     )
     title = f"御反之隙第一段护盾"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_shield_skill_multi(skill_multi, title, msg)
 
     skill_multi = skill_damage_calc(
         char_result.skillTrees, SkillTreeMap[skill_type], "28", skillLevel
     )
     title = f"御反之隙第二段护盾"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_shield_skill_multi(skill_multi, title, msg)
 
     skill_multi = skill_damage_calc(
         char_result.skillTrees, SkillTreeMap[skill_type], "29", skillLevel
     )
     title = f"御反之隙第三段护盾"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_shield_skill_multi(skill_multi, title, msg)
 
     # 设置角色等级
@@ -247,8 +247,8 @@ def calc_damage_3(
 
     shield_bonus = attr.calculate_shield(attr.effect_def)
 
-    crit_damage = f"{shield_bonus:,.0f}"
-    return None, crit_damage
+    crit_damage = shield_bonus
+    return DamageResult(None, crit_damage)
 
 
 damage_detail = [
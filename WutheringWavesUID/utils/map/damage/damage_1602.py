@@ -3,7 +3,7 @@ from typing import List, Union
 
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     cast_hit,
     cast_liberation,
@@ -85,7 +85,7 @@ def calc_damage_1(
     role: RoleDetailData,
     isGroup: bool = False,
     skill_type: Union[str, List[str]] = "满能缭乱",
-) -> tuple[str, str]:
+) -> DamageResult:
     """
     满能缭乱伤害
     """
@@ -112,28 +112,28 @@ def calc_damage_1(
     if "满能缭乱" in skill_type:
         skill_multi = skill_damage_calc(char_result.skillTrees, "7", "3", skillLevel)
         title = "满能缭乱伤害"
-        msg = f"技能倍率{skill_multi}"
+        msg = f"技能倍率{skill_multi}" if attr.trace else ""
         attr.add_skill_multi(skill_multi, title, msg)
 
     if "满能纷落" in skill_type:
         skill_multi = skill_damage_calc(char_result.skillTrees, "7", "4", skillLevel)
         title = "满能纷落伤害"
-        msg = f"技能倍率{skill_multi}"
+        msg = f"技能倍率{skill_multi}" if attr.trace else ""
         attr.add_skill_multi(skill_multi, title, msg)
 
     attr.set_phantom_dmg_bonus()
 
     calc_damage(attr, role, damage_func, isGroup)
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_4(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     """
     绯红绽放
     """
@@ -159,12 +159,12 @@ def calc_damage_4(
     # 技能倍率
     skill_multi = skill_damage_calc(char_result.skillTrees, "3", "1", skillLevel)
     title = "连续攻击"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     skill_multi = skill_damage_calc(char_result.skillTrees, "3", "2", skillLevel)
     title = "绯刹爆发"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     attr.set_phantom_dmg_bonus()
@@ -172,10 +172,10 @@ def calc_damage_4(
     calc_damage(attr, role, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 damage_detail = [
@@ -3,7 +3,7 @@ from .buff import shouanren_buff, motefei_buff
 from .damage import echo_damage, phase_damage, weapon_damage
 from ...api.model import RoleDetailData
 from ...ascension.char import get_char_detail2
-from ...damage.damage import DamageAttribute
+from ...damage.damage import DamageAttribute, DamageResult
 from ...damage.utils import (
     SkillType,
     SkillTreeMap,
@@ -18,7 +18,7 @@ from ...damage.utils import (
 
 def calc_damage_0(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     title = "默认手法"
     if isGroup:
         msg = "变奏入场 a qr e aaa"
@@ -107,7 +107,7 @@ def calc_damage_0(
         atk_flat = min(atk_flat, 200)
 
         title = f"{role_name}-暴击提升攻击值"
-        msg = f"暴击最高可提升200点攻击，当前提升{atk_flat}点"
+        msg = f"暴击最高可提升200点攻击，当前提升{atk_flat}点" if attr.trace else ""
         attr.add_atk_flat(atk_flat, title, msg)
 
     title = "普攻·幻想照进现实-第{}段倍率"
@@ -115,49 +115,54 @@ def calc_damage_0(
     msg = "技能倍率{}"
     if chain_num >= 2:
         attr.add_dmg_bonus(0.1)
-    attr.add_effect(title.format(1), msg.format(skill_multi1))
+    if attr.trace:
+        attr.add_effect(title.format(1), msg.format(skill_multi1))
     attr.set_skill_multi(skill_multi1)
     crit_damage1 = attr.calculate_crit_damage()
     expected_damage1 = attr.calculate_expected_damage()
-    attr.add_effect(
-        title2.format(1),
-        f"期望伤害:{crit_damage1:,.0f}; 暴击伤害:{expected_damage1:,.0f}",
-    )
+    if attr.trace:
+        attr.add_effect(
+            title2.format(1),
+            f"期望伤害:{crit_damage1:,.0f}; 暴击伤害:{expected_damage1:,.0f}",
+        )
     if chain_num >= 2:
         attr.add_dmg_bonus(0.1)
-    attr.add_effect(title.format(2), msg.format(skill_multi2))
+    if attr.trace:
+        attr.add_effect(title.format(2), msg.format(skill_multi2))
     attr.set_skill_multi(skill_multi2)
     crit_damage2 = attr.calculate_crit_damage()
     expected_damage2 = attr.calculate_expected_damage()
-    attr.add_effect(
-        title2.format(2),
-        f"期望伤害:{crit_damage2:,.0f}; 暴击伤害:{expected_damage2:,.0f}",
-    )
+    if attr.trace:
+        attr.add_effect(
+            title2.format(2),
+            f"期望伤害:{crit_damage2:,.0f}; 暴击伤害:{expected_damage2:,.0f}",
+        )
 
     if chain_num >= 2:
         attr.add_dmg_bonus(0.2)
-    attr.add_effect(title.format(3), msg.format(skill_multi3))
+    if attr.trace:
+        attr.add_effect(title.format(3), msg.format(skill_multi3))
     attr.set_skill_multi(skill_multi3)
     crit_damage3 = attr.calculate_crit_damage()
     expected_damage3 = attr.calculate_expected_damage()
-    attr.add_effect(
-        title2.format(3),
-        f"期望伤害:{crit_damage3:,.0f}; 暴击伤害:{expected_damage3:,.0f}",
+    if attr.trace:
+        attr.add_effect(
+            title2.format(3),
+            f"期望伤害:{crit_damage3:,.0f}; 暴击伤害:{expected_damage3:,.0f}",
+        )
+
+    return DamageResult.merge(
+        [
+            (title2.format(1), DamageResult(crit_damage1, expected_damage1)),
+            (title2.format(2), DamageResult(crit_damage2, expected_damage2)),
+            (title2.format(3), DamageResult(crit_damage3, expected_damage3)),
+        ]
     )
 
-    crit_damage = crit_damage1 + crit_damage2 + crit_damage3
-    expected_damage = expected_damage1 + expected_damage2 + expected_damage3
-
-    # 暴击伤害
-    crit_damage = f"{crit_damage:,.0f}"
-    # 期望伤害
-    expected_damage = f"{expected_damage:,.0f}"
-    return crit_damage, expected_damage
-
 
 def calc_damage_1(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     title = "默认手法"
     if isGroup:
         msg = "变奏入场 a qr e aaa"
@@ -182,7 +187,7 @@ def calc_damage_1(
         char_result.skillTrees, SkillTreeMap[skill_type], "3", skillLevel
     )
     title = f"普攻·幻想照进现实-第三段"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -242,19 +247,19 @@ def calc_damage_1(
         atk_flat = min(atk_flat, 200)
 
         title = f"{role_name}-暴击提升攻击值"
-        msg = f"暴击最高可提升200点攻击，当前提升{atk_flat}点"
+        msg = f"暴击最高可提升200点攻击，当前提升{atk_flat}点" if attr.trace else ""
         attr.add_atk_flat(atk_flat, title, msg)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_3(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = False
-) -> tuple[str, str]:
+) -> DamageResult:
     title = "默认手法"
     if isGroup:
         msg = "变奏入场 a e aaa qr"
@@ -279,7 +284,7 @@ def calc_damage_3(
         char_result.skillTrees, SkillTreeMap[skill_type], "1", skillLevel
     )
     title = f"即兴喜剧开场"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -336,19 +341,19 @@ def calc_damage_3(
         atk_flat = min(atk_flat, 200)
 
         title = f"{role_name}-暴击提升攻击值"
-        msg = f"暴击最高可提升200点攻击，当前提升{atk_flat}点"
+        msg = f"暴击最高可提升200点攻击，当前提升{atk_flat}点" if attr.trace else ""
         attr.add_atk_flat(atk_flat, title, msg)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 def calc_damage_10(
     attr: DamageAttribute, role: RoleDetailData, isGroup: bool = True
-) -> (str, str):
+) -> DamageResult:
     attr.set_char_damage(hit_damage)
     attr.set_char_template("temp_atk")
     # 守岸人buff
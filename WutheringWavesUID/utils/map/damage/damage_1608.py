@@ -3,7 +3,7 @@
 
 from ...api.model import RoleDetailData
 from ...ascension.char import WavesCharResult, get_char_detail2
-from ...damage.damage import DamageAttribute, calc_percent_expression
+from ...damage.damage import DamageAttribute, DamageResult, calc_percent_expression
 from ...damage.utils import (
     SkillTreeMap,
     SkillType,
@@ -52,7 +52,7 @@ def calc_damage_1(
     role: RoleDetailData,
     isGroup: bool = False,
     isSingle: bool = True,
-) -> tuple[str, str]:
+) -> DamageResult:
     # 设置角色伤害类型
     attr.set_char_damage(skill_damage)
     # 设置角色模板  "temp_atk", "temp_life", "temp_def"
@@ -80,7 +80,7 @@ def calc_damage_1(
         skill_multi = f"{s2*100:.2f}%"
 
     title = "谱曲终末"
-    msg = f"技能倍率{skill_multi}"
+    msg = f"技能倍率{skill_multi}" if attr.trace else ""
     attr.add_skill_multi(skill_multi, title, msg)
 
     # 余响层数
@@ -96,7 +96,11 @@ def calc_damage_1(
         f"{aftersound_skill_multi}*{aftersound_num_multi}*{aftersound_percent}"
     )
     title = f"{role_name}-余响"
-    msg = f"{aftersound_num_multi}层余响-余响倍率{aftersound_skill_multi}"
+    msg = (
+        f"{aftersound_num_multi}层余响-余响倍率{aftersound_skill_multi}"
+        if attr.trace
+        else ""
+    )
     attr.add_skill_multi(aftersound_skill_multi, title, msg)
 
     # 设置角色施放技能
@@ -112,7 +116,7 @@ def calc_damage_1(
         crit_dmg = calc_aftersound_crit_dmg(aftersound_num)
         crit_dmg_str = f"{crit_dmg*100:.2f}%"
         title = f"{role_name}-固有技能-八重奏"
-        msg = f"{aftersound_num}层余响-暴击伤害提升{crit_dmg_str}"
+        msg = f"{aftersound_num}层余响-暴击伤害提升{crit_dmg_str}" if attr.trace else ""
         attr.add_crit_dmg(crit_dmg, title, msg)
 
     # 设置角色技能施放是不是也有加成 eg：守岸人
@@ -139,10 +143,10 @@ def calc_damage_1(
     weapon_damage(attr, role.weaponData, damage_func, isGroup)
 
     # 暴击伤害
-    crit_damage = f"{attr.calculate_crit_damage():,.0f}"
+    crit_damage = attr.calculate_crit_damage()
     # 期望伤害
-    expected_damage = f"{attr.calculate_expected_damage():,.0f}"
-    return crit_damage, expected_damage
+    expected_damage = attr.calculate_expected_damage()
+    return DamageResult(crit_damage, expected_damage)
 
 
 damage_detail = [
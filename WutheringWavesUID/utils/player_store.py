@@ -0,0 +1,492 @@
+"""
+玩家面板数据存储 players/<uid>/rawData.bin
+
+文件结构:
+    | magic(4) | version(1) | index_len(4) | index | record | record | ...
+
+index 为 msgpack 编码的 [roleId, offset, length, hash] 列表，offset 相对于第一条
+record 的起始位置；每条 record 为单个角色原始数据的 msgpack 编码。
+只需要单个角色时，读取 index 后直接 seek 到对应 record 解码，无需解析整个文件。
+
+旧版本的 rawData.json 会在首次读取时自动迁移。
+
+文件内容按 uid 缓存在内存中(LRU)，以文件 mtime/size 校验是否过期，
+写入时同步更新缓存，总占用受 PlayerCacheSize 配置限制。缓存中只保存 msgpack 编码，
+每次读取时重新解码，调用方拿到的 dict 都是独立的副本，可以随意修改。
+"""
+
+import asyncio
+import hashlib
+import json
+import shutil
+import struct
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+import aiofiles
+from msgspec import Struct, msgpack
+
+from gsuid_core.logger import logger
+
+from .api.model_struct import RoleDetailStruct, decode_role_detail
+from .atomic_writer import storage_writer
+from .cache import register_cache
+from .resource.RESOURCE_PATH import PLAYER_PATH
+
+RAW_DATA_FILE = "rawData.bin"
+RAW_DATA_JSON_FILE = "rawData.json"
+# 旧版本单独保存的角色哈希
+RAW_DATA_HASH_FILE = "rawDataHash.json"
+
+MAGIC = b"WWPD"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBI")
+
+
+class PlayerIndexEntry(Struct, array_like=True):
+    roleId: int
+    offset: int
+    length: int
+    hash: str
+
+
+_index_encoder = msgpack.Encoder()
+_index_decoder = msgpack.Decoder(List[PlayerIndexEntry])
+_record_encoder = msgpack.Encoder()
+_record_decoder = msgpack.Decoder(dict)
+
+
+def get_role_hash(role_detail: Dict) -> str:
+    """单个角色原始数据的内容哈希"""
+    raw = json.dumps(
+        role_detail, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def get_player_path(uid: str) -> Path:
+    return PLAYER_PATH / uid / RAW_DATA_FILE
+
+
+def encode_player_data(
+    data: List[Dict], role_hash: Optional[Dict[int, str]] = None
+) -> bytes:
+    records: List[bytes] = []
+    index: List[PlayerIndexEntry] = []
+    offset = 0
+    for item in data:
+        role_id = item["role"]["roleId"]
+        record = _record_encoder.encode(item)
+        _hash = (role_hash or {}).get(role_id) or get_role_hash(item)
+        index.append(PlayerIndexEntry(role_id, offset, len(record), _hash))
+        records.append(record)
+        offset += len(record)
+
+    index_bytes = _index_encoder.encode(index)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(index_bytes))
+    return b"".join([header, index_bytes, *records])
+
+
+def _decode_header(buf: bytes) -> int:
+    magic, version, index_len = HEADER.unpack_from(buf)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"unknown player data format {magic!r} v{version}")
+    return index_len
+
+
+def decode_player_index(buf: bytes) -> Tuple[List[PlayerIndexEntry], int]:
+    """返回 (index, record 起始位置)"""
+    index_len = _decode_header(buf)
+    start = HEADER.size + index_len
+    return _index_decoder.decode(buf[HEADER.size : start]), start
+
+
+def decode_player_data(buf: bytes) -> List[Dict]:
+    index, start = decode_player_index(buf)
+    view = memoryview(buf)
+    return [
+        _record_decoder.decode(view[start + i.offset : start + i.offset + i.length])
+        for i in index
+    ]
+
+
+class PlayerCacheEntry(Struct):
+    stat_key: Tuple[int, int]
+    buf: bytes
+    index: List[PlayerIndexEntry]
+    # 第一条 record 的起始位置
+    start: int
+
+    def record(self, i: PlayerIndexEntry) -> bytes:
+        offset = self.start + i.offset
+        return self.buf[offset : offset + i.length]
+
+    def decode_all(self) -> List[Dict]:
+        return [_record_decoder.decode(self.record(i)) for i in self.index]
+
+
+class PlayerDataCache:
+    """uid -> 面板数据文件内容"""
+
+    def __init__(self):
+        self._cache: "OrderedDict[str, PlayerCacheEntry]" = OrderedDict()
+        self.cur_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        # 计算进程也会导入本模块，配置在使用时再导入
+        from ..wutheringwaves_config import WutheringWavesConfig
+
+        mb = WutheringWavesConfig.get_config("PlayerCacheSize").data
+        return max(mb, 0) * 1024 * 1024
+
+    def get(self, uid: str, stat_key: Tuple[int, int]) -> Optional[PlayerCacheEntry]:
+        entry = self._cache.get(uid)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.stat_key != stat_key:
+            # 文件被外部修改
+            self.invalidate(uid)
+            self.misses += 1
+            return None
+        self._cache.move_to_end(uid)
+        self.hits += 1
+        return entry
+
+    def set(self, uid: str, entry: PlayerCacheEntry):
+        self.invalidate(uid)
+        max_size = self.max_size
+        size = len(entry.buf)
+        if size > max_size:
+            return
+        self._cache[uid] = entry
+        self.cur_size += size
+        while self.cur_size > max_size and self._cache:
+            _, old = self._cache.popitem(last=False)
+            self.cur_size -= len(old.buf)
+            self.evictions += 1
+
+    def invalidate(self, uid: str):
+        entry = self._cache.pop(uid, None)
+        if entry is not None:
+            self.cur_size -= len(entry.buf)
+
+    def clear(self):
+        self._cache.clear()
+        self.cur_size = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def cache_size(self) -> int:
+        return int(self.cur_size)
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "num": len(self._cache),
+            "size_mb": self.cur_size / 1024 / 1024,
+            "max_size_mb": self.max_size / 1024 / 1024,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+player_cache = PlayerDataCache()
+register_cache("player_data", player_cache)
+
+
+def _get_stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+async def _migrate_json(uid: str) -> bool:
+    """rawData.json -> rawData.bin"""
+    _dir = PLAYER_PATH / uid
+    json_path = _dir / RAW_DATA_JSON_FILE
+    bin_path = _dir / RAW_DATA_FILE
+    if not json_path.exists():
+        return False
+    # 外部仍可能写入 rawData.json(如旧版本)，以较新的为准
+    if bin_path.exists() and bin_path.stat().st_mtime >= json_path.stat().st_mtime:
+        return False
+
+    try:
+        async with aiofiles.open(json_path, mode="r", encoding="utf-8") as f:
+            data = json.loads(await f.read())
+    except Exception as e:
+        logger.exception(f"migrate player data failed {json_path}:", e)
+        json_path.unlink(missing_ok=True)
+        return False
+
+    await save_player_raw(uid, data)
+    json_path.unlink(missing_ok=True)
+    (_dir / RAW_DATA_HASH_FILE).unlink(missing_ok=True)
+    logger.info(f"[鸣潮] 面板数据迁移完成 {uid}: {len(data)}个角色")
+    return True
+
+
+async def _read_bytes(path: Path) -> Optional[bytes]:
+    try:
+        async with aiofiles.open(path, mode="rb") as f:
+            return await f.read()
+    except Exception as e:
+        logger.exception(f"read player data failed {path}:", e)
+        return None
+
+
+async def _load_player_entry(uid: str) -> Optional[PlayerCacheEntry]:
+    await _migrate_json(uid)
+    path = get_player_path(uid)
+    stat_key = _get_stat_key(path)
+    if stat_key is None:
+        player_cache.invalidate(uid)
+        return None
+
+    entry = player_cache.get(uid, stat_key)
+    if entry is not None:
+        return entry
+
+    buf = await _read_bytes(path)
+    if buf is None:
+        return None
+    try:
+        index, start = decode_player_index(buf)
+    except Exception as e:
+        logger.exception(f"decode player data failed {path}:", e)
+        path.unlink(missing_ok=True)
+        player_cache.invalidate(uid)
+        return None
+
+    # 读取期间文件可能被替换，以读取前的 stat 为准，下次读取时会重新校验
+    entry = PlayerCacheEntry(stat_key, buf, index, start)
+    player_cache.set(uid, entry)
+    return entry
+
+
+async def load_player_raw(uid: str) -> Optional[List[Dict]]:
+    """读取全部角色原始数据，每次调用都重新解码，返回的 dict 可以修改"""
+    entry = await _load_player_entry(uid)
+    if entry is None:
+        return None
+    try:
+        return entry.decode_all()
+    except Exception as e:
+        path = get_player_path(uid)
+        logger.exception(f"decode player data failed {path}:", e)
+        path.unlink(missing_ok=True)
+        player_cache.invalidate(uid)
+        return None
+
+
+async def load_player_index(uid: str) -> Optional[List[PlayerIndexEntry]]:
+    """只读取 index，不解码角色数据"""
+    await _migrate_json(uid)
+    path = get_player_path(uid)
+    stat_key = _get_stat_key(path)
+    if stat_key is None:
+        return None
+    entry = player_cache.get(uid, stat_key)
+    if entry is not None:
+        return list(entry.index)
+    try:
+        async with aiofiles.open(path, mode="rb") as f:
+            head = await f.read(HEADER.size)
+            index_len = _decode_header(head)
+            return _index_decoder.decode(await f.read(index_len))
+    except Exception as e:
+        logger.exception(f"decode player index failed {path}:", e)
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _to_role_ids(role_id: Union[int, str, List[int], List[str]]) -> Set[int]:
+    if isinstance(role_id, (int, str)):
+        return {int(role_id)}
+    return {int(i) for i in role_id}
+
+
+def _get_cached_role(
+    uid: str, role_id: Union[int, str, List[int], List[str]]
+) -> Tuple[bool, Optional[bytes]]:
+    """(是否命中缓存, 角色 record)"""
+    stat_key = _get_stat_key(get_player_path(uid))
+    if stat_key is None:
+        return False, None
+    entry = player_cache.get(uid, stat_key)
+    if entry is None:
+        return False, None
+    role_ids = _to_role_ids(role_id)
+    for i in entry.index:
+        if i.roleId in role_ids:
+            return True, entry.record(i)
+    return True, None
+
+
+async def _load_player_role_bytes(
+    uid: str, role_id: Union[int, str, List[int], List[str]]
+) -> Optional[bytes]:
+    await _migrate_json(uid)
+    path = get_player_path(uid)
+    if not path.exists():
+        return None
+
+    if isinstance(role_id, (int, str)):
+        role_ids = {int(role_id)}
+    else:
+        role_ids = {int(i) for i in role_id}
+
+    try:
+        async with aiofiles.open(path, mode="rb") as f:
+            head = await f.read(HEADER.size)
+            index_len = _decode_header(head)
+            index = _index_decoder.decode(await f.read(index_len))
+            entry = next((i for i in index if i.roleId in role_ids), None)
+            if entry is None:
+                return None
+            await f.seek(HEADER.size + index_len + entry.offset)
+            return await f.read(entry.length)
+    except Exception as e:
+        logger.exception(f"decode player index failed {path}:", e)
+        path.unlink(missing_ok=True)
+        return None
+
+
+async def load_player_role_raw(
+    uid: str, role_id: Union[int, str, List[int], List[str]]
+) -> Optional[Dict]:
+    """按角色id读取单个角色原始数据，role_id 为列表时返回第一个匹配的角色"""
+    await _migrate_json(uid)
+    hit, record = _get_cached_role(uid, role_id)
+    if not hit:
+        record = await _load_player_role_bytes(uid, role_id)
+    if record is None:
+        return None
+    try:
+        return _record_decoder.decode(record)
+    except Exception as e:
+        logger.exception(f"decode player role failed {uid}:", e)
+        return None
+
+
+async def load_player_role_struct(
+    uid: str, role_id: Union[int, str, List[int], List[str]]
+) -> Optional[RoleDetailStruct]:
+    """按角色id直接解码为 RoleDetailStruct，不经过 dict"""
+    await _migrate_json(uid)
+    hit, record = _get_cached_role(uid, role_id)
+    if not hit:
+        record = await _load_player_role_bytes(uid, role_id)
+    if record is None:
+        return None
+    try:
+        return decode_role_detail(record)
+    except Exception as e:
+        logger.exception(f"decode player role failed {uid}:", e)
+        return None
+
+
+async def load_role_hash(uid: str) -> Dict[str, str]:
+    """每个角色的内容哈希 {roleId: hash}"""
+    index = await load_player_index(uid)
+    if not index:
+        return {}
+    return {str(i.roleId): i.hash for i in index}
+
+
+async def save_player_raw(
+    uid: str, data: List[Dict], role_hash: Optional[Dict[int, str]] = None
+):
+    path = get_player_path(uid)
+    try:
+        buf = await asyncio.to_thread(encode_player_data, data, role_hash)
+        written = await storage_writer.write_bytes(path, buf)
+    except Exception as e:
+        logger.exception(f"save player data failed {path}:", e)
+        player_cache.invalidate(uid)
+        return
+
+    if not written:
+        # 已被之后的写入覆盖，由之后的写入更新缓存
+        return
+    stat_key = _get_stat_key(path)
+    if stat_key is None:
+        player_cache.invalidate(uid)
+        return
+    index, start = decode_player_index(buf)
+    player_cache.set(uid, PlayerCacheEntry(stat_key, buf, index, start))
+
+
+async def benchmark_player_store(uid: str, rounds: int = 20) -> Dict[str, float]:
+    """
+    对比 rawData.json 与 rawData.bin 的读写耗时(单位 ms，取平均)
+    使用真实账号数据，不会修改该账号的数据文件
+    """
+    data = await load_player_raw(uid)
+    if not data:
+        return {}
+
+    bench_dir = Path(tempfile.mkdtemp(prefix="waves_bench_"))
+    json_path = bench_dir / RAW_DATA_JSON_FILE
+    bin_path = bench_dir / RAW_DATA_FILE
+    role_id = data[len(data) // 2]["role"]["roleId"]
+
+    async def _timeit(func) -> float:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            await func()
+        return (time.perf_counter() - start) * 1000 / rounds
+
+    async def write_json():
+        async with aiofiles.open(json_path, "w", encoding="utf-8") as f:
+            await f.write(json.dumps(data, ensure_ascii=False))
+
+    async def read_json():
+        async with aiofiles.open(json_path, "r", encoding="utf-8") as f:
+            json.loads(await f.read())
+
+    async def write_bin():
+        async with aiofiles.open(bin_path, "wb") as f:
+            await f.write(encode_player_data(data))
+
+    async def read_bin():
+        async with aiofiles.open(bin_path, "rb") as f:
+            decode_player_data(await f.read())
+
+    async def read_bin_role():
+        async with aiofiles.open(bin_path, "rb") as f:
+            index_len = _decode_header(await f.read(HEADER.size))
+            index = _index_decoder.decode(await f.read(index_len))
+            entry = next(i for i in index if i.roleId == role_id)
+            await f.seek(HEADER.size + index_len + entry.offset)
+            _record_decoder.decode(await f.read(entry.length))
+
+    try:
+        result = {
+            "role_num": len(data),
+            "json_size_kb": 0.0,
+            "bin_size_kb": 0.0,
+            "json_write_ms": await _timeit(write_json),
+            "bin_write_ms": await _timeit(write_bin),
+            "json_read_ms": await _timeit(read_json),
+            "bin_read_ms": await _timeit(read_bin),
+            "bin_read_one_ms": await _timeit(read_bin_role),
+        }
+        result["json_size_kb"] = json_path.stat().st_size / 1024
+        result["bin_size_kb"] = bin_path.stat().st_size / 1024
+    finally:
+        shutil.rmtree(bench_dir, ignore_errors=True)
+    return result
@@ -0,0 +1,121 @@
+"""
+排行榜昵称解析
+
+- 库街区昵称缓存 KURO_NAME_TTL，失败的在 FAIL_TTL 内不再请求
+- 未缓存的昵称加入待解析队列，由后台任务按批解析，同时进行的请求不超过 PROFILE_CONCURRENCY
+- 同一批共用一个公共 ck 请求账号信息，不再为每个 uid 校验 ck；
+  只允许使用自己 ck 时才逐个获取
+- 排行先用占位名称绘制，解析完成后下次查询显示
+"""
+
+import asyncio
+from typing import Dict, Iterable, Optional, Tuple
+
+from gsuid_core.logger import logger
+
+from ..wutheringwaves_config import WutheringWavesConfig
+from .api.model import AccountBaseInfo
+from .cache import TimedCache
+from .info_cache import get_cached_account_info, set_cached_account_info
+from .waves_api import waves_api
+
+KURO_NAME_TTL = 86400
+FAIL_TTL = 600
+PROFILE_CONCURRENCY = 4
+BATCH_SIZE = 50
+
+kuro_name_cache = TimedCache(KURO_NAME_TTL, 20000, "profile.kuro_name")
+_failed_cache = TimedCache(FAIL_TTL, 20000)
+
+
+class ProfileResolver:
+    def __init__(self):
+        # uid -> (user_id, bot_id)
+        self._pending_names: Dict[str, Tuple[str, str]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.resolved = 0
+        self.failed = 0
+
+    def get_kuro_name(self, uid: str) -> Optional[str]:
+        name = kuro_name_cache.get(uid)
+        if name:
+            return name
+        account_info = get_cached_account_info(uid)
+        if account_info and account_info.name:
+            kuro_name_cache.set(uid, account_info.name)
+            return account_info.name
+        return None
+
+    def request_kuro_names(self, items: Iterable[Tuple[str, str, str]]):
+        """items 为 (uid, user_id, bot_id)，在后台解析未缓存的昵称"""
+        for uid, user_id, bot_id in items:
+            if uid in self._pending_names or self.get_kuro_name(uid):
+                continue
+            if _failed_cache.get(("name", uid)):
+                continue
+            self._pending_names[uid] = (user_id, bot_id)
+        self._schedule()
+
+    def pending(self) -> int:
+        return len(self._pending_names)
+
+    def _schedule(self):
+        if not self.pending():
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+
+    async def _drain(self):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(PROFILE_CONCURRENCY)
+        while self.pending():
+            names = dict(list(self._pending_names.items())[:BATCH_SIZE])
+            try:
+                await self._resolve_names(names)
+            except Exception as e:
+                logger.exception(f"[鸣潮] 昵称解析失败: {e}")
+            finally:
+                for uid in names:
+                    self._pending_names.pop(uid, None)
+
+    async def _resolve_names(self, batch: Dict[str, Tuple[str, str]]):
+        if not batch:
+            return
+        assert self._semaphore is not None
+        shared_ck = None
+        if not WutheringWavesConfig.get_config("WavesOnlySelfCk").data:
+            uid, (user_id, _) = next(iter(batch.items()))
+            shared_ck = await waves_api.get_waves_random_cookie(uid, user_id)
+
+        async def _resolve(uid: str, user_id: str, bot_id: str):
+            async with self._semaphore:
+                ck = shared_ck
+                if not ck:
+                    _, ck = await waves_api.get_ck_result(uid, user_id, bot_id)
+                if ck:
+                    account_info = await waves_api.get_base_info(uid, ck)
+                    if account_info.success:
+                        info = AccountBaseInfo.model_validate(account_info.data)
+                        set_cached_account_info(uid, info)
+                        kuro_name_cache.set(uid, info.name)
+                        self.resolved += 1
+                        return
+            self.failed += 1
+            _failed_cache.set(("name", uid), True)
+
+        results = await asyncio.gather(
+            *[
+                _resolve(uid, user_id, bot_id)
+                for uid, (user_id, bot_id) in batch.items()
+            ],
+            return_exceptions=True,
+        )
+        for uid, res in zip(batch, results):
+            if isinstance(res, Exception):
+                logger.warning(f"为特征码 {uid} 获取昵称失败: {res}")
+                self.failed += 1
+                _failed_cache.set(("name", uid), True)
+
+
+profile_resolver = ProfileResolver()
@@ -1,6 +1,4 @@
-from typing import Any
-
-import httpx
+from typing import Any, Awaitable, Callable, Optional
 
 from gsuid_core.logger import logger
 
@@ -10,100 +8,84 @@ from ..api.wwapi import (
     UPLOAD_URL,
 )
 from .const import QUEUE_ABYSS_RECORD, QUEUE_SCORE_RANK, QUEUE_SLASH_RECORD
-from .queues import register_handler, start_dispatcher
+from .queues import POLICY_DROP_OLDEST, register_handler, start_dispatcher
 
 
-async def send_score_rank(item: Any):
+async def _upload(
+    url: str,
+    item: Any,
+    name: str,
+    on_success: Optional[Callable[[], Awaitable[Any]]] = None,
+) -> bool:
+    """返回 False 时任务稍后重试，on_success 只在上传成功后调用"""
     if not item:
-        return
+        return True
     if not isinstance(item, dict):
-        return
+        return True
     from ...wutheringwaves_config import WutheringWavesConfig
+    from ..api.wwapi_client import get_wwapi_client
 
     WavesToken = WutheringWavesConfig.get_config("WavesToken").data
 
     if not WavesToken:
-        return
-
-    async with httpx.AsyncClient() as client:
-        res = None
+        return True
+
+    res = None
+    try:
+        res = await get_wwapi_client().post(
+            url,
+            json=item,
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {WavesToken}",
+            },
+        )
+        logger.info(f"上传{name}结果: {res.status_code} - {res.text}")
+    except Exception as e:
+        logger.exception(f"上传{name}失败: {res.text if res else ''} {e}")
+        return False
+    if on_success and 200 <= res.status_code < 300:
         try:
-            res = await client.post(
-                UPLOAD_URL,
-                json=item,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {WavesToken}",
-                },
-                timeout=httpx.Timeout(10),
-            )
-            logger.info(f"上传面板结果: {res.status_code} - {res.text}")
+            await on_success()
         except Exception as e:
-            logger.exception(f"上传面板失败: {res.text if res else ''} {e}")
-
-
-async def send_abyss_record(item: Any):
-    if not item:
-        return
-    if not isinstance(item, dict):
-        return
-    from ...wutheringwaves_config import WutheringWavesConfig
+            logger.exception(f"上传{name}成功后处理失败: {e}")
+    # 服务端错误时重试，其余状态码不再重试
+    return res.status_code < 500
 
-    WavesToken = WutheringWavesConfig.get_config("WavesToken").data
 
-    if not WavesToken:
-        return
+async def send_score_rank(item: Any) -> bool:
+    return await _upload(UPLOAD_URL, item, "面板")
 
-    async with httpx.AsyncClient() as client:
-        res = None
-        try:
-            res = await client.post(
-                UPLOAD_ABYSS_RECORD_URL,
-                json=item,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {WavesToken}",
-                },
-                timeout=httpx.Timeout(10),
-            )
-            logger.info(f"上传深渊结果: {res.status_code} - {res.text}")
-        except Exception as e:
-            logger.exception(f"上传深渊失败: {res.text if res else ''} {e}")
 
+async def send_abyss_record(item: Any) -> bool:
+    from ...wutheringwaves_abyss.snapshot_store import mark_uploaded
 
-async def send_slash_record(item: Any):
-    if not item:
-        return
-    if not isinstance(item, dict):
-        return
-    from ...wutheringwaves_config import WutheringWavesConfig
+    return await _upload(
+        UPLOAD_ABYSS_RECORD_URL,
+        item,
+        "深渊",
+        lambda: mark_uploaded(item["waves_id"], "abyss", item),
+    )
 
-    WavesToken = WutheringWavesConfig.get_config("WavesToken").data
 
-    if not WavesToken:
-        return
+async def send_slash_record(item: Any) -> bool:
+    from ...wutheringwaves_abyss.snapshot_store import mark_uploaded
 
-    async with httpx.AsyncClient() as client:
-        res = None
-        try:
-            res = await client.post(
-                UPLOAD_SLASH_RECORD_URL,
-                json=item,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {WavesToken}",
-                },
-                timeout=httpx.Timeout(10),
-            )
-            logger.info(f"上传冥海结果: {res.status_code} - {res.text}")
-        except Exception as e:
-            logger.exception(f"上传冥海失败: {res.text if res else ''} {e}")
+    return await _upload(
+        UPLOAD_SLASH_RECORD_URL,
+        item,
+        "冥海",
+        lambda: mark_uploaded(item["wavesId"], "slash", item),
+    )
 
 
 def init_queues():
-    # 注册处理函数
-    register_handler(QUEUE_SCORE_RANK, send_score_rank)
-    register_handler(QUEUE_ABYSS_RECORD, send_abyss_record)
-    register_handler(QUEUE_SLASH_RECORD, send_slash_record)
+    """需在 bot 的事件循环中调用"""
+    from ...wutheringwaves_config import WutheringWavesConfig
+
+    # 注册处理函数，上传积压时丢弃最早的数据
+    register_handler(QUEUE_SCORE_RANK, send_score_rank, policy=POLICY_DROP_OLDEST)
+    register_handler(QUEUE_ABYSS_RECORD, send_abyss_record, policy=POLICY_DROP_OLDEST)
+    register_handler(QUEUE_SLASH_RECORD, send_slash_record, policy=POLICY_DROP_OLDEST)
     # 启动任务分发器
-    start_dispatcher(daemon=True)
+    start_dispatcher(journal=WutheringWavesConfig.get_config("TaskJournal").data)
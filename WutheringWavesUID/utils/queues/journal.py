@@ -0,0 +1,105 @@
+"""
+任务日志 MAIN_PATH/task_journal.db
+
+任务入队时写入，处理成功或最终放弃后删除；启动时把未删除的任务重新入队，
+保证重启后任务至少执行一次
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from gsuid_core.logger import logger
+
+from ..resource.RESOURCE_PATH import MAIN_PATH
+
+JOURNAL_PATH = MAIN_PATH / "task_journal.db"
+
+
+class TaskJournal:
+    """sqlite 连接在线程池中使用，操作之间用锁串行"""
+
+    def __init__(self, path: Path = JOURNAL_PATH):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS task ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "task_type TEXT NOT NULL, "
+                "data TEXT NOT NULL, "
+                "created REAL NOT NULL, "
+                "attempts INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def add(self, task_type: str, data: Any) -> Optional[int]:
+        try:
+            content = json.dumps(data, ensure_ascii=False)
+        except (TypeError, ValueError):
+            # 无法序列化的任务只保存在内存中
+            return None
+        with self._lock:
+            conn = self._get_conn()
+            cur = conn.execute(
+                "INSERT INTO task (task_type, data, created) VALUES (?, ?, ?)",
+                (task_type, content, time.time()),
+            )
+            conn.commit()
+            return cur.lastrowid
+
+    def remove(self, task_id: int):
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute("DELETE FROM task WHERE id = ?", (task_id,))
+            conn.commit()
+
+    def set_attempts(self, task_id: int, attempts: int):
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute(
+                "UPDATE task SET attempts = ? WHERE id = ?", (attempts, task_id)
+            )
+            conn.commit()
+
+    def load(self) -> List[Tuple[int, str, Any, float, int]]:
+        """返回 (id, 类型, 数据, 创建时间, 已尝试次数)"""
+        if not self.path.exists():
+            return []
+        with self._lock:
+            rows = (
+                self._get_conn()
+                .execute(
+                    "SELECT id, task_type, data, created, attempts FROM task "
+                    "ORDER BY id"
+                )
+                .fetchall()
+            )
+        result = []
+        for task_id, task_type, content, created, attempts in rows:
+            try:
+                data = json.loads(content)
+            except ValueError:
+                logger.warning(f"[鸣潮] 任务日志损坏, 丢弃任务 {task_id}")
+                self.remove(task_id)
+                continue
+            result.append((task_id, task_type, data, created, attempts))
+        return result
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
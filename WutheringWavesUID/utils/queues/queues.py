@@ -1,77 +1,318 @@
+"""
+任务分发器
+
+- 队列与处理协程都运行在 bot 的事件循环中，其他线程通过 run_coroutine_threadsafe 投递
+- 每种任务一个有界队列，满时按策略处理:
+  block 等待(背压) / drop_new 丢弃新任务 / drop_oldest 丢弃最早的任务
+- 可选的 sqlite 任务日志(TaskJournal)，处理成功后才删除，重启后重新入队
+- 处理函数返回 False 或抛出异常视为失败，按间隔翻倍重试
+"""
+
 import asyncio
-import threading
-from typing import Any, Callable, Coroutine, Dict, Union
+import time
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from gsuid_core.logger import logger
 
+from .journal import TaskJournal
+
+POLICY_BLOCK = "block"
+POLICY_DROP_NEW = "drop_new"
+POLICY_DROP_OLDEST = "drop_oldest"
+
+QUEUE_MAXSIZE = 1000
+QUEUE_WORKERS = 4
+# 最大尝试次数
+MAX_ATTEMPTS = 5
+# 首次重试间隔(秒)，之后逐次翻倍
+RETRY_DELAY = 30
+# 统计吞吐量的时间窗口(秒)
+THROUGHPUT_WINDOW = 60
+
+Handler = Callable[[Any], Union[Any, Coroutine[Any, Any, Any]]]
+
+
+class TaskItem:
+    __slots__ = ("task_type", "data", "journal_id", "created", "attempts")
+
+    def __init__(
+        self,
+        task_type: str,
+        data: Any,
+        journal_id: Optional[int] = None,
+        created: Optional[float] = None,
+        attempts: int = 0,
+    ):
+        self.task_type = task_type
+        self.data = data
+        self.journal_id = journal_id
+        self.created = created or time.time()
+        self.attempts = attempts
+
+
+class TaskQueue:
+    def __init__(
+        self,
+        task_type: str,
+        handler: Handler,
+        maxsize: int = QUEUE_MAXSIZE,
+        policy: str = POLICY_BLOCK,
+        workers: int = QUEUE_WORKERS,
+    ):
+        self.task_type = task_type
+        self.handler = handler
+        self.maxsize = maxsize
+        self.policy = policy
+        self.workers = workers
+        # 在 start 时于 bot 事件循环中创建
+        self.queue: Optional[asyncio.Queue] = None
+
+        self.enqueued = 0
+        self.processed = 0
+        self.failed = 0
+        self.retried = 0
+        self.dropped = 0
+        self.running = 0
+        self.lag_last = 0.0
+        self.lag_max = 0.0
+        self.lag_total = 0.0
+        self._done_times: Deque[float] = deque()
+
+    def record_lag(self, lag: float):
+        self.lag_last = lag
+        self.lag_max = max(self.lag_max, lag)
+        self.lag_total += lag
+
+    def record_done(self):
+        self.processed += 1
+        now = time.time()
+        self._done_times.append(now)
+        while self._done_times and self._done_times[0] < now - THROUGHPUT_WINDOW:
+            self._done_times.popleft()
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        while self._done_times and self._done_times[0] < now - THROUGHPUT_WINDOW:
+            self._done_times.popleft()
+        started = self.processed + self.failed + self.retried
+        return {
+            "task_type": self.task_type,
+            "pending": self.queue.qsize() if self.queue else 0,
+            "running": self.running,
+            "maxsize": self.maxsize,
+            "policy": self.policy,
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "failed": self.failed,
+            "retried": self.retried,
+            "dropped": self.dropped,
+            "per_min": len(self._done_times) * 60 / THROUGHPUT_WINDOW,
+            "lag_last": self.lag_last,
+            "lag_max": self.lag_max,
+            "lag_avg": self.lag_total / started if started else 0.0,
+        }
+
 
 class TaskDispatcher:
 
     def __init__(self):
-        self.queue = asyncio.Queue()
         self.running = False
-        self.handlers: Dict[str, Callable] = {}
+        self.queues: Dict[str, TaskQueue] = {}
+        self.journal: Optional[TaskJournal] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: Set[asyncio.Task] = set()
 
     def register_handler(
         self,
         task_type: str,
-        handler: Callable[[Any], Union[Any, Coroutine[Any, Any, Any]]],
+        handler: Handler,
+        maxsize: int = QUEUE_MAXSIZE,
+        policy: str = POLICY_BLOCK,
+        workers: int = QUEUE_WORKERS,
     ) -> None:
-        self.handlers[task_type] = handler
+        self.queues[task_type] = TaskQueue(task_type, handler, maxsize, policy, workers)
         logger.info(f"注册任务处理器: {task_type}")
 
     async def dispatch(self, task_type: str, data: Any) -> None:
-        if not self.running:
+        if not self.running or not self.loop:
             logger.warning("任务分发器未启动或已关闭")
             return
-        if task_type not in self.handlers:
+        if task_type not in self.queues:
             return
 
-        await self.queue.put((task_type, data))
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not self.loop:
+            # 其他线程或事件循环中调用，交给 bot 的事件循环
+            future = asyncio.run_coroutine_threadsafe(
+                self._dispatch(task_type, data), self.loop
+            )
+            await asyncio.wrap_future(future)
+            return
+        await self._dispatch(task_type, data)
 
-    async def _process(self) -> None:
-        while True:
+    def dispatch_threadsafe(self, task_type: str, data: Any) -> None:
+        """在没有事件循环的线程中投递，不等待入队"""
+        if not self.running or not self.loop:
+            logger.warning("任务分发器未启动或已关闭")
+            return
+        asyncio.run_coroutine_threadsafe(self._dispatch(task_type, data), self.loop)
+
+    async def _dispatch(self, task_type: str, data: Any) -> None:
+        queue = self.queues.get(task_type)
+        if not queue:
+            return
+        journal_id = None
+        if self.journal:
             try:
-                # 如果分发器已关闭，退出循环
-                if not self.running:
-                    break
+                journal_id = await asyncio.to_thread(self.journal.add, task_type, data)
+            except Exception as e:
+                logger.exception(f"写入任务日志失败 ({task_type}): {e}")
+        queue.enqueued += 1
+        await self._enqueue(queue, TaskItem(task_type, data, journal_id))
 
-                # 获取队列任务
-                task_type, data = await asyncio.wait_for(self.queue.get(), timeout=3.0)
+    async def _enqueue(self, queue: TaskQueue, item: TaskItem) -> None:
+        q = queue.queue
+        if q is None:
+            return
+        if q.full():
+            if queue.policy == POLICY_BLOCK:
+                await q.put(item)
+                return
+            if queue.policy == POLICY_DROP_NEW:
+                self._drop(queue, item)
+                return
+            old = q.get_nowait()
+            q.task_done()
+            self._drop(queue, old)
+        q.put_nowait(item)
 
-                # 处理任务
-                handler = self.handlers.get(task_type)
-                if handler:
-                    # 创建异步任务
-                    asyncio.create_task(self._run_task(handler, data, task_type))
+    def _drop(self, queue: TaskQueue, item: TaskItem):
+        queue.dropped += 1
+        logger.warning(f"任务队列已满, 丢弃任务 ({queue.task_type})")
+        self._remove_journal(item)
 
-                # 标记任务完成
-                self.queue.task_done()
+    def _remove_journal(self, item: TaskItem):
+        if self.journal and item.journal_id is not None:
+            self._spawn(asyncio.to_thread(self.journal.remove, item.journal_id))
 
-            except asyncio.TimeoutError:
-                continue
+    def _spawn(self, coro: Coroutine) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _worker(self, queue: TaskQueue) -> None:
+        q = queue.queue
+        assert q is not None
+        while self.running:
+            item = await q.get()
+            try:
+                await self._run_task(queue, item)
             except Exception as e:
                 logger.exception(f"任务处理异常: {e}")
+            finally:
+                q.task_done()
 
-    async def _run_task(self, handler: Callable, data: Any, task_type: str) -> None:
+    async def _run_task(self, queue: TaskQueue, item: TaskItem) -> None:
+        queue.record_lag(time.time() - item.created)
+        queue.running += 1
         try:
-            result = handler(data)
+            result = queue.handler(item.data)
             # 如果是协程，等待它完成
             if asyncio.iscoroutine(result):
-                await result
+                result = await result
         except Exception as e:
-            logger.exception(f"任务执行错误 ({task_type}): {e}")
+            logger.exception(f"任务执行错误 ({item.task_type}): {e}")
+            result = False
+        finally:
+            queue.running -= 1
 
-    def start(self, daemon: bool = True) -> None:
+        if result is not False:
+            queue.record_done()
+            self._remove_journal(item)
+            return
+
+        item.attempts += 1
+        if item.attempts >= MAX_ATTEMPTS:
+            queue.failed += 1
+            logger.warning(f"任务重试{item.attempts}次仍失败, 放弃 ({item.task_type})")
+            self._remove_journal(item)
+            return
+
+        queue.retried += 1
+        if self.journal and item.journal_id is not None:
+            await asyncio.to_thread(
+                self.journal.set_attempts, item.journal_id, item.attempts
+            )
+        self._spawn(self._retry_later(queue, item))
+
+    async def _retry_later(self, queue: TaskQueue, item: TaskItem) -> None:
+        await asyncio.sleep(RETRY_DELAY * 2 ** (item.attempts - 1))
+        if self.running:
+            await self._enqueue(queue, item)
+
+    async def _replay(self, rows: List[Tuple[int, str, Any, float, int]]) -> None:
+        """重新入队上次未完成的任务"""
+        num = 0
+        for task_id, task_type, data, created, attempts in rows:
+            queue = self.queues.get(task_type)
+            if not queue:
+                self._remove_journal(TaskItem(task_type, data, task_id))
+                continue
+            await self._enqueue(
+                queue, TaskItem(task_type, data, task_id, created, attempts)
+            )
+            num += 1
+        if num:
+            logger.info(f"任务日志恢复任务: {num}")
+
+    def start(self, journal: bool = True) -> None:
+        """需在 bot 的事件循环中调用"""
         if self.running:
             return
 
+        self.loop = asyncio.get_running_loop()
         self.running = True
+        rows = []
+        self.journal = TaskJournal() if journal else None
+        if self.journal:
+            # 在接收新任务前读取，避免新写入的任务被重复入队
+            try:
+                rows = self.journal.load()
+            except Exception as e:
+                logger.exception(f"读取任务日志失败: {e}")
+        for queue in self.queues.values():
+            queue.queue = asyncio.Queue(maxsize=queue.maxsize)
+            for _ in range(queue.workers):
+                self._spawn(self._worker(queue))
+        if rows:
+            self._spawn(self._replay(rows))
+
+    async def stop(self) -> None:
+        self.running = False
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self.journal:
+            self.journal.close()
 
-        # 启动处理线程
-        threading.Thread(
-            target=lambda: asyncio.run(self._process()), daemon=daemon
-        ).start()
+    def stats(self) -> List[Dict[str, Any]]:
+        return [queue.stats() for queue in self.queues.values()]
 
 
 # 创建全局任务分发器实例
@@ -81,13 +322,16 @@ dispatcher = TaskDispatcher()
 # 工具函数
 def register_handler(
     task_type: str,
-    handler: Callable[[Any], Union[Any, Coroutine[Any, Any, Any]]],
+    handler: Handler,
+    maxsize: int = QUEUE_MAXSIZE,
+    policy: str = POLICY_BLOCK,
+    workers: int = QUEUE_WORKERS,
 ) -> None:
-    dispatcher.register_handler(task_type, handler)
+    dispatcher.register_handler(task_type, handler, maxsize, policy, workers)
 
 
-def start_dispatcher(daemon: bool = True) -> None:
-    dispatcher.start(daemon=daemon)
+def start_dispatcher(journal: bool = True) -> None:
+    dispatcher.start(journal=journal)
 
 
 # 兼容原有代码的函数
@@ -0,0 +1,295 @@
+"""
+批量角色评分
+
+群练度排行、角色排行在缓存为空时需要一次计算大量 (uid, 角色)，
+逐个在事件循环中计算会长时间阻塞。这里先按内容哈希取出评分缓存中未变化的角色，
+其余角色分块交给计算进程池(CalcProcessNum)，按块完成顺序返回结果并写回各 uid 的评分缓存
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from gsuid_core.logger import logger
+
+from .api.model_struct import RoleDetailStruct, role_detail_to_struct
+from .calc import WuWaCalc
+from .calc_pool import get_calc_workers, run_in_calc_pool
+from .calculate import calc_phantom_score, get_calc_map, get_total_score_bg
+from .char_info_utils import get_all_role_detail_raw_list
+from .char_rank_cache import (
+    get_cached_char_rank,
+    load_char_rank_cache,
+    save_char_rank_cache,
+    set_cached_char_rank,
+)
+from .damage.abstract import DamageRankRegister
+from .expression_ctx import WavesCharRank, calc_rank_damage, calc_waves_char_rank
+from .player_store import load_role_hash
+
+# (uid, 角色原始数据)
+RoleJob = Tuple[str, Dict]
+
+# 每块最多的角色数
+SCORE_CHUNK_SIZE = 32
+# 少于该数量时直接在当前进程计算
+INLINE_THRESHOLD = 8
+# 同时读取的玩家数据文件数
+LOAD_CONCURRENCY = 20
+
+
+def score_role_chunk(
+    jobs: List[RoleJob], need_expected_damage: bool
+) -> List[Tuple[str, Dict]]:
+    """在计算进程中执行，返回 (uid, WavesCharRank.model_dump())"""
+    result = []
+    for uid, role_data in jobs:
+        try:
+            wcr = calc_waves_char_rank(
+                role_detail_to_struct(role_data), need_expected_damage
+            )
+        except Exception as e:
+            logger.exception(f"[鸣潮] 角色评分失败 uid:{uid}", e)
+            continue
+        result.append((uid, wcr.model_dump()))
+    return result
+
+
+def _split_chunks(jobs: List, chunk_size: int = SCORE_CHUNK_SIZE) -> List[List]:
+    # 至少分成进程数的两倍块，结果可以更早返回
+    size = -(-len(jobs) // (get_calc_workers() * 2))
+    size = max(min(size, chunk_size), 1)
+    return [jobs[i : i + size] for i in range(0, len(jobs), size)]
+
+
+async def iter_scored_chunks(
+    jobs: List[RoleJob], need_expected_damage: bool = False
+) -> AsyncIterator[List[Tuple[str, WavesCharRank]]]:
+    """按块完成的顺序返回 (uid, 评分)"""
+    if not jobs:
+        return
+    if len(jobs) < INLINE_THRESHOLD:
+        result = score_role_chunk(jobs, need_expected_damage)
+        yield [(uid, WavesCharRank(**data)) for uid, data in result]
+        return
+
+    tasks = [
+        asyncio.ensure_future(
+            run_in_calc_pool(score_role_chunk, chunk, need_expected_damage)
+        )
+        for chunk in _split_chunks(jobs)
+    ]
+    try:
+        for future in asyncio.as_completed(tasks):
+            result = await future
+            yield [(uid, WavesCharRank(**data)) for uid, data in result]
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def get_waves_char_rank_batch(
+    uids: List[str], need_expected_damage: bool = False
+) -> Dict[str, List[WavesCharRank]]:
+    """
+    多个 uid 的 get_waves_char_rank，结果一致(角色顺序与数据文件一致)
+    每个 uid 的角色全部算完后立即写回评分缓存
+    """
+    semaphore = asyncio.Semaphore(LOAD_CONCURRENCY)
+
+    async def _load(uid: str):
+        async with semaphore:
+            role_list = await get_all_role_detail_raw_list(uid)
+            if not role_list:
+                return uid, None, {}, {}
+            return (
+                uid,
+                role_list,
+                await load_char_rank_cache(uid),
+                await load_role_hash(uid),
+            )
+
+    role_order: Dict[str, List[int]] = {}
+    ranks: Dict[str, Dict[int, WavesCharRank]] = {}
+    rank_caches: Dict[str, Dict[str, Dict]] = {}
+    role_hashes: Dict[str, Dict[str, str]] = {}
+    pending: Dict[str, int] = {}
+    jobs: List[RoleJob] = []
+
+    for uid, role_list, rank_cache, role_hash in await asyncio.gather(
+        *[_load(uid) for uid in dict.fromkeys(uids)]
+    ):
+        if not role_list:
+            continue
+        role_order[uid] = []
+        ranks[uid] = {}
+        rank_caches[uid] = rank_cache
+        role_hashes[uid] = role_hash
+        for role_data in role_list:
+            role_id = role_data["role"]["roleId"]
+            role_order[uid].append(role_id)
+            cached = get_cached_char_rank(
+                rank_cache,
+                role_id,
+                role_hash.get(str(role_id)),
+                need_expected_damage,
+            )
+            if cached:
+                ranks[uid][role_id] = WavesCharRank(**cached)
+                continue
+            jobs.append((uid, role_data))
+            pending[uid] = pending.get(uid, 0) + 1
+
+    async def _save(uid: str):
+        try:
+            await save_char_rank_cache(uid, rank_caches[uid])
+        except Exception as e:
+            logger.exception(f"[鸣潮] 保存评分缓存失败 uid:{uid}", e)
+
+    changed = set()
+    save_tasks = []
+    async for chunk in iter_scored_chunks(jobs, need_expected_damage):
+        for uid, wcr in chunk:
+            ranks[uid][wcr.roleId] = wcr
+            role_hash = role_hashes[uid].get(str(wcr.roleId))
+            if role_hash:
+                set_cached_char_rank(
+                    rank_caches[uid],
+                    wcr.roleId,
+                    role_hash,
+                    wcr.model_dump(),
+                    need_expected_damage,
+                )
+                changed.add(uid)
+            pending[uid] -= 1
+            if pending[uid] == 0 and uid in changed:
+                save_tasks.append(asyncio.create_task(_save(uid)))
+    # 计算失败的角色不会回到这里，剩余的 uid 统一保存
+    for uid, num in pending.items():
+        if num > 0 and uid in changed:
+            save_tasks.append(asyncio.create_task(_save(uid)))
+    if save_tasks:
+        await asyncio.gather(*save_tasks)
+
+    return {
+        uid: [ranks[uid][role_id] for role_id in order if role_id in ranks[uid]]
+        for uid, order in role_order.items()
+    }
+
+
+def calc_rank_info(
+    role_detail: RoleDetailStruct, need_expected_damage: bool
+) -> Optional[Dict]:
+    """
+    角色排行一行的评分与期望伤害，评分为 0 时返回 None
+    伤害函数按角色自身 id 查找，同一角色的不同形态共用伤害模块
+    """
+    equipPhantomList = role_detail.phantomData.equipPhantomList
+
+    calc: WuWaCalc = WuWaCalc(role_detail)
+    calc.phantom_pre = calc.prepare_phantom()
+    calc.phantom_card = calc.enhance_summation_phantom_value(calc.phantom_pre)
+    calc.calc_temp = get_calc_map(
+        calc.phantom_card,
+        role_detail.role.roleName,
+        role_detail.role.roleId,
+    )
+
+    # 评分
+    phantom_score = 0
+    for _phantom in equipPhantomList:
+        if _phantom and _phantom.phantomProp:
+            props = _phantom.get_props()
+            _score, _bg = calc_phantom_score(
+                role_detail.role.roleId, props, _phantom.cost, calc.calc_temp
+            )
+            phantom_score += _score
+
+    if phantom_score == 0:
+        return None
+
+    phantom_score = round(phantom_score, 2)
+    phantom_bg = get_total_score_bg(
+        role_detail.role.roleName, phantom_score, calc.calc_temp
+    )
+
+    expected_damage = 0.0
+    if need_expected_damage:
+        rankDetail = DamageRankRegister.find_class(str(role_detail.role.roleId))
+        if rankDetail:
+            result = calc_rank_damage(calc, role_detail, rankDetail)
+            expected_damage = result.expected_damage
+
+    sonata_name = ""
+    ph_detail = calc.phantom_card.get("ph_detail", [])
+    if isinstance(ph_detail, list):
+        for ph in ph_detail:
+            if ph.get("ph_num") == 5:
+                sonata_name = ph.get("ph_name", "")
+                break
+
+            if ph.get("isFull"):
+                sonata_name = ph.get("ph_name", "")
+                break
+
+    return {
+        "score": round(int(phantom_score * 100) / 100, ndigits=2),
+        "score_bg": phantom_bg,
+        "expected_damage": expected_damage,
+        "sonata_name": sonata_name,
+    }
+
+
+def calc_rank_info_chunk(
+    role_details: List[RoleDetailStruct], need_expected_damage: bool
+) -> List[Optional[Dict]]:
+    """在计算进程中执行"""
+    return [calc_rank_info(r, need_expected_damage) for r in role_details]
+
+
+async def calc_rank_info_batch(
+    role_details: List[RoleDetailStruct], need_expected_damage: bool
+) -> List[Optional[Dict]]:
+    """与 role_details 顺序一致"""
+    if len(role_details) < INLINE_THRESHOLD:
+        return calc_rank_info_chunk(role_details, need_expected_damage)
+
+    chunks = _split_chunks(role_details)
+    results = await asyncio.gather(
+        *[
+            run_in_calc_pool(calc_rank_info_chunk, chunk, need_expected_damage)
+            for chunk in chunks
+        ]
+    )
+    return [info for result in results for info in result]
+
+
+async def benchmark_rank_scoring(
+    role_data_list: List[Dict], size: int = 1000
+) -> Dict[str, float]:
+    """
+    以 role_data_list 重复凑够 size 个角色，对比逐个计算与进程池分块计算的吞吐(角色/秒)
+    不读写评分缓存
+    """
+    if not role_data_list:
+        return {}
+    roles = [role_data_list[i % len(role_data_list)] for i in range(size)]
+    jobs: List[RoleJob] = [(str(i), r) for i, r in enumerate(roles)]
+
+    start = time.perf_counter()
+    single = await asyncio.to_thread(score_role_chunk, jobs[:100], True)
+    single_cost = time.perf_counter() - start
+
+    start = time.perf_counter()
+    num = 0
+    async for chunk in iter_scored_chunks(jobs, True):
+        num += len(chunk)
+    batch_cost = time.perf_counter() - start
+
+    return {
+        "role_num": num,
+        "workers": get_calc_workers(),
+        "single_per_sec": len(single) / single_cost if single_cost else 0,
+        "batch_per_sec": num / batch_cost if batch_cost else 0,
+        "batch_ms": batch_cost * 1000,
+    }
@@ -1,9 +1,6 @@
 import asyncio
-import json
 from typing import Dict, List, Optional, Union
 
-import aiofiles
-
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
 
@@ -11,9 +8,14 @@ from ..utils.api.model import AccountBaseInfo, RoleList
 from ..utils.error_reply import WAVES_CODE_101, WAVES_CODE_102
 from ..utils.expression_ctx import WavesCharRank, get_waves_char_rank
 from ..utils.hint import error_reply
+from ..utils.player_store import (
+    get_role_hash,
+    load_player_raw,
+    load_role_hash,
+    save_player_raw,
+)
 from ..utils.queues.const import QUEUE_SCORE_RANK
 from ..utils.queues.queues import put_item
-from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
 from ..utils.util import get_version
 from ..utils.waves_api import waves_api
 from ..wutheringwaves_config import WutheringWavesConfig
@@ -118,19 +120,17 @@ async def save_card_info(
 ):
     if len(waves_data) == 0:
         return
-    _dir = PLAYER_PATH / uid
-    _dir.mkdir(parents=True, exist_ok=True)
-    path = _dir / "rawData.json"
-
     old_data = {}
-    if path.exists():
-        try:
-            async with aiofiles.open(path, mode="r", encoding="utf-8") as f:
-                old = json.loads(await f.read())
-                old_data = {d["role"]["roleId"]: d for d in old}
-        except Exception as e:
-            logger.exception(f"save_card_info get failed {path}:", e)
-            path.unlink(missing_ok=True)
+    old_hash = {}
+    old = await load_player_raw(uid)
+    if old:
+        old_data = {d["role"]["roleId"]: d for d in old}
+        old_hash = await load_role_hash(uid)
+
+    # 角色内容哈希，用于判断角色是否变化
+    role_hash: Dict[int, str] = {}
+    for role_id, old in old_data.items():
+        role_hash[role_id] = old_hash.get(str(role_id)) or get_role_hash(old)
 
     #
     refresh_update = {}
@@ -146,24 +146,22 @@ async def save_card_info(
                     continue
                 if piaobo_id != role_id:
                     del old_data[piaobo_id]
+                    role_hash.pop(piaobo_id, None)
 
-        old = old_data.get(role_id)
-        if old != item:
+        item_hash = get_role_hash(item)
+        if role_hash.get(role_id) != item_hash:
             refresh_update[role_id] = item
         else:
             refresh_unchanged[role_id] = item
 
         old_data[role_id] = item
+        role_hash[role_id] = item_hash
 
     save_data = list(old_data.values())
 
     await send_card(uid, user_id, save_data, is_self_ck, token, role_info, waves_data)
 
-    try:
-        async with aiofiles.open(path, "w", encoding="utf-8") as file:
-            await file.write(json.dumps(save_data, ensure_ascii=False))
-    except Exception as e:
-        logger.exception(f"save_card_info save failed {path}:", e)
+    await save_player_raw(uid, save_data, role_hash)
 
     if waves_map:
         waves_map["refresh_update"] = refresh_update
@@ -10,11 +10,15 @@ import httpx
 
 from gsuid_core.subscribe import gs_subscribe
 
+from .cache import CacheStats, register_cache
+
 
 def timed_async_cache(expiration, condition=lambda x: True):
     def decorator(func):
         cache = {}
         locks = {}
+        stats = CacheStats()
+        register_cache(func.__qualname__, cache, stats)
 
         sig = inspect.signature(func)
         params = list(sig.parameters.keys())
@@ -36,6 +40,7 @@ def timed_async_cache(expiration, condition=lambda x: True):
             if cache_key in cache:
                 value, timestamp = cache[cache_key]
                 if current_time - timestamp < expiration:
+                    stats.hits += 1
                     return value
 
             # 获取锁以确保并发安全
@@ -47,6 +52,7 @@ def timed_async_cache(expiration, condition=lambda x: True):
                         return value
 
                 # 执行原始函数
+                stats.misses += 1
                 value = await func(*args)
                 if condition(value):
                     cache[cache_key] = (value, current_time)
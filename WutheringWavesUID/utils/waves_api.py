@@ -1,3 +1,8 @@
 from ..utils.api.requests import WavesApi
+from .cache import register_cache
 
 waves_api = WavesApi()
+
+register_cache("waves_api.ann_map", lambda: waves_api.ann_map)
+register_cache("waves_api.ann_list", lambda: waves_api.ann_list_data)
+register_cache("waves_api.entry_detail", lambda: waves_api.entry_detail_map)
@@ -0,0 +1,34 @@
+"""
+校验本地突破材料计算与 get_batch_role_cost 的记录是否一致
+
+在插件所在目录执行:
+    python -m WutheringWavesUID.verify_develop_cost [developCost.json ...]
+
+默认校验 wutheringwaves_develop/cost_fixtures 中的记录，
+玩家的记录保存在 players/<uid>/developCost.json，确认无误后可复制到该目录提交。
+有不一致或没有任何记录时返回非 0
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import List
+
+from .wutheringwaves_develop.cost_record import FIXTURE_PATH, check_cost_files
+
+
+def main(argv: List[str]) -> int:
+    paths = [Path(p) for p in argv] or sorted(FIXTURE_PATH.glob("*.json"))
+    num, errors = asyncio.run(check_cost_files(paths))
+    errors = list(dict.fromkeys(errors))
+    print(f"文件数: {len(paths)} 记录数: {num} 不一致: {len(errors)}")
+    for error in errors:
+        print(f"  {error}")
+    if not num:
+        print("没有养成记录")
+        return 1
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,74 @@
+"""
+校验排行模式(不记录计算过程)与记录计算过程的伤害结果是否一致
+
+在插件所在目录执行:
+    python -m WutheringWavesUID.verify_rank_mode [面板数据json ...]
+
+默认使用 utils/map/1.json 中的全部角色，pydantic 模型与 msgspec Struct 各校验一次，
+有不一致的角色或没有角色参与校验时返回非 0
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from .utils.api.model import RoleDetailData
+from .utils.api.model_struct import role_detail_to_struct
+from .utils.damage.abstract import DamageRankRegister
+from .utils.expression_ctx import check_rank_mode
+from .utils.map.damage.register import init_damage_register
+
+DEFAULT_DATA_PATH = Path(__file__).parent / "utils/map/1.json"
+
+
+def load_role_list(path: Path) -> List[Dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def verify(path: Path) -> bool:
+    role_list = load_role_list(path)
+    role_details = [RoleDetailData(**r) for r in role_list]
+
+    success = True
+    for name, details in (
+        ("model", role_details),
+        ("struct", [role_detail_to_struct(r) for r in role_list]),
+    ):
+        result = check_rank_mode(details)
+        print(
+            f"[{path.name}][{name}] 角色数: {result['role_num']}/{len(role_list)} "
+            f"记录过程: {result['trace_ms']:.2f}ms "
+            f"排行模式: {result['rank_ms']:.2f}ms"
+        )
+        for m in result["mismatch"]:
+            print(f"  {m['roleId']} {m['roleName']}: {m['trace']} != {m['rank']}")
+        if result["mismatch"] or not result["role_num"]:
+            success = False
+
+    # 没有声骸或伤害计算模块的角色不参与校验，单独列出便于确认
+    skipped = [
+        f"{r.role.roleId} {r.role.roleName}"
+        for r in role_details
+        if not r.phantomData
+        or not r.phantomData.equipPhantomList
+        or not DamageRankRegister.find_class(str(r.role.roleId))
+    ]
+    if skipped:
+        print(f"  未校验: {', '.join(skipped)}")
+    return success
+
+
+def main(argv: List[str]) -> int:
+    init_damage_register()
+    paths = [Path(p) for p in argv] or [DEFAULT_DATA_PATH]
+    success = True
+    for path in paths:
+        success = verify(path) and success
+    print("结果一致" if success else "结果不一致")
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
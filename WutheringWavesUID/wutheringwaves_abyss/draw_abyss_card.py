@@ -6,13 +6,7 @@ from PIL import Image, ImageDraw
 from gsuid_core.models import Event
 from gsuid_core.utils.image.convert import convert_img
 
-from ..utils.api.model import (
-    AbyssChallenge,
-    AbyssFloor,
-    AccountBaseInfo,
-    RoleDetailData,
-    RoleList,
-)
+from ..utils.api.model import AbyssChallenge, AbyssFloor, RoleDetailData
 from ..utils.api.wwapi import ABYSS_TYPE_MAP, AbyssDetail, AbyssItem
 from ..utils.char_info_utils import get_all_roleid_detail_info
 from ..utils.error_reply import WAVES_CODE_102
@@ -34,6 +28,7 @@ from ..utils.queues.queues import put_item
 from ..utils.util import get_version
 from ..utils.waves_api import waves_api
 from ..wutheringwaves_config import PREFIX
+from .snapshot_store import check_upload, get_game_data
 
 TEXT_PATH = Path(__file__).parent / "texture2d"
 
@@ -70,15 +65,6 @@ async def get_abyss_data(uid: str, ck: str, is_self_ck: bool):
 
 
 async def draw_abyss_img(ev: Event, uid: str, user_id: str) -> Union[bytes, str]:
-    is_self_ck, ck = await waves_api.get_ck_result(uid, user_id, ev.bot_id)
-    if not ck:
-        return error_reply(WAVES_CODE_102)
-
-    # succ, game_info = await waves_api.get_game_role_info(ck)
-    # if not succ:
-    #     return game_info
-    # game_info = KuroRoleInfo(**game_info)
-
     command = ev.command
     text = ev.text.strip()
     difficultyName = "深境区"
@@ -89,23 +75,21 @@ async def draw_abyss_img(ev: Event, uid: str, user_id: str) -> Union[bytes, str]
     elif "实验" in text or "实验" in command:
         difficultyName = "实验区"
 
-    # 账户数据
-    account_info = await waves_api.get_base_info(uid, ck)
-    if not account_info.success:
-        return account_info.throw_msg()
-    account_info = AccountBaseInfo.model_validate(account_info.data)
-
-    # 共鸣者信息
-    role_info = await waves_api.get_role_info(uid, ck)
-    if not role_info.success:
-        return role_info.throw_msg()
-
-    role_info = RoleList.model_validate(role_info.data)
-
-    # 深渊
-    abyss_data = await get_abyss_data(uid, ck, is_self_ck)
-    if isinstance(abyss_data, str) or not abyss_data:
-        return abyss_data
+    # 深渊、账户数据、共鸣者信息
+    game_data = await get_game_data(
+        uid,
+        user_id,
+        ev.bot_id,
+        "abyss",
+        AbyssChallenge,
+        get_abyss_data,
+        lambda x: x.seasonEndTime,
+    )
+    if game_data is None:
+        return error_reply(WAVES_CODE_102)
+    if isinstance(game_data, str):
+        return game_data
+    is_self_ck, abyss_data, account_info, role_info = game_data
     if not abyss_data.isUnlock:
         return ABYSS_ERROR_MESSAGE_NO_UNLOCK
 
@@ -363,5 +347,8 @@ async def upload_abyss_record(
             "version": get_version(),
         }
     )
+    # 与上次上传的内容一致时跳过
+    if not await check_upload(waves_id, "abyss", abyss_item.model_dump()):
+        return
     # logger.info(f"上传深渊记录: {abyss_item.model_dump()}")
     await put_item(QUEUE_ABYSS_RECORD, abyss_item.model_dump())
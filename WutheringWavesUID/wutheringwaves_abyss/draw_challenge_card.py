@@ -7,7 +7,7 @@ from PIL import Image, ImageDraw
 from gsuid_core.models import Event
 from gsuid_core.utils.image.convert import convert_img
 
-from ..utils.api.model import AccountBaseInfo, ChallengeArea, RoleList
+from ..utils.api.model import ChallengeArea
 from ..utils.error_reply import WAVES_CODE_102
 from ..utils.fonts.waves_fonts import (
     waves_font_18,
@@ -31,6 +31,7 @@ from ..utils.imagetool import draw_pic, draw_pic_with_ring
 from ..utils.name_convert import char_name_to_char_id
 from ..utils.resource.RESOURCE_PATH import CHALLENGE_PATH
 from ..utils.waves_api import waves_api
+from .snapshot_store import get_game_data
 
 TEXT_PATH = Path(__file__).parent / "texture2d"
 
@@ -40,36 +41,37 @@ ERROR_OPEN = "您未打开库街区[全息挑战]的对外展示"
 ERROR_NO_CHALLENGE = "您未通关任何全息战略"
 
 
-async def draw_challenge_img(ev: Event, uid: str, user_id: str) -> Union[bytes, str]:
-    is_self_ck, ck = await waves_api.get_ck_result(uid, user_id, ev.bot_id)
-    if not ck:
-        return error_reply(WAVES_CODE_102)
-
-    # 全息数据
+async def get_challenge_data(
+    uid: str, ck: str, is_self_ck: bool
+) -> Union[ChallengeArea, str]:
     challenge_data = await waves_api.get_challenge_data(uid, ck)
     if not challenge_data.success:
         return challenge_data.throw_msg()
+    return ChallengeArea.model_validate(challenge_data.data)
 
-    challenge_data = ChallengeArea.model_validate(challenge_data.data)
+
+async def draw_challenge_img(ev: Event, uid: str, user_id: str) -> Union[bytes, str]:
+    # 全息数据、账户数据、共鸣者信息
+    game_data = await get_game_data(
+        uid,
+        user_id,
+        ev.bot_id,
+        "challenge",
+        ChallengeArea,
+        get_challenge_data,
+        lambda x: None,
+    )
+    if game_data is None:
+        return error_reply(WAVES_CODE_102)
+    if isinstance(game_data, str):
+        return game_data
+    _, challenge_data, account_info, role_info = game_data
     if not challenge_data.isUnlock:
         return ERROR_UNLOCK
 
     if not challenge_data.open:
         return ERROR_OPEN
 
-    # 账户数据
-    account_info = await waves_api.get_base_info(uid, ck)
-    if not account_info.success:
-        return account_info.throw_msg()
-    account_info = AccountBaseInfo.model_validate(account_info.data)
-
-    # 共鸣者信息
-    role_info = await waves_api.get_role_info(uid, ck)
-    if not role_info.success:
-        return role_info.throw_msg()
-
-    role_info = RoleList.model_validate(role_info.data)
-
     num = len(challenge_data.challengeInfo)
     a = num // 2 + (0 if num % 2 == 0 else 1)
     h = 300 + a * 260 + 50
@@ -6,12 +6,7 @@ from PIL import Image, ImageDraw
 from gsuid_core.models import Event
 from gsuid_core.utils.image.convert import convert_img
 
-from ..utils.api.model import (
-    AccountBaseInfo,
-    RoleDetailData,
-    RoleList,
-    SlashDetail,
-)
+from ..utils.api.model import RoleDetailData, SlashDetail
 from ..utils.api.wwapi import SlashDetailRequest
 from ..utils.ascension.char import get_char_model
 from ..utils.char_info_utils import get_all_roleid_detail_info
@@ -38,6 +33,7 @@ from ..utils.queues.const import QUEUE_SLASH_RECORD
 from ..utils.queues.queues import put_item
 from ..utils.resource.RESOURCE_PATH import SLASH_PATH
 from ..utils.waves_api import waves_api
+from .snapshot_store import check_upload, get_game_data
 
 TEXT_PATH = Path(__file__).parent / "texture2d"
 
@@ -100,13 +96,9 @@ async def get_slash_data(
 
 
 async def draw_slash_img(ev: Event, uid: str, user_id: str) -> Union[bytes, str]:
-    is_self_ck, ck = await waves_api.get_ck_result(uid, user_id, ev.bot_id)
-    if not ck:
-        return error_reply(WAVES_CODE_102)
-
     command = ev.command
     text = ev.text.strip()
-    challengeIds = [7, 8, 9, 10, 11, 12] if is_self_ck else [12]
+    challengeIds = [7, 8, 9, 10, 11, 12]
     if "无尽" in text or "无尽" in command:
         challengeIds = [12]
     elif "禁忌" in text or "禁忌" in command:
@@ -118,14 +110,25 @@ async def draw_slash_img(ev: Event, uid: str, user_id: str) -> Union[bytes, str]
         if text.isdigit() and 1 <= int(text) <= 12:
             challengeIds = [int(text)]
 
+    # 冥海数据、账户数据、共鸣者信息
+    game_data = await get_game_data(
+        uid,
+        user_id,
+        ev.bot_id,
+        "slash",
+        SlashDetail,
+        get_slash_data,
+        lambda x: x.seasonEndTime,
+    )
+    if game_data is None:
+        return error_reply(WAVES_CODE_102)
+    if isinstance(game_data, str):
+        return game_data
+    is_self_ck, slash_detail, account_info, role_info = game_data
+
     if not is_self_ck:
         challengeIds = [12]
 
-    # 冥海数据
-    slash_detail: Union[SlashDetail, str] = await get_slash_data(uid, ck, is_self_ck)
-    if isinstance(slash_detail, str):
-        return slash_detail
-
     # check 冥海数据
     if not is_self_ck and not slash_detail.isUnlock:
         return SLASH_ERROR_MESSAGE_NO_UNLOCK
@@ -148,19 +151,6 @@ async def draw_slash_img(ev: Event, uid: str, user_id: str) -> Union[bytes, str]
     if len(query_challenge_ids) == 0:
         return SLASH_ERROR_MESSAGE_NO_DATA
 
-    # 账户数据
-    account_info = await waves_api.get_base_info(uid, ck)
-    if not account_info.success:
-        return account_info.throw_msg()
-    account_info = AccountBaseInfo.model_validate(account_info.data)
-
-    # 共鸣者信息
-    role_info = await waves_api.get_role_info(uid, ck)
-    if not role_info.success:
-        return role_info.throw_msg()
-
-    role_info = RoleList.model_validate(role_info.data)
-
     # 绘制图片
     footer_h = 50
     card_h = 300
@@ -419,5 +409,8 @@ async def upload_slash_record(
             "score": challenge.score,
         }
     )
+    # 与上次上传的内容一致时跳过
+    if not await check_upload(waves_id, "slash", slash_item.model_dump()):
+        return
     # logger.info(f"上传冥海记录: {slash_item.model_dump()}")
     await put_item(QUEUE_SLASH_RECORD, slash_item.model_dump())
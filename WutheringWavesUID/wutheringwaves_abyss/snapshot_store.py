@@ -0,0 +1,237 @@
+"""
+深塔/全息/冥海数据快照 players/<uid>/<kind>Snapshot.json
+
+{
+    "current": {
+        "season": 赛季结束时间, "time": 获取时间, "is_self_ck": bool,
+        "hash": 内容哈希, "data": ...
+    },
+    "history": {赛季: {"time": ..., "data": ...}},
+    "upload": 上一次成功上传内容的哈希
+}
+
+- 新鲜期内(GameSnapshotFresh)重复查看直接使用 current，赛季结束后立即失效
+- 账号信息与共鸣者列表使用短时缓存，只请求缺少的部分
+- 每个赛季保留最后一次的数据，用于之后对比
+- 上传记录时与上一次成功上传或正在上传的内容一致则跳过，上传成功后才记录哈希
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import aiofiles
+from pydantic import BaseModel
+
+from gsuid_core.logger import logger
+
+from ..utils.api.model import AccountBaseInfo, RoleList
+from ..utils.atomic_writer import save_json_atomic
+from ..utils.cache import TimedCache
+from ..utils.database.models import WavesUser
+from ..utils.info_cache import (
+    get_cached_account_info,
+    get_cached_role_info,
+    set_cached_account_info,
+    set_cached_role_info,
+)
+from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+from ..utils.waves_api import waves_api
+from ..wutheringwaves_config import WutheringWavesConfig
+
+SNAPSHOT_FILE = {
+    "abyss": "abyssSnapshot.json",
+    "challenge": "challengeSnapshot.json",
+    "slash": "slashSnapshot.json",
+}
+# 每种数据保留的赛季数
+MAX_HISTORY = 12
+# 加入上传队列后多久内不再重复加入相同内容，队列丢弃或放弃上传后可再次加入
+UPLOAD_PENDING_TTL = 600
+
+T = TypeVar("T", bound=BaseModel)
+
+_locks: Dict[str, asyncio.Lock] = {}
+# {uid:kind: 已加入上传队列的内容哈希}
+upload_pending = TimedCache(UPLOAD_PENDING_TTL, 2000, "snapshot.upload_pending")
+
+
+def _get_lock(uid: str, kind: str) -> asyncio.Lock:
+    key = f"{uid}:{kind}"
+    if key not in _locks:
+        _locks[key] = asyncio.Lock()
+    return _locks[key]
+
+
+def get_content_hash(data: Any) -> str:
+    content = json.dumps(data, sort_keys=True, ensure_ascii=False)
+    return hashlib.md5(content.encode()).hexdigest()
+
+
+async def load_snapshot(uid: str, kind: str) -> Dict:
+    path = PLAYER_PATH / uid / SNAPSHOT_FILE[kind]
+    if not path.exists():
+        return {}
+    try:
+        async with aiofiles.open(path, mode="r", encoding="utf-8") as f:
+            data = json.loads(await f.read())
+    except Exception as e:
+        logger.exception(f"load {path} failed:", e)
+        path.unlink(missing_ok=True)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+async def _save_snapshot(uid: str, kind: str, snapshot: Dict):
+    _dir = PLAYER_PATH / uid
+    _dir.mkdir(parents=True, exist_ok=True)
+    await save_json_atomic(_dir / SNAPSHOT_FILE[kind], snapshot)
+
+
+def get_fresh_data(snapshot: Dict, is_self_ck: bool) -> Optional[Dict]:
+    current = snapshot.get("current")
+    if not current or current.get("is_self_ck") != is_self_ck:
+        return None
+    now = time.time()
+    fresh = WutheringWavesConfig.get_config("GameSnapshotFresh").data
+    if now - current.get("time", 0) > fresh:
+        return None
+    season = current.get("season") or 0
+    if season and now > season:
+        return None
+    return current["data"]
+
+
+async def save_game_snapshot(
+    uid: str, kind: str, data: Dict, season: int, is_self_ck: bool
+):
+    async with _get_lock(uid, kind):
+        snapshot = await load_snapshot(uid, kind)
+        now = int(time.time())
+        content_hash = get_content_hash(data)
+        changed = (snapshot.get("current") or {}).get("hash") != content_hash
+        snapshot["current"] = {
+            "season": season,
+            "time": now,
+            "is_self_ck": is_self_ck,
+            "hash": content_hash,
+            "data": data,
+        }
+        # 只记录自己登录获取的完整数据
+        if is_self_ck and changed:
+            history = snapshot.setdefault("history", {})
+            history[str(season)] = {"time": now, "data": data}
+            for key in sorted(history, key=int)[:-MAX_HISTORY]:
+                del history[key]
+        await _save_snapshot(uid, kind, snapshot)
+
+
+async def check_upload(uid: str, kind: str, payload: Dict) -> bool:
+    """上传内容与上次成功上传及正在上传的内容都不同时返回 True"""
+    key = f"{uid}:{kind}"
+    upload_hash = get_content_hash(payload)
+    if upload_pending.get(key) == upload_hash:
+        return False
+    snapshot = await load_snapshot(uid, kind)
+    if snapshot.get("upload") == upload_hash:
+        return False
+    upload_pending.set(key, upload_hash)
+    return True
+
+
+async def mark_uploaded(uid: str, kind: str, payload: Dict):
+    """上传成功后由上传任务调用，记录内容哈希"""
+    key = f"{uid}:{kind}"
+    upload_hash = get_content_hash(payload)
+    async with _get_lock(uid, kind):
+        snapshot = await load_snapshot(uid, kind)
+        snapshot["upload"] = upload_hash
+        await _save_snapshot(uid, kind, snapshot)
+    if upload_pending.get(key) == upload_hash:
+        upload_pending.delete(key)
+
+
+async def _is_self_login(uid: str, user_id: str, bot_id: str) -> bool:
+    waves_user = await WavesUser.select_waves_user(uid, user_id, bot_id)
+    return bool(waves_user and waves_user.cookie and waves_user.status != "无效")
+
+
+async def _fetch_account_info(uid: str, ck: str) -> Union[AccountBaseInfo, str]:
+    account_info = await waves_api.get_base_info(uid, ck)
+    if not account_info.success:
+        return account_info.throw_msg()
+    account_info = AccountBaseInfo.model_validate(account_info.data)
+    set_cached_account_info(uid, account_info)
+    return account_info
+
+
+async def _fetch_role_info(uid: str, ck: str) -> Union[RoleList, str]:
+    role_info = await waves_api.get_role_info(uid, ck)
+    if not role_info.success:
+        return role_info.throw_msg()
+    role_info = RoleList.model_validate(role_info.data)
+    set_cached_role_info(uid, role_info)
+    return role_info
+
+
+async def get_game_data(
+    uid: str,
+    user_id: str,
+    bot_id: str,
+    kind: str,
+    model: Type[T],
+    fetch: Callable[[str, str, bool], Awaitable[Union[T, str]]],
+    get_season: Callable[[T], Optional[int]],
+) -> Union[Tuple[bool, T, AccountBaseInfo, RoleList], str, None]:
+    """
+    返回 (is_self_ck, 数据, 账号信息, 共鸣者列表)，出错时返回提示，无可用 ck 时返回 None
+    fetch(uid, ck, is_self_ck) 请求数据，返回模型或提示
+    """
+    is_self = await _is_self_login(uid, user_id, bot_id)
+    snapshot = await load_snapshot(uid, kind)
+    fresh = get_fresh_data(snapshot, is_self)
+    data = model.model_validate(fresh) if fresh else None
+    account_info = get_cached_account_info(uid)
+    role_info = get_cached_role_info(uid)
+    if data and account_info and role_info:
+        return is_self, data, account_info, role_info
+
+    is_self_ck, ck = await waves_api.get_ck_result(uid, user_id, bot_id)
+    if not ck:
+        return None
+    if is_self_ck != is_self:
+        data = None
+
+    if not data:
+        data = await fetch(uid, ck, is_self_ck)
+        if isinstance(data, str):
+            return data
+        season = get_season(data) or 0
+        await save_game_snapshot(uid, kind, data.model_dump(), season, is_self_ck)
+
+    # 只请求缓存中缺少的部分
+    account_res, role_res = await asyncio.gather(
+        (
+            _fetch_account_info(uid, ck)
+            if not account_info
+            else asyncio.sleep(0, account_info)
+        ),
+        _fetch_role_info(uid, ck) if not role_info else asyncio.sleep(0, role_info),
+    )
+    if isinstance(account_res, str):
+        return account_res
+    if isinstance(role_res, str):
+        return role_res
+    return is_self_ck, data, account_res, role_res
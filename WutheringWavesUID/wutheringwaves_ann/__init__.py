@@ -1,6 +1,3 @@
-import asyncio
-import random
-
 from gsuid_core.aps import scheduler
 from gsuid_core.bot import Bot
 from gsuid_core.logger import logger
@@ -11,6 +8,7 @@ from gsuid_core.sv import SV
 from ..utils.waves_api import waves_api
 from ..wutheringwaves_config import WutheringWavesConfig
 from .ann_card import ann_detail_card, ann_list_card
+from .ann_push import add_ann_push, run_ann_push
 
 sv_ann = SV("鸣潮公告")
 sv_ann_sub = SV("订阅鸣潮公告", pm=3)
@@ -116,21 +114,24 @@ async def check_waves_ann_state():
 
     if not new_ann_need_send:
         logger.info("[鸣潮公告] 没有最新公告")
-        return
+        # 继续发送重启前未完成的推送
+        return await send_ann_push(datas)
 
     logger.info(f"[鸣潮公告] 更新公告id: {new_ann_need_send}")
-    save_ids = sorted(ids, reverse=True)[:50] + new_ann_ids
-    WutheringWavesConfig.set_config("WavesAnnNewIds", list(set(save_ids)))
-
     for ann_id in new_ann_need_send:
         try:
-            img = await ann_detail_card(ann_id, is_check_time=True)
-            if isinstance(img, str):
-                continue
-            for subscribe in datas:
-                await subscribe.send(img)  # type: ignore
-                await asyncio.sleep(random.uniform(1, 3))
+            await add_ann_push(ann_id, datas)
         except Exception as e:
             logger.exception(e)
 
-    logger.info("[鸣潮公告] 推送完毕")
+    # 加入推送后再记录，避免绘制中途重启时漏掉公告
+    save_ids = sorted(ids, reverse=True)[:50] + new_ann_ids
+    WutheringWavesConfig.set_config("WavesAnnNewIds", list(set(save_ids)))
+
+    await send_ann_push(datas)
+
+
+async def send_ann_push(datas):
+    success, fail = await run_ann_push(datas)
+    if success or fail:
+        logger.info(f"[鸣潮公告] 推送完毕 成功: {success} 失败: {fail}")
@@ -0,0 +1,139 @@
+"""
+公告图片预取与缓存
+
+- 一次公告引用的图片按 url 去重后并发下载(ANN_PREFETCH_CONCURRENCY)
+- 计算高度只读取图片文件头中的尺寸，不解码
+- ANN_CARD_PATH 按修改时间做 LRU 清理，总大小不超过 AnnCardCacheSize
+"""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from PIL import Image
+
+from gsuid_core.logger import logger
+
+from ..utils.resource.RESOURCE_PATH import ANN_CARD_PATH
+from ..wutheringwaves_config import WutheringWavesConfig
+
+ANN_PREFETCH_CONCURRENCY = 8
+IMAGE_SUFFIX = ("jpg", "png", "jpeg", "webp")
+
+
+def is_ann_image(temp: Dict) -> bool:
+    return (
+        temp.get("contentType") == 2
+        and "url" in temp
+        and temp["url"].endswith(IMAGE_SUFFIX)
+    )
+
+
+def _touch(path: Path):
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+async def _download(url: str, semaphore: asyncio.Semaphore) -> Optional[Path]:
+    name = url.split("/")[-1]
+    path = ANN_CARD_PATH / name
+    if path.exists():
+        _touch(path)
+        return path
+
+    from gsuid_core.utils.download_resource.download_file import download
+
+    async with semaphore:
+        try:
+            await download(url, ANN_CARD_PATH, name, tag="[鸣潮]")
+        except Exception as e:
+            logger.warning(f"[鸣潮公告] 图片下载失败 {url}: {e}")
+    return path if path.exists() else None
+
+
+async def prefetch_ann_images(urls: Iterable[str]) -> Dict[str, Path]:
+    """并发下载图片，返回 url -> 本地路径，下载失败的不在结果中"""
+    ANN_CARD_PATH.mkdir(parents=True, exist_ok=True)
+    urls = list(dict.fromkeys(u for u in urls if u))
+    if not urls:
+        return {}
+
+    semaphore = asyncio.Semaphore(ANN_PREFETCH_CONCURRENCY)
+    paths = await asyncio.gather(*[_download(url, semaphore) for url in urls])
+    clean_ann_cache()
+    return {url: path for url, path in zip(urls, paths) if path}
+
+
+def get_ann_image_size(
+    temp: Dict, path: Optional[Path]
+) -> Optional[Tuple[int, int]]:
+    """
+    图片尺寸，优先使用公告中的 imgWidth/imgHeight，没有时读取文件头
+    图片下载失败时返回 None，绘制时跳过
+    """
+    if not path:
+        return None
+    try:
+        size = int(temp.get("imgWidth") or 0), int(temp.get("imgHeight") or 0)
+    except (TypeError, ValueError):
+        size = (0, 0)
+    if size[0] > 0 and size[1] > 0:
+        return size
+    try:
+        # Image.open 只解析文件头
+        with Image.open(path) as img:
+            return img.size
+    except Exception as e:
+        logger.warning(f"[鸣潮公告] 图片读取失败 {path}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+
+
+def get_ann_draw_size(
+    size: Tuple[int, int], max_width: int = 1080
+) -> Tuple[int, int]:
+    width, height = size
+    if width > max_width:
+        return max_width, int(height * max_width / width)
+    return width, height
+
+
+def clean_ann_cache(max_size: Optional[int] = None) -> int:
+    """按最近使用时间删除最旧的图片，返回删除的数量"""
+    if max_size is None:
+        max_size = WutheringWavesConfig.get_config("AnnCardCacheSize").data
+    max_bytes = max_size * 1024 * 1024
+    if max_bytes <= 0 or not ANN_CARD_PATH.exists():
+        return 0
+
+    files = []
+    total = 0
+    for entry in os.scandir(ANN_CARD_PATH):
+        if not entry.is_file():
+            continue
+        stat = entry.stat()
+        files.append((stat.st_mtime, stat.st_size, entry.path))
+        total += stat.st_size
+    if total <= max_bytes:
+        return 0
+
+    files.sort()
+    # 刚下载的图片不删除，避免正在绘制的公告缺图
+    recent = time.time() - 600
+    removed = 0
+    for mtime, size, path in files:
+        if total <= max_bytes or mtime > recent:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    if removed:
+        logger.info(f"[鸣潮公告] 清理图片缓存 {removed} 张")
+    return removed
@@ -1,6 +1,7 @@
 import time
 from datetime import datetime
-from typing import List, Union
+from pathlib import Path
+from typing import Dict, List, Optional, Union
 
 from PIL import Image, ImageDraw, ImageOps
 
@@ -22,6 +23,12 @@ from ..utils.image import add_footer, pic_download_from_url
 from ..utils.resource.RESOURCE_PATH import ANN_CARD_PATH
 from ..utils.waves_api import waves_api
 from ..wutheringwaves_config import PREFIX
+from .ann_assets import (
+    get_ann_draw_size,
+    get_ann_image_size,
+    is_ann_image,
+    prefetch_ann_images,
+)
 
 
 async def ann_list_card() -> bytes:
@@ -38,6 +45,9 @@ async def ann_list_card() -> bytes:
     for data in grouped.values():
         data.sort(key=lambda x: x.get("publishTime", 0), reverse=True)
 
+    # 预取所有封面
+    await prefetch_ann_images(item.get("coverUrl", "") for item in ann_list)
+
     # 配置
     W, H_ITEM, H_SECTION, H_HEADER, H_FOOTER = 750, 100, 60, 80, 30
     CONFIGS = {1: ("活动", "#ff6b6b"), 2: ("资讯", "#45b7d1"), 3: ("公告", "#4ecdc4")}
@@ -202,7 +212,16 @@ def wrap_text_smart(text, font, max_w):
     return lines or [""]
 
 
-async def ann_batch_card(post_content: List, drow_height: float) -> bytes:
+async def ann_batch_card(
+    post_content: List,
+    drow_height: float,
+    img_paths: Optional[Dict[str, Path]] = None,
+) -> bytes:
+    if img_paths is None:
+        img_paths = await prefetch_ann_images(
+            temp["url"] for temp in post_content if is_ann_image(temp)
+        )
+
     im = Image.new("RGB", (1080, drow_height), "#f9f6f2")  # type: ignore
     draw = ImageDraw.Draw(im)
     x, y = 0, 0
@@ -214,18 +233,17 @@ async def ann_batch_card(post_content: List, drow_height: float) -> bytes:
             for duanluo, line_count in drow_duanluo:
                 draw.text((x, y), duanluo, fill=(0, 0, 0), font=ww_font_26)
                 y += drow_line_height * line_count + 30
-        elif (
-            temp["contentType"] == 2
-            and "url" in temp
-            and temp["url"].endswith(("jpg", "png", "jpeg", "webp"))
-        ):
-            img = await pic_download_from_url(ANN_CARD_PATH, temp["url"])
-            img_x = 0
-            if img.width > im.width:
-                ratio = im.width / img.width
-                img = img.resize((int(img.width * ratio), int(img.height * ratio)))
-            else:
-                img_x = (im.width - img.width) // 2
+        elif is_ann_image(temp):
+            path = img_paths.get(temp["url"])
+            size = get_ann_image_size(temp, path)
+            if not path or not size:
+                continue
+            # 按计算高度时的尺寸绘制，保证与画布高度一致
+            draw_size = get_ann_draw_size(size, im.width)
+            img = Image.open(path).convert("RGBA")
+            if img.size != draw_size:
+                img = img.resize(draw_size)
+            img_x = (im.width - img.width) // 2
             easy_paste(im, img, (img_x, y))
             y += img.size[1] + 40
 
@@ -277,6 +295,11 @@ async def ann_detail_card(
     if not post_content:
         return "未找到该公告"
 
+    # 并发预取所有图片
+    img_paths = await prefetch_ann_images(
+        temp["url"] for temp in post_content if is_ann_image(temp)
+    )
+
     drow_height = 0
     index_start = 0
     index_end = 0
@@ -293,30 +316,24 @@ async def ann_detail_card(
                 x_drow_height,
             ) = split_text(content)
             drow_height += x_drow_height + 30
-        elif (
-            content_type == 2
-            and "url" in temp
-            and temp["url"].endswith(("jpg", "png", "jpeg", "webp"))
-        ):
+        elif is_ann_image(temp):
             # 图片
-            _size = (temp["imgWidth"], temp["imgHeight"])
-            img = await pic_download_from_url(ANN_CARD_PATH, temp["url"])
-            img_height = img.size[1]
-            if img.width > 1080:
-                ratio = 1080 / img.width
-                img_height = int(img.height * ratio)
-            drow_height += img_height + 40
+            size = get_ann_image_size(temp, img_paths.get(temp["url"]))
+            if size:
+                drow_height += get_ann_draw_size(size)[1] + 40
 
         index_end = index + 1
         if drow_height > 5000:
-            img = await ann_batch_card(post_content[index_start:index_end], drow_height)
+            img = await ann_batch_card(
+                post_content[index_start:index_end], drow_height, img_paths
+            )
             index_start = index_end
             index_end = index + 1
             drow_height = 0
             imgs.append(img)
 
     if index_start == 0:
-        return await ann_batch_card(post_content[index_start:], drow_height)
+        return await ann_batch_card(post_content[index_start:], drow_height, img_paths)
     else:
         return imgs
 
@@ -0,0 +1,199 @@
+"""
+公告推送
+
+- 每条公告只绘制一次，图片保存在 ANN_PUSH_PATH，推送时直接发送
+- 订阅按 bot 分组，每个 bot 一个发送队列各自限速，不同 bot 并行发送
+- 推送进度保存在 state.json，每发送一个订阅更新一次，重启后从未发送的订阅继续
+- 进度只在内存中保留一份，加入公告与推送过程都修改同一个 dict，互不覆盖
+"""
+
+import asyncio
+import json
+import random
+import shutil
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import aiofiles
+from msgspec import json as msgjson
+
+from gsuid_core.logger import logger
+
+from ..utils.atomic_writer import storage_writer
+from ..utils.resource.RESOURCE_PATH import OTHER_PATH
+from .ann_card import ann_detail_card
+
+ANN_PUSH_PATH = OTHER_PATH / "ann_push"
+ANN_PUSH_STATE = ANN_PUSH_PATH / "state.json"
+
+# 同一 bot 两次发送的间隔
+SEND_INTERVAL = (1, 3)
+# 单个订阅的最大失败次数，超过后不再发送
+MAX_FAIL = 3
+# 超过该时间仍未发送完成的公告不再发送
+PUSH_EXPIRE = 86400
+
+_push_lock = asyncio.Lock()
+_state_lock = asyncio.Lock()
+# 推送进度，首次使用时从 state.json 读取
+_state: Optional[Dict[str, Dict]] = None
+
+
+def get_subscribe_key(subscribe: Any) -> str:
+    target = subscribe.group_id if subscribe.group_id else subscribe.user_id
+    return (
+        f"{subscribe.bot_id}:{subscribe.bot_self_id}:{subscribe.user_type}:{target}"
+    )
+
+
+async def load_push_state() -> Dict[str, Dict]:
+    if not ANN_PUSH_STATE.exists():
+        return {}
+    try:
+        async with aiofiles.open(ANN_PUSH_STATE, mode="r", encoding="utf-8") as f:
+            data = json.loads(await f.read())
+    except Exception as e:
+        logger.exception(f"load {ANN_PUSH_STATE} failed:", e)
+        ANN_PUSH_STATE.unlink(missing_ok=True)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+async def get_push_state() -> Dict[str, Dict]:
+    global _state
+    async with _state_lock:
+        if _state is None:
+            _state = await load_push_state()
+    return _state
+
+
+async def save_push_state(state: Dict[str, Dict]):
+    # 写入期间 state 仍会被修改，先在当前线程序列化
+    try:
+        await storage_writer.write_bytes(ANN_PUSH_STATE, msgjson.encode(state))
+    except Exception as e:
+        logger.exception(f"save {ANN_PUSH_STATE} failed:", e)
+
+
+def _remove_ann_files(ann_id: str):
+    shutil.rmtree(ANN_PUSH_PATH / ann_id, ignore_errors=True)
+
+
+async def _save_ann_img(ann_id: str, img: Union[bytes, List[bytes]]) -> int:
+    _dir = ANN_PUSH_PATH / ann_id
+    _dir.mkdir(parents=True, exist_ok=True)
+    imgs = img if isinstance(img, list) else [img]
+    for index, data in enumerate(imgs):
+        async with aiofiles.open(_dir / f"{index}.img", "wb") as f:
+            await f.write(data)
+    return len(imgs)
+
+
+async def _load_ann_img(ann_id: str, info: Dict) -> Union[bytes, List[bytes], None]:
+    _dir = ANN_PUSH_PATH / ann_id
+    imgs = []
+    for index in range(info["img_num"]):
+        path = _dir / f"{index}.img"
+        if not path.exists():
+            return None
+        async with aiofiles.open(path, "rb") as f:
+            imgs.append(await f.read())
+    return imgs if info["is_list"] else imgs[0]
+
+
+async def add_ann_push(ann_id: int, subscribes: List[Any]) -> bool:
+    """绘制公告并加入推送，公告无需推送时返回 False"""
+    img = await ann_detail_card(ann_id, is_check_time=True)
+    if isinstance(img, str):
+        return False
+
+    key = str(ann_id)
+    img_num = await _save_ann_img(key, img)
+    state = await get_push_state()
+    state[key] = {
+        "time": int(time.time()),
+        "img_num": img_num,
+        "is_list": isinstance(img, list),
+        "pending": [get_subscribe_key(s) for s in subscribes],
+        "fail": {},
+    }
+    await save_push_state(state)
+    return True
+
+
+async def run_ann_push(subscribes: List[Any]) -> Tuple[int, int]:
+    """发送所有未完成的推送，返回 (成功数, 失败数)"""
+    if _push_lock.locked():
+        logger.info("[鸣潮公告] 上一次推送尚未完成")
+        return 0, 0
+
+    async with _push_lock:
+        return await _run_ann_push(subscribes)
+
+
+async def _run_ann_push(subscribes: List[Any]) -> Tuple[int, int]:
+    state = await get_push_state()
+    if not state:
+        return 0, 0
+
+    now = time.time()
+    subscribe_map = {get_subscribe_key(s): s for s in subscribes}
+    imgs: Dict[str, Union[bytes, List[bytes]]] = {}
+    # bot_self_id -> [(公告, 订阅)]
+    queues: Dict[str, List[Tuple[str, str]]] = {}
+    for ann_id, info in list(state.items()):
+        img = None
+        if now - info.get("time", 0) <= PUSH_EXPIRE:
+            img = await _load_ann_img(ann_id, info)
+        if img is None:
+            logger.warning(f"[鸣潮公告] 公告{ann_id} 已过期或图片丢失, 停止推送")
+            del state[ann_id]
+            _remove_ann_files(ann_id)
+            continue
+        # 已取消订阅的不再发送
+        info["pending"] = [k for k in info["pending"] if k in subscribe_map]
+        if not info["pending"]:
+            del state[ann_id]
+            _remove_ann_files(ann_id)
+            continue
+        imgs[ann_id] = img
+        for key in info["pending"]:
+            bot_self_id = subscribe_map[key].bot_self_id
+            queues.setdefault(bot_self_id, []).append((ann_id, key))
+
+    result = [0, 0]
+
+    async def _finish(ann_id: str, key: str):
+        info = state[ann_id]
+        info["pending"].remove(key)
+        if not info["pending"]:
+            del state[ann_id]
+            _remove_ann_files(ann_id)
+        await save_push_state(state)
+
+    async def _send_queue(jobs: List[Tuple[str, str]]):
+        for ann_id, key in jobs:
+            try:
+                await subscribe_map[key].send(imgs[ann_id])
+            except Exception as e:
+                logger.exception(f"[鸣潮公告] 公告{ann_id} 推送{key}失败", e)
+                result[1] += 1
+                fail = state[ann_id]["fail"]
+                fail[key] = fail.get(key, 0) + 1
+                if fail[key] >= MAX_FAIL:
+                    await _finish(ann_id, key)
+                else:
+                    await save_push_state(state)
+            else:
+                result[0] += 1
+                await _finish(ann_id, key)
+            await asyncio.sleep(random.uniform(*SEND_INTERVAL))
+
+    await save_push_state(state)
+    if queues:
+        logger.info(
+            f"[鸣潮公告] 开始推送 bot数: {len(queues)} "
+            f"待发送: {sum(len(jobs) for jobs in queues.values())}"
+        )
+        await asyncio.gather(*[_send_queue(jobs) for jobs in queues.values()])
+    return result[0], result[1]
@@ -1,7 +1,10 @@
 import asyncio
+import hashlib
+import json
 import random
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import List, Tuple
 
 from PIL import Image, ImageDraw
 from PIL.ImageFile import ImageFile
@@ -12,6 +15,7 @@ from gsuid_core.utils.image.image_tools import crop_center_img
 
 from ..utils.ascension.char import get_char_id
 from ..utils.ascension.weapon import get_weapon_id
+from ..utils.cache import TimedCache
 from ..utils.fonts.waves_fonts import ww_font_20, ww_font_24, ww_font_30
 from ..utils.image import (
     SPECIAL_GOLD,
@@ -27,6 +31,14 @@ from .calendar_model import ImageItem, SpecialImages, VersionActivity
 TEXT_PATH = Path(__file__).parent / "texture2d"
 time_icon = Image.open(TEXT_PATH / "time_icon.png")
 
+# wiki 首页
+wiki_home_cache = TimedCache(60, 1, "calendar.wiki_home")
+# 按 wiki 首页内容哈希缓存的静态图层 (图片, 倒计时位置)
+calendar_layer_cache = TimedCache(86400, 4, "calendar.layer")
+# 倒计时精确到分钟，同一分钟内直接复用
+calendar_img_cache = TimedCache(60, 2, "calendar.img")
+entry_detail_cache = TimedCache(86400, 200, "calendar.entry_detail")
+
 
 def tower_node(now: datetime):
     start_time = datetime(2025, 2, 3, 4, 0)
@@ -76,20 +88,72 @@ def shenhai_node(now: datetime):
     }
 
 
+async def get_wiki_home():
+    return await wiki_home_cache.get_or_set(
+        "wiki_home",
+        waves_api.get_wiki_home,
+        condition=lambda x: x.get("code") == 200,
+    )
+
+
+def get_content_hash(data) -> str:
+    content = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.md5(content.encode()).hexdigest()
+
+
 async def draw_calendar_img(ev: Event, uid: str):
-    wiki_home = await waves_api.get_wiki_home()
-    if wiki_home["code"] != 200:
+    wiki_home = await get_wiki_home()
+    if wiki_home.get("code") != 200:
         return "获取日历失败"
 
     # 当前时间
     now = datetime.now()
 
+    content_json = wiki_home.get("data", {}).get("contentJson", {})
+    side_modules = []
+    for side_module in content_json.get("sideModules", []):
+        if side_module["title"] == "版本活动":
+            # 不修改缓存中的数据
+            side_module = {
+                **side_module,
+                "content": [tower_node(now), shenhai_node(now)]
+                + side_module["content"],
+            }
+        side_modules.append(side_module)
+
+    bg = f"bg{random.choice([1, 2])}"
+    content_hash = get_content_hash(
+        {"banner": content_json.get("banner", []), "sideModules": side_modules}
+    )
+    key = f"{content_hash}_{bg}_{now.strftime('%Y%m%d%H%M')}"
+    img = calendar_img_cache.get(key)
+    if img is not None:
+        return img
+
+    layer = calendar_layer_cache.get(f"{content_hash}_{bg}")
+    if layer is None:
+        layer = await draw_calendar_layer(wiki_home, side_modules, bg, now)
+        calendar_layer_cache.set(f"{content_hash}_{bg}", layer)
+
+    # 静态图层之上只绘制倒计时
+    layer_img, countdowns = layer
+    img = layer_img.copy()
+    draw_calendar_countdown(img, countdowns, now)
+    img = await convert_img(img)
+    calendar_img_cache.set(key, img)
+    return img
+
+
+async def draw_calendar_layer(
+    wiki_home, side_modules, bg: str, now: datetime
+) -> Tuple[Image.Image, List[Tuple]]:
+    """
+    绘制不随时间变化的部分
+    返回 (图片, 倒计时列表)，倒计时为 (类型, x, y, dateRange)
+    """
     gacha_char_list = []
     gacha_weapon_list = []
     content = None
-    side_modules = (
-        wiki_home.get("data", {}).get("contentJson", {}).get("sideModules", [])
-    )
     for side_module in side_modules:
         if side_module["title"] == "角色活动唤取":
             gacha_char_list = await draw_calendar_gacha(side_module, "角色")
@@ -98,8 +162,6 @@ async def draw_calendar_img(ev: Event, uid: str):
             gacha_weapon_list = await draw_calendar_gacha(side_module, "武器")
 
         elif side_module["title"] == "版本活动":
-            side_module["content"].insert(0, tower_node(now))
-            side_module["content"].insert(1, shenhai_node(now))
             content = VersionActivity(**side_module)
 
     title_high = 150
@@ -127,7 +189,7 @@ async def draw_calendar_img(ev: Event, uid: str):
         total_high += temp_high
         total_high += bar1_high
 
-    bg = f"bg{random.choice([1, 2])}"
+    countdowns = []
     img = await get_calendar_bg(1200, total_high, bg)
     # title
     title_img = Image.open(TEXT_PATH / "title.png")
@@ -146,13 +208,8 @@ async def draw_calendar_img(ev: Event, uid: str):
         char_bar = Image.open(TEXT_PATH / "char_bar.png")
 
         if gacha_char_list[0]["dateRange"]:
-            char_bar_draw = ImageDraw.Draw(char_bar)
             dateRange = gacha_char_list[0]["dateRange"]
-            status, left, color = get_date_range(dateRange, now)
-            if left:
-                status = f"{status}: "
-                char_bar_draw.text((310, 110), f"{left}", color, ww_font_24, "lm")
-            char_bar_draw.text((220, 110), f"{status}", "white", ww_font_24, "lm")
+            countdowns.append(("gacha", 0, _high, dateRange))
 
         img.paste(char_bar, (0, _high), char_bar)
         _high += char_bar_high
@@ -162,13 +219,8 @@ async def draw_calendar_img(ev: Event, uid: str):
         _high += temp_high
         weapon_bar: ImageFile = Image.open(TEXT_PATH / "weapon_bar.png")
         if gacha_weapon_list[0]["dateRange"]:
-            weapon_bar_draw = ImageDraw.Draw(weapon_bar)
             dateRange = gacha_weapon_list[0]["dateRange"]
-            status, left, color = get_date_range(dateRange, now)
-            if left:
-                status = f"{status}: "
-                weapon_bar_draw.text((310, 110), f"{left}", color, ww_font_24, "lm")
-            weapon_bar_draw.text((220, 110), f"{status}", "white", ww_font_24, "lm")
+            countdowns.append(("gacha", 0, _high, dateRange))
 
         img.paste(weapon_bar, (0, _high), weapon_bar)
         _high += weapon_bar_high
@@ -183,6 +235,7 @@ async def draw_calendar_img(ev: Event, uid: str):
     for i, cont in enumerate(content.content):  # type: ignore
         event_bg = Image.open(TEXT_PATH / "event_bg.png")
         event_bg_draw = ImageDraw.Draw(event_bg)
+        event_x = 70 + (i % 2) * 540
         dateRange = []
         if cont.countDown:
             dateRange = cont.countDown.dateRange
@@ -191,11 +244,6 @@ async def draw_calendar_img(ev: Event, uid: str):
             start_time = datetime.strptime(dateRange[0], "%Y-%m-%d %H:%M")
             end_time = datetime.strptime(dateRange[1], "%Y-%m-%d %H:%M")
 
-            status, left, color = get_date_range(dateRange, now)
-            if left:
-                event_bg_draw.text((260, 130), f"{left}", color, ww_font_20, "lm")
-                status = f"{status}: "
-
             # 格式化
             formatted_start = start_time.strftime("%m.%d %H:%M")
             formatted_end = end_time.strftime("%m.%d %H:%M")
@@ -207,53 +255,7 @@ async def draw_calendar_img(ev: Event, uid: str):
             )
             # 时间小图标
             event_bg.alpha_composite(time_icon, (155, 115))
-            # 状态
-            event_bg_draw.text((190, 130), f"{status}", "white", ww_font_20, "lm")
-
-            # 添加进度条
-            progress_x = 25
-            progress_y = 155
-            progress_width = 485
-            progress_height = 8
-
-            # 计算进度百分比
-            if status == "已结束":
-                # 已结束
-                progress = 1
-                fill_color = "white"
-            else:
-                # 进行中
-                total_duration = (end_time - start_time).total_seconds()
-                elapsed_duration = (now - start_time).total_seconds()
-                progress = (
-                    elapsed_duration / total_duration if total_duration > 0 else 0
-                )
-                fill_color = "gold" if color == "white" else color
-
-            # 绘制进度条背景
-            event_bg_draw.rectangle(
-                [
-                    progress_x,
-                    progress_y,
-                    progress_x + progress_width,
-                    progress_y + progress_height,
-                ],
-                fill=(100, 100, 100),  # 灰色背景
-            )
-
-            # 绘制进度条前景
-            if progress > 0:
-                progress_fill_width = int(progress_width * progress)
-
-                event_bg_draw.rectangle(
-                    [
-                        progress_x,
-                        progress_y,
-                        progress_x + progress_fill_width,
-                        progress_y + progress_height,
-                    ],
-                    fill=fill_color,
-                )
+            countdowns.append(("event", event_x, _high, dateRange))
 
         if "http" in cont.contentUrl:
             # linkUrl = Image.open(
@@ -268,13 +270,76 @@ async def draw_calendar_img(ev: Event, uid: str):
         event_bg.paste(linkUrl, (40, 40), linkUrl)
         event_bg_draw.text((160, 60), f"{cont.title}", SPECIAL_GOLD, ww_font_30, "lm")
 
-        img.alpha_composite(event_bg, (70 + (i % 2) * 540, _high))
+        img.alpha_composite(event_bg, (event_x, _high))
         if i % 2 == 1:
             _high += event_high
 
     img = add_footer(img)
-    img = await convert_img(img)
-    return img
+    return img, countdowns
+
+
+def draw_calendar_countdown(img: Image.Image, countdowns: List[Tuple], now: datetime):
+    """绘制状态、剩余时间与进度条"""
+    img_draw = ImageDraw.Draw(img)
+    for kind, x, y, dateRange in countdowns:
+        status, left, color = get_date_range(dateRange, now)
+        if kind == "gacha":
+            if left:
+                status = f"{status}: "
+                img_draw.text((x + 310, y + 110), f"{left}", color, ww_font_24, "lm")
+            img_draw.text((x + 220, y + 110), f"{status}", "white", ww_font_24, "lm")
+            continue
+
+        if left:
+            img_draw.text((x + 260, y + 130), f"{left}", color, ww_font_20, "lm")
+            status = f"{status}: "
+        # 状态
+        img_draw.text((x + 190, y + 130), f"{status}", "white", ww_font_20, "lm")
+
+        # 添加进度条
+        progress_x = x + 25
+        progress_y = y + 155
+        progress_width = 485
+        progress_height = 8
+
+        # 计算进度百分比
+        if status == "已结束":
+            # 已结束
+            progress = 1
+            fill_color = "white"
+        else:
+            # 进行中
+            start_time = datetime.strptime(dateRange[0], "%Y-%m-%d %H:%M")
+            end_time = datetime.strptime(dateRange[1], "%Y-%m-%d %H:%M")
+            total_duration = (end_time - start_time).total_seconds()
+            elapsed_duration = (now - start_time).total_seconds()
+            progress = elapsed_duration / total_duration if total_duration > 0 else 0
+            fill_color = "gold" if color == "white" else color
+
+        # 绘制进度条背景
+        img_draw.rectangle(
+            [
+                progress_x,
+                progress_y,
+                progress_x + progress_width,
+                progress_y + progress_height,
+            ],
+            fill=(100, 100, 100),  # 灰色背景
+        )
+
+        # 绘制进度条前景
+        if progress > 0:
+            progress_fill_width = int(progress_width * progress)
+
+            img_draw.rectangle(
+                [
+                    progress_x,
+                    progress_y,
+                    progress_x + progress_fill_width,
+                    progress_y + progress_height,
+                ],
+                fill=fill_color,
+            )
 
 
 async def draw_calendar_gacha(side_module, gacha_type):
@@ -438,15 +503,13 @@ def get_date_range(dateRange, now):
     return status, left, color
 
 
-cache = {}
-
-
 async def get_unsafe_entry_detail(entryId):
-    if entryId in cache:
-        return cache[entryId]
+    item_detail = entry_detail_cache.get(entryId)
+    if item_detail is not None:
+        return item_detail
     item_detail = await waves_api.get_entry_detail(entryId)
     if item_detail["code"] != 200:
         return None
 
-    cache[entryId] = item_detail
+    entry_detail_cache.set(entryId, item_detail)
     return item_detail
@@ -27,6 +27,7 @@ waves_new_get_char_info = SV("waves新获取面板", priority=3)
 waves_new_get_one_char_info = SV("waves新获取单个角色面板", priority=3)
 waves_new_char_detail = SV("waves新角色面板", priority=4)
 waves_char_detail = SV("waves角色面板", priority=5)
+waves_echo_optimize = SV("waves声骸配装优化", priority=3)
 waves_upload_char = SV("waves上传面板图", priority=5, pm=1)
 waves_char_card_list = SV("waves面板图列表", priority=5, pm=1)
 waves_delete_char_card = SV("waves删除面板图", priority=5, pm=1)
@@ -106,6 +107,32 @@ async def send_one_char_detail_msg(bot: Bot, ev: Event):
         return await bot.send_option(msg, buttons)
 
 
+@waves_echo_optimize.on_regex(
+    r"^[\u4e00-\u9fa5]+(声骸优化|配装优化)(\s*[\u4e00-\u9fa5]+)?$",
+    block=True,
+)
+async def send_echo_optimize_msg(bot: Bot, ev: Event):
+    match = re.search(
+        r"(?P<char>[\u4e00-\u9fa5]+?)(声骸优化|配装优化)\s*(?P<sonata>[\u4e00-\u9fa5]+)?",
+        ev.raw_text,
+    )
+    if not match:
+        return
+    char = match.group("char")
+    sonata = match.group("sonata")
+
+    user_id = ruser_id(ev)
+    uid = await WavesBind.get_uid_by_game(user_id, ev.bot_id)
+    if not uid:
+        return await bot.send(error_reply(WAVES_CODE_103))
+
+    from .echo_optimize import get_echo_optimize_msg
+
+    await bot.send(f"[鸣潮] 正在为【{char}】计算声骸配装, 请稍候...")
+    msg = await get_echo_optimize_msg(uid, char, sonata)
+    return await bot.send(msg)
+
+
 @waves_char_detail.on_prefix(("角色面板", "查询"))
 async def send_char_detail_msg(bot: Bot, ev: Event):
     char = ev.text.strip(" ")
@@ -1,9 +1,10 @@
+import asyncio
 import copy
 import re
+import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Awaitable, Dict, Optional, TypeVar
 
-import httpx
 from PIL import Image, ImageDraw, ImageEnhance
 
 from gsuid_core.logger import logger
@@ -20,6 +21,7 @@ from ..utils.api.model import (
 )
 from ..utils.api.model_other import EnemyDetailData
 from ..utils.api.wwapi import ONE_RANK_URL, OneRankRequest, OneRankResponse
+from ..utils.api.wwapi_client import wwapi_request
 from ..utils.ascension.char import get_char_model
 from ..utils.ascension.template import get_template_data
 from ..utils.ascension.weapon import (
@@ -39,6 +41,7 @@ from ..utils.calculate import (
 )
 from ..utils.char_info_utils import get_all_roleid_detail_info
 from ..utils.damage.abstract import DamageDetailRegister
+from ..utils.damage.damage import DamageResult
 from ..utils.error_reply import WAVES_CODE_102
 from ..utils.fonts.waves_fonts import (
     waves_font_16,
@@ -92,10 +95,7 @@ from ..utils.resource.download_file import (
 )
 from ..utils.waves_api import waves_api
 from ..wutheringwaves_config import PREFIX
-from ..wutheringwaves_config.wutheringwaves_config import (
-    ShowConfig,
-    WutheringWavesConfig,
-)
+from ..wutheringwaves_config.wutheringwaves_config import ShowConfig
 from .role_info_change import change_role_detail
 
 TEXT_PATH = Path(__file__).parent / "texture2d"
@@ -161,32 +161,37 @@ weight_list = [
     "共鸣解放伤害加成",
 ]
 
+# 评分排名的等待时间(秒)，从开始查询面板计算
+RANK_SOFT_DEADLINE = 1.5
+
+T = TypeVar("T")
+
 damage_bar1 = Image.open(TEXT_PATH / "damage_bar1.png")
 damage_bar2 = Image.open(TEXT_PATH / "damage_bar2.png")
 
 
-async def get_one_rank(item: OneRankRequest) -> Optional[OneRankResponse]:
-    WavesToken = WutheringWavesConfig.get_config("WavesToken").data
+async def _timed(name: str, coro: Awaitable[T], timings: Dict[str, float]) -> T:
+    """记录单个步骤的耗时"""
+    start = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        timings[name] = (time.perf_counter() - start) * 1000
 
-    if not WavesToken:
-        return
 
-    async with httpx.AsyncClient() as client:
-        try:
-            res = await client.post(
-                ONE_RANK_URL,
-                json=item.dict(),
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {WavesToken}",
-                },
-                timeout=httpx.Timeout(10),
-            )
-            # logger.debug(f"获取排行: {res.text}")
-            if res.status_code == 200:
-                return OneRankResponse.model_validate(res.json())
-        except Exception as e:
-            logger.exception(f"获取排行失败: {e}")
+def _cancel_task(task: Optional[asyncio.Task]):
+    if task and not task.done():
+        task.cancel()
+
+
+async def get_one_rank(item: OneRankRequest) -> Optional[OneRankResponse]:
+    res = await wwapi_request("POST", ONE_RANK_URL, json=item.dict(), need_token=True)
+    if res is None:
+        return
+    try:
+        return OneRankResponse.model_validate(res)
+    except Exception as e:
+        logger.exception(f"获取排行失败: {e}")
 
 
 def parse_text_and_number(text):
@@ -641,30 +646,80 @@ async def draw_char_detail_img(
         if damageId and not damageDetail:
             return f"[鸣潮] 角色【{char_name}】暂不支持伤害计算！\n"
 
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    rank_task = None
+    if not is_limit_query and not change_list_regex:
+        # 评分排名不是必需的，与其他请求并行，超时则不显示
+        rank_task = asyncio.create_task(
+            _timed(
+                "rank",
+                get_one_rank(
+                    OneRankRequest(char_id=int(char_id), waves_id=waves_id or uid)
+                ),
+                timings,
+            )
+        )
+
     is_online_user = False
     ck = ""
     if not is_limit_query:
-        _, ck = await waves_api.get_ck_result(uid, user_id, ev.bot_id)
+        _, ck = await _timed(
+            "ck", waves_api.get_ck_result(uid, user_id, ev.bot_id), timings
+        )
         if not ck:
+            _cancel_task(rank_task)
             return hint.error_reply(WAVES_CODE_102)
 
-        online_list = await waves_api.get_online_list_role(ck)
-        if online_list.success and online_list.data:
-            online_list_role_model = OnlineRoleList.model_validate(online_list.data)
-            online_role_map = {str(i.roleId): i for i in online_list_role_model}
-            if char_id in online_role_map:
-                is_online_user = True
-
     # 账户数据
     if waves_id:
         uid = waves_id
 
+    force_resource_id = char_id if is_limit_query else None
+
+    async def _get_role_need():
+        nonlocal is_online_user
+        if not is_limit_query:
+            online_list = await _timed(
+                "online_list", waves_api.get_online_list_role(ck), timings
+            )
+            if online_list.success and online_list.data:
+                online_list_role_model = OnlineRoleList.model_validate(
+                    online_list.data
+                )
+                online_role_map = {str(i.roleId): i for i in online_list_role_model}
+                if char_id in online_role_map:
+                    is_online_user = True
+
+        # 获取数据
+        return await _timed(
+            "role_need",
+            get_role_need(
+                ev,
+                char_id,
+                ck,
+                uid,
+                char_name,
+                waves_id,
+                is_force_avatar,
+                force_resource_id,
+                is_online_user,
+                is_limit_query,
+                change_list_regex,
+            ),
+            timings,
+        )
+
     if not is_limit_query:
-        account_info = await waves_api.get_base_info(uid, ck)
-        if not account_info.success:
-            return account_info.throw_msg()
-        account_info = AccountBaseInfo.model_validate(account_info.data)
-        force_resource_id = None
+        # 账户信息 与 在线角色列表->角色数据 互不依赖
+        account_res, (avatar, role_detail) = await asyncio.gather(
+            _timed("base_info", waves_api.get_base_info(uid, ck), timings),
+            _get_role_need(),
+        )
+        if not account_res.success:
+            _cancel_task(rank_task)
+            return account_res.throw_msg()
+        account_info = AccountBaseInfo.model_validate(account_res.data)
     else:
         account_info = AccountBaseInfo.model_validate(
             {
@@ -675,22 +730,9 @@ async def draw_char_detail_img(
                 "creatTime": 1739375719,
             }
         )
-        force_resource_id = char_id
-    # 获取数据
-    avatar, role_detail = await get_role_need(
-        ev,
-        char_id,
-        ck,
-        uid,
-        char_name,
-        waves_id,
-        is_force_avatar,
-        force_resource_id,
-        is_online_user,
-        is_limit_query,
-        change_list_regex,
-    )
+        avatar, role_detail = await _get_role_need()
     if isinstance(role_detail, str):
+        _cancel_task(rank_task)
         return role_detail
 
     change_command = ""
@@ -705,14 +747,15 @@ async def draw_char_detail_img(
         except Exception as e:
             logger.exception("角色数据转换错误", e)
             role_detail = temp
-    else:
-        if not is_limit_query:
-            # 非极限查询时，获取评分排名
-            oneRank = await get_one_rank(
-                OneRankRequest(char_id=int(char_id), waves_id=uid)
-            )
-            if oneRank and len(oneRank.data) > 0:
-                dd_len += 60 * 2
+    elif rank_task:
+        remain = RANK_SOFT_DEADLINE - (time.perf_counter() - start)
+        try:
+            oneRank = await asyncio.wait_for(rank_task, timeout=max(remain, 0))
+        except asyncio.TimeoutError:
+            timings["rank"] = -1
+        if oneRank and len(oneRank.data) > 0:
+            dd_len += 60 * 2
+    timings["fetch"] = (time.perf_counter() - start) * 1000
 
     # 声骸
     calc, phantom_temp = await ph_card_draw(
@@ -731,11 +774,8 @@ async def draw_char_detail_img(
         # damageAttribute = card_sort_map_to_attribute(card_map)
         calc.damageAttribute = calc.card_sort_map_to_attribute(calc.role_card)
         damageAttributeTemp = copy.deepcopy(calc.damageAttribute)
-        crit_damage, expected_damage = damage_calc["func"](
-            damageAttributeTemp, role_detail
-        )
-        logger.debug(f"{char_name}-{damage_title} 暴击伤害: {crit_damage}")
-        logger.debug(f"{char_name}-{damage_title} 期望伤害: {expected_damage}")
+        result: DamageResult = damage_calc["func"](damageAttributeTemp, role_detail)
+        logger.debug(f"{char_name}-{damage_title} 伤害: {result}")
         logger.debug(f"{char_name}-{damage_title} 属性值: {damageAttributeTemp}")
 
         damage_high = 100 + (len(damageAttributeTemp.effect) + 3) * 60
@@ -757,16 +797,16 @@ async def draw_char_detail_img(
         damage_bar = damage_bar2.copy()
         damage_bar_draw = ImageDraw.Draw(damage_bar)
         damage_bar_draw.text((400, 50), f"{damage_title}", "white", waves_font_24, "rm")
-        if crit_damage and expected_damage:
+        if result.crit_damage is not None:
             damage_bar_draw.text(
-                (700, 50), f"{crit_damage}", "white", waves_font_24, "mm"
+                (700, 50), result.crit_text, "white", waves_font_24, "mm"
             )
             damage_bar_draw.text(
-                (1000, 50), f"{expected_damage}", "white", waves_font_24, "mm"
+                (1000, 50), result.expected_text, "white", waves_font_24, "mm"
             )
         else:
             damage_bar_draw.text(
-                (850, 50), f"{expected_damage}", "white", waves_font_24, "mm"
+                (850, 50), result.expected_text, "white", waves_font_24, "mm"
             )
         damage_calc_img.alpha_composite(damage_bar, dest=(0, 70))
 
@@ -929,11 +969,10 @@ async def draw_char_detail_img(
         for dindex, damage_temp in enumerate(damageDetail):
             damage_title = damage_temp["title"]
             damageAttributeTemp = copy.deepcopy(calc.damageAttribute)
-            crit_damage, expected_damage = damage_temp["func"](
+            result: DamageResult = damage_temp["func"](
                 damageAttributeTemp, role_detail
             )
-            logger.debug(f"{char_name}-{damage_title} 暴击伤害: {crit_damage}")
-            logger.debug(f"{char_name}-{damage_title} 期望伤害: {expected_damage}")
+            logger.debug(f"{char_name}-{damage_title} 伤害: {result}")
             logger.debug(f"{char_name}-{damage_title} 属性值: {damageAttributeTemp}")
 
             damage_bar = damage_bar2.copy() if dindex % 2 == 0 else damage_bar1.copy()
@@ -941,16 +980,16 @@ async def draw_char_detail_img(
             damage_bar_draw.text(
                 (400, 50), f"{damage_title}", "white", waves_font_24, "rm"
             )
-            if crit_damage and expected_damage:
+            if result.crit_damage is not None:
                 damage_bar_draw.text(
-                    (700, 50), f"{crit_damage}", "white", waves_font_24, "mm"
+                    (700, 50), result.crit_text, "white", waves_font_24, "mm"
                 )
                 damage_bar_draw.text(
-                    (1000, 50), f"{expected_damage}", "white", waves_font_24, "mm"
+                    (1000, 50), result.expected_text, "white", waves_font_24, "mm"
                 )
             else:
                 damage_bar_draw.text(
-                    (850, 50), f"{expected_damage}", "white", waves_font_24, "mm"
+                    (850, 50), result.expected_text, "white", waves_font_24, "mm"
                 )
             img.alpha_composite(
                 damage_bar,
@@ -1070,6 +1109,11 @@ async def draw_char_detail_img(
     img = add_footer(img)
     if need_convert_img:
         img = await convert_img(img)
+    timings["total"] = (time.perf_counter() - start) * 1000
+    cost = " ".join(
+        f"{k}:{v:.0f}ms" if v >= 0 else f"{k}:超时" for k, v in timings.items()
+    )
+    logger.debug(f"[鸣潮] 面板[{uid}][{char_name}] 耗时: {cost}")
     return img
 
 
@@ -9,10 +9,10 @@ from gsuid_core.models import Event
 from gsuid_core.utils.image.convert import convert_img
 from gsuid_core.utils.image.image_tools import crop_center_img
 
-from ..utils.api.model import AccountBaseInfo, RoleDetailData
+from ..utils.api.model import AccountBaseInfo
 from ..utils.button import WavesButton
 from ..utils.cache import TimedCache
-from ..utils.char_info_utils import get_all_role_detail_info_list
+from ..utils.char_info_utils import get_all_role_detail_raw_list
 from ..utils.database.models import WavesBind
 from ..utils.error_reply import WAVES_CODE_102
 from ..utils.expression_ctx import WavesCharRank, get_waves_char_rank
@@ -60,7 +60,10 @@ refresh_role_map = {
 refresh_interval: int = WutheringWavesConfig.get_config("RefreshInterval").data
 
 if refresh_interval > 0:
-    timed_cache = TimedCache(timeout=refresh_interval, maxsize=10000)
+    # 冷却记录被淘汰后会提前允许刷新，按冷却时间内可能刷新的用户数设置上限
+    timed_cache = TimedCache(
+        timeout=refresh_interval, maxsize=100000, name="refresh_cd", evictable=False
+    )
 else:
     timed_cache = None
 
@@ -176,14 +179,12 @@ async def draw_refresh_char_detail_img(
 
     waves_map = {"refresh_update": {}, "refresh_unchanged": {}}
     if ev.command == "面板":
-        all_waves_datas = await get_all_role_detail_info_list(uid)
+        all_waves_datas = await get_all_role_detail_raw_list(uid)
         if not all_waves_datas:
             return "暂无面板数据"
         waves_map = {
             "refresh_update": {},
-            "refresh_unchanged": {
-                i.role.roleId: i.model_dump() for i in all_waves_datas
-            },
+            "refresh_unchanged": {i["role"]["roleId"]: i for i in all_waves_datas},
         }
     else:
         waves_datas = await refresh_char(
@@ -198,8 +199,9 @@ async def draw_refresh_char_detail_img(
         if isinstance(waves_datas, str):
             return waves_datas
 
+    # 原始数据，未变化的角色直接命中评分缓存
     role_detail_list = [
-        RoleDetailData(**r)
+        r
         for key in ["refresh_update", "refresh_unchanged"]
         for r in waves_map[key].values()
     ]
@@ -223,7 +225,7 @@ async def draw_refresh_char_detail_img(
 
     # 提示文案
     title = f"共刷新{role_update}个角色，可以使用"
-    name = role_detail_list[0].role.roleName
+    name = role_detail_list[0]["role"]["roleName"]
     name = NAME_ALIAS.get(name, name)
     title2 = f"{PREFIX}{name}面板"
     title3 = "来查询该角色的具体面板"
@@ -0,0 +1,106 @@
+from typing import Dict, List, Optional
+
+from ..utils.api.model_struct import EquipPhantomStruct
+from ..utils.calc.echo_optimizer import (
+    OptimizeResult,
+    collect_echo_inventory,
+    optimize_echo,
+)
+from ..utils.char_info_utils import get_all_role_detail_raw_list
+from ..utils.damage.damage import format_damage
+from ..utils.name_convert import (
+    alias_to_char_name,
+    alias_to_sonata_name,
+    char_name_to_char_id,
+)
+from ..utils.resource.constant import SPECIAL_CHAR
+from ..wutheringwaves_config import WutheringWavesConfig
+
+
+def _echo_line(
+    index: int, phantom: EquipPhantomStruct, owner: Optional[str], role_name: str
+) -> str:
+    main = " ".join(
+        f"{p.attributeName}{p.attributeValue}" for p in (phantom.mainProps or [])[:1]
+    )
+    line = (
+        f"{index}. {phantom.phantomProp.name} {phantom.cost}c "
+        f"{phantom.fetterDetail.name} {main}"
+    )
+    if owner and owner != role_name:
+        line += f" (来自{owner})"
+    return line
+
+
+def _result_msg(result: OptimizeResult, owners: List[Optional[str]]) -> str:
+    msg = [
+        f"[鸣潮] {result.role_name} 声骸配装优化【{result.sonata}】",
+        f"伤害类型: {result.rank_title}",
+        f"背包声骸: {len(result.inventory)} 计算组合: "
+        f"{result.scored_num}/{result.candidate_num} "
+        f"耗时: {(result.search_ms + result.calc_ms) / 1000:.1f}s",
+    ]
+    if result.timeout:
+        msg.append("已超时，仅比较已完成计算的组合")
+    if result.current_damage:
+        msg.append(f"当前配装 期望伤害: {format_damage(result.current_damage)}")
+
+    for i, build in enumerate(result.builds):
+        line = f"方案{i + 1} 期望伤害: {format_damage(build.expected_damage)}"
+        if result.current_damage:
+            diff = build.expected_damage / result.current_damage - 1
+            line += f" ({diff:+.1%})"
+        msg.append(line)
+        for j, index in enumerate(build.combo):
+            msg.append(
+                _echo_line(
+                    j + 1, result.inventory[index], owners[index], result.role_name
+                )
+            )
+    return "\n".join(msg)
+
+
+async def get_echo_optimize_msg(
+    uid: str, char: str, sonata: Optional[str] = None
+) -> str:
+    char_id = char_name_to_char_id(char)
+    if not char_id:
+        return f"[鸣潮] 角色名【{char}】无法找到, 可能暂未适配, 请先检查输入是否正确！\n"
+    char_name = alias_to_char_name(char)
+
+    sonata_name = None
+    if sonata:
+        sonata_name = alias_to_sonata_name(sonata)
+        if not sonata_name:
+            return f"[鸣潮] 合鸣效果【{sonata}】无法找到, 请先检查输入是否正确！\n"
+
+    role_data_list = await get_all_role_detail_raw_list(uid)
+    if not role_data_list:
+        return f"[鸣潮] 特征码[{uid}]暂无面板数据, 请先刷新面板！\n"
+
+    char_ids = SPECIAL_CHAR.get(char_id, [char_id])
+    role_data: Optional[Dict] = next(
+        (r for r in role_data_list if str(r["role"]["roleId"]) in char_ids), None
+    )
+    if not role_data:
+        return f"[鸣潮] 未找到角色【{char_name}】的面板数据, 请先刷新面板！\n"
+
+    inventory = collect_echo_inventory(role_data_list)
+    owner_map = {}
+    for r in role_data_list:
+        for phantom in (r.get("phantomData") or {}).get("equipPhantomList") or []:
+            if phantom:
+                owner_map[id(phantom)] = r["role"]["roleName"]
+    owners = [owner_map.get(id(p)) for p in inventory]
+
+    result = await optimize_echo(
+        role_data,
+        inventory,
+        sonata_name,
+        timeout=WutheringWavesConfig.get_config("EchoOptimizeTimeout").data,
+    )
+    if isinstance(result, str):
+        return result
+    if not result.builds:
+        return "[鸣潮] 声骸配装优化超时, 请稍后再试"
+    return _result_msg(result, owners)
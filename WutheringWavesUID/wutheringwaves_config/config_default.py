@@ -162,6 +162,57 @@ CONFIG_DEFAULT: Dict[str, GSC] = {
         "开启后刷新角色面板并发数为全局共享",
         False,
     ),
+    "PlayerCacheSize": GsIntConfig(
+        "面板数据内存缓存上限（单位MB，0为关闭）",
+        "面板数据内存缓存上限（单位MB，0为关闭）",
+        64,
+        1024,
+    ),
+    "DamageWarmUp": GsBoolConfig(
+        "启动后后台预加载伤害计算模块",
+        "关闭后首次查询某角色伤害时再加载",
+        True,
+    ),
+    "CalcProcessNum": GsIntConfig(
+        "伤害计算进程数（0为不使用多进程）",
+        "声骸配装优化等批量计算使用的进程数，修改后下次计算生效",
+        0,
+        16,
+    ),
+    "EchoOptimizeTimeout": GsIntConfig(
+        "声骸配装优化时限（单位秒）",
+        "超时后返回已计算部分中的最优结果",
+        15,
+        120,
+    ),
+    "StaminaPush": GsBoolConfig(
+        "体力推送",
+        "开启后按预测的体力达到阈值时间检查并推送已订阅用户",
+        True,
+    ),
+    "GameSnapshotFresh": GsIntConfig(
+        "深塔/全息/冥海数据复用时间（单位秒，0为每次请求）",
+        "该时间内重复查看时直接使用上次获取的数据",
+        300,
+        3600,
+    ),
+    "AnnCardCacheSize": GsIntConfig(
+        "公告图片缓存大小（单位MB，0为不清理）",
+        "超过后按最近使用时间清理公告图片",
+        300,
+        10000,
+    ),
+    "CacheMemoryLimit": GsIntConfig(
+        "内存缓存上限（单位MB，0为不限制）",
+        "估算的缓存总大小超过后，从最大的缓存开始清理",
+        512,
+        8192,
+    ),
+    "TaskJournal": GsBoolConfig(
+        "上传任务持久化",
+        "排行上传任务写入本地任务日志，重启后继续上传未完成的任务",
+        True,
+    ),
     "CaptchaProvider": GsStrConfig(
         "验证码提供方（重启生效）",
         "验证码提供方（重启生效）",
@@ -0,0 +1,77 @@
+"""
+养成成本记录 players/<uid>/developCost.json
+
+保存最近几次 get_batch_role_cost 的请求与返回，用于校验本地突破材料计算
+记录复制到 cost_fixtures/ 后随插件提交，作为固定的校验数据
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import aiofiles
+
+from gsuid_core.logger import logger
+
+from ..utils.api.model import BatchRoleCostResponse
+from ..utils.ascension.cultivate import check_role_cost
+from ..utils.atomic_writer import save_json_atomic
+from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+
+DEVELOP_COST_FILE = "developCost.json"
+# 每个 uid 保留的记录数
+MAX_RECORD_NUM = 10
+# 随插件提交的记录，格式与 developCost.json 相同
+FIXTURE_PATH = Path(__file__).parent / "cost_fixtures"
+
+
+async def _load_records(path) -> List[Dict]:
+    try:
+        async with aiofiles.open(path, mode="r", encoding="utf-8") as f:
+            data = json.loads(await f.read())
+    except Exception as e:
+        logger.exception(f"load {path} failed:", e)
+        return []
+    return data if isinstance(data, list) else []
+
+
+async def save_cost_record(uid: str, content_list: List[Dict], data: Dict):
+    _dir = PLAYER_PATH / uid
+    _dir.mkdir(parents=True, exist_ok=True)
+    path = _dir / DEVELOP_COST_FILE
+
+    records = await _load_records(path) if path.exists() else []
+    records.append({"content": content_list, "response": data})
+    await save_json_atomic(path, records[-MAX_RECORD_NUM:])
+
+
+def check_cost_record(record: Dict) -> List[str]:
+    content_map = {f"{i['roleId']}": i for i in record["content"]}
+    response = BatchRoleCostResponse.model_validate(record["response"])
+    errors = []
+    for cost in response.costList:
+        content = content_map.get(f"{cost.roleId}")
+        if content:
+            errors.extend(check_role_cost(content, cost))
+    return errors
+
+
+async def check_cost_files(paths: List[Path]) -> Tuple[int, List[str]]:
+    """校验记录文件，返回 (记录数, 不一致项)"""
+    num = 0
+    errors = []
+    for path in paths:
+        for record in await _load_records(path):
+            num += 1
+            try:
+                errors.extend(check_cost_record(record))
+            except Exception as e:
+                errors.append(f"{path} 记录解析失败: {e}")
+    return num, errors
+
+
+async def check_all_cost_records() -> Tuple[int, List[str]]:
+    """校验随插件提交的记录与所有玩家的记录"""
+    paths = sorted(FIXTURE_PATH.glob("*.json"))
+    paths.extend(PLAYER_PATH.glob(f"*/{DEVELOP_COST_FILE}"))
+    return await check_cost_files(paths)
@@ -1,27 +1,33 @@
+import asyncio
 import copy
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Union
 
 from PIL import Image, ImageDraw
 
+from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.utils.image.convert import convert_img
 
 from ..utils.api.model import (
     BatchRoleCostResponse,
     CultivateCost,
-    OnlineRole,
-    OnlineRoleList,
-    OnlineWeapon,
-    OnlineWeaponList,
     OwnedRoleList,
     RoleCostDetail,
     RoleCultivateStatusList,
     RoleDetailData,
 )
-from ..utils.char_info_utils import get_all_role_detail_info_list
+from ..utils.api.request_util import RespCode
+from ..utils.ascension.cultivate import (
+    calc_content_breach_cost,
+    get_role_name_star,
+    get_weapon_name_star,
+    to_cultivate_cost_list,
+)
+from ..utils.cache import TimedCache
+from ..utils.char_info_utils import get_all_role_detail_raw_list
 from ..utils.database.models import WavesBind
-from ..utils.error_reply import WAVES_CODE_102, WAVES_CODE_103
+from ..utils.error_reply import WAVES_CODE_102, WAVES_CODE_103, WAVES_CODE_999
 from ..utils.fonts.waves_fonts import (
     waves_font_20,
     waves_font_32,
@@ -44,6 +50,18 @@ from ..utils.refresh_char_detail import refresh_char
 from ..utils.resource.constant import SPECIAL_CHAR
 from ..utils.resource.download_file import get_material_img
 from ..utils.waves_api import waves_api
+from .cost_record import save_cost_record
+
+# 网络或服务器错误时才以本地突破材料降级，登录失效等错误直接提示
+LOCAL_FALLBACK_CODES = (
+    WAVES_CODE_999,
+    RespCode.SERVER_ERROR.value,
+    RespCode.SERVER_EXTERNAL_ERROR.value,
+)
+# 养成刷新的最短间隔(秒)
+REFRESH_INTERVAL = 60
+# 最近刷新过的 uid
+refresh_cache = TimedCache(REFRESH_INTERVAL, 1000, "develop.refresh")
 
 skillBreakList = ["2-1", "2-2", "2-3", "2-4", "2-5", "3-1", "3-2", "3-3", "3-4", "3-5"]
 
@@ -124,6 +142,32 @@ skill_index_kuro = {
 }
 
 
+async def _calculator_refresh(uid: str, token: str) -> bool:
+    """短时间内重复查询只刷新一次"""
+    if refresh_cache.get(uid):
+        return True
+    refresh_data = await waves_api.calculator_refresh_data(uid, token)
+    if not refresh_data.success:
+        return False
+    refresh_cache.set(uid, True)
+    return True
+
+
+def _local_role_cost(content: Dict) -> RoleCostDetail:
+    """接口不可用时，以本地突破材料代替"""
+    role_cost, weapon_cost = calc_content_breach_cost(content)
+    all_cost = dict(role_cost)
+    for material_id, num in weapon_cost.items():
+        all_cost[material_id] = all_cost.get(material_id, 0) + num
+    return RoleCostDetail(
+        roleId=int(content["roleId"]),
+        weaponId=content.get("weaponId"),
+        allCost=to_cultivate_cost_list(all_cost),
+        missingRoleCost=to_cultivate_cost_list(role_cost) or None,
+        missingWeaponCost=to_cultivate_cost_list(weapon_cost) or None,
+    )
+
+
 async def calc_develop_cost(ev: Event, develop_list: List[str], is_flush=False):
     user_id = ev.user_id
     uid = await WavesBind.get_uid_by_game(user_id, ev.bot_id)
@@ -147,44 +191,60 @@ async def calc_develop_cost(ev: Event, develop_list: List[str], is_flush=False):
     if len(alias_char_ids) > 2:
         return "暂不支持查询两个以上角色养成"
 
-    refresh_data = await waves_api.calculator_refresh_data(uid, token)
-    if not refresh_data.success:
-        return "养成刷新失败"
+    if is_flush:
+        waves_datas = await refresh_char(ev, uid, user_id, ck=token)
+        if isinstance(waves_datas, str):
+            return waves_datas
+    else:
+        waves_datas = await get_all_role_detail_raw_list(uid)
+        if not waves_datas:
+            return "未找到养成角色"
 
-    # 获取所有角色
-    online_list_role = await waves_api.get_online_list_role(token)
-    if not online_list_role.success or isinstance(online_list_role.data, str):
-        return online_list_role.throw_msg()
-    online_list_role_model = OnlineRoleList.model_validate(online_list_role.data)
-    online_role_map = {str(i.roleId): i for i in online_list_role_model}
-    # 获取所有武器
-    online_list_weapon = await waves_api.get_online_list_weapon(token)
-    if not online_list_weapon.success or isinstance(online_list_weapon.data, str):
-        return online_list_weapon.throw_msg()
-    online_list_weapon_model = OnlineWeaponList.model_validate(online_list_weapon.data)
-    online_weapon_map = {str(i.weaponId): i for i in online_list_weapon_model}
-    # 获取拥有的角色
-    owned_role = await waves_api.get_owned_role(uid, token)
-    if not owned_role.success or isinstance(owned_role.data, str):
-        return owned_role.throw_msg()
-    owned_char_ids_model = OwnedRoleList.model_validate(owned_role.data)
-    owned_char_ids = [str(i) for i in owned_char_ids_model]
+    role_data_map: Dict[str, Union[Dict, RoleDetailData]] = {}
+    for r in waves_datas:
+        if isinstance(r, RoleDetailData):
+            role_id = r.role.roleId
+        else:
+            role_id = r["role"]["roleId"]
+        role_data_map[str(role_id)] = r
 
+    # 角色名/星级使用本地数据，面板中已有的角色视为已拥有
     owneds = []
     not_owneds = []
+    unknown_char_ids = []
     for char_id in alias_char_ids:
-        if char_id not in online_role_map:
+        if not get_role_name_star(char_id):
             continue
-        if char_id in SPECIAL_CHAR:
-            find_char_ids = SPECIAL_CHAR[char_id]
-            for find_char_id in find_char_ids:
-                if find_char_id in owned_char_ids:
-                    char_id = find_char_id
-                    break
-        if char_id in owned_char_ids:
-            owneds.append(char_id)
+        find_char_ids = SPECIAL_CHAR.get(char_id, [char_id])
+        owned_char_id = next((i for i in find_char_ids if i in role_data_map), None)
+        if owned_char_id:
+            owneds.append(owned_char_id)
         else:
-            not_owneds.append(char_id)
+            unknown_char_ids.append(char_id)
+
+    # 面板中没有的角色才需要查询拥有情况，与养成刷新同时进行
+    tasks = [_calculator_refresh(uid, token)]
+    if unknown_char_ids:
+        tasks.append(waves_api.get_owned_role(uid, token))
+    results = await asyncio.gather(*tasks)
+    if not results[0]:
+        return "养成刷新失败"
+
+    if unknown_char_ids:
+        owned_role = results[1]
+        if not owned_role.success or isinstance(owned_role.data, str):
+            return owned_role.throw_msg()
+        owned_char_ids_model = OwnedRoleList.model_validate(owned_role.data)
+        owned_char_ids = [str(i) for i in owned_char_ids_model]
+        for char_id in unknown_char_ids:
+            find_char_ids = SPECIAL_CHAR.get(char_id, [char_id])
+            owned_char_id = next(
+                (i for i in find_char_ids if i in owned_char_ids), None
+            )
+            if owned_char_id:
+                owneds.append(owned_char_id)
+            else:
+                not_owneds.append(char_id)
 
     develop_data_map = {}
     if owneds:
@@ -196,15 +256,6 @@ async def calc_develop_cost(ev: Event, develop_list: List[str], is_flush=False):
         develop_data = RoleCultivateStatusList.model_validate(develop_data.data)
         develop_data_map = {i.roleId: i for i in develop_data}
 
-    if is_flush:
-        waves_datas = await refresh_char(ev, uid, user_id, ck=token)
-        if isinstance(waves_datas, str):
-            return waves_datas
-    else:
-        waves_datas = await get_all_role_detail_info_list(uid)
-        if not waves_datas:
-            return "未找到养成角色"
-
     content_list = []
     for no_owned_char_id in not_owneds:
         template_role = copy.deepcopy(template_role_develop)
@@ -218,10 +269,12 @@ async def calc_develop_cost(ev: Event, develop_list: List[str], is_flush=False):
 
         content_list.append(template_role)
 
-    for r in waves_datas:
+    for r in role_data_map.values():
         if isinstance(r, RoleDetailData):
             role_detail = r
         else:
+            if r["role"]["roleId"] not in develop_data_map:
+                continue
             role_detail = RoleDetailData.model_validate(r)
         char_id = role_detail.role.roleId
         if char_id not in develop_data_map:
@@ -248,19 +301,27 @@ async def calc_develop_cost(ev: Event, develop_list: List[str], is_flush=False):
     if not content_list:
         return "未找到养成角色"
 
+    content_map = {f"{i['roleId']}": i for i in content_list}
     develop_cost = await waves_api.get_batch_role_cost(uid, token, content_list)
-    if not develop_cost.success:
+    if develop_cost.success:
+        batch_role_cost_res = BatchRoleCostResponse.model_validate(develop_cost.data)
+        cost_list = batch_role_cost_res.costList
+        is_local = False
+        try:
+            await save_cost_record(uid, content_list, develop_cost.data)
+        except Exception as e:
+            logger.exception(f"[鸣潮] 保存养成记录失败 uid:{uid}", e)
+    elif develop_cost.code in LOCAL_FALLBACK_CODES:
+        logger.warning(f"[鸣潮] 养成计算失败, 使用本地突破材料 uid:{uid}")
+        cost_list = [_local_role_cost(content) for content in content_list]
+        is_local = True
+    else:
         return develop_cost.throw_msg()
-    content_map = {f"{i['roleId']}": i for i in content_list}
-
-    batch_role_cost_res = BatchRoleCostResponse.model_validate(develop_cost.data)
 
     all_card = []
     # batch_preview: RoleCostDetail = batch_role_cost_res.preview
-    for cost in batch_role_cost_res.costList:
-        role_detail_card = await calc_role_need_card(
-            cost, online_role_map, online_weapon_map, content_map
-        )
+    for cost in cost_list:
+        role_detail_card = await calc_role_need_card(cost, content_map, is_local)
         all_card.extend(role_detail_card)
 
     height_block = 40
@@ -357,21 +418,18 @@ async def draw_material_card(cultivate_cost_list: List[CultivateCost], title: st
 
 async def calc_role_need_card(
     role_cost_detail: RoleCostDetail,
-    online_role_map: Dict[str, OnlineRole],
-    online_weapon_map: Dict[str, OnlineWeapon],
     content_map: Dict[str, Dict],
+    is_local: bool = False,
 ):
     img_cards = []
     if not role_cost_detail.roleId:
         return img_cards
 
-    if (
-        f"{role_cost_detail.roleId}" not in online_role_map
-        or f"{role_cost_detail.roleId}" not in content_map
-    ):
+    role_name_star = get_role_name_star(role_cost_detail.roleId)
+    if not role_name_star or f"{role_cost_detail.roleId}" not in content_map:
         return img_cards
 
-    online_role = online_role_map[f"{role_cost_detail.roleId}"]
+    role_name, role_star = role_name_star
 
     content = content_map[f"{role_cost_detail.roleId}"]
     top_bg_img = Image.open(TEXT_PATH / "top-bg.png")
@@ -380,12 +438,12 @@ async def calc_role_need_card(
     # 角色头像
     square_avatar = await get_square_avatar(role_cost_detail.roleId)
     square_avatar = square_avatar.resize((180, 180))
-    star_img = copy.deepcopy(star_img_map[online_role.starLevel])
+    star_img = copy.deepcopy(star_img_map[role_star])
     top_bg_img.alpha_composite(square_avatar, (70, 40))
     top_bg_img.alpha_composite(star_img, (70, 40))
     top_bg_img_draw.text(
         (280, 100),
-        online_role.roleName,
+        role_name,
         fill="white",
         font=waves_font_40,
     )
@@ -397,17 +455,20 @@ async def calc_role_need_card(
     )
 
     # 武器
+    weapon_name_star = None
     if content.get("weaponId", None) and role_cost_detail.weaponId:
-        online_weapon = online_weapon_map[f"{role_cost_detail.weaponId}"]
+        weapon_name_star = get_weapon_name_star(content["weaponId"])
+    if weapon_name_star:
+        weapon_name, weapon_star = weapon_name_star
         weapon_id = content["weaponId"]
         square_weapon = await get_square_weapon(weapon_id)
         square_weapon = square_weapon.resize((180, 180))
-        star_img = copy.deepcopy(star_img_map[online_weapon.weaponStarLevel])
+        star_img = copy.deepcopy(star_img_map[weapon_star])
         top_bg_img.alpha_composite(square_weapon, (530, 40))
         top_bg_img.alpha_composite(star_img, (530, 40))
         top_bg_img_draw.text(
             (750, 100),
-            online_weapon.weaponName,
+            weapon_name,
             fill="white",
             font=waves_font_40,
         )
@@ -468,7 +529,8 @@ async def calc_role_need_card(
 
     if role_cost_detail.allCost:
         all_cost_img = await draw_material_card(
-            role_cost_detail.allCost, "所需材料总览"
+            role_cost_detail.allCost,
+            "突破材料总览(本地计算)" if is_local else "所需材料总览",
         )
         img_cards.append(all_cost_img)
 
@@ -13,6 +13,7 @@ from gsuid_core.logger import logger
 from gsuid_core.models import Event
 
 from ..utils.api.model import GachaLog
+from ..utils.atomic_writer import storage_writer
 from ..utils.database.models import WavesUser
 from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
 from ..utils.waves_api import waves_api
@@ -168,8 +169,7 @@ async def backup_gachalogs(uid: str, gachalogs_history: Dict, type: str):
     backup_path = (
         path / f"{type}_gacha_logs_{datetime.now().strftime('%Y-%m-%d.%H%M%S')}.json"
     )
-    async with aiofiles.open(backup_path, "w", encoding="UTF-8") as file:
-        await file.write(json.dumps(gachalogs_history, ensure_ascii=False))
+    await storage_writer.write_json(backup_path, gachalogs_history)
 
 
 async def save_gachalogs(
@@ -262,8 +262,7 @@ async def save_gachalogs(
     }
 
     vo = msgspec.to_builtins(result)
-    async with aiofiles.open(gachalogs_path, "w", encoding="UTF-8") as file:
-        await file.write(json.dumps(vo, ensure_ascii=False))
+    await storage_writer.write_json(gachalogs_path, vo)
 
     # 计算数据
     all_add = sum(gachalogs_count_add.values())
@@ -27,7 +27,8 @@ from ..wutheringwaves_config import PREFIX, WutheringWavesConfig
 from ..wutheringwaves_user import deal
 from ..wutheringwaves_user.login_succ import login_success_msg
 
-cache = TimedCache(timeout=600, maxsize=10)
+# 每个进行中的登录占用 user_token 与 auth 两项，超过 maxsize 会淘汰其他人的登录
+cache = TimedCache(timeout=600, maxsize=1000, name="login", evictable=False)
 
 game_title = "[鸣潮]"
 msg_error = "[鸣潮] 登录失败\n1.是否注册过库街区\n2.库街区能否查询当前鸣潮特征码数据\n"
@@ -1,3 +1,6 @@
+import asyncio
+
+from gsuid_core.aps import scheduler
 from gsuid_core.bot import Bot
 from gsuid_core.logger import logger
 from gsuid_core.models import Event
@@ -25,3 +28,326 @@ async def rover_sign_result(bot: Bot, ev: Event):
         await gs_subscribe.add_subscribe("single", master_name_ann, ev)
 
     await bot.send(f"[联系主人] 已{option}订阅!")
+
+
+sv_waves_benchmark = SV("ww性能测试", pm=1)
+
+
+@sv_waves_benchmark.on_prefix(("存储测试",))
+async def send_player_store_benchmark(bot: Bot, ev: Event):
+    from ..utils.database.models import WavesBind
+    from ..utils.player_store import benchmark_player_store
+
+    uid = ev.text.strip()
+    if not uid:
+        uid = await WavesBind.get_uid_by_game(ev.user_id, ev.bot_id)
+    if not uid:
+        return await bot.send("[鸣潮] 请指定特征码")
+
+    result = await benchmark_player_store(uid)
+    if not result:
+        return await bot.send(f"[鸣潮] 特征码[{uid}]暂无面板数据")
+
+    msg = [
+        f"[鸣潮] 面板存储测试 特征码[{uid}] 角色数: {result['role_num']}",
+        f"json: {result['json_size_kb']:.1f}KB "
+        f"写 {result['json_write_ms']:.2f}ms 读 {result['json_read_ms']:.2f}ms",
+        f"bin: {result['bin_size_kb']:.1f}KB "
+        f"写 {result['bin_write_ms']:.2f}ms 读 {result['bin_read_ms']:.2f}ms "
+        f"读单角色 {result['bin_read_one_ms']:.2f}ms",
+    ]
+    await bot.send("\n".join(msg))
+
+
+@sv_waves_benchmark.on_prefix(("解析测试",))
+async def send_role_decode_benchmark(bot: Bot, ev: Event):
+    from ..utils.api.model_struct import benchmark_role_detail_decode
+    from ..utils.database.models import WavesBind
+    from ..utils.player_store import load_player_raw
+
+    uid = ev.text.strip()
+    if not uid:
+        uid = await WavesBind.get_uid_by_game(ev.user_id, ev.bot_id)
+    if not uid:
+        return await bot.send("[鸣潮] 请指定特征码")
+
+    data = await load_player_raw(uid)
+    if not data:
+        return await bot.send(f"[鸣潮] 特征码[{uid}]暂无面板数据")
+
+    result = benchmark_role_detail_decode(data)
+    msg = [
+        f"[鸣潮] 面板解析测试 特征码[{uid}] 角色数: {result['role_num']}",
+        f"pydantic json: {result['pydantic_json_ms']:.2f}ms "
+        f"dict: {result['pydantic_dict_ms']:.2f}ms",
+        f"struct json: {result['struct_json_ms']:.2f}ms "
+        f"msgpack: {result['struct_msgpack_ms']:.2f}ms "
+        f"dict: {result['struct_dict_ms']:.2f}ms",
+    ]
+    await bot.send("\n".join(msg))
+
+
+@sv_waves_benchmark.on_fullmatch(("面板缓存状态", "清除面板缓存"))
+async def send_player_cache_stats(bot: Bot, ev: Event):
+    from ..utils.player_store import player_cache
+
+    if "清除" in ev.command:
+        player_cache.clear()
+        return await bot.send("[鸣潮] 面板缓存已清除")
+
+    stats = player_cache.stats()
+    msg = [
+        f"[鸣潮] 面板缓存 {stats['num']}个账号 "
+        f"{stats['size_mb']:.1f}/{stats['max_size_mb']:.0f}MB",
+        f"命中 {stats['hits']} 未命中 {stats['misses']} "
+        f"命中率 {stats['hit_rate']:.1%} 淘汰 {stats['evictions']}",
+    ]
+    await bot.send("\n".join(msg))
+
+
+@sv_waves_benchmark.on_prefix(("伤害校验",))
+async def send_rank_mode_check(bot: Bot, ev: Event):
+    from ..utils.char_info_utils import get_all_role_detail_info_list
+    from ..utils.database.models import WavesBind
+    from ..utils.expression_ctx import check_rank_mode
+
+    uid = ev.text.strip()
+    if not uid:
+        uid = await WavesBind.get_uid_by_game(ev.user_id, ev.bot_id)
+    if not uid:
+        return await bot.send("[鸣潮] 请指定特征码")
+
+    role_details = await get_all_role_detail_info_list(uid)
+    if not role_details:
+        return await bot.send(f"[鸣潮] 特征码[{uid}]暂无面板数据")
+
+    result = check_rank_mode(role_details)
+    msg = [
+        f"[鸣潮] 排行伤害校验 特征码[{uid}] 角色数: {result['role_num']}",
+        f"记录过程: {result['trace_ms']:.2f}ms 排行模式: {result['rank_ms']:.2f}ms",
+    ]
+    if result["mismatch"]:
+        msg.append("结果不一致:")
+        for m in result["mismatch"]:
+            msg.append(f"{m['roleName']}: {m['trace']} != {m['rank']}")
+    else:
+        msg.append("结果一致")
+    await bot.send("\n".join(msg))
+
+
+@sv_waves_benchmark.on_fullmatch(("伤害模块加载",))
+async def send_damage_load_stats(bot: Bot, ev: Event):
+    from ..utils.map.damage.register import get_damage_load_stats
+
+    stats = get_damage_load_stats()
+    if not stats:
+        return await bot.send("[鸣潮] 伤害计算模块尚未加载")
+
+    total = sum(stats.values())
+    msg = [f"[鸣潮] 已加载伤害计算模块 {len(stats)}个 共耗时: {total:.0f}ms"]
+    for name, cost in sorted(stats.items(), key=lambda x: x[1], reverse=True)[:10]:
+        msg.append(f"{name}: {cost:.1f}ms")
+    await bot.send("\n".join(msg))
+
+
+@sv_waves_benchmark.on_prefix(("配装测试",))
+async def send_echo_optimize_benchmark(bot: Bot, ev: Event):
+    from ..utils.calc.echo_optimizer import (
+        benchmark_echo_optimizer,
+        collect_echo_inventory,
+    )
+    from ..utils.char_info_utils import get_all_role_detail_raw_list
+    from ..utils.database.models import WavesBind
+    from ..utils.name_convert import char_name_to_char_id
+
+    char = ev.text.strip()
+    char_id = char_name_to_char_id(char) if char else None
+    if not char_id:
+        return await bot.send("[鸣潮] 请指定角色, 例如: 配装测试今汐")
+
+    uid = await WavesBind.get_uid_by_game(ev.user_id, ev.bot_id)
+    if not uid:
+        return await bot.send("[鸣潮] 请先绑定特征码")
+
+    role_data_list = await get_all_role_detail_raw_list(uid)
+    if not role_data_list:
+        return await bot.send(f"[鸣潮] 特征码[{uid}]暂无面板数据")
+    role_data = next(
+        (r for r in role_data_list if str(r["role"]["roleId"]) == char_id), None
+    )
+    if not role_data:
+        return await bot.send(f"[鸣潮] 特征码[{uid}]没有该角色的面板数据")
+
+    # 背包不足 200 时以已有声骸为模板扩充
+    result = await benchmark_echo_optimizer(
+        role_data, collect_echo_inventory(role_data_list), 200
+    )
+    if "error" in result:
+        return await bot.send(result["error"])
+
+    msg = [
+        f"[鸣潮] 配装优化测试 背包: {result['inventory_num']} "
+        f"进程数: {result['workers']}",
+        f"候选组合: {result['candidate_num']} 完成: {result['scored_num']}",
+        f"搜索: {result['search_ms']:.0f}ms 计算: {result['calc_ms']:.0f}ms "
+        f"单线程计算: {result['single_ms']:.0f}ms",
+        f"当前期望: {result['current']:.0f} 最优期望: {result['best']:.0f}",
+    ]
+    await bot.send("\n".join(msg))
+
+
+@sv_waves_benchmark.on_prefix(("评分测试",))
+async def send_rank_scoring_benchmark(bot: Bot, ev: Event):
+    from ..utils.char_info_utils import get_all_role_detail_raw_list
+    from ..utils.database.models import WavesBind
+    from ..utils.rank_scoring import benchmark_rank_scoring
+
+    uid = ev.text.strip()
+    if not uid:
+        uid = await WavesBind.get_uid_by_game(ev.user_id, ev.bot_id)
+    if not uid:
+        return await bot.send("[鸣潮] 请指定特征码")
+
+    role_data_list = await get_all_role_detail_raw_list(uid)
+    if not role_data_list:
+        return await bot.send(f"[鸣潮] 特征码[{uid}]暂无面板数据")
+
+    result = await benchmark_rank_scoring(role_data_list, 1000)
+    msg = [
+        f"[鸣潮] 批量评分测试 角色数: {result['role_num']} "
+        f"进程数: {result['workers']}",
+        f"逐个计算: {result['single_per_sec']:.0f}个/秒",
+        f"分块计算: {result['batch_per_sec']:.0f}个/秒 "
+        f"耗时: {result['batch_ms']:.0f}ms",
+    ]
+    await bot.send("\n".join(msg))
+
+
+@sv_waves_benchmark.on_fullmatch(("养成校验",))
+async def send_develop_cost_check(bot: Bot, ev: Event):
+    from ..wutheringwaves_develop.cost_record import check_all_cost_records
+
+    num, errors = await check_all_cost_records()
+    if not num:
+        return await bot.send("[鸣潮] 暂无养成记录")
+
+    errors = list(dict.fromkeys(errors))
+    msg = [f"[鸣潮] 养成突破材料校验 记录数: {num} 不一致: {len(errors)}"]
+    msg.extend(errors[:20])
+    await bot.send("\n".join(msg))
+
+
+@sv_waves_benchmark.on_prefix(("体力推送测试",))
+async def send_stamina_push_benchmark(bot: Bot, ev: Event):
+    from ..wutheringwaves_stamina.stamina_push import benchmark_stamina_push
+
+    num = ev.text.strip()
+    num = int(num) if num.isdigit() else 50000
+    result = await benchmark_stamina_push(num)
+    msg = [
+        f"[鸣潮] 体力推送模拟 订阅数: {result['subscriber']} "
+        f"时长: {result['hours']}小时",
+        f"推送次数: {result['push_num']} 请求次数: {result['fetch_num']}",
+        f"每分钟轮询请求次数: {result['poll_fetch_num']}",
+        f"平均每次检查耗时: {result['tick_ms']:.2f}ms",
+    ]
+    await bot.send("\n".join(msg))
+
+
+@sv_waves_benchmark.on_fullmatch(("排行服务状态",))
+async def send_wwapi_metrics(bot: Bot, ev: Event):
+    from ..utils.api.wwapi_client import get_wwapi_metrics
+
+    metrics = get_wwapi_metrics()
+    msg = [
+        f"[鸣潮] 排行服务 熔断: {metrics['breaker']} "
+        f"连续失败: {metrics['fail_count']} 熔断次数: {metrics['open_count']}"
+    ]
+    for name, m in metrics["endpoints"].items():
+        msg.append(
+            f"{name} 请求: {m['count']} 失败: {m['fail']} 拒绝: {m['rejected']} "
+            f"平均: {m['avg_ms']:.0f}ms 最大: {m['max_ms']:.0f}ms"
+        )
+    await bot.send("\n".join(msg))
+
+
+@sv_waves_benchmark.on_fullmatch(("队列状态",))
+async def send_queue_status(bot: Bot, ev: Event):
+    from ..utils.queues.queues import dispatcher
+
+    msg = [
+        f"[鸣潮] 任务队列 {'运行中' if dispatcher.running else '未启动'} "
+        f"任务日志: {'开启' if dispatcher.journal else '关闭'}"
+    ]
+    for s in dispatcher.stats():
+        msg.append(
+            f"{s['task_type']} 等待: {s['pending']}/{s['maxsize']} "
+            f"执行中: {s['running']} 入队: {s['enqueued']} "
+            f"完成: {s['processed']} 重试: {s['retried']} "
+            f"失败: {s['failed']} 丢弃: {s['dropped']}"
+        )
+        msg.append(
+            f"  吞吐: {s['per_min']:.0f}/分钟 延迟: {s['lag_last']:.1f}s "
+            f"平均: {s['lag_avg']:.1f}s 最大: {s['lag_max']:.1f}s"
+        )
+    await bot.send("\n".join(msg))
+
+
+@sv_waves_benchmark.on_fullmatch(("缓存状态",))
+async def send_cache_status(bot: Bot, ev: Event):
+    from ..utils.cache import cache_registry
+    from ..wutheringwaves_config import WutheringWavesConfig
+
+    report = cache_registry.report()
+    total = sum(item["size"] for item in report)
+    limit = WutheringWavesConfig.get_config("CacheMemoryLimit").data
+    msg = [f"[鸣潮] 缓存估算总大小: {total / 1024 / 1024:.1f}MB / {limit}MB"]
+    for item in report:
+        hit_rate = item["hit_rate"]
+        hit_text = f" 命中率: {hit_rate * 100:.0f}%" if hit_rate is not None else ""
+        msg.append(
+            f"{item['name']} 数量: {item['length']} "
+            f"大小: {item['size'] / 1024:.0f}KB{hit_text}"
+            f"{'' if item['evictable'] else ' (不自动清理)'}"
+        )
+    await bot.send("\n".join(msg))
+
+
+@sv_waves_benchmark.on_prefix(("清除缓存",))
+async def send_cache_clear(bot: Bot, ev: Event):
+    from ..utils.cache import cache_registry
+
+    name = ev.text.strip()
+    cleared = cache_registry.clear(name)
+    if not cleared:
+        return await bot.send(f"[鸣潮] 未找到缓存[{name}]")
+    await bot.send(f"[鸣潮] 已清除缓存: {', '.join(cleared)}")
+
+
+@scheduler.scheduled_job("interval", minutes=10)
+async def check_cache_memory():
+    from ..utils.cache import cache_registry
+    from ..wutheringwaves_config import WutheringWavesConfig
+
+    limit = WutheringWavesConfig.get_config("CacheMemoryLimit").data
+    total, evicted = cache_registry.enforce_budget(limit * 1024 * 1024)
+    if evicted:
+        logger.info(
+            f"[鸣潮] 缓存估算大小 {total / 1024 / 1024:.1f}MB 超过上限 {limit}MB, "
+            f"已清理: {', '.join(evicted)}"
+        )
+
+
+@sv_waves_benchmark.on_fullmatch(("缓存测试",))
+async def send_timed_cache_benchmark(bot: Bot, ev: Event):
+    from ..utils.cache import benchmark_timed_cache
+
+    result = await asyncio.to_thread(benchmark_timed_cache)
+    msg = ["[鸣潮] TimedCache 测试 (单次耗时)"]
+    for item in result:
+        msg.append(
+            f"{item['size']}项 写入: {item['set_us']:.2f}us "
+            f"读取: {item['get_us']:.2f}us 淘汰写入: {item['evict_set_us']:.2f}us "
+            f"旧实现写入: {item['legacy_set_us']:.0f}us"
+        )
+    await bot.send("\n".join(msg))
@@ -12,14 +12,22 @@ from gsuid_core.utils.image.convert import convert_img
 from gsuid_core.utils.image.image_tools import crop_center_img
 
 from ..utils.api.model import AccountBaseInfo, Period, PeriodDetail, PeriodList
-from ..utils.database.models import WavesBind
+from ..utils.database.models import WavesBind, WavesUser
 from ..utils.fonts.waves_fonts import (
     waves_font_24,
     waves_font_30,
     waves_font_36,
 )
 from ..utils.image import add_footer, get_event_avatar, get_waves_bg
+from ..utils.info_cache import get_cached_account_info, set_cached_account_info
 from ..utils.waves_api import waves_api
+from .period_store import (
+    get_cached_period_list,
+    get_stored_period_detail,
+    is_period_closed,
+    save_period_detail,
+    set_cached_period_list,
+)
 
 TEXT_PATH = Path(__file__).parent / "texture2d"
 
@@ -43,18 +51,66 @@ MSG_NO_PERIOD = "该特征码[{}]没有[{}]简报数据~"
 PREFIX = get_plugin_available_prefix("WutheringWavesUID")
 
 
+async def _fetch_period_list(uid: str, ck: str) -> Optional[PeriodList]:
+    period_list = await waves_api.get_period_list(uid, ck)
+    if not period_list.success or not period_list.data:
+        return None
+    period_list = PeriodList.model_validate(period_list.data)
+    set_cached_period_list(uid, period_list)
+    return period_list
+
+
+async def _fetch_account_info(uid: str, ck: str) -> Optional[AccountBaseInfo]:
+    account_info = await waves_api.get_base_info(uid, ck)
+    if not account_info.success or not account_info.data:
+        return None
+    account_info = AccountBaseInfo.model_validate(account_info.data)
+    set_cached_account_info(uid, account_info)
+    return account_info
+
+
+async def _fetch_period_detail(
+    uid: str, ck: str, period_type: Any, index: int
+) -> Optional[PeriodDetail]:
+    period_detail = await waves_api.get_period_detail(period_type, index, uid, ck)
+    if not period_detail.success or not period_detail.data:
+        return None
+    return PeriodDetail.model_validate(period_detail.data)
+
+
 async def process_uid(
     uid, ev, period_param: Optional[Union[int, str]]
 ) -> Optional[Union[Dict[str, Any], str]]:
-    ck = await waves_api.get_self_waves_ck(uid, ev.user_id, ev.bot_id)
-    if not ck:
+    # 未登录或登录已失效的特征码不使用缓存
+    waves_user = await WavesUser.select_waves_user(uid, ev.user_id, ev.bot_id)
+    if not waves_user or not waves_user.cookie or waves_user.status == "无效":
         return None
 
-    period_list = await waves_api.get_period_list(uid, ck)
-    if not period_list.success or not period_list.data:
-        return None
-
-    period_list = PeriodList.model_validate(period_list.data)
+    ck: Optional[str] = None
+
+    async def get_ck() -> str:
+        nonlocal ck
+        if ck is None:
+            ck = await waves_api.get_self_waves_ck(uid, ev.user_id, ev.bot_id) or ""
+        return ck
+
+    period_list = get_cached_period_list(uid)
+    account_info = get_cached_account_info(uid)
+    if not period_list:
+        token = await get_ck()
+        if not token:
+            return None
+        # 列表与账号信息同时请求
+        period_list, account_info = await asyncio.gather(
+            _fetch_period_list(uid, token),
+            (
+                _fetch_account_info(uid, token)
+                if not account_info
+                else asyncio.sleep(0, account_info)
+            ),
+        )
+        if not period_list:
+            return None
 
     period_type = "month"
     period_node: Optional[Period] = None
@@ -75,24 +131,42 @@ async def process_uid(
                 period_type = "version"
                 break
     elif period_list.versions:
-        period_list.versions.sort(key=lambda x: x.index, reverse=True)
-        period_node = period_list.versions[0]
+        period_node = max(period_list.versions, key=lambda x: x.index)
         period_type = "version"
 
     if not period_node:
         return MSG_NO_PERIOD.format(uid, period_param)
 
-    period_detail = await waves_api.get_period_detail(
-        period_type, period_node.index, uid, ck
-    )
-    if not period_detail.success or not period_detail.data:
-        return None
-    period_detail = PeriodDetail.model_validate(period_detail.data)
+    # 已结束的简报优先读取本地
+    is_closed = is_period_closed(period_list, period_type, period_node.index)
+    period_detail = None
+    if is_closed:
+        period_detail = await get_stored_period_detail(
+            uid, period_type, period_node.index
+        )
 
-    account_info = await waves_api.get_base_info(uid, ck)
-    if not account_info.success or not account_info.data:
-        return None
-    account_info = AccountBaseInfo.model_validate(account_info.data)
+    if not period_detail or not account_info:
+        token = await get_ck()
+        if not token:
+            return None
+        period_detail, account_info = await asyncio.gather(
+            (
+                _fetch_period_detail(uid, token, period_type, period_node.index)
+                if not period_detail
+                else asyncio.sleep(0, period_detail)
+            ),
+            (
+                _fetch_account_info(uid, token)
+                if not account_info
+                else asyncio.sleep(0, account_info)
+            ),
+        )
+        if not period_detail or not account_info:
+            return None
+        if is_closed:
+            await save_period_detail(
+                uid, period_type, period_node.index, period_detail
+            )
 
     return {
         "period_node": period_node,
@@ -0,0 +1,81 @@
+"""
+资源简报缓存
+
+已结束的月报/周报/版本简报不会再变化，持久化在 players/<uid>/periodDetail.json，
+只有当前(各类型中 index 最大)的简报每次实时请求。简报列表在内存中短时缓存
+"""
+
+import json
+from typing import Dict, Optional
+
+import aiofiles
+
+from gsuid_core.logger import logger
+
+from ..utils.api.model import PeriodDetail, PeriodList
+from ..utils.atomic_writer import save_json_atomic
+from ..utils.cache import TimedCache
+from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+
+PERIOD_DETAIL_FILE = "periodDetail.json"
+
+period_list_cache = TimedCache(600, 500, "period_list")
+
+
+def get_period_key(period_type: str, index: int) -> str:
+    return f"{period_type}_{index}"
+
+
+def is_period_closed(period_list: PeriodList, period_type: str, index: int) -> bool:
+    periods = {
+        "month": period_list.months,
+        "week": period_list.weeks,
+        "version": period_list.versions,
+    }.get(period_type)
+    if not periods:
+        return False
+    return index < max(p.index for p in periods)
+
+
+async def load_period_details(uid: str) -> Dict[str, Dict]:
+    path = PLAYER_PATH / uid / PERIOD_DETAIL_FILE
+    if not path.exists():
+        return {}
+    try:
+        async with aiofiles.open(path, mode="r", encoding="utf-8") as f:
+            data = json.loads(await f.read())
+    except Exception as e:
+        logger.exception(f"load {path} failed:", e)
+        path.unlink(missing_ok=True)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+async def get_stored_period_detail(
+    uid: str, period_type: str, index: int
+) -> Optional[PeriodDetail]:
+    data = (await load_period_details(uid)).get(get_period_key(period_type, index))
+    if not data:
+        return None
+    try:
+        return PeriodDetail.model_validate(data)
+    except Exception:
+        return None
+
+
+async def save_period_detail(
+    uid: str, period_type: str, index: int, period_detail: PeriodDetail
+):
+    details = await load_period_details(uid)
+    details[get_period_key(period_type, index)] = period_detail.model_dump()
+    _dir = PLAYER_PATH / uid
+    _dir.mkdir(parents=True, exist_ok=True)
+    await save_json_atomic(_dir / PERIOD_DETAIL_FILE, details)
+
+
+def get_cached_period_list(uid: str) -> Optional[PeriodList]:
+    return period_list_cache.get(uid)
+
+
+def set_cached_period_list(uid: str, period_list: PeriodList):
+    period_list_cache.set(uid, period_list)
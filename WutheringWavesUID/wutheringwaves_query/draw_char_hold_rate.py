@@ -3,14 +3,13 @@ import copy
 from pathlib import Path
 from typing import Dict, Union
 
-import httpx
 from PIL import Image, ImageDraw
 
-from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.utils.image.convert import convert_img
 
 from ..utils.api.wwapi import GET_HOLD_RATE_URL
+from ..utils.api.wwapi_client import get_cached_data
 from ..utils.ascension.char import get_char_model
 from ..utils.char_info_utils import get_all_role_detail_info_list
 from ..utils.database.models import WavesBind
@@ -36,7 +35,6 @@ from ..utils.resource.constant import (
     NORMAL_LIST_IDS,
     SPECIAL_CHAR_NAME,
 )
-from ..utils.util import timed_async_cache
 
 TEXT_PATH = Path(__file__).parent / "texture2d"
 bar1 = Image.open(TEXT_PATH / "bar1.png")
@@ -248,22 +246,9 @@ async def draw_pic(roleId):
     return img
 
 
-@timed_async_cache(
-    expiration=3600,
-    condition=lambda x: x,
-)
 async def get_char_hold_rate_data() -> Dict:
     """获取角色持有率数据"""
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(GET_HOLD_RATE_URL, timeout=10)
-            response.raise_for_status()
-            if response.status_code == 200:
-                return response.json().get("data", {})
-    except Exception as e:
-        logger.error(f"获取角色持有率数据失败: {e}")
-
-    return {}
+    return await get_cached_data(GET_HOLD_RATE_URL, condition=lambda x: x) or {}
 
 
 async def get_group_char_hold_rate_data(group_id: str) -> Dict:
@@ -1,10 +1,10 @@
 import asyncio
 import time
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from PIL import Image, ImageDraw
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from gsuid_core.bot import Bot
 from gsuid_core.logger import logger
@@ -12,16 +12,11 @@ from gsuid_core.models import Event
 from gsuid_core.utils.image.convert import convert_img
 from gsuid_core.utils.image.image_tools import crop_center_img
 
-from ..utils.api.model import RoleDetailData, WeaponData
+from ..utils.api.model_struct import RoleDetailStruct, WeaponDataStruct
 from ..utils.cache import TimedCache
-from ..utils.calc import WuWaCalc
-from ..utils.calculate import (
-    calc_phantom_score,
-    get_calc_map,
-    get_total_score_bg,
-)
-from ..utils.char_info_utils import get_all_role_detail_info_list
+from ..utils.char_info_utils import get_role_detail_struct
 from ..utils.damage.abstract import DamageRankRegister
+from ..utils.damage.damage import format_damage
 from ..utils.database.models import WavesBind, WavesUser
 from ..utils.fonts.waves_fonts import (
     waves_font_14,
@@ -50,6 +45,7 @@ from ..utils.image import (
     get_waves_bg,
 )
 from ..utils.name_convert import alias_to_char_name, char_name_to_char_id
+from ..utils.rank_scoring import calc_rank_info_batch
 from ..utils.resource.constant import SPECIAL_CHAR, SPECIAL_CHAR_NAME
 from ..utils.util import hide_uid
 from ..wutheringwaves_config import PREFIX, WutheringWavesConfig
@@ -65,11 +61,13 @@ weapon_icon_bg_5 = Image.open(TEXT_PATH / "weapon_icon_bg_5.png")
 promote_icon = Image.open(TEXT_PATH / "promote_icon.png")
 char_mask = Image.open(TEXT_PATH / "char_mask.png")
 logo_img = Image.open(TEXT_PATH / "logo_small_2.png")
-pic_cache = TimedCache(86400, 200)
+pic_cache = TimedCache(86400, 200, "rank.pic")
 
 
 class RankInfo(BaseModel):
-    roleDetail: RoleDetailData  # 角色明细
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    roleDetail: RoleDetailStruct  # 角色明细
     qid: str  # qq id
     uid: str  # uid
     level: int  # 角色等级
@@ -77,65 +75,12 @@ class RankInfo(BaseModel):
     chainName: str  # 命座
     score: float  # 角色评分
     score_bg: str  # 评分背景
-    expected_damage: str  # 期望伤害
-    expected_damage_int: int  # 期望伤害
+    expected_damage: float  # 期望伤害
     sonata_name: str  # 合鸣效果
 
 
-async def get_one_rank_info(user_id, uid, role_detail, rankDetail):
-    equipPhantomList = role_detail.phantomData.equipPhantomList
-
-    calc: WuWaCalc = WuWaCalc(role_detail)
-    calc.phantom_pre = calc.prepare_phantom()
-    calc.phantom_card = calc.enhance_summation_phantom_value(calc.phantom_pre)
-    calc.calc_temp = get_calc_map(
-        calc.phantom_card,
-        role_detail.role.roleName,
-        role_detail.role.roleId,
-    )
-
-    # 评分
-    phantom_score = 0
-    # calc_temp = get_calc_map(phantom_sum_value, role_detail.role.roleName)
-    for i, _phantom in enumerate(equipPhantomList):
-        if _phantom and _phantom.phantomProp:
-            props = _phantom.get_props()
-            _score, _bg = calc_phantom_score(
-                role_detail.role.roleId, props, _phantom.cost, calc.calc_temp
-            )
-            phantom_score += _score
-
-    if phantom_score == 0:
-        return
-
-    phantom_score = round(phantom_score, 2)
-    phantom_bg = get_total_score_bg(
-        role_detail.role.roleName, phantom_score, calc.calc_temp
-    )
-
-    calc.role_card = calc.enhance_summation_card_value(calc.phantom_card)
-    calc.damageAttribute = calc.card_sort_map_to_attribute(calc.role_card)
-
-    if rankDetail:
-        crit_damage, expected_damage = rankDetail["func"](
-            calc.damageAttribute, role_detail
-        )
-    else:
-        expected_damage = "0"
-
-    sonata_name = ""
-    ph_detail = calc.phantom_card.get("ph_detail", [])
-    if isinstance(ph_detail, list):
-        for ph in ph_detail:
-            if ph.get("ph_num") == 5:
-                sonata_name = ph.get("ph_name", "")
-                break
-
-            if ph.get("isFull"):
-                sonata_name = ph.get("ph_name", "")
-                break
-
-    rankInfo = RankInfo(
+def _to_rank_info(user_id, uid, role_detail: RoleDetailStruct, info: Dict):
+    return RankInfo(
         **{
             "roleDetail": role_detail,
             "qid": user_id,
@@ -143,46 +88,28 @@ async def get_one_rank_info(user_id, uid, role_detail, rankDetail):
             "level": role_detail.role.level,
             "chain": role_detail.get_chain_num(),
             "chainName": role_detail.get_chain_name(),
-            "score": round(int(phantom_score * 100) / 100, ndigits=2),
-            "score_bg": phantom_bg,
-            "expected_damage": expected_damage,
-            "expected_damage_int": int(expected_damage.replace(",", "")),
-            "sonata_name": sonata_name,
+            **info,
         }
     )
-    return rankInfo
 
 
 async def find_role_detail(
     uid: str, char_id: Union[int, str, List[str], List[int]]
-) -> Optional[RoleDetailData]:
-    role_details = await get_all_role_detail_info_list(uid)
-    if role_details is None:
-        return None
-
-    # 将char_id转换为字符串列表进行匹配
-    if isinstance(char_id, (int, str)):
-        char_id_list = [str(char_id)]
-    else:
-        char_id_list = [str(cid) for cid in char_id]
-
-    # 使用生成器来进行过滤
-    return next(
-        (role for role in role_details if str(role.role.roleId) in char_id_list), None
-    )
+) -> Optional[RoleDetailStruct]:
+    # 只解码目标角色
+    return await get_role_detail_struct(uid, char_id)
 
 
-async def get_rank_info_for_user(
+async def get_rank_role_details_for_user(
     user: WavesBind,
-    char_id,
     find_char_id,
-    rankDetail,
     tokenLimitFlag,
     wavesTokenUsersMap,
-):
-    rankInfoList = []
+) -> List[Tuple[str, str, RoleDetailStruct]]:
+    """(qq id, uid, 角色明细)"""
+    result = []
     if not user.uid:
-        return rankInfoList
+        return result
 
     tasks = [find_role_detail(uid, find_char_id) for uid in user.uid.split("_")]
     role_details = await asyncio.gather(*tasks)
@@ -201,13 +128,9 @@ async def get_rank_info_for_user(
             continue
         if not role_detail.phantomData or not role_detail.phantomData.equipPhantomList:
             continue
+        result.append((user.user_id, uid, role_detail))
 
-        rankInfo = await get_one_rank_info(user.user_id, uid, role_detail, rankDetail)
-        if not rankInfo:
-            continue
-        rankInfoList.append(rankInfo)
-
-    return rankInfoList
+    return result
 
 
 async def get_all_rank_info(
@@ -222,20 +145,24 @@ async def get_all_rank_info(
 
     async def process_user(user):
         async with semaphore:
-            return await get_rank_info_for_user(
+            return await get_rank_role_details_for_user(
                 user,
-                char_id,
                 find_char_id,
-                rankDetail,
                 tokenLimitFlag,
                 wavesTokenUsersMap,
             )
 
     tasks = [process_user(user) for user in users]
     results = await asyncio.gather(*tasks)
-
-    # Flatten the results list
-    rankInfoList = [rank_info for result in results for rank_info in result]
+    role_list = [item for result in results for item in result]
+
+    # 评分与伤害分块计算，角色多时交给计算进程池
+    infos = await calc_rank_info_batch([r for _, _, r in role_list], bool(rankDetail))
+    rankInfoList = [
+        _to_rank_info(user_id, uid, role_detail, info)
+        for (user_id, uid, role_detail), info in zip(role_list, infos)
+        if info
+    ]
     return rankInfoList
 
 
@@ -335,12 +262,12 @@ async def draw_rank_img(
 
     if rank_type == "评分":
         rankInfoList.sort(
-            key=lambda i: (i.score, i.expected_damage_int, i.level, i.chain),
+            key=lambda i: (i.score, i.expected_damage, i.level, i.chain),
             reverse=True,
         )
     else:
         rankInfoList.sort(
-            key=lambda i: (i.expected_damage_int, i.score, i.level, i.chain),
+            key=lambda i: (i.expected_damage, i.score, i.level, i.chain),
             reverse=True,
         )
 
@@ -380,7 +307,7 @@ async def draw_rank_img(
     for index, temp in enumerate(zip(rankInfoList, results)):
         rank, role_avatar = temp
         rank: RankInfo
-        rank_role_detail: RoleDetailData = rank.roleDetail
+        rank_role_detail: RoleDetailStruct = rank.roleDetail
         bar_bg = bar.copy()
         bar_star_draw = ImageDraw.Draw(bar_bg)
         # role_avatar = await get_avatar(ev, rank.qid, role_detail.role.roleId)
@@ -439,7 +366,7 @@ async def draw_rank_img(
         # 武器
         weapon_bg_temp = Image.new("RGBA", (600, 300))
 
-        weaponData: WeaponData = rank_role_detail.weaponData
+        weaponData: WeaponDataStruct = rank_role_detail.weaponData
         weapon_icon = await get_square_weapon(weaponData.weapon.weaponId)
         weapon_icon = crop_center_img(weapon_icon, 110, 110)
         weapon_icon_bg = get_weapon_icon_bg(weaponData.weapon.weaponStarLevel)
@@ -478,7 +405,11 @@ async def draw_rank_img(
             bar_star_draw.text((870, 55), "等待更新(:", GREY, waves_font_34, "mm")
         else:
             bar_star_draw.text(
-                (870, 45), f"{rank.expected_damage}", SPECIAL_GOLD, waves_font_34, "mm"
+                (870, 45),
+                format_damage(rank.expected_damage),
+                SPECIAL_GOLD,
+                waves_font_34,
+                "mm",
             )
             bar_star_draw.text(
                 (870, 75), f"{damage_title}", "white", waves_font_16, "mm"
@@ -526,7 +457,7 @@ async def draw_rank_img(
 
         if rank_id is not None and rank_id <= rank_length:
             total_score += rank.score
-            total_damage += rank.expected_damage_int
+            total_damage += rank.expected_damage
 
     if rankId is not None and rankId > rank_length:
         totalNum -= 1
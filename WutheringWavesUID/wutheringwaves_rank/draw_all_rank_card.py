@@ -4,7 +4,6 @@ import time
 from pathlib import Path
 from typing import Optional, Union
 
-import httpx
 from PIL import Image, ImageDraw
 
 from gsuid_core.bot import Bot
@@ -18,6 +17,7 @@ from ..utils.api.wwapi import (
     RankInfoResponse,
     RankItem,
 )
+from ..utils.api.wwapi_client import wwapi_request
 from ..utils.ascension.char import get_char_model
 from ..utils.ascension.weapon import get_weapon_model
 from ..utils.cache import TimedCache
@@ -75,7 +75,7 @@ char_mask = Image.open(TEXT_PATH / "char_mask.png")
 char_mask2 = Image.open(TEXT_PATH / "char_mask.png")
 char_mask2 = char_mask2.resize((1300, char_mask2.size[1]))
 logo_img = Image.open(TEXT_PATH / "logo_small_2.png")
-pic_cache = TimedCache(600, 200)
+pic_cache = TimedCache(600, 200, "all_rank.pic")
 
 
 BOT_COLOR = [
@@ -90,28 +90,13 @@ BOT_COLOR = [
 
 
 async def get_rank(item: RankItem) -> Optional[RankInfoResponse]:
-    WavesToken = WutheringWavesConfig.get_config("WavesToken").data
-
-    if not WavesToken:
+    res = await wwapi_request("POST", GET_RANK_URL, json=item.dict(), need_token=True)
+    if res is None:
         return
-
-    async with httpx.AsyncClient() as client:
-        try:
-            res = await client.post(
-                GET_RANK_URL,
-                json=item.dict(),
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {WavesToken}",
-                },
-                timeout=httpx.Timeout(10),
-            )
-            if res.status_code == 200:
-                return RankInfoResponse.model_validate(res.json())
-            else:
-                logger.warning(f"获取排行失败: {res.status_code} - {res.text}")
-        except Exception as e:
-            logger.exception(f"获取排行失败: {e}")
+    try:
+        return RankInfoResponse.model_validate(res)
+    except Exception as e:
+        logger.exception(f"获取排行失败: {e}")
 
 
 async def draw_all_rank_card(
@@ -3,7 +3,6 @@ import copy
 from pathlib import Path
 from typing import Optional, Union
 
-import httpx
 from PIL import Image, ImageDraw
 
 from gsuid_core.bot import Bot
@@ -17,6 +16,7 @@ from ..utils.api.wwapi import (
     TotalRankRequest,
     TotalRankResponse,
 )
+from ..utils.api.wwapi_client import wwapi_request
 from ..utils.cache import TimedCache
 from ..utils.database.models import WavesBind
 from ..utils.fonts.waves_fonts import (
@@ -52,7 +52,7 @@ from ..wutheringwaves_config import WutheringWavesConfig
 TEXT_PATH = Path(__file__).parent / "texture2d"
 avatar_mask = Image.open(TEXT_PATH / "avatar_mask.png")
 char_mask = Image.open(TEXT_PATH / "char_mask.png")
-pic_cache = TimedCache(600, 200)
+pic_cache = TimedCache(600, 200, "total_rank.pic")
 
 
 BOT_COLOR = [
@@ -67,28 +67,13 @@ BOT_COLOR = [
 
 
 async def get_rank(item: TotalRankRequest) -> Optional[TotalRankResponse]:
-    WavesToken = WutheringWavesConfig.get_config("WavesToken").data
-
-    if not WavesToken:
+    res = await wwapi_request("POST", GET_TOTAL_RANK_URL, json=item.dict(), need_token=True)
+    if res is None:
         return
-
-    async with httpx.AsyncClient() as client:
-        try:
-            res = await client.post(
-                GET_TOTAL_RANK_URL,
-                json=item.dict(),
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {WavesToken}",
-                },
-                timeout=httpx.Timeout(10),
-            )
-            if res.status_code == 200:
-                return TotalRankResponse.model_validate(res.json())
-            else:
-                logger.warning(f"获取练度排行失败: {res.status_code} - {res.text}")
-        except Exception as e:
-            logger.exception(f"获取练度排行失败: {e}")
+    try:
+        return TotalRankResponse.model_validate(res)
+    except Exception as e:
+        logger.exception(f"获取排行失败: {e}")
 
 
 async def draw_total_rank(bot: Bot, ev: Event, pages: int) -> Union[str, bytes]:
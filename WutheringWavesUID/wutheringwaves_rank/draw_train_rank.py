@@ -1,24 +1,20 @@
 import asyncio
 import copy
-import json
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
 from PIL import Image, ImageDraw
 
 from gsuid_core.bot import Bot
-from gsuid_core.logger import logger
 from gsuid_core.models import Event
 from gsuid_core.utils.image.convert import convert_img
 from gsuid_core.utils.image.image_tools import crop_center_img
 
-from ..utils.api.model import AccountBaseInfo
 from ..utils.api.wwapi import CharScoreDetail, TotalRankDetail
 from ..utils.cache import TimedCache
-from ..utils.char_info_utils import get_all_roleid_detail_info_int
 from ..utils.database.models import WavesBind
 from ..utils.error_reply import WAVES_CODE_102
-from ..utils.expression_ctx import get_waves_char_rank
+from ..utils.expression_ctx import WavesCharRank
 from ..utils.fonts.waves_fonts import (
     waves_font_12,
     waves_font_16,
@@ -46,17 +42,15 @@ from ..utils.image import (
     get_square_avatar,
     get_waves_bg,
 )
-from ..utils.waves_api import waves_api
+from ..utils.profile_resolver import profile_resolver
+from ..utils.rank_scoring import get_waves_char_rank_batch
 from ..wutheringwaves_config import PREFIX, WutheringWavesConfig
+from .train_rank_store import get_train_rank_records
 
 TEXT_PATH = Path(__file__).parent / "texture2d"
 avatar_mask = Image.open(TEXT_PATH / "avatar_mask.png")
 char_mask = Image.open(TEXT_PATH / "char_mask.png")
-pic_cache = TimedCache(600, 200)
-
-# In-memory cache for group rank data
-# Structure: { "group_id": { "user_uid": TotalRankDetail, ... }, ... }
-group_rank_cache: Dict[str, Dict[str, TotalRankDetail]] = {}
+pic_cache = TimedCache(600, 200, "train_rank.pic")
 
 
 BOT_COLOR = [
@@ -292,14 +286,11 @@ async def draw_rank_card_template(
     return await convert_img(card_img)
 
 
-async def _process_user_rank_data(
-    user_id: str, bot_id: str, uid: str, group_id: str
+def _process_user_rank_data(
+    user_id: str,
+    uid: str,
+    waves_char_rank: Optional[List[WavesCharRank]],
 ) -> Optional[TotalRankDetail]:
-    all_role_detail = await get_all_roleid_detail_info_int(uid)
-    if not all_role_detail:
-        return None
-
-    waves_char_rank = await get_waves_char_rank(uid, all_role_detail)
     if not waves_char_rank:
         return None
 
@@ -315,24 +306,8 @@ async def _process_user_rank_data(
         if c.score
     ]
 
-    kuro_name = user_id
-    alias_name = user_id
-    try:
-        bot = Bot(bot_id)
-        _, ck = await waves_api.get_ck_result(uid, user_id, bot_id)
-        if ck:
-            account_info = await waves_api.get_base_info(uid, ck)
-            if account_info.success:
-                validated_info = AccountBaseInfo.model_validate(account_info.data)
-                kuro_name = validated_info.name
-
-        sender_info = await bot.get_group_member_info(
-            group_id=group_id, user_id=int(user_id)
-        )
-        alias_name = sender_info.get("card") or sender_info.get("nickname")
-    except Exception as e:
-        logger.warning(f"为用户 {user_id} 获取昵称失败: {e}")
-
+    # 昵称由 profile_resolver 在后台解析，绘制时再替换
+    kuro_name = profile_resolver.get_kuro_name(uid) or user_id
     return TotalRankDetail(
         user_id=user_id,
         waves_id=uid,
@@ -341,7 +316,7 @@ async def _process_user_rank_data(
         total_score=total_score,
         char_score_details=char_score_details,
         rank=0,
-        alias_name=alias_name,
+        alias_name=kuro_name,
     )
 
 
@@ -349,28 +324,6 @@ async def draw_train_rank(bot: Bot, ev: Event) -> Union[str, bytes]:
     if not ev.group_id:
         return "请在群聊中使用此功能"
 
-    # 定义缓存路径
-    cache_dir = Path(__file__).parent / "group_train_data"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    cache_file = cache_dir / f"{ev.group_id}.json"
-
-    # 懒加载：仅在内存缓存不存在时从文件加载
-    if ev.group_id not in group_rank_cache:
-        if cache_file.exists():
-            try:
-                raw_data = json.loads(cache_file.read_text(encoding="utf-8"))
-                group_rank_cache[ev.group_id] = {
-                    uid: TotalRankDetail.model_validate(data)
-                    for uid, data in raw_data.items()
-                }
-            except (json.JSONDecodeError, TypeError):
-                logger.warning(f"群聊 {ev.group_id} 的排行缓存文件损坏，将重新生成。")
-                group_rank_cache[ev.group_id] = {}
-        else:
-            group_rank_cache[ev.group_id] = {}
-
-    current_group_cache = group_rank_cache[ev.group_id]
-
     # 获取群内所有绑定的用户
     bind_list = await WavesBind.get_group_all_uid(ev.group_id)
     if not bind_list:
@@ -384,69 +337,49 @@ async def draw_train_rank(bot: Bot, ev: Event) -> Union[str, bytes]:
                 if uid:
                     all_group_uids[uid] = bind
 
-    # 确定需要刷新的用户：触发者 + 新用户
     trigger_user_uid = await WavesBind.get_uid_by_game(ev.user_id, ev.bot_id)
-    users_to_refresh: Dict[str, WavesBind] = {}
-
-    if trigger_user_uid and trigger_user_uid in all_group_uids:
-        users_to_refresh[trigger_user_uid] = all_group_uids[trigger_user_uid]
 
-    for uid, bind in all_group_uids.items():
-        if uid not in current_group_cache:
-            if uid not in users_to_refresh:
-                users_to_refresh[uid] = bind
-
-    # 并发执行刷新任务并更新内存缓存
-    if users_to_refresh:
-        tasks = [
-            _process_user_rank_data(
-                bind.user_id, bind.bot_id, uid, ev.group_id
+    async def refresh(uids: List[str]) -> Dict[str, Optional[TotalRankDetail]]:
+        # 评分统一分块计算，未变化的角色直接使用评分缓存
+        char_rank_map = await get_waves_char_rank_batch(uids)
+        return {
+            uid: _process_user_rank_data(
+                all_group_uids[uid].user_id, uid, char_rank_map.get(uid)
             )
-            for uid, bind in users_to_refresh.items()
-        ]
-        results = await asyncio.gather(*tasks)
-        for res in results:
-            if res:
-                current_group_cache[res.waves_id] = res
-
-    if not current_group_cache:
+            for uid in uids
+        }
+
+    # 只重新计算面板有变化或没有记录的用户，其余直接使用共享的记录
+    records = await get_train_rank_records(list(all_group_uids), refresh)
+    rank_details = [r.detail for r in records.values() if r.detail]
+    if not rank_details:
         return f"群内无人刷新面板或缓存数据不全, 请使用`{PREFIX}刷新面板`后再试"
 
-    # 在内存中对所有数据进行排序和分配排名
-    full_rank_list = sorted(
-        current_group_cache.values(), key=lambda x: x.total_score, reverse=True
-    )
-    self_rank_detail = None
+    # 记录为所有群共用，排名与昵称写在副本上
+    full_rank_list = sorted(rank_details, key=lambda x: x.total_score, reverse=True)
+    data_to_draw: List[TotalRankDetail] = []
     for i, detail in enumerate(full_rank_list):
-        detail.rank = i + 1
-        if detail.waves_id == trigger_user_uid:
-            self_rank_detail = detail
-
-    # 准备最终要绘制的列表
-    data_to_draw = full_rank_list[:20]
-    if self_rank_detail:
-        is_self_in_top_20 = any(
-            u.waves_id == self_rank_detail.waves_id for u in data_to_draw
-        )
-        if not is_self_in_top_20:
-            data_to_draw.append(self_rank_detail)
-
-    # 异步将内存缓存写回硬盘
-    async def save_cache_to_disk():
-        data_to_save = {
-            uid: detail.model_dump(mode="json")
-            for uid, detail in current_group_cache.items()
-        }
-        try:
-            cache_file.write_text(
-                json.dumps(data_to_save, ensure_ascii=False, indent=4),
-                encoding="utf-8",
+        if i >= 20 and detail.waves_id != trigger_user_uid:
+            continue
+        user_id = all_group_uids[detail.waves_id].user_id
+        kuro_name = profile_resolver.get_kuro_name(detail.waves_id) or detail.kuro_name
+        data_to_draw.append(
+            detail.model_copy(
+                update={
+                    "rank": i + 1,
+                    "user_id": user_id,
+                    "kuro_name": kuro_name,
+                    "username": kuro_name,
+                    "alias_name": kuro_name,
+                }
             )
-            logger.info(f"群聊 {ev.group_id} 的排行缓存已成功保存到硬盘。")
-        except Exception as e:
-            logger.error(f"保存群聊 {ev.group_id} 的排行缓存失败: {e}")
+        )
 
-    asyncio.create_task(save_cache_to_disk())
+    # 只解析需要显示的用户，未缓存的先显示占位名称
+    profile_resolver.request_kuro_names(
+        (d.waves_id, d.user_id, all_group_uids[d.waves_id].bot_id)
+        for d in data_to_draw
+    )
 
     return await draw_rank_card_template(
         f"{ev.group_id}群练度排行", data_to_draw, trigger_user_uid or ""
@@ -4,7 +4,6 @@ import re
 from pathlib import Path
 from typing import Optional
 
-import httpx
 from PIL import Image, ImageDraw
 
 from gsuid_core.bot import Bot
@@ -19,6 +18,7 @@ from ..utils.api.wwapi import (
     SlashRankItem,
     SlashRankRes,
 )
+from ..utils.api.wwapi_client import wwapi_request
 from ..utils.ascension.char import get_char_model
 from ..utils.cache import TimedCache
 from ..utils.database.models import WavesBind
@@ -54,7 +54,7 @@ from ..wutheringwaves_config import WutheringWavesConfig
 TEXT_PATH = Path(__file__).parent / "texture2d"
 avatar_mask = Image.open(TEXT_PATH / "avatar_mask.png")
 default_avatar_char_id = "1505"
-pic_cache = TimedCache(600, 200)
+pic_cache = TimedCache(600, 200, "slash_rank.pic")
 
 BOT_COLOR = [
     WAVES_MOLTEN,
@@ -83,28 +83,13 @@ def get_score_color(score: int):
 
 
 async def get_rank(item: SlashRankItem) -> Optional[SlashRankRes]:
-    WavesToken = WutheringWavesConfig.get_config("WavesToken").data
-
-    if not WavesToken:
+    res = await wwapi_request("POST", GET_SLASH_RANK_URL, json=item.dict(), need_token=True)
+    if res is None:
         return
-
-    async with httpx.AsyncClient() as client:
-        try:
-            res = await client.post(
-                GET_SLASH_RANK_URL,
-                json=item.dict(),
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {WavesToken}",
-                },
-                timeout=httpx.Timeout(10),
-            )
-            if res.status_code == 200:
-                return SlashRankRes.model_validate(res.json())
-            else:
-                logger.warning(f"获取排行失败: {res.status_code} - {res.text}")
-        except Exception as e:
-            logger.exception(f"获取排行失败: {e}")
+    try:
+        return SlashRankRes.model_validate(res)
+    except Exception as e:
+        logger.exception(f"获取排行失败: {e}")
 
 
 async def draw_all_slash_rank_card(bot: Bot, ev: Event):
@@ -0,0 +1,171 @@
+"""
+群练度排行数据
+
+- 每个 uid 一条 TotalRankDetail，所有群共用，保存在 PLAYER_PATH/<uid>/trainRank.json
+- 记录面板签名(各角色数据哈希 + 计算签名)，面板或评分/伤害计算变化后查询时才重新计算
+- 群排行由群内绑定的 uid 与该数据合并得到，只写入有变化的 uid
+- 旧版按群保存的 group_train_data/<group_id>.json 没有面板签名无法复用，启动时删除
+"""
+
+import asyncio
+import hashlib
+import json
+import shutil
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import aiofiles
+
+from gsuid_core.logger import logger
+
+from ..utils.api.wwapi import TotalRankDetail
+from ..utils.atomic_writer import save_json_atomic
+from ..utils.cache import register_cache
+from ..utils.char_rank_cache import get_calc_sign
+from ..utils.player_store import load_role_hash
+from ..utils.resource.RESOURCE_PATH import PLAYER_PATH
+
+TRAIN_RANK_FILE = "trainRank.json"
+LEGACY_GROUP_DATA_PATH = Path(__file__).parent / "group_train_data"
+LOAD_CONCURRENCY = 16
+
+
+class TrainRankRecord:
+    __slots__ = ("sign", "detail")
+
+    def __init__(self, sign: str, detail: Optional[TotalRankDetail]):
+        self.sign = sign
+        # 没有达到上榜条件时为 None，同样缓存，避免重复计算
+        self.detail = detail
+
+
+# { uid: TrainRankRecord }
+train_rank_store: Dict[str, TrainRankRecord] = {}
+register_cache("train_rank.store", train_rank_store)
+
+_refreshing: Dict[str, "asyncio.Future[Optional[TrainRankRecord]]"] = {}
+
+Refresher = Callable[[List[str]], Awaitable[Dict[str, Optional[TotalRankDetail]]]]
+
+
+async def get_panel_sign(uid: str) -> str:
+    """
+    面板签名，没有面板数据时为空字符串
+    计算签名已包含插件版本，评分模板或伤害脚本修改后同样失效
+    """
+    role_hash = await load_role_hash(uid)
+    if not role_hash:
+        return ""
+    content = "|".join(
+        f"{k}:{role_hash[k]}:{get_calc_sign(int(k))}" for k in sorted(role_hash)
+    )
+    return hashlib.md5(content.encode()).hexdigest()
+
+
+def remove_legacy_group_data():
+    """删除旧版按群保存的练度排行数据，只在目录存在时执行一次"""
+    if not LEGACY_GROUP_DATA_PATH.exists():
+        return
+    shutil.rmtree(LEGACY_GROUP_DATA_PATH, ignore_errors=True)
+    logger.info(f"[鸣潮] 已删除旧版群练度排行数据 {LEGACY_GROUP_DATA_PATH}")
+
+
+async def _load_record(uid: str) -> Optional[TrainRankRecord]:
+    path = PLAYER_PATH / uid / TRAIN_RANK_FILE
+    if not path.exists():
+        return None
+    try:
+        async with aiofiles.open(path, mode="r", encoding="utf-8") as f:
+            data = json.loads(await f.read())
+        detail = data.get("detail")
+        return TrainRankRecord(
+            data["sign"],
+            TotalRankDetail.model_validate(detail) if detail else None,
+        )
+    except Exception as e:
+        logger.exception(f"load {path} failed:", e)
+        path.unlink(missing_ok=True)
+        return None
+
+
+async def _save_record(uid: str, record: TrainRankRecord):
+    _dir = PLAYER_PATH / uid
+    _dir.mkdir(parents=True, exist_ok=True)
+    await save_json_atomic(
+        _dir / TRAIN_RANK_FILE,
+        {
+            "sign": record.sign,
+            "detail": record.detail.model_dump(mode="json") if record.detail else None,
+        },
+    )
+
+
+async def get_train_rank_records(
+    uids: List[str], refresher: Refresher
+) -> Dict[str, TrainRankRecord]:
+    """
+    返回 uids 中有面板数据的记录
+    面板签名与记录不一致(或没有记录)的 uid 交给 refresher 批量重新计算并写入
+    同一 uid 同时只会被刷新一次，其他群的查询等待同一个结果
+    """
+    semaphore = asyncio.Semaphore(LOAD_CONCURRENCY)
+
+    async def _check(uid: str):
+        async with semaphore:
+            sign = await get_panel_sign(uid)
+            if not sign:
+                return uid, sign, None
+            record = train_rank_store.get(uid)
+            if record is None:
+                record = await _load_record(uid)
+                if record is not None:
+                    train_rank_store[uid] = record
+            return uid, sign, record
+
+    result: Dict[str, TrainRankRecord] = {}
+    stale: Dict[str, str] = {}
+    waiting: Dict[str, asyncio.Future] = {}
+    for uid, sign, record in await asyncio.gather(
+        *[_check(uid) for uid in dict.fromkeys(uids)]
+    ):
+        if not sign:
+            continue
+        if record is not None and record.sign == sign:
+            result[uid] = record
+        elif uid in _refreshing:
+            waiting[uid] = _refreshing[uid]
+        else:
+            stale[uid] = sign
+
+    if stale:
+        loop = asyncio.get_running_loop()
+        futures = {uid: loop.create_future() for uid in stale}
+        _refreshing.update(futures)
+        try:
+            details = await refresher(list(stale))
+            changed = []
+            for uid, sign in stale.items():
+                record = TrainRankRecord(sign, details.get(uid))
+                train_rank_store[uid] = record
+                result[uid] = record
+                changed.append(_save_record(uid, record))
+                futures[uid].set_result(record)
+            await asyncio.gather(*changed)
+        finally:
+            for uid, future in futures.items():
+                if not future.done():
+                    future.cancel()
+                if _refreshing.get(uid) is future:
+                    del _refreshing[uid]
+
+    if waiting:
+        await asyncio.wait(waiting.values())
+    for uid, future in waiting.items():
+        # 其他查询刷新失败时使用已有的记录
+        if future.cancelled():
+            record = train_rank_store.get(uid)
+        else:
+            record = future.result()
+        if record is not None:
+            result[uid] = record
+    return result
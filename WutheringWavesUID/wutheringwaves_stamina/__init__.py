@@ -1,12 +1,16 @@
+from gsuid_core.aps import scheduler
 from gsuid_core.bot import Bot
 from gsuid_core.models import Event
 from gsuid_core.sv import SV
 
-from ..utils.database.models import WavesBind
-from ..utils.error_reply import ERROR_CODE, WAVES_CODE_103
+from ..utils.database.models import WavesBind, WavesPush, WavesUser
+from ..utils.error_reply import ERROR_CODE, WAVES_CODE_102, WAVES_CODE_103
+from ..wutheringwaves_config import WutheringWavesConfig
 from .draw_waves_stamina import draw_stamina_img
+from .stamina_push import stamina_push_task, update_stamina_push
 
 waves_daily_info = SV("waves查询体力")
+waves_stamina_push = SV("waves体力推送")
 
 
 @waves_daily_info.on_fullmatch(
@@ -25,3 +29,53 @@ async def send_daily_info_pic(bot: Bot, ev: Event):
     if not uid:
         return await bot.send(ERROR_CODE[WAVES_CODE_103])
     return await bot.send(await draw_stamina_img(bot, ev))
+
+
+@waves_stamina_push.on_fullmatch(("开启体力推送", "关闭体力推送"))
+async def switch_stamina_push(bot: Bot, ev: Event):
+    at_sender = True if ev.group_id else False
+    uid = await WavesBind.get_uid_by_game(ev.user_id, ev.bot_id)
+    if not uid:
+        return await bot.send(ERROR_CODE[WAVES_CODE_103], at_sender)
+
+    if "开启" in ev.command:
+        user = await WavesUser.select_waves_user(uid, ev.user_id, ev.bot_id)
+        if not user or not user.cookie or user.status == "无效":
+            return await bot.send(ERROR_CODE[WAVES_CODE_102], at_sender)
+        # 群聊中开启时推送到该群
+        push = ev.group_id if ev.group_id else "on"
+        await WavesPush.set_push_data(
+            uid, ev.bot_id, resin_push=push, resin_is_push="off"
+        )
+        msg = f"[鸣潮] 特征码{uid} 已开启体力推送"
+    else:
+        await WavesPush.set_push_data(uid, ev.bot_id, resin_push="off")
+        msg = f"[鸣潮] 特征码{uid} 已关闭体力推送"
+
+    await update_stamina_push(uid, ev.user_id, ev.bot_id)
+    await bot.send(msg, at_sender)
+
+
+@waves_stamina_push.on_prefix(("体力阈值", "设置体力阈值"))
+async def set_stamina_push_value(bot: Bot, ev: Event):
+    at_sender = True if ev.group_id else False
+    uid = await WavesBind.get_uid_by_game(ev.user_id, ev.bot_id)
+    if not uid:
+        return await bot.send(ERROR_CODE[WAVES_CODE_103], at_sender)
+
+    value = ev.text.strip()
+    if not value.isdigit() or not 1 <= int(value) <= 240:
+        return await bot.send("[鸣潮] 请输入1-240之间的体力阈值\n", at_sender)
+
+    await WavesPush.set_push_data(
+        uid, ev.bot_id, resin_value=int(value), resin_is_push="off"
+    )
+    await update_stamina_push(uid, ev.user_id, ev.bot_id)
+    await bot.send(f"[鸣潮] 特征码{uid} 体力阈值已设置为{value}", at_sender)
+
+
+@scheduler.scheduled_job("interval", minutes=1)
+async def check_stamina_push():
+    if not WutheringWavesConfig.get_config("StaminaPush").data:
+        return
+    await stamina_push_task()
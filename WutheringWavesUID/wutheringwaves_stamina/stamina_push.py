@@ -0,0 +1,417 @@
+"""
+体力推送
+
+根据最近一次查询到的结晶波片与恢复速度预测达到阈值的时间，按预测时间放入最小堆，
+只在预测时间附近请求 get_daily_info。请求量与推送次数成正比，与订阅人数无关
+下次检查时间记录在 WavesPush 中，重启后按记录继续，不会重新查询全部订阅
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from msgspec import Struct
+
+from gsuid_core.gss import gss
+from gsuid_core.logger import logger
+from gsuid_core.segment import MessageSegment
+
+from ..utils.api.model import DailyData
+from ..utils.database.models import WavesPush, WavesUser
+from ..utils.waves_api import waves_api
+
+# 结晶波片恢复 1 点的秒数
+STAMINA_REGEN_SECONDS = 360
+# 在预测时间之后多久检查，避免恰好差 1 点
+CHECK_SLACK = 30
+# 已推送后隔多久检查体力是否已被消耗
+PUSHED_RECHECK = 3 * 3600
+# 请求失败的重试间隔，逐次翻倍
+FAIL_RETRY = 600
+MAX_FAIL_RETRY = 3600
+# 同时请求的数量
+FETCH_CONCURRENCY = 10
+# 重新从数据库同步订阅的间隔
+RELOAD_INTERVAL = 3600
+# 没有检查时间记录或已过期(如停机期间)的订阅，首次检查分散到这段时间内
+INITIAL_SPREAD = 1800
+
+# (当前, 上限, 回满时间戳)
+Energy = Tuple[int, int, int]
+
+
+class StaminaTarget(Struct):
+    uid: str
+    bot_id: str
+    user_id: str
+    cookie: str
+    push: str  # on 为私聊，其余为群号
+    threshold: int
+    is_pushed: bool = False
+    fail: int = 0
+    # 下次检查的时间戳，0 为没有记录
+    check_time: int = 0
+
+    @property
+    def key(self) -> str:
+        return f"{self.bot_id}:{self.uid}"
+
+
+class StaminaTargetInvalid(Exception):
+    """登录已失效，不再检查该订阅"""
+
+
+def predict_reach_time(energy: Energy, threshold: int, now: float) -> float:
+    """达到阈值的预测时间，已达到时返回 now"""
+    cur, total, refresh_ts = energy
+    threshold = min(threshold, total)
+    if cur >= threshold:
+        return now
+    if refresh_ts and cur < total:
+        # 以回满时间反推，不受查询时刻的恢复进度影响
+        reach = refresh_ts - (total - threshold) * STAMINA_REGEN_SECONDS
+        if reach > now:
+            return reach
+    return now + (threshold - cur) * STAMINA_REGEN_SECONDS
+
+
+class StaminaPushScheduler:
+    """
+    订阅按下次检查时间放在最小堆中，堆中过期的项以序号惰性删除
+    fetch 返回 None 表示请求失败，抛出 StaminaTargetInvalid 时移除该订阅
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[StaminaTarget], Awaitable[Optional[Energy]]],
+        clock: Callable[[], float] = time.time,
+    ):
+        self.fetch = fetch
+        self.clock = clock
+        self.targets: Dict[str, StaminaTarget] = {}
+        self.fetch_num = 0
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq: Dict[str, int] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def schedule(self, key: str, at: float):
+        seq = next(self._counter)
+        self._seq[key] = seq
+        heapq.heappush(self._heap, (at, seq, key))
+        target = self.targets.get(key)
+        if target:
+            target.check_time = int(at)
+
+    def upsert(self, target: StaminaTarget, immediate: bool = False):
+        """immediate 为 True 时立即检查(用户修改了设置)"""
+        old = self.targets.get(target.key)
+        self.targets[target.key] = target
+        if (
+            not immediate
+            and old
+            and target.key in self._seq
+            and old.threshold == target.threshold
+            and old.cookie == target.cookie
+        ):
+            # 设置未变化时保留原检查时间
+            target.is_pushed = old.is_pushed
+            target.fail = old.fail
+            target.check_time = old.check_time
+            return
+
+        now = self.clock()
+        if immediate:
+            at = now
+        elif target.check_time > now:
+            at = target.check_time
+        else:
+            at = now + random.uniform(0, INITIAL_SPREAD)
+        self.schedule(target.key, at)
+
+    def remove(self, key: str):
+        self.targets.pop(key, None)
+        self._seq.pop(key, None)
+
+    def sync(self, targets: List[StaminaTarget]):
+        keys = {target.key for target in targets}
+        for key in list(self.targets):
+            if key not in keys:
+                self.remove(key)
+        for target in targets:
+            self.upsert(target)
+
+    def next_check_time(self) -> Optional[float]:
+        while self._heap:
+            at, seq, key = self._heap[0]
+            if self._seq.get(key) == seq:
+                return at
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: float) -> List[str]:
+        keys = []
+        while self._heap and self._heap[0][0] <= now:
+            _, seq, key = heapq.heappop(self._heap)
+            if self._seq.get(key) != seq:
+                continue
+            del self._seq[key]
+            keys.append(key)
+        return keys
+
+    def on_energy(self, target: StaminaTarget, energy: Energy, now: float) -> bool:
+        """处理查询结果并安排下次检查，返回是否需要推送"""
+        target.fail = 0
+        if energy[0] >= min(target.threshold, energy[1]):
+            self.schedule(target.key, now + PUSHED_RECHECK)
+            if target.is_pushed:
+                return False
+            target.is_pushed = True
+            return True
+
+        target.is_pushed = False
+        reach = predict_reach_time(energy, target.threshold, now)
+        self.schedule(target.key, reach + CHECK_SLACK)
+        return False
+
+    def on_fail(self, target: StaminaTarget, now: float):
+        target.fail += 1
+        retry = min(FAIL_RETRY * 2 ** (target.fail - 1), MAX_FAIL_RETRY)
+        self.schedule(target.key, now + retry)
+
+    async def tick(
+        self,
+    ) -> Tuple[List[Tuple[StaminaTarget, Energy]], List[StaminaTarget]]:
+        """
+        检查所有到期的订阅
+        返回 (需要推送的 (订阅, 体力), 已检查需要保存状态的订阅)
+        """
+        keys = self.pop_due(self.clock())
+        if not keys:
+            return [], []
+
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+        pushes = []
+        checked = []
+
+        async def _check(key: str):
+            target = self.targets.get(key)
+            if not target:
+                return
+            async with semaphore:
+                self.fetch_num += 1
+                invalid = False
+                try:
+                    energy = await self.fetch(target)
+                except StaminaTargetInvalid:
+                    invalid = True
+                    energy = None
+                except Exception as e:
+                    logger.exception(f"[鸣潮][体力推送] 查询失败 uid:{target.uid}", e)
+                    energy = None
+            # 查询期间可能已取消订阅
+            if self.targets.get(key) is not target:
+                return
+            if invalid:
+                logger.info(f"[鸣潮][体力推送] 登录已失效 uid:{target.uid}")
+                self.remove(key)
+                return
+            if energy is None:
+                self.on_fail(target, self.clock())
+            elif self.on_energy(target, energy, self.clock()):
+                pushes.append((target, energy))
+            checked.append(target)
+
+        await asyncio.gather(*[_check(key) for key in keys])
+        return pushes, checked
+
+
+async def _fetch_energy(target: StaminaTarget) -> Optional[Energy]:
+    res = await waves_api.get_daily_info(target.uid, target.cookie)
+    if not res.success:
+        if res.is_token_invalid:
+            await res.mark_cookie_invalid(target.uid, target.cookie)
+            raise StaminaTargetInvalid(target.uid)
+        return None
+    if not isinstance(res.data, dict):
+        return None
+    energy = DailyData.model_validate(res.data).energyData
+    return energy.cur, energy.total, energy.refreshTimeStamp
+
+
+stamina_push_scheduler = StaminaPushScheduler(_fetch_energy)
+_last_reload = 0.0
+
+
+def _make_target(
+    push: Optional[WavesPush], user: Optional[WavesUser]
+) -> Optional[StaminaTarget]:
+    """未开启推送或登录失效(与开启体力推送时的检查一致)时返回 None"""
+    if not push or not push.resin_push or push.resin_push == "off":
+        return None
+    if not user or not user.cookie or user.status == "无效":
+        return None
+    return StaminaTarget(
+        uid=push.uid,
+        bot_id=push.bot_id,
+        user_id=user.user_id,
+        cookie=user.cookie,
+        push=push.resin_push,
+        threshold=push.resin_value or 180,
+        is_pushed=push.resin_is_push == "on",
+        check_time=push.resin_check_time or 0,
+    )
+
+
+async def load_stamina_targets() -> List[StaminaTarget]:
+    push_list = await WavesPush.get_all_resin_push()
+    if not push_list:
+        return []
+    user_map = {(u.uid, u.bot_id): u for u in await WavesUser.get_waves_all_user()}
+
+    targets = []
+    for push in push_list:
+        target = _make_target(push, user_map.get((push.uid, push.bot_id)))
+        if target:
+            targets.append(target)
+    return targets
+
+
+async def reload_stamina_push():
+    global _last_reload
+    _last_reload = time.time()
+    stamina_push_scheduler.sync(await load_stamina_targets())
+    logger.info(f"[鸣潮][体力推送] 已加载订阅 {len(stamina_push_scheduler)} 个")
+
+
+async def update_stamina_push(uid: str, user_id: str, bot_id: str):
+    """订阅设置变化后同步单个 uid"""
+    target = _make_target(
+        await WavesPush.select_push_data(uid, bot_id),
+        await WavesUser.select_waves_user(uid, user_id, bot_id),
+    )
+    if target:
+        stamina_push_scheduler.upsert(target, immediate=True)
+    else:
+        stamina_push_scheduler.remove(f"{bot_id}:{uid}")
+
+
+def _push_text(target: StaminaTarget, energy: Energy) -> str:
+    return (
+        f"[鸣潮] 特征码{target.uid} 结晶波片已达到 {energy[0]}/{energy[1]}"
+        f"(阈值{target.threshold}), 请及时使用!"
+    )
+
+
+async def send_stamina_push(pushes: List[Tuple[StaminaTarget, Energy]]):
+    """同一 bot 的推送合并: 私聊每人一条，群聊每群一条"""
+    batches: Dict[str, Dict[str, Dict[str, List]]] = {}
+    for target, energy in pushes:
+        batch = batches.setdefault(target.bot_id, {"direct": {}, "group": {}})
+        if target.push == "on":
+            batch["direct"].setdefault(target.user_id, []).append(
+                MessageSegment.text(_push_text(target, energy))
+            )
+        else:
+            batch["group"].setdefault(target.push, []).extend(
+                [
+                    MessageSegment.at(target.user_id),
+                    MessageSegment.text(f" {_push_text(target, energy)}\n"),
+                ]
+            )
+
+    for bot_id, batch in batches.items():
+        for target_type, messages in batch.items():
+            for target_id, message in messages.items():
+                try:
+                    for bot in gss.active_bot.values():
+                        await bot.target_send(
+                            message, target_type, target_id, bot_id, "", ""
+                        )
+                except Exception as e:
+                    logger.exception(f"[鸣潮][体力推送] {target_id} 推送失败", e)
+                await asyncio.sleep(0.5 + random.random())
+
+
+async def stamina_push_task():
+    if time.time() - _last_reload > RELOAD_INTERVAL:
+        await reload_stamina_push()
+
+    pushes, checked = await stamina_push_scheduler.tick()
+    if checked:
+        await WavesPush.set_resin_state(
+            [
+                (t.uid, t.bot_id, "on" if t.is_pushed else "off", t.check_time)
+                for t in checked
+            ]
+        )
+    if pushes:
+        logger.info(f"[鸣潮][体力推送] 本次推送 {len(pushes)} 个")
+        await send_stamina_push(pushes)
+
+
+async def benchmark_stamina_push(
+    num: int = 50000, hours: int = 24, tick_seconds: int = 60
+) -> Dict[str, float]:
+    """
+    以模拟时钟运行 hours 小时，订阅者随机消耗体力，
+    对比按 tick_seconds 轮询全部订阅的请求数
+    """
+    rng = random.Random(0)
+    now = [1_700_000_000.0]
+    # uid -> (查询时刻的体力, 查询时刻)
+    state: Dict[str, Tuple[float, float]] = {}
+
+    def _energy(uid: str) -> float:
+        cur, at = state[uid]
+        return min(240.0, cur + (now[0] - at) / STAMINA_REGEN_SECONDS)
+
+    async def _fetch(target: StaminaTarget) -> Optional[Energy]:
+        cur = _energy(target.uid)
+        # 每次查询有一定概率在之前已经消耗了体力
+        if cur >= target.threshold and rng.random() < 0.3:
+            cur = rng.uniform(0, 60)
+        state[target.uid] = (cur, now[0])
+        refresh_ts = int(now[0] + (240 - cur) * STAMINA_REGEN_SECONDS)
+        return int(cur), 240, refresh_ts
+
+    scheduler = StaminaPushScheduler(_fetch, clock=lambda: now[0])
+    targets = []
+    for i in range(num):
+        uid = str(100000000 + i)
+        state[uid] = (rng.uniform(0, 240), now[0])
+        targets.append(
+            StaminaTarget(
+                uid=uid,
+                bot_id="onebot",
+                user_id=uid,
+                cookie="",
+                push="on",
+                threshold=rng.choice([160, 180, 200, 240]),
+            )
+        )
+    scheduler.sync(targets)
+
+    push_num = 0
+    tick_cost = 0.0
+    ticks = hours * 3600 // tick_seconds
+    for _ in range(ticks):
+        start = time.perf_counter()
+        pushes, _ = await scheduler.tick()
+        tick_cost += time.perf_counter() - start
+        push_num += len(pushes)
+        now[0] += tick_seconds
+
+    return {
+        "subscriber": num,
+        "hours": hours,
+        "fetch_num": scheduler.fetch_num,
+        "push_num": push_num,
+        "poll_fetch_num": num * ticks,
+        "tick_ms": tick_cost * 1000 / ticks,
+    }
@@ -1,6 +1,9 @@
+import asyncio
+
 from gsuid_core.logger import logger
 from gsuid_core.server import on_core_start
 
+from ..wutheringwaves_config import WutheringWavesConfig
 from ..wutheringwaves_resource import startup
 
 
@@ -8,28 +11,30 @@ from ..wutheringwaves_resource import startup
 async def all_start():
     logger.info("[鸣潮] 启动中...")
     try:
-        from ..utils.damage.register_char import register_char
-        from ..utils.damage.register_echo import register_echo
-        from ..utils.damage.register_weapon import register_weapon
         from ..utils.limit_user_card import load_limit_user_card
-        from ..utils.map.damage.register import register_damage, register_rank
+        from ..utils.map.damage.register import init_damage_register
         from ..utils.queues import init_queues
+        from ..wutheringwaves_rank.train_rank_store import remove_legacy_group_data
 
-        # 注册
-        register_weapon()
-        register_echo()
-        register_damage()
-        register_rank()
-        register_char()
+        # 注册，模块在首次查找时才导入
+        init_damage_register()
 
         # 初始化任务队列
         init_queues()
 
+        # 练度排行已改为按 uid 共用，删除旧版按群保存的数据
+        remove_legacy_group_data()
+
         # 加载角色极限面板
         card_list = await load_limit_user_card()
         logger.info(f"[鸣潮][加载角色极限面板] 数量: {len(card_list)}")
 
         await startup()
+
+        if WutheringWavesConfig.get_config("DamageWarmUp").data:
+            from ..utils.map.damage.register import warm_up_damage
+
+            asyncio.create_task(warm_up_damage())
     except Exception as e:
         logger.exception(e)
 
@@ -3,13 +3,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
-import httpx
 from PIL import Image, ImageDraw
 
-from gsuid_core.logger import logger
 from gsuid_core.utils.image.convert import convert_img
 
 from ..utils.api.wwapi import GET_POOL_LIST
+from ..utils.api.wwapi_client import get_cached_data
 from ..utils.fonts.waves_fonts import waves_font_30, waves_font_58
 from ..utils.image import (
     SPECIAL_GOLD,
@@ -22,7 +21,6 @@ from ..utils.image import (
     get_waves_bg,
 )
 from ..utils.name_convert import easy_id_to_name
-from ..utils.util import timed_async_cache
 from .model import WavesPool
 
 TEXT_PATH = Path(__file__).parent / "texture2d"
@@ -30,21 +28,8 @@ bar = Image.open(TEXT_PATH / "bar.png")
 avatar_mask = Image.open(TEXT_PATH / "avatar_mask.png")
 
 
-@timed_async_cache(expiration=3600, condition=lambda x: isinstance(x, list))
 async def get_pool_data() -> Union[List, None]:
-    async with httpx.AsyncClient() as client:
-        try:
-            res = await client.get(
-                GET_POOL_LIST,
-                headers={
-                    "Content-Type": "application/json",
-                },
-                timeout=httpx.Timeout(10),
-            )
-            if res.status_code == 200:
-                return res.json().get("data", [])
-        except Exception as e:
-            logger.exception(f"获取卡池数据失败: {e}")
+    return await get_cached_data(GET_POOL_LIST, condition=lambda x: isinstance(x, list))
 
 
 async def clean_pool_data():